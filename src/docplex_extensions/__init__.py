@@ -18,12 +18,18 @@ if _find_spec('docplex') is None:
     raise ImportError('Unable to import required dependency: docplex')
 
 # Package functionality
+from ._computed_params import ComputedParamDict1D, ComputedParamDictND
+from ._constr_dicts import ConstraintDict1D, ConstraintDictND
+from ._constr_funcs import add_constraints
 from ._index_sets import IndexSet1D, IndexSetND
 from ._model_funcs import print_problem_stats, print_solution_quality_stats, runseeds, solve
+from ._networks import Network
 from ._pandas_accessors import DataFrameAccessor as _DataFrameAccessor
 from ._pandas_accessors import IndexAccessor as _IndexAccessor
 from ._pandas_accessors import SeriesAccessor as _SeriesAccessor
 from ._param_dicts import ParamDict1D, ParamDictND
+from ._readers import read_indexset, read_paramdict
+from ._sparse_params import SparseParamDict1D, SparseParamDictND
 from ._tuning_funcs import batch_tune, tune
 from ._var_dicts import VarDict1D, VarDictND
 from ._var_funcs import add_variable, add_variables
@@ -49,10 +55,20 @@ __all__ = [
     'runseeds',
     'IndexSet1D',
     'IndexSetND',
+    'Network',
+    'read_indexset',
     'ParamDict1D',
     'ParamDictND',
+    'ComputedParamDict1D',
+    'ComputedParamDictND',
+    'SparseParamDict1D',
+    'SparseParamDictND',
+    'read_paramdict',
     'VarDict1D',
     'VarDictND',
     'add_variable',
     'add_variables',
+    'ConstraintDict1D',
+    'ConstraintDictND',
+    'add_constraints',
 ]
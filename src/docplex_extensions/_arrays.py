@@ -0,0 +1,418 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Helpers for the optional NumPy array-backed functionality."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+ARRAY_DTYPES = ('float64', 'int64')
+"""Data types supported for array-backed storage of parameter values."""
+
+_INT64_BOUNDS = (-(2**63), 2**63 - 1)
+"""Minimum and maximum values of the int64 data type."""
+
+
+def import_numpy() -> ModuleType:
+    """Import NumPy, which is an optional dependency needed for array-backed functionality.
+
+    Returns
+    -------
+    module
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            'Unable to import optional dependency: numpy (required for array-backed functionality)'
+        ) from None
+    return numpy
+
+
+def check_dtype(dtype: str) -> None:
+    """Check if a data type is supported for array-backed storage.
+
+    Parameters
+    ----------
+    dtype : str
+
+    Raises
+    ------
+    TypeError
+        If `dtype` is not a string.
+    ValueError
+        If `dtype` is not supported.
+    """
+    if not isinstance(dtype, str):
+        raise TypeError('`dtype` should be a string')
+    if dtype not in ARRAY_DTYPES:
+        raise ValueError(f'`dtype` should be one of {", ".join(map(repr, ARRAY_DTYPES))}')
+
+
+def is_int_dtype(dtype: str) -> bool:
+    """Check if a supported data type is an integer type.
+
+    Parameters
+    ----------
+    dtype : str
+
+    Returns
+    -------
+    bool
+    """
+    return dtype.startswith('int')
+
+
+NUMERIC_KINDS = ('b', 'i', 'u', 'f')
+"""Kinds of NumPy data types accepted for parameter values (bool, int, unsigned int, float)."""
+
+
+def as_python_scalar(value: Any) -> Any:
+    """Coerce a NumPy numeric scalar (or 0-dim array) to the equivalent Python int or float.
+
+    Parameters
+    ----------
+    value : Any
+
+    Returns
+    -------
+    Any
+        Python scalar for a NumPy numeric scalar, and `value` itself otherwise.
+    """
+    if getattr(value, 'ndim', None) == 0 and getattr(value.dtype, 'kind', None) in NUMERIC_KINDS:
+        return value.item()
+    return value
+
+
+def as_python_values(values: list[Any]) -> list[Any] | None:
+    """Coerce NumPy numeric scalars among parameter values to the equivalent Python int or float.
+
+    All values are validated at once by inspecting the data type of a NumPy array of them, and
+    checked one by one only if this is inconclusive (object data type, for example with integers
+    too large for int64).
+
+    Parameters
+    ----------
+    values : list
+
+    Returns
+    -------
+    list[int or float] or None
+        Values as Python int or float (keeping the type of each value), or None if any value is not
+        numeric.
+    """
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover
+        kind = 'O'
+    else:
+        try:
+            arr = np.asarray(values)
+        except (TypeError, ValueError):  # ragged nested sequences
+            return None
+        kind = arr.dtype.kind if arr.ndim == 1 else ''
+
+    if kind in NUMERIC_KINDS:
+        return [as_python_scalar(v) for v in values]
+    if kind == 'O':
+        coerced = [as_python_scalar(v) for v in values]
+        if all(isinstance(v, int | float) for v in coerced):
+            return coerced
+    return None
+
+
+def check_array_value(value: int | float, dtype: str, subject: str) -> None:
+    """Check if a parameter value can be stored in an array of a data type.
+
+    Parameters
+    ----------
+    value : int or float
+    dtype : str
+    subject : str
+        Reference to the value in error messages.
+
+    Raises
+    ------
+    TypeError
+        If `value` is a float for ``dtype='int64'``.
+    OverflowError
+        If `value` is out of the range of ``dtype='int64'``.
+    """
+    if is_int_dtype(dtype):
+        if isinstance(value, float):
+            raise TypeError(f'{subject} should be int for dtype {dtype}')
+        lo, hi = _INT64_BOUNDS
+        if not lo <= value <= hi:
+            raise OverflowError(f'{subject} should be between {lo} and {hi} for dtype {dtype}')
+
+
+def check_array_values(values: list[int | float], dtype: str, subject: str) -> None:
+    """Check if parameter values can be stored in an array of a data type, all at once.
+
+    Parameters
+    ----------
+    values : list[int or float]
+    dtype : str
+    subject : str
+        Reference to the values in error messages.
+
+    Raises
+    ------
+    TypeError
+        If any value is a float for ``dtype='int64'``.
+    OverflowError
+        If any value is out of the range of ``dtype='int64'``.
+    """
+    if values and is_int_dtype(dtype):
+        if any(isinstance(v, float) for v in values):
+            raise TypeError(f'{subject} should be int for dtype {dtype}')
+        lo, hi = _INT64_BOUNDS
+        if min(values) < lo or max(values) > hi:
+            raise OverflowError(f'{subject} should be between {lo} and {hi} for dtype {dtype}')
+
+
+def int_abs_max(arr: NDArray[Any]) -> int:
+    """Get the largest absolute value of a populated integer array, as a Python int.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        Populated 1-dim array of an integer data type.
+
+    Returns
+    -------
+    int
+    """
+    return max(abs(int(arr.min())), abs(int(arr.max())))
+
+
+def int_sum_may_overflow(arr: NDArray[Any], factor: int = 1) -> bool:
+    """Check if accumulating the values of an integer array in int64 could overflow.
+
+    The check is conservative - the number of values times the largest absolute value (times
+    `factor`, e.g., for products with values of another array) is compared with the int64 maximum.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        Populated 1-dim array of an integer data type.
+    factor : int, default ``1``
+        Largest absolute value each value is multiplied by.
+
+    Returns
+    -------
+    bool
+    """
+    n: int = arr.shape[0]
+    return n * int_abs_max(arr) * factor > _INT64_BOUNDS[1]
+
+
+def int_arith_may_overflow(
+    lhs: NDArray[Any] | int | float, rhs: NDArray[Any] | int | float, op_name: str
+) -> bool:
+    """Check if a vectorized arithmetic operation with integer operands could overflow in int64.
+
+    The check is conservative - it is based on the largest absolute values of the operands. Arrays
+    of ``object`` data type hold integers out of the int64 range, so they always need an exact
+    calculation.
+
+    Parameters
+    ----------
+    lhs : numpy.ndarray or int or float
+        1-dim array or number as the left operand.
+    rhs : numpy.ndarray or int or float
+        1-dim array or number as the right operand.
+    op_name : str
+        One of `'add'`, `'sub'`, `'mul'`, or `'div'`.
+
+    Returns
+    -------
+    bool
+        False if either operand is a float or an array of a floating point data type.
+    """
+    abs_maxes = []
+    for operand in (lhs, rhs):
+        if isinstance(operand, float):
+            return False
+        if isinstance(operand, int):
+            abs_maxes.append(abs(operand))
+            continue
+        kind = operand.dtype.kind
+        if kind == 'O':
+            return True
+        if kind not in 'iu':
+            return False
+        abs_maxes.append(int_abs_max(operand) if operand.shape[0] else 0)
+
+    lmax, rmax = abs_maxes
+    int64_max = _INT64_BOUNDS[1]
+    if op_name == 'mul':
+        return lmax * rmax > int64_max
+    if op_name == 'div':  # only a number operand could be out of range
+        return max(lmax, rmax) > int64_max
+    return lmax + rmax > int64_max
+
+
+def build_exact_array(values: list[int | float]) -> NDArray[Any] | None:
+    """Build an array of int64 or float64 data type from values, if it stores them exactly.
+
+    Parameters
+    ----------
+    values : list[int or float]
+
+    Returns
+    -------
+    numpy.ndarray or None
+        None if the values mix ints and floats, or any int is out of the int64 range.
+    """
+    np = import_numpy()
+    is_float = [isinstance(v, float) for v in values]
+    if all(is_float) and values:
+        return cast('NDArray[Any]', np.array(values, dtype='float64'))
+    if any(is_float):
+        return None
+    lo, hi = _INT64_BOUNDS
+    if values and (min(values) < lo or max(values) > hi):
+        return None
+    return cast('NDArray[Any]', np.array(values, dtype='int64'))
+
+
+def build_array(values: Iterable[int | float], dtype: str, count: int) -> NDArray[Any]:
+    """Build a contiguous array from parameter values.
+
+    Parameters
+    ----------
+    values : iterable[int or float]
+    dtype : str
+    count : int
+        Number of values.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    np = import_numpy()
+    return cast('NDArray[Any]', np.fromiter(values, dtype=dtype, count=count))
+
+
+def calc_array_stat(arr: NDArray[Any], stat_func: str) -> int | float:
+    """Calculate a statistic with all values of a populated array.
+
+    Results follow the conventions of the `statistics` module of the standard library: the mean of
+    integers is an integer when it is exact, and the median of an odd number of values is one of the
+    values.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        Populated 1-dim array.
+    stat_func : str
+        One of `'sum'`, `'mean'`, `'median'`, `'median_high'`, or `'median_low'`.
+
+    Returns
+    -------
+    int or float
+    """
+    np = import_numpy()
+    n = arr.shape[0]
+    is_int = arr.dtype.kind in 'iu'
+
+    # Integers are summed with Python ints (which are exact) if int64 could overflow
+    exact_int_sum = is_int and stat_func in ('sum', 'mean') and int_sum_may_overflow(arr)
+
+    match stat_func:
+        case 'sum':
+            if exact_int_sum:
+                res: int | float = sum(arr.tolist())
+            else:
+                res = arr.sum().item()
+        case 'mean':
+            if is_int:
+                total = sum(arr.tolist()) if exact_int_sum else int(arr.sum())
+                res = total // n if total % n == 0 else total / n
+            else:
+                res = arr.mean().item()
+        case 'median':
+            if n % 2:
+                res = np.partition(arr, n // 2)[n // 2].item()
+            else:
+                part = np.partition(arr, (n // 2 - 1, n // 2))
+                res = (part[n // 2 - 1].item() + part[n // 2].item()) / 2
+        case 'median_high':
+            res = np.partition(arr, n // 2)[n // 2].item()
+        case 'median_low':
+            res = np.partition(arr, (n - 1) // 2)[(n - 1) // 2].item()
+        case _:  # pragma: no cover
+            raise ValueError(f'`{stat_func}` is not supported for arrays')
+
+    return res
+
+
+def calc_group_stat(
+    arr: NDArray[Any], codes: NDArray[Any], ngroups: int, stat_func: str
+) -> NDArray[Any]:
+    """Calculate a statistic for each group of values of a populated array in one pass.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        Populated 1-dim array.
+    codes : numpy.ndarray
+        Group codes (from ``0`` to ``ngroups - 1``) aligned with `arr`; each group has at least
+        one value.
+    ngroups : int
+        Number of groups.
+    stat_func : str
+        One of `'sum'`, `'mean'`, `'min'`, `'max'`, `'count'`, or `'median'`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of statistics by group code. Mean and median are always floats. Sums of integers are
+        Python ints (in an array of object data type) if int64 could overflow.
+    """
+    np = import_numpy()
+    counts = np.bincount(codes, minlength=ngroups)
+
+    match stat_func:
+        case 'count':
+            res = counts.astype('int64', copy=False)
+        case 'sum' | 'mean':
+            if arr.dtype.kind in 'iu' and int_sum_may_overflow(arr):
+                wide = arr.astype(object)  # Python ints, which are exact
+            else:
+                wide = arr
+            res = np.zeros(ngroups, dtype=wide.dtype)
+            np.add.at(res, codes, wide)
+            if stat_func == 'mean':
+                res = res / counts
+        case 'min' | 'max' | 'median':
+            # Sort values within each group, then pick by offsets of the groups
+            sorted_arr = arr[np.lexsort((arr, codes))]
+            starts = np.cumsum(counts) - counts
+            if stat_func == 'min':
+                res = sorted_arr[starts]
+            elif stat_func == 'max':
+                res = sorted_arr[starts + counts - 1]
+            else:
+                # Halve before adding, so that the sum of two large integers cannot overflow
+                res = (
+                    sorted_arr[starts + (counts - 1) // 2] / 2
+                    + sorted_arr[starts + counts // 2] / 2
+                )
+        case _:  # pragma: no cover
+            raise ValueError(f'`{stat_func}` is not supported for arrays')
+
+    return cast('NDArray[Any]', res)
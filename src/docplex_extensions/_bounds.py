@@ -0,0 +1,145 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Resolving variable bounds (and right-hand sides of constraints) given in any accepted form."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any, Literal, cast
+
+from ._computed_params import ComputedParamDict1D, ComputedParamDictND, computed_bound_values
+from ._index_sets import Elem1DT, ElemNDT, IndexSet1D, IndexSetND
+from ._param_dicts import ParamDict1D, ParamDictND, ParamT, paramdict_bound_values
+from ._sparse_params import SparseParamDict1D, SparseParamDictND, sparse_bound_values
+
+
+def _paramdictNd_as_bound(
+    indexset: IndexSetND[ElemNDT],
+    bound: ParamDictND[ElemNDT, ParamT],
+    bound_type: Literal['lb', 'ub', 'rhs'],
+) -> list[int | float | None]:
+    """Use ParamDictND as DOcplex varaible bound.
+
+    Parameters
+    ----------
+    indexset : IndexSetND
+        Index-set for defining the variables.
+    bound : ParamDictND
+        ParamDict to be used as variable bound.
+    bound_type : str
+        Bound type, either ``'lb'`` or ``'ub'``.
+
+    Returns
+    -------
+    list[int or float or None]
+        Bound values aligned with the index-set elements, that can be used for DOcplex variable
+        bound for the `Model.xyz_var_dict` method.
+
+    Raises
+    ------
+    ValueError
+        ParamDict keys and indexset have tuple elements of different lengths.
+    """
+    if (not bound) or (bound and bound._indexset._tuplelen == indexset._tuplelen):
+        return paramdict_bound_values(indexset, bound)
+    else:
+        raise ValueError(f'{bound_type} keys and indexset have tuple elements of different lengths')
+
+
+def preprocess_bound(
+    indexset: IndexSet1D[Elem1DT] | IndexSetND[ElemNDT],
+    bound: int
+    | float
+    | Sequence[int | float | None]
+    | Callable[..., int | float | None]
+    | ParamDict1D[Elem1DT, ParamT]
+    | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT]
+    | None,
+    bound_type: Literal['lb', 'ub', 'rhs'],
+) -> int | float | Sequence[int | float | None] | Callable[..., int | float | None] | None:
+    """Preprocess DOcplex variable bound.
+
+    Parameters
+    ----------
+    indexset : IndexSet1D or IndexSetND
+        Index-set for defining the variables.
+    bound : ParamDict1D or ParamDictND or ComputedParamDict or SparseParamDict
+        ParamDict to be used as variable bound.
+    bound_type : str
+        Bound type, either ``'lb'`` or ``'ub'`` (or ``'rhs'`` for the right-hand side of
+        constraints).
+
+    Returns
+    -------
+    int or float or Sequence or function or None
+        DOcplex variable bound for the `Model.xyz_var_dict` method.
+
+    Raises
+    ------
+    ValueError
+        ParamDict keys and indexset have tuple elements of different lengths.
+    TypeError
+        If paramdict is ParamDictND and indexset is IndexSet1D, or vice versa.
+    """
+    # Get all values of ParamDict at once, aligned with the index-set
+    if isinstance(bound, ParamDict1D):
+        if isinstance(indexset, IndexSet1D):
+            return paramdict_bound_values(indexset, bound)
+        else:
+            raise TypeError(f'`{bound_type}` should be ParamDictND when indexset is IndexSetND')
+    elif isinstance(bound, ParamDictND):
+        if isinstance(indexset, IndexSetND):
+            return _paramdictNd_as_bound(indexset, bound, bound_type)
+        else:
+            raise TypeError(f'`{bound_type}` should be ParamDict1D when indexset is IndexSet1D')
+    # Compute all values of ComputedParamDict at once
+    elif isinstance(bound, ComputedParamDict1D):
+        if isinstance(indexset, IndexSet1D):
+            return computed_bound_values(indexset, bound)
+        else:
+            raise TypeError(
+                f'`{bound_type}` should be ComputedParamDictND when indexset is IndexSetND'
+            )
+    elif isinstance(bound, ComputedParamDictND):
+        if isinstance(indexset, IndexSetND):
+            if bound and bound._indexset._tuplelen != indexset._tuplelen:
+                raise ValueError(
+                    f'{bound_type} keys and indexset have tuple elements of different lengths'
+                )
+            return computed_bound_values(indexset, bound)
+        else:
+            raise TypeError(
+                f'`{bound_type}` should be ComputedParamDict1D when indexset is IndexSet1D'
+            )
+    # Fill in the default for all keys of SparseParamDict that are not overridden
+    elif isinstance(bound, SparseParamDict1D):
+        if isinstance(indexset, IndexSet1D):
+            return sparse_bound_values(indexset, bound)
+        else:
+            raise TypeError(
+                f'`{bound_type}` should be SparseParamDictND when indexset is IndexSetND'
+            )
+    elif isinstance(bound, SparseParamDictND):
+        if isinstance(indexset, IndexSetND):
+            if bound and bound._indexset._tuplelen != indexset._tuplelen:
+                raise ValueError(
+                    f'{bound_type} keys and indexset have tuple elements of different lengths'
+                )
+            return sparse_bound_values(indexset, bound)
+        else:
+            raise TypeError(
+                f'`{bound_type}` should be SparseParamDict1D when indexset is IndexSet1D'
+            )
+    # Convert NumPy arrays (or pandas Series) at once, instead of DOcplex checking each NumPy scalar
+    elif hasattr(bound, 'tolist') and hasattr(bound, 'ndim'):
+        values: list[int | float | None] = cast('Any', bound).tolist()
+        return values
+    # Let DOcplex handle everything else, so return as is
+    else:
+        return bound
@@ -0,0 +1,642 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""ComputedParamDict data structures."""
+
+from __future__ import annotations
+
+import statistics
+from collections import OrderedDict, abc
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import starmap
+from typing import Any
+
+from ._arrays import as_python_scalar, as_python_values
+from ._dict_mixins import Dict1DMixin, DictBaseMixin, DictNDMixin
+from ._index_sets import Elem1DT, ElemNDT, ElemT, IndexSet1D, IndexSetBase, IndexSetND
+from ._param_dicts import ParamDict1D, ParamDictND
+
+DEFAULT_MAXSIZE = 65_536
+"""Default maximum number of computed parameter values kept in the cache."""
+
+
+class ComputedParamDictBase(abc.Mapping[ElemT, int | float], DictBaseMixin[ElemT, int | float]):
+    """Base class for read-only mappings of parameters computed lazily with a key function.
+
+    Provides:
+    1. Evaluation on first access, with memoization in a bounded LRU cache.
+    2. Optional bulk evaluation with a batch function for many keys at once.
+
+    Parameters
+    ----------
+    func : callable
+        Key function to compute the parameter value of a key.
+    indexset : IndexSetBase
+        Index-set of keys for which the parameter is defined.
+    batch_func : callable, optional
+        Batch function to compute the parameter values of a list of keys at once.
+    maxsize : int, optional
+        Maximum number of computed parameter values kept in the cache.
+    """
+
+    # Private attributes
+    # ------------------
+    # _cache : OrderedDict
+    #     Computed parameter values, in order of least to most recent access.
+
+    __slots__ = ('_func', '_batch_func', '_indexset', '_cache', '_maxsize')
+
+    def __init__(
+        self,
+        func: Callable[..., int | float],
+        indexset: IndexSetBase[ElemT],
+        /,
+        *,
+        batch_func: Callable[[list[ElemT]], Iterable[int | float]] | None = None,
+        maxsize: int | None = DEFAULT_MAXSIZE,
+    ) -> None:
+        if not callable(func):
+            raise TypeError('`func` should be callable')
+        if batch_func is not None and not callable(batch_func):
+            raise TypeError('`batch_func` should be callable')
+        if maxsize is not None:
+            if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+                raise TypeError('`maxsize` should be an integer')
+            if maxsize < 0:
+                raise ValueError('`maxsize` should be non-negative')
+
+        self._func = func
+        self._batch_func = batch_func
+        self._indexset = indexset
+        self._cache: OrderedDict[ElemT, int | float] = OrderedDict()
+        self._maxsize = maxsize
+
+    def _call_func(self, key: ElemT) -> int | float:
+        """Call the key function for a key.
+
+        Parameters
+        ----------
+        key : key
+
+        Returns
+        -------
+        int or float
+        """
+        # Implement in subclasses by overloading this method
+        raise NotImplementedError  # pragma: no cover
+
+    def _map_func(self, keys: list[ElemT]) -> list[Any]:
+        """Call the key function for each of many keys.
+
+        Parameters
+        ----------
+        keys : list
+
+        Returns
+        -------
+        list
+        """
+        # Implement in subclasses by overloading this method
+        raise NotImplementedError  # pragma: no cover
+
+    def _evaluate_many(self, keys: list[ElemT]) -> list[int | float]:
+        """Compute the parameter values of many keys, with the batch function if available.
+
+        Parameters
+        ----------
+        keys : list
+
+        Returns
+        -------
+        list[int or float]
+
+        Raises
+        ------
+        ValueError
+            If the batch function does not return one value for each key.
+        TypeError
+            If any computed value is not int or float.
+        """
+        if self._batch_func is not None:
+            res = self._batch_func(keys)
+            values: list[Any] = res.tolist() if hasattr(res, 'tolist') else list(res)
+            if len(values) != len(keys):
+                raise ValueError('`batch_func` should return one value for each key')
+        else:
+            values = self._map_func(keys)
+
+        if not all(isinstance(v, int | float) for v in values):
+            coerced = as_python_values(values)
+            if coerced is None:
+                raise TypeError('computed parameter values should be either int or float')
+            values = coerced
+        return values
+
+    def _store(self, keys: list[ElemT], values: list[int | float]) -> None:
+        """Store computed parameter values in the cache, evicting the least recently accessed ones.
+
+        Only the last `maxsize` values of a batch are stored, and the least recently accessed values
+        are evicted before storing them, so that the cache never holds more than `maxsize` values
+        (even while storing a batch of many keys).
+
+        Parameters
+        ----------
+        keys : list
+            Keys not in the cache.
+        values : list[int or float]
+        """
+        if self._maxsize == 0:
+            return
+        cache = self._cache
+        if self._maxsize is not None:
+            if len(keys) > self._maxsize:
+                keys = keys[-self._maxsize :]
+                values = values[-self._maxsize :]
+            while cache and len(cache) + len(keys) > self._maxsize:
+                cache.popitem(last=False)
+        cache.update(zip(keys, values, strict=True))
+
+    def _get_many(self, keys: list[ElemT]) -> list[int | float]:
+        """Get the parameter values of many keys, computing the ones not in the cache at once.
+
+        Keys are assumed to be present in the index-set.
+
+        Parameters
+        ----------
+        keys : list
+
+        Returns
+        -------
+        list[int or float]
+        """
+        cache = self._cache
+        values: list[Any] = list(map(cache.get, keys))
+        missing = [i for i, v in enumerate(values) if v is None]
+        if self._maxsize is not None:
+            hits = [k for k, v in zip(keys, values, strict=True) if v is not None]
+            for key in hits:
+                cache.move_to_end(key)
+
+        if missing:
+            missing_keys = [keys[i] for i in missing]
+            computed = self._evaluate_many(missing_keys)
+            for i, value in zip(missing, computed, strict=True):
+                values[i] = value
+            self._store(missing_keys, computed)
+
+        return values
+
+    def __getitem__(self, key: ElemT, /) -> int | float:
+        # Get `self[key]`, computing it on first access (only for keys in the index-set, even if a
+        # value is cached for a key removed from the index-set).
+        if key not in self._indexset._set:
+            raise KeyError(key)
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = as_python_scalar(self._call_func(key))
+            if not isinstance(value, int | float):
+                raise TypeError('computed parameter values should be either int or float') from None
+            self._store([key], [value])
+        else:
+            if self._maxsize is not None:
+                self._cache.move_to_end(key)
+        return value
+
+    def __contains__(self, key: object, /) -> bool:
+        # Check if `key` is in the index-set.
+        return key in self._indexset._set
+
+    def __iter__(self) -> Iterator[ElemT]:
+        # Iterate over keys in the order of the index-set.
+        return iter(self._indexset._list)
+
+    def __len__(self) -> int:
+        # Number of keys in the index-set.
+        return len(self._indexset._list)
+
+    def _get_repr_body(self) -> str:
+        # Body for repr, summarizing the computation instead of listing all items.
+        func_name = getattr(self._func, '__qualname__', type(self._func).__qualname__)
+        return f'<computed with {func_name!r} for {len(self)} keys; {len(self._cache)} cached>'
+
+    @property
+    def maxsize(self) -> int | None:
+        """Maximum number of computed parameter values kept in the cache.
+
+        ``None`` if the cache is unbounded.
+
+        Returns
+        -------
+        int
+        """
+        return self._maxsize
+
+    def cache_clear(self) -> None:
+        """Clear the cache of computed parameter values."""
+        self._cache.clear()
+
+    def _check_for_sum(self) -> None:
+        """Perform validation checks before calculating the sum of parameter values.
+
+        Raises
+        ------
+        StatisticsError
+            If the ComputedParamDict is empty.
+        """
+        if not self:
+            raise statistics.StatisticsError(
+                f'Cannot calculate `sum` as the {self.__class__.__name__} is empty'
+            )
+
+
+class ComputedParamDict1D(ComputedParamDictBase[Elem1DT], Dict1DMixin[Elem1DT, int | float]):
+    """Read-only mapping of parameters with 1-dim scalar keys, computed lazily with a key function.
+
+    Parameter values are computed on first access and memoized in a bounded cache, which evicts the
+    least recently accessed values - for parameters that are cheap to compute for each key but too
+    large to materialize for all keys. Can be used wherever a ParamDict1D is used to read values,
+    including as variable bounds with `add_variables`.
+
+    Parameters
+    ----------
+    func : callable
+        Key function that returns the parameter value (int or float) of a key - called as
+        ``func(key)``.
+    indexset : IndexSet1D
+        Index-set of keys for which the parameter is defined. It is used by reference, so later
+        changes to the index-set are reflected.
+    value_name : str, optional
+        Name to refer to parameter values - not used internally, and solely for user reference.
+    batch_func : callable, optional
+        Batch function that returns the parameter values of a list of keys at once (as an iterable
+        or a NumPy array aligned with the keys) - used instead of `func` to compute the values of
+        many keys, such as with `sum` and `materialize`, or as variable bounds.
+    maxsize : int or None, default ``65536``
+        Maximum number of computed parameter values kept in the cache; ``None`` for an unbounded
+        cache, or ``0`` to disable caching.
+
+    Raises
+    ------
+    TypeError
+        If `func` or `batch_func` is not callable.
+    TypeError
+        If `indexset` is not an IndexSet1D.
+    TypeError
+        If `maxsize` is not an int.
+    ValueError
+        If `maxsize` is negative.
+    TypeError
+        If `value_name` is not a string.
+
+    Examples
+    --------
+    >>> sites = IndexSet1D([1, 2, 3], name='SITE')
+    >>> capacity = ComputedParamDict1D(lambda s: 100 * s, sites, value_name='CAP')
+    >>> capacity
+    ComputedParamDict1D: SITE -> CAP
+    <computed with '<lambda>' for 3 keys; 0 cached>
+    >>> capacity[2]
+    200
+    >>> capacity.sum()
+    600
+    """
+
+    __slots__ = ('_key_name', '_value_name')
+
+    def __init__(
+        self,
+        func: Callable[[Elem1DT], int | float],
+        indexset: IndexSet1D[Elem1DT],
+        /,
+        *,
+        value_name: str | None = None,
+        batch_func: Callable[[list[Elem1DT]], Iterable[int | float]] | None = None,
+        maxsize: int | None = DEFAULT_MAXSIZE,
+    ) -> None:
+        if not isinstance(indexset, IndexSet1D):
+            raise TypeError('`indexset` should be IndexSet1D')
+        self.key_name = indexset.name
+        self.value_name = value_name
+        super().__init__(func, indexset, batch_func=batch_func, maxsize=maxsize)
+
+    def __repr__(self) -> str:
+        # Printable string representation.
+        return f'{self._get_repr_header()}\n{self._get_repr_body()}'
+
+    def _call_func(self, key: Elem1DT) -> int | float:
+        # Call the key function for a key.
+        return self._func(key)
+
+    def _map_func(self, keys: list[Elem1DT]) -> list[Any]:
+        # Call the key function for each of many keys.
+        return list(map(self._func, keys))
+
+    def lookup(self, key: Elem1DT) -> int | float:
+        """Get the parameter value for the specified key, or zero if it is not found.
+
+        Parameters
+        ----------
+        key : key
+
+        Returns
+        -------
+        int or float
+
+        Examples
+        --------
+        >>> capacity = ComputedParamDict1D(lambda s: 100 * s, IndexSet1D([1, 2, 3]))
+        >>> capacity.lookup(3)
+        300
+        >>> capacity.lookup(4)
+        0
+        """
+        if key in self._indexset._set:
+            return self[key]
+        return 0
+
+    def sum(self) -> int | float:
+        """Calculate the sum of parameter values, computing the values not in the cache at once.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the ComputedParamDict is empty.
+
+        Examples
+        --------
+        >>> capacity = ComputedParamDict1D(lambda s: 100 * s, IndexSet1D([1, 2, 3]))
+        >>> capacity.sum()
+        600
+        """
+        self._check_for_sum()
+        return sum(self._get_many(self._indexset._list))
+
+    def materialize(self, *, dtype: str | None = None) -> ParamDict1D[Elem1DT, int | float]:
+        """Compute the parameter values of all keys to get a ParamDict1D.
+
+        Parameters
+        ----------
+        dtype : {'float64', 'int64'}, optional
+            Data type for array-backed storage of the ParamDict1D.
+
+        Returns
+        -------
+        ParamDict1D
+
+        Examples
+        --------
+        >>> capacity = ComputedParamDict1D(lambda s: 100 * s, IndexSet1D([1, 2, 3]))
+        >>> capacity.materialize()
+        ParamDict1D:
+        {1: 100, 2: 200, 3: 300}
+        """
+        keys = self._indexset._list
+        mapping = dict(zip(keys, self._get_many(keys), strict=True))
+        if dtype is not None:
+            return ParamDict1D(
+                mapping, key_name=self.key_name, value_name=self.value_name, dtype=dtype
+            )
+        return ParamDict1D._create(mapping, key_name=self.key_name, value_name=self.value_name)
+
+
+class ComputedParamDictND(ComputedParamDictBase[ElemNDT], DictNDMixin[ElemNDT, int | float]):
+    """Read-only mapping of parameters with N-dim tuple keys, computed lazily with a key function.
+
+    Parameter values are computed on first access and memoized in a bounded cache, which evicts the
+    least recently accessed values - for parameters that are cheap to compute for each key but too
+    large to materialize for all keys. Can be used wherever a ParamDictND is used to read values,
+    including as variable bounds with `add_variables`.
+
+    Parameters
+    ----------
+    func : callable
+        Key function that returns the parameter value (int or float) of a key - called with the
+        elements of the N-dim tuple key as positional arguments, i.e., ``func(*key)``.
+    indexset : IndexSetND
+        Index-set of keys for which the parameter is defined. It is used by reference, so later
+        changes to the index-set are reflected.
+    value_name : str, optional
+        Name to refer to parameter values - not used internally, and solely for user reference.
+    batch_func : callable, optional
+        Batch function that returns the parameter values of a list of N-dim tuple keys at once (as
+        an iterable or a NumPy array aligned with the keys) - used instead of `func` to compute the
+        values of many keys, such as with `sum` and `materialize`, or as variable bounds.
+    maxsize : int or None, default ``65536``
+        Maximum number of computed parameter values kept in the cache; ``None`` for an unbounded
+        cache, or ``0`` to disable caching.
+
+    Raises
+    ------
+    TypeError
+        If `func` or `batch_func` is not callable.
+    TypeError
+        If `indexset` is not an IndexSetND.
+    TypeError
+        If `maxsize` is not an int.
+    ValueError
+        If `maxsize` is negative.
+    TypeError
+        If `value_name` is not a string.
+
+    Examples
+    --------
+    >>> coords = {'A': 0.0, 'B': 3.0, 'C': 7.0}
+    >>> arcs = IndexSetND([('A', 'B'), ('B', 'C'), ('A', 'C')], names=['ORI', 'DES'])
+    >>> dist = ComputedParamDictND(lambda o, d: abs(coords[o] - coords[d]), arcs, value_name='DIST')
+    >>> dist['B', 'C']
+    4.0
+    >>> dist.sum('A', '*')
+    10.0
+    """
+
+    __slots__ = ('_key_names', '_value_name')
+
+    def __init__(
+        self,
+        func: Callable[..., int | float],
+        indexset: IndexSetND[ElemNDT],
+        /,
+        *,
+        value_name: str | None = None,
+        batch_func: Callable[[list[ElemNDT]], Iterable[int | float]] | None = None,
+        maxsize: int | None = DEFAULT_MAXSIZE,
+    ) -> None:
+        if not isinstance(indexset, IndexSetND):
+            raise TypeError('`indexset` should be IndexSetND')
+        self.key_names = indexset.names
+        self.value_name = value_name
+        super().__init__(func, indexset, batch_func=batch_func, maxsize=maxsize)
+
+    def __repr__(self) -> str:
+        # Printable string representation.
+        return f'{self._get_repr_header()}\n{self._get_repr_body()}'
+
+    def _call_func(self, key: ElemNDT) -> int | float:
+        # Call the key function for a key.
+        return self._func(*key)
+
+    def _map_func(self, keys: list[ElemNDT]) -> list[Any]:
+        # Call the key function for each of many keys.
+        return list(starmap(self._func, keys))
+
+    def subset_values(self, *pattern: Any) -> list[int | float]:
+        """Get parameter values for all keys that match the wildcard pattern.
+
+        The values not in the cache are computed at once.
+
+        Parameters
+        ----------
+        *pattern : Any
+            The pattern requires one value for each dimension of the N-dim tuple key. The
+            single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+
+        Returns
+        -------
+        list[int or float]
+
+        Raises
+        ------
+        LookupError
+            If the ComputedParamDict is empty.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+        """
+        return self._get_many(self.subset_keys(*pattern))
+
+    def lookup(self, *key: Any) -> int | float:
+        """Get the parameter value for the specified key, or zero if it is not found.
+
+        Parameters
+        ----------
+        *key : key
+
+        Returns
+        -------
+        int or float
+
+        Examples
+        --------
+        >>> arcs = IndexSetND([('A', 'B'), ('B', 'C')])
+        >>> cost = ComputedParamDictND(lambda o, d: 10 if o == 'A' else 20, arcs)
+        >>> cost.lookup('A', 'B')
+        10
+        >>> cost.lookup('B', 'A')
+        0
+        """
+        if any((isinstance(k, Iterable) and not isinstance(k, str)) for k in key):
+            raise TypeError('lookup key must be scalars (no iterables except string)')
+        if self and len(key) != self._indexset._tuplelen:
+            raise ValueError('lookup key length must be the same as that of N-dim tuple keys')
+        if key in self._indexset._set:
+            return self[key]
+        return 0
+
+    def sum(self, *pattern: Any) -> int | float:
+        """Calculate the sum of all parameter values or a subset based on wildcard pattern.
+
+        The values not in the cache are computed at once.
+
+        Parameters
+        ----------
+        *pattern : Any, optional
+            For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
+            The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the ComputedParamDict is empty.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+
+        Examples
+        --------
+        >>> arcs = IndexSetND([('A', 'B'), ('B', 'C'), ('A', 'C')])
+        >>> cost = ComputedParamDictND(lambda o, d: 10 if o == 'A' else 20, arcs)
+
+        Sum over all parameter values:
+
+        >>> cost.sum()
+        40
+
+        Sum over a subset based on wildcard pattern:
+
+        >>> cost.sum('A', '*')
+        20
+        """
+        self._check_for_sum()
+        if pattern:
+            return sum(self.subset_values(*pattern))
+        return sum(self._get_many(self._indexset._list))
+
+    def materialize(self, *, dtype: str | None = None) -> ParamDictND[ElemNDT, int | float]:
+        """Compute the parameter values of all keys to get a ParamDictND.
+
+        Parameters
+        ----------
+        dtype : {'float64', 'int64'}, optional
+            Data type for array-backed storage of the ParamDictND.
+
+        Returns
+        -------
+        ParamDictND
+
+        Examples
+        --------
+        >>> arcs = IndexSetND([('A', 'B'), ('B', 'C')])
+        >>> cost = ComputedParamDictND(lambda o, d: 10 if o == 'A' else 20, arcs)
+        >>> cost.materialize()
+        ParamDictND:
+        {('A', 'B'): 10, ('B', 'C'): 20}
+        """
+        keys = self._indexset._list
+        mapping = dict(zip(keys, self._get_many(keys), strict=True))
+        if dtype is not None:
+            return ParamDictND(
+                mapping, key_names=self.key_names, value_name=self.value_name, dtype=dtype
+            )
+        return ParamDictND._create(mapping, key_names=self.key_names, value_name=self.value_name)
+
+
+def computed_bound_values(
+    indexset: IndexSet1D[Elem1DT] | IndexSetND[ElemNDT],
+    bound: ComputedParamDict1D[Elem1DT] | ComputedParamDictND[ElemNDT],
+) -> Sequence[int | float | None]:
+    """Get the values of a ComputedParamDict aligned with an index-set, computed at once.
+
+    Parameters
+    ----------
+    indexset : IndexSet1D or IndexSetND
+    bound : ComputedParamDict1D or ComputedParamDictND
+
+    Returns
+    -------
+    list[int or float or None]
+        Parameter values, or ``None`` for index-set elements that are not keys of `bound`.
+    """
+    keys: list[Any] = indexset._list
+    present = [k for k in keys if k in bound._indexset._set]
+    if len(present) == len(keys):
+        return bound._get_many(keys)
+    values = dict(zip(present, bound._get_many(present), strict=True))
+    return [values.get(k) for k in keys]
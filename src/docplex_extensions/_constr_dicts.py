@@ -0,0 +1,423 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""ConstraintDict data structures."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, NoReturn, TypeVar, cast
+
+from docplex.mp.constr import LinearConstraint
+from docplex.mp.model import Model
+
+from ._dict_mixins import Dict1DMixin, DictBaseMixin, DictNDMixin
+from ._index_sets import Elem1DT, ElemNDT, ElemT, IndexSet1D, IndexSetBase, IndexSetND
+from ._param_dicts import ParamDict1D, ParamDictND
+
+CtT = TypeVar('CtT', bound=LinearConstraint)
+
+
+class ConstraintDictBase(dict[ElemT, CtT], DictBaseMixin[ElemT, CtT]):
+    """Base class for custom subclasses of `dict` to define DOcplex model linear constraints.
+
+    Provides:
+    1. Runtime type checks to ensure constraints are `docplex.mp.constr.LinearConstraint` objects.
+    2. Disables all mutable mapping operations.
+
+    Parameters
+    ----------
+    docpx_ct_dict : dict
+        Dictionary of linear constraint objects from docplex.
+    indexset : IndexSetBase
+        Keys of dictionary encapsulated in an IndexSet.
+    model : docplex.mp.model.Model
+        DOcplex model associated with the constraint objects.
+    """
+
+    # Private attributes
+    # ------------------
+    # _indexset : IndexSetBase
+    #     Index-set of keys.
+
+    __slots__ = ('_indexset', '_model')
+
+    def __init__(
+        self,
+        docpx_ct_dict: dict[ElemT, CtT],
+        /,
+        *,
+        indexset: IndexSetBase[ElemT],
+        model: Model,
+    ) -> None:
+        self._validate_docpx_ct_dict(docpx_ct_dict)
+
+        if indexset._set != set(docpx_ct_dict.keys()):
+            raise ValueError(
+                f'{indexset.__class__.__name__} elements and {self.__class__.__name__} keys are not'
+                ' the same.'
+            )
+
+        self._indexset = indexset
+        """Index-set of keys."""
+
+        self._model = model
+
+        super().__init__(docpx_ct_dict)
+
+    @property
+    def model(self) -> Model:
+        """DOcplex model associated with the constraints.
+
+        Returns
+        -------
+        docplex.mp.model.Model
+        """
+        return self._model
+
+    def duals(self) -> ParamDict1D[Any, float] | ParamDictND[Any, float]:
+        """Get the dual values of all constraints at once.
+
+        The model should be a pure LP (with no integer or binary variables), solved successfully.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            Dual values with the same keys as the constraints.
+        """
+        return self._to_paramdict(self.model.dual_values(list(self.values())))
+
+    def slacks(self) -> ParamDict1D[Any, float] | ParamDictND[Any, float]:
+        """Get the slack values of all constraints at once.
+
+        The model should be solved successfully.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            Slack values with the same keys as the constraints.
+        """
+        return self._to_paramdict(self.model.slack_values(list(self.values())))
+
+    def rhs(self) -> ParamDict1D[Any, float] | ParamDictND[Any, float]:
+        """Get the right-hand side constants of all constraints at once.
+
+        As in CPLEX, any constant of the left-hand side expression is moved to the right-hand side.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            Right-hand side constants with the same keys as the constraints.
+        """
+        return self._to_paramdict([ct.cplex_num_rhs() for ct in self.values()])
+
+    def _to_paramdict(
+        self, values: list[float]
+    ) -> ParamDict1D[Any, float] | ParamDictND[Any, float]:
+        """Build a ParamDict of values aligned with the keys of the constraints.
+
+        Parameters
+        ----------
+        values : list[float]
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+        """
+        mapping = dict(zip(self._indexset._list, values, strict=True))
+        keyset = set(self._indexset._set)  # copy, since keys can be added to the ParamDict
+        if isinstance(self, ConstraintDict1D):
+            return ParamDict1D._create(mapping, key_name=self.key_name, keyset=keyset)
+        return ParamDictND._create(
+            mapping, key_names=cast('ConstraintDictND[Any, Any]', self).key_names, keyset=keyset
+        )
+
+    @staticmethod
+    def _validate_docpx_ct_dict(docpx_ct_dict: dict[ElemT, CtT]) -> None:
+        """Validate that the input is a populated dict of DOcplex linear constraints.
+
+        Parameters
+        ----------
+        docpx_ct_dict : dict
+            Input dictionary for ConstraintDict.
+        """
+        if not isinstance(docpx_ct_dict, dict):
+            raise TypeError('input should be a dict')
+        if not docpx_ct_dict:
+            raise ValueError('dict should be populated')
+        if any(not isinstance(x, LinearConstraint) for x in docpx_ct_dict.values()):
+            raise TypeError('dict values should be docplex.mp.constr.LinearConstraint objects')
+
+    def __setitem__(self, *args: Any) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        self._raise_not_supported_err('__setitem__')
+
+    def __delitem__(self, *args: Any) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        self._raise_not_supported_err('__delitem__')
+
+    def clear(self) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        self._raise_not_supported_err('clear')
+
+    def copy(self) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        self._raise_not_supported_err('copy')
+
+    def pop(self, *args: Any) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        self._raise_not_supported_err('pop')
+
+    def popitem(self) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        self._raise_not_supported_err('popitem')
+
+    def setdefault(self, *args: Any) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        self._raise_not_supported_err('setdefault')
+
+    def update(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        self._raise_not_supported_err('update')
+
+    @classmethod
+    def fromkeys(cls, *args: Any) -> NoReturn:
+        """Not supported by ConstraintDict."""
+        raise AttributeError(f'`fromkeys` is not supported by {cls.__name__}')
+
+
+class ConstraintDict1D(ConstraintDictBase[Elem1DT, CtT], Dict1DMixin[Elem1DT, CtT]):
+    """Custom subclasses of `dict` to define DOcplex model linear constraints with 1-dim keys.
+
+    Parameters
+    ----------
+    docpx_ct_dict : dict
+        Dictionary of linear constraint objects from docplex.
+    indexset : IndexSet1D
+        Keys of dictionary encapsulated in IndexSet1D.
+    model : docplex.mp.model.Model
+        DOcplex model associated with the constraint objects.
+    value_name : str, optional
+        Name to refer to constraints - not used internally, and solely for user reference.
+    """
+
+    # Private attributes
+    # ------------------
+    # _indexset : IndexSet1D
+    #     Index-set of keys.
+
+    __slots__ = ('_key_name', '_value_name')
+
+    def __init__(
+        self,
+        docpx_ct_dict: dict[Elem1DT, CtT],
+        indexset: IndexSet1D[Elem1DT],
+        /,
+        *,
+        model: Model,
+        value_name: str | None = None,
+    ) -> None:
+        self.key_name = indexset.name
+        self.value_name = value_name
+
+        super().__init__(docpx_ct_dict, indexset=indexset, model=model)
+
+    def __new__(
+        cls,
+        docpx_ct_dict: dict[Elem1DT, CtT],
+        indexset: IndexSet1D[Elem1DT],
+        /,
+        *,
+        model: Model,
+        value_name: str | None = None,
+    ) -> ConstraintDict1D[Elem1DT, CtT]:
+        raise TypeError(
+            'This class is not meant to be instantiated; ConstraintDict1D is built through the '
+            'docplex_extensions.add_constraints function'
+        )
+
+    @classmethod
+    def _create(
+        cls,
+        docpx_ct_dict: dict[Elem1DT, CtT],
+        indexset: IndexSet1D[Elem1DT],
+        /,
+        *,
+        model: Model,
+        value_name: str | None = None,
+    ) -> ConstraintDict1D[Elem1DT, CtT]:
+        # Private method to construt ConstraintDict1D
+        instance = super().__new__(cls)
+        cls.__init__(instance, docpx_ct_dict, indexset, model=model, value_name=value_name)
+        return instance
+
+    def __repr__(self) -> str:
+        # Printable string representation.
+        return f'{self._get_repr_header()}\n{super().__repr__()}'
+
+    def _repr_pretty_(self, p, cycle: bool) -> None:  # type: ignore[no-untyped-def]
+        # Pretty repr for IPython.
+        # https://ipython.readthedocs.io/en/stable/api/generated/IPython.lib.pretty.html#extending
+        # Since IPython is not typed, we'll add a type ignore commnent here
+        # The annotation for arg `p` is `IPython.lib.pretty.RepresentationPrinter`
+        p.text(f'{self._get_repr_header()}\n')
+        p.pretty(dict(self))
+
+    def lookup(self, key: Elem1DT) -> CtT | None:
+        """Get the constraint for the specified key, or ``None`` if it is not found.
+
+        Parameters
+        ----------
+        key : key
+
+        Returns
+        -------
+        docplex.mp.constr.LinearConstraint or ``None``
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-set:
+
+        >>> nodes = IndexSet1D(['A', 'B', 'C'], name='node')
+
+        Add variables and constraints:
+
+        >>> from docplex_extensions import add_constraints, add_variables
+        >>> node_select = add_variables(mdl, nodes, 'B', name='select')
+        >>> limit = add_constraints(mdl, nodes, node_select, '<=', 1, name='limit')
+
+        Lookup for keys:
+
+        >>> limit.lookup('A')
+        docplex.mp.LinearConstraint[limit_A](select_A,LE,1)
+
+        >>> limit.lookup('Z') is None
+        True
+        """
+        return super().get(key)
+
+
+class ConstraintDictND(ConstraintDictBase[ElemNDT, CtT], DictNDMixin[ElemNDT, CtT]):
+    """Custom subclasses of `dict` to define DOcplex model linear constraints with N-dim tuple keys.
+
+    Parameters
+    ----------
+    docpx_ct_dict : dict
+        Dictionary of linear constraint objects from docplex.
+    indexset : IndexSetND
+        Keys of dictionary encapsulated in IndexSetND.
+    model : docplex.mp.model.Model
+        DOcplex model associated with the constraint objects.
+    value_name : str, optional
+        Name to refer to constraints - not used internally, and solely for user reference.
+    """
+
+    # Private attributes
+    # ------------------
+    # _indexset : IndexSetND
+    #     Index-set of keys.
+
+    __slots__ = ('_key_names', '_value_name')
+
+    def __init__(
+        self,
+        docpx_ct_dict: dict[ElemNDT, CtT],
+        indexset: IndexSetND[ElemNDT],
+        /,
+        *,
+        model: Model,
+        value_name: str | None = None,
+    ) -> None:
+        self.key_names = indexset.names
+        self.value_name = value_name
+
+        super().__init__(docpx_ct_dict, indexset=indexset, model=model)
+
+    def __new__(
+        cls,
+        docpx_ct_dict: dict[ElemNDT, CtT],
+        indexset: IndexSetND[ElemNDT],
+        /,
+        *,
+        model: Model,
+        value_name: str | None = None,
+    ) -> ConstraintDictND[ElemNDT, CtT]:
+        raise TypeError(
+            'This class is not meant to be instantiated; ConstraintDictND is built through the '
+            'docplex_extensions.add_constraints function'
+        )
+
+    @classmethod
+    def _create(
+        cls,
+        docpx_ct_dict: dict[ElemNDT, CtT],
+        indexset: IndexSetND[ElemNDT],
+        /,
+        *,
+        model: Model,
+        value_name: str | None = None,
+    ) -> ConstraintDictND[ElemNDT, CtT]:
+        # Private method to construt ConstraintDictND
+        instance = super().__new__(cls)
+        cls.__init__(instance, docpx_ct_dict, indexset, model=model, value_name=value_name)
+        return instance
+
+    def __repr__(self) -> str:
+        # Printable string representation.
+        return f'{self._get_repr_header()}\n{super().__repr__()}'
+
+    def _repr_pretty_(self, p, cycle: bool) -> None:  # type: ignore[no-untyped-def]
+        # Pretty repr for IPython.
+        # https://ipython.readthedocs.io/en/stable/api/generated/IPython.lib.pretty.html#extending
+        # Since IPython is not typed, we'll add a type ignore commnent here
+        # The annotation for arg `p` is `IPython.lib.pretty.RepresentationPrinter`
+        p.text(f'{self._get_repr_header()}\n')
+        p.pretty(dict(self))
+
+    def lookup(self, *key: Any) -> CtT | None:
+        """Get the constraint for the specified key, or ``None`` if it is not found.
+
+        Parameters
+        ----------
+        *key : key
+
+        Returns
+        -------
+        docplex.mp.constr.LinearConstraint or ``None``
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-set:
+
+        >>> arcs = IndexSetND([('A', 'B'), ('B', 'C'), ('C', 'B')], names=['ori', 'des'])
+
+        Add variables and constraints:
+
+        >>> from docplex_extensions import add_constraints, add_variables
+        >>> arc_flow = add_variables(mdl, arcs, 'C', name='flow')
+        >>> arc_cap = add_constraints(mdl, arcs, arc_flow, '<=', 10, name='cap')
+
+        Lookup with keys:
+
+        >>> arc_cap.lookup('A', 'B')
+        docplex.mp.LinearConstraint[cap_A_B](flow_A_B,LE,10)
+
+        >>> arc_cap.lookup('X', 'Y') is None
+        True
+        """
+        if any((isinstance(k, Iterable) and not isinstance(k, str)) for k in key):
+            raise TypeError('lookup key must be scalars (no iterables except string)')
+        if len(key) != self._indexset._tuplelen:
+            raise ValueError('lookup key length must be the same as that of N-dim tuple keys')
+        return super().get(cast('ElemNDT', key))
@@ -0,0 +1,315 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Functions to add constraints to a DOcplex model."""
+
+from __future__ import annotations
+
+from collections import abc
+from collections.abc import Callable, Mapping, Sequence
+from itertools import repeat
+from typing import Any, Literal, overload
+
+from docplex.mp.constr import LinearConstraint
+from docplex.mp.mfactory import compile_naming_function, str_flatten_tuple
+from docplex.mp.model import Model
+
+from ._bounds import preprocess_bound
+from ._computed_params import ComputedParamDict1D, ComputedParamDictND
+from ._constr_dicts import ConstraintDict1D, ConstraintDictND
+from ._index_sets import Elem1DT, ElemNDT, IndexSet1D, IndexSetND
+from ._param_dicts import ParamDict1D, ParamDictND, ParamT
+from ._sparse_params import SparseParamDict1D, SparseParamDictND
+
+SenseT = Literal['<=', '>=', '==', 'le', 'ge', 'eq']
+
+# DOcplex model methods to build a constraint for each sense, which do not parse the sense each time
+_SENSES = {
+    '<=': 'le_constraint',
+    'le': 'le_constraint',
+    '>=': 'ge_constraint',
+    'ge': 'ge_constraint',
+    '==': 'eq_constraint',
+    'eq': 'eq_constraint',
+}
+
+
+def _preprocess_rhs(
+    indexset: IndexSet1D[Elem1DT] | IndexSetND[ElemNDT],
+    rhs: int
+    | float
+    | Sequence[int | float]
+    | Callable[..., int | float]
+    | ParamDict1D[Elem1DT, ParamT]
+    | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT],
+) -> int | float | list[int | float]:
+    """Preprocess the right-hand side of constraints.
+
+    Parameters
+    ----------
+    indexset : IndexSet1D or IndexSetND
+        Index-set for defining the constraints.
+    rhs : int or float or sequence or function or ParamDict
+        Right-hand side, in any of the forms accepted by `add_constraints`.
+
+    Returns
+    -------
+    int or float or list[int or float]
+        A number shared by all constraints, or the values aligned with the index-set elements (with
+        ``0`` for elements not found in the keys of a ParamDict).
+
+    Raises
+    ------
+    TypeError
+        If `rhs` is not in any of the accepted forms.
+    ValueError
+        If a sequence does not have one value for each element of the index-set.
+    ValueError
+        If a sequence (or a function) has any ``None`` values.
+    """
+    if isinstance(rhs, int | float):
+        return rhs
+    # Resolve ParamDicts, functions, and NumPy arrays in the same way as variable bounds
+    values: Any = preprocess_bound(indexset, rhs, 'rhs')
+    if isinstance(values, int | float):  # NumPy scalar
+        return values
+    if callable(values):
+        values = list(map(values, indexset._list))
+    if not isinstance(values, Sequence) or isinstance(values, str):
+        raise TypeError('`rhs` should be either a number, sequence, function, or ParamDict')
+    if len(values) != len(indexset):
+        raise ValueError('`rhs` should have one value for each element of the index-set')
+    if isinstance(rhs, abc.Mapping):  # ParamDict, with None for elements not found in its keys
+        return [0 if value is None else value for value in values]
+    if any(value is None for value in values):
+        raise ValueError('`rhs` should not have None values')
+    return list(values)
+
+
+@overload
+def add_constraints(  # numpydoc ignore=GL08
+    model: Model,
+    indexset: IndexSet1D[Elem1DT],
+    lhs: Callable[..., Any] | Mapping[Elem1DT, Any],
+    sense: SenseT,
+    rhs: int
+    | float
+    | Sequence[int | float]
+    | Callable[..., int | float]
+    | ParamDict1D[Elem1DT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT],
+    *,
+    name: str | Callable[..., str] | None = ...,
+    key_format: str | None = ...,
+) -> ConstraintDict1D[Elem1DT, LinearConstraint]: ...
+
+
+@overload
+def add_constraints(  # numpydoc ignore=GL08
+    model: Model,
+    indexset: IndexSetND[ElemNDT],
+    lhs: Callable[..., Any] | Mapping[ElemNDT, Any],
+    sense: SenseT,
+    rhs: int
+    | float
+    | Sequence[int | float]
+    | Callable[..., int | float]
+    | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT],
+    *,
+    name: str | Callable[..., str] | None = ...,
+    key_format: str | None = ...,
+) -> ConstraintDictND[ElemNDT, LinearConstraint]: ...
+
+
+def add_constraints(
+    model: Model,
+    indexset: IndexSet1D[Elem1DT] | IndexSetND[ElemNDT],
+    lhs: Callable[..., Any] | Mapping[Elem1DT, Any] | Mapping[ElemNDT, Any],
+    sense: SenseT,
+    rhs: int
+    | float
+    | Sequence[int | float]
+    | Callable[..., int | float]
+    | ParamDict1D[Elem1DT, ParamT]
+    | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT],
+    *,
+    name: str | Callable[..., str] | None = None,
+    key_format: str | None = None,
+) -> ConstraintDict1D[Elem1DT, LinearConstraint] | ConstraintDictND[ElemNDT, LinearConstraint]:
+    """Create and add multiple linear constraints (corresponding to an index-set) to the model.
+
+    All constraints are built first, and then added to the DOcplex model in a single batch with its
+    `add_constraints` method. The constraints are returned in a ConstraintDict1D/ConstraintDictND
+    data structure - to look them up by key, select subsets based on wildcard patterns, and get
+    their dual values, slack values, and right-hand sides in bulk.
+
+    Parameters
+    ----------
+    model : docplex.mp.model.Model
+        DOcplex model.
+    indexset : IndexSet1D or IndexSetND
+        Index-set for defining the constraints.
+    lhs : function or mapping
+        Left-hand side, in one of the following forms:
+
+        * A function - that returns a linear expression (or a variable, or a number) when called on
+          each element of the index-set.
+        * A mapping (e.g., a VarDict, or the result of `VarDictND.sum_by`) - with keys following
+          the same structure as the index-set elements, and a value for each element of the
+          index-set. For a mapping without values for some elements, use a function instead (e.g.,
+          ``lambda key: mapping.get(key, 0)``).
+
+    sense : {'<=', '>=', '==', 'le', 'ge', 'eq'}
+        Sense of the constraints.
+    rhs : int or float or sequence or function or ParamDict
+        Right-hand side, in one of the following forms:
+
+        * A number - if all constraints share the same right-hand side.
+        * A sequence of numbers (or a NumPy array) - one for each constraint; ``None`` values are
+          not accepted.
+        * A function - that returns a number (not ``None``) when called on each element of the
+          index-set.
+        * A ParamDict - with keys following the same structure as the index-set elements; will
+          fallback to ``0`` for index-set elements not found in ParamDict keys.
+        * A ComputedParamDict - same as a ParamDict, with all values computed at once.
+        * A SparseParamDict - same as a ParamDict, with the default for keys not overridden.
+
+    name : str or function, optional
+        For naming constraints, in one of the following forms:
+
+        * A string - applied as a prefix to the string representation of each element of the
+          index-set.
+        * A function - that generates a name when called on each element of the index-set.
+        * ``None``.
+
+        Default is None.
+
+    key_format : format str (should include '%s'), optional
+        Defines how index-set elements are incorporated into constraint names, by default ``'_%s'``.
+
+    Returns
+    -------
+    ConstraintDict1D or ConstraintDictND
+
+    Raises
+    ------
+    ValueError
+        If the index-set is empty.
+    TypeError
+        If `lhs` is neither a function nor a mapping.
+    ValueError
+        If `lhs` is a mapping without a value for each element of the index-set.
+    ValueError
+        If the sense is invalid.
+    TypeError
+        If `rhs` is not in any of the accepted forms.
+    ValueError
+        If `rhs` is a sequence without one value for each element of the index-set, or with any
+        ``None`` values.
+
+    See Also
+    --------
+    add_variables : For multiple variables (corresponding to an index-set).
+
+    Examples
+    --------
+    Create DOcplex model:
+
+    >>> from docplex.mp.model import Model
+    >>> mdl = Model()
+
+    Create index-sets:
+
+    >>> nodes = IndexSet1D(['A', 'B', 'C'], name='node')
+    >>> arcs = IndexSetND([('A', 'B'), ('B', 'C'), ('C', 'B')], names=['ori', 'des'])
+
+    Add variables:
+
+    >>> from docplex_extensions import add_variables
+    >>> arc_flow = add_variables(mdl, arcs, 'C', name='flow')
+
+    Add flow balance constraints:
+
+    >>> supply = ParamDict1D({'A': 10, 'C': -10})
+    >>> balance = add_constraints(
+    ...     mdl,
+    ...     nodes,
+    ...     lambda node: arc_flow.sum(node, '*') - arc_flow.sum('*', node),
+    ...     '==',
+    ...     supply,
+    ...     name='balance',
+    ... )
+    >>> balance
+    ConstraintDict1D: node -> balance
+    {'A': docplex.mp.LinearConstraint[balance_A](flow_A_B,EQ,10),
+     'B': docplex.mp.LinearConstraint[balance_B](-flow_A_B+flow_B_C-flow_C_B,EQ,0),
+     'C': docplex.mp.LinearConstraint[balance_C](-flow_B_C+flow_C_B,EQ,-10)}
+
+    Add capacity constraints:
+
+    >>> capacity = add_constraints(mdl, arcs, arc_flow, '<=', 8, name='cap')
+    >>> capacity
+    ConstraintDictND: (ori, des) -> cap
+    {('A', 'B'): docplex.mp.LinearConstraint[cap_A_B](flow_A_B,LE,8),
+     ('B', 'C'): docplex.mp.LinearConstraint[cap_B_C](flow_B_C,LE,8),
+     ('C', 'B'): docplex.mp.LinearConstraint[cap_C_B](flow_C_B,LE,8)}
+    """
+    if not isinstance(model, Model):
+        raise TypeError('`model` should be docplex.mp.model.Model')
+    if not isinstance(indexset, IndexSet1D | IndexSetND):
+        raise TypeError('`indexset` should be either IndexSet1D or IndexSetND')
+    if not indexset:
+        raise ValueError(f'{indexset.__class__.__name__} is empty')
+
+    keys: list[Any] = indexset._list
+    if isinstance(lhs, abc.Mapping):
+        try:
+            lhs_values = list(map(lhs.__getitem__, keys))
+        except KeyError:
+            # A constant left-hand side would silently make the constraint trivial or infeasible
+            missing = [key for key in keys if key not in lhs]
+            shown = ', '.join(map(repr, missing[:5])) + (', ...' if len(missing) > 5 else '')
+            raise ValueError(
+                f'`lhs` mapping should have a value for each element of the index-set; '
+                f'missing {len(missing)}: {shown}'
+            ) from None
+    elif callable(lhs):
+        lhs_values = list(map(lhs, keys))
+    else:
+        raise TypeError('`lhs` should be either a function or a mapping')
+
+    if not isinstance(sense, str) or sense.lower() not in _SENSES:
+        raise ValueError(f'`sense` should be one of {", ".join(map(repr, _SENSES))}')
+    new_constraint = getattr(model, _SENSES[sense.lower()])
+
+    rhs_values = _preprocess_rhs(indexset, rhs)
+    if isinstance(rhs_values, int | float):
+        rhs_values = list(repeat(rhs_values, len(keys)))
+
+    # Build all constraints, and add them to the model in one batch
+    cts = list(map(new_constraint, lhs_values, rhs_values))
+    if name is not None and not model.ignore_names:
+        naming = compile_naming_function(
+            keys, name, key_format=key_format, stringifier=str_flatten_tuple
+        )
+        model.add_constraints(cts, list(map(naming, keys)))
+    else:
+        model.add_constraints(cts)
+    docpx_ct_dict = dict(zip(keys, cts, strict=True))
+    value_name = name if isinstance(name, str) else None
+
+    if isinstance(indexset, IndexSet1D):
+        return ConstraintDict1D._create(docpx_ct_dict, indexset, model=model, value_name=value_name)
+    return ConstraintDictND._create(docpx_ct_dict, indexset, model=model, value_name=value_name)
@@ -11,7 +11,7 @@ from collections.abc import Sequence
 from operator import itemgetter
 from typing import Any, Generic, Literal, NoReturn, Protocol, TypeVar
 
-from ._index_sets import Elem1DT, ElemNDT, ElemT, IndexSetBase, IndexSetND
+from ._index_sets import Elem1DT, ElemNDT, ElemT, IndexSetBase, IndexSetND, dim_index
 
 _KT_contra = TypeVar('_KT_contra', contravariant=True)
 _VT_co = TypeVar('_VT_co', covariant=True)
@@ -172,6 +172,61 @@ class DictNDMixin(DictBaseMixin[ElemNDT, ValT], SupportsGetItem[ElemNDT, ValT]):
         else:
             return f'{self.__class__.__name__}:'
 
+    def _dim_index(self, dim: int | str) -> int:
+        """Get the position index of a dimension of N-dim tuple keys.
+
+        Parameters
+        ----------
+        dim : int or str
+            Dimension index (negative values count from the end) or name (one of `key_names`).
+
+        Returns
+        -------
+        int
+            Non-negative dimension index if the Dict is populated.
+
+        Raises
+        ------
+        TypeError
+            If `dim` is not an int or str.
+        ValueError
+            If the dimension is not found.
+        """
+        tuplelen = self._indexset._tuplelen if self._indexset._list else None
+        return dim_index(self.key_names, tuplelen, dim, f'`key_names` of {self.__class__.__name__}')
+
+    def _group_dim_indices(self, dims: tuple[int | str, ...], caller: str) -> tuple[int, ...]:
+        """Get the position indices of dimensions to group keys by.
+
+        Parameters
+        ----------
+        dims : tuple[int or str, ...]
+        caller : str
+            Name of the calling method to refer to in the error message.
+
+        Returns
+        -------
+        tuple[int, ...]
+
+        Raises
+        ------
+        ValueError
+            If all dimensions are given, or any dimension is repeated.
+        ValueError
+            If any dimension is not found.
+        TypeError
+            If any dimension is not an int or str.
+        """
+        indices = tuple(self._dim_index(dim) for dim in dims)
+        if len(set(indices)) != len(indices):
+            raise ValueError('dimensions to keep should not be repeated')
+        if len(indices) == self._indexset._tuplelen:
+            raise ValueError(
+                f'`{caller}` does not work with all dimensions; use the '
+                f'{self.__class__.__name__} directly'
+            )
+        return indices
+
     def subset_keys(self, *pattern: Any) -> list[ElemNDT]:
         """Get a subset of the N-dim tuple keys of the Dict with a wildcard pattern.
 
@@ -0,0 +1,103 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Building pandas DataFrames from keys and values of custom dict subclasses.
+
+Key columns are built from the columnar encoding of keys (as for pickling), so that each categorical
+column is created from its unique values and an array of codes, without any intermediate list of
+rows.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from operator import itemgetter
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, cast
+
+from ._pickling import encode_column, encode_tuples
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from pandas import DataFrame
+
+
+def import_pandas() -> ModuleType:
+    """Import pandas, which is an optional dependency needed to build DataFrames.
+
+    Returns
+    -------
+    module
+
+    Raises
+    ------
+    ImportError
+        If pandas is not installed.
+    """
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError(
+            'Unable to import optional dependency: pandas (required to build DataFrames)'
+        ) from None
+    return pandas
+
+
+def build_frame(
+    keys: list[Any],
+    values: list[Any] | NDArray[Any],
+    *,
+    key_columns: Sequence[str],
+    value_column: str,
+    tuple_keys: bool,
+    categorical: bool,
+) -> DataFrame:
+    """Build a DataFrame with a column for each dimension of keys, and a column of values.
+
+    Parameters
+    ----------
+    keys : list
+        Scalar keys, or tuple keys of length ``len(key_columns)``.
+    values : list or numpy.ndarray
+        Values aligned with keys.
+    key_columns : sequence[str]
+        Names of key columns.
+    value_column : str
+        Name of value column.
+    tuple_keys : bool
+        Whether keys are N-dim tuples instead of 1-dim scalars.
+    categorical : bool
+        Whether key columns are categorical - only for dimensions whose values are all `str` or
+        all `int`; other dimensions are kept as plain values.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Raises
+    ------
+    ValueError
+        If column names are not unique.
+    """
+    pd = import_pandas()
+    columns = [*key_columns, value_column]
+    if len(set(columns)) != len(columns):
+        raise ValueError(f'column names should be unique; got {columns}')
+
+    data: dict[str, Any] = {}
+    if not categorical:
+        if tuple_keys:
+            for dim, name in enumerate(key_columns):
+                data[name] = list(map(itemgetter(dim), keys))
+        else:
+            data[key_columns[0]] = keys
+    else:
+        encoded = encode_tuples(keys, len(key_columns)) if tuple_keys else [encode_column(keys)]
+        for name, (uniques, codes) in zip(key_columns, encoded, strict=True):
+            if codes is None:
+                data[name] = uniques
+            else:
+                data[name] = pd.Categorical.from_codes(codes, categories=uniques)
+    data[value_column] = values
+    return cast('DataFrame', pd.DataFrame(data, columns=columns))
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import inspect
 import sys
+import weakref
 from collections import defaultdict
 from collections.abc import Callable, Collection, Iterable, Iterator, MutableSequence, Sequence
 from datetime import date, datetime
@@ -27,6 +28,8 @@ from typing import (
 
 from typing_extensions import Self, Unpack, override
 
+from ._pickling import Column, decode_tuples, encode_tuples
+
 if TYPE_CHECKING:
     from _typeshed import SupportsRichComparison
     from pandas import Timestamp
@@ -69,10 +72,14 @@ class IndexSetBase(Generic[ElemT]):
     #     List of elements for mutable sequence operations.
     # _set : set
     #     Set of elements for preventing duplicates, faster `in` lookup, and rich comparisons.
+    # _dependents : weakref.WeakValueDictionary or None
+    #     Mappings that reference the IndexSet for their keys (e.g., SparseParamDict), by their
+    #     `id` (as mappings are not hashable), to be notified of removed elements.
 
-    __slots__ = ('_list', '_set')
+    __slots__ = ('_list', '_set', '_dependents')
 
     def __init__(self, elems: list[ElemT] | None = None) -> None:
+        self._dependents: weakref.WeakValueDictionary[int, Any] | None = None
         if elems is not None:
             if self._validate_elements(elems):
                 self._set: set[ElemT] = self._ensure_no_duplicates(elems)
@@ -109,6 +116,30 @@ class IndexSetBase(Generic[ElemT]):
             raise ValueError(f'input introduced duplicates in {self.__class__.__name__}')
         return unique
 
+    def _ensure_no_new_duplicates(self, elems: list[ElemT]) -> set[ElemT]:
+        """Ensure that a list of new elements to add has no duplicates and coerce it to a set.
+
+        Unlike `_ensure_no_duplicates`, existing elements of the IndexSet are not checked again, so
+        the cost is proportional to the number of new elements only.
+
+        Parameters
+        ----------
+        elems : list
+
+        Returns
+        -------
+        set
+
+        Raises
+        ------
+        ValueError
+            If the list has duplicates or any element already present in the IndexSet.
+        """
+        unique = set(elems)
+        if len(elems) > len(unique) or not self._set.isdisjoint(unique):
+            raise ValueError(f'input introduced duplicates in {self.__class__.__name__}')
+        return unique
+
     def _validate_elements(self, elems: list[ElemT]) -> bool:
         """Validate all elements of a list.
 
@@ -132,6 +163,32 @@ class IndexSetBase(Generic[ElemT]):
         elems : list
         """
         self._set.difference_update(elems)
+        self._notify_removed(elems)
+
+    def _add_dependent(self, dependent: Any) -> None:
+        """Register a mapping to be notified of removed elements, with its `_discard_keys` method.
+
+        Only a weak reference is kept, so that the mapping can be garbage collected.
+
+        Parameters
+        ----------
+        dependent : mapping
+        """
+        if self._dependents is None:
+            self._dependents = weakref.WeakValueDictionary()
+        self._dependents[id(dependent)] = dependent
+
+    def _notify_removed(self, elems: list[ElemT]) -> None:
+        """Notify registered mappings of removed elements.
+
+        Parameters
+        ----------
+        elems : list
+            Elements removed from (or replaced in) the IndexSet.
+        """
+        if self._dependents:
+            for dependent in list(self._dependents.values()):
+                dependent._discard_keys(elems)
 
     def _raise_op_not_supported_err(self, op_name: str) -> NoReturn:
         """Raise a type error for an unsupported operation.
@@ -205,9 +262,8 @@ class IndexSetBase(Generic[ElemT]):
                     f'can only concatenate an iterable to {self.__class__.__name__}'
                 ) from None
             if self._validate_elements(lst_other):
-                added = self._list + lst_other
-                self._set = self._ensure_no_duplicates(added)
-                self._list = added
+                self._set.update(self._ensure_no_new_duplicates(lst_other))
+                self._list.extend(lst_other)
         return self
 
     @overload
@@ -241,6 +297,7 @@ class IndexSetBase(Generic[ElemT]):
             except ValueError:
                 self._list[index] = old  # restore the old element
                 raise
+            self._notify_removed([old])
 
     def _setitem_slice(self, index: slice, elem: Iterable[ElemT], /) -> None:
         # __setitem__ implementation for `slice` input.
@@ -257,6 +314,7 @@ class IndexSetBase(Generic[ElemT]):
             except ValueError:
                 self._list = old  # restore the list
                 raise
+            self._notify_removed(old)
 
     @overload
     def __setitem__(self, index: SupportsIndex, elem: ElemT, /) -> None: ...
@@ -353,7 +411,7 @@ class IndexSetBase(Generic[ElemT]):
         """
         new = [elem]
         if self._validate_elements(new):
-            self._set = self._ensure_no_duplicates(self._list + new)
+            self._set.update(self._ensure_no_new_duplicates(new))
             self._list.append(elem)
 
     def extend(self, elems: Iterable[ElemT], /) -> None:
@@ -375,7 +433,7 @@ class IndexSetBase(Generic[ElemT]):
         except TypeError:
             raise TypeError(f'can only extend {self.__class__.__name__} with an iterable') from None
         if self._validate_elements(new):
-            self._set = self._ensure_no_duplicates(self._list + new)
+            self._set.update(self._ensure_no_new_duplicates(new))
             self._list.extend(new)
 
     def insert(self, index: SupportsIndex, elem: ElemT, /) -> None:
@@ -397,7 +455,7 @@ class IndexSetBase(Generic[ElemT]):
             case int():
                 elems = [elem]
                 if self._validate_elements(elems):
-                    self._set = self._ensure_no_duplicates(self._list + elems)
+                    self._set.update(self._ensure_no_new_duplicates(elems))
                     self._list.insert(index, elem)
             case _:
                 raise TypeError(f'position index must be an integer, not {type(index).__name__}')
@@ -446,8 +504,12 @@ class IndexSetBase(Generic[ElemT]):
     def clear(self) -> None:
         """Remove all elements from the IndexSet."""
         if self._list:  # is pouplated
+            # Copy the removed elements only if there are mappings to notify
+            old = self._list.copy() if self._dependents else None
             self._list.clear()
             self._set.clear()
+            if old is not None:
+                self._notify_removed(old)
 
     def sort(
         self,
@@ -548,6 +610,26 @@ class IndexSet1D(IndexSetBase[Elem1DT]):
         else:
             super().__init__(None)
 
+    @classmethod
+    def _create(
+        cls,
+        elems: list[Elem1DT],
+        /,
+        *,
+        name: str | None = None,
+        elems_set: set[Elem1DT] | None = None,
+    ) -> Self:
+        # Private method to construct IndexSet1D from elements that are known to be valid and
+        # unique (e.g., derived from another IndexSet), without any validation checks. A set of the
+        # elements can be given if already known (e.g., copied from another IndexSet, which reuses
+        # the hashes of the elements).
+        instance = cls.__new__(cls)
+        instance.name = name
+        instance._list = elems
+        instance._set = set(elems) if elems_set is None else elems_set
+        instance._dependents = None
+        return instance
+
     @property
     def name(self) -> str | None:
         """Name to refer to 1-dim scalar elements.
@@ -587,6 +669,11 @@ class IndexSet1D(IndexSetBase[Elem1DT]):
         p.text(f'{self._get_repr_header()}\n')
         p.pretty(self._list)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle the elements only once (not both the list and the set), and unpickle without any
+        # validation checks.
+        return (_unpickle_indexset1d, (type(self), self._list, self.name))
+
     @staticmethod
     def _check_allscalars(elems: list[Elem1DT]) -> None:
         """Check if a list contains all 1-dim scalar elements (no iterables except string).
@@ -924,6 +1011,30 @@ class IndexSetND(IndexSetBase[ElemNDT]):
         else:
             super().__init__(None)
 
+    @classmethod
+    def _create(
+        cls,
+        elems: list[ElemNDT],
+        /,
+        *,
+        names: Sequence[str] | None = None,
+        tuplelen: int,
+        elems_set: set[ElemNDT] | None = None,
+    ) -> Self:
+        # Private method to construct IndexSetND from tuple elements that are known to be valid,
+        # unique, and of length `tuplelen` (e.g., derived from another IndexSet), without any
+        # validation checks. A set of the elements can be given if already known (e.g., copied from
+        # another IndexSet, which reuses the hashes of the elements).
+        instance = cls.__new__(cls)
+        instance.names = names
+        instance._index_groups = {}
+        instance._list = elems
+        instance._set = set(elems) if elems_set is None else elems_set
+        instance._dependents = None
+        if elems:  # is populated
+            instance._tuplelen = tuplelen
+        return instance
+
     @property
     def names(self) -> Sequence[str] | None:
         """Names to refer to each dimension of N-dim tuple elements.
@@ -967,6 +1078,13 @@ class IndexSetND(IndexSetBase[ElemNDT]):
         p.text(f'{self._get_repr_header()}\n')
         p.pretty(self._list)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle the elements only once as columns of unique values and codes (see `_pickling`),
+        # and unpickle without any validation checks. The cache of index groups is not pickled.
+        tuplelen = self._tuplelen if self._list else 0
+        columns = encode_tuples(self._list, tuplelen)
+        return (_unpickle_indexsetnd, (type(self), columns, self.names, tuplelen))
+
     def __le__(self, other: Self | tuple[IndexSet1D[Any], ...], /) -> bool:
         """Rich comparsion method as a subset check: self <= other.
 
@@ -1162,6 +1280,37 @@ class IndexSetND(IndexSetBase[ElemNDT]):
 
         return unique
 
+    @override
+    def _ensure_no_new_duplicates(self, elems: list[ElemNDT]) -> set[ElemNDT]:
+        """Ensure that a list of new elements to add has no duplicates and return a set of them.
+
+        Parameters
+        ----------
+        elems : list
+
+        Returns
+        -------
+        set
+
+        Raises
+        ------
+        ValueError
+            If the list has duplicates or any element already present in the IndexSet.
+
+        Notes
+        -----
+        This method is called when new elements are added to the IndexSet. Given that adding new
+        elements will modify the IndexSet, we'll reset the following private attributes:
+        (1) _index_groups : Clear this dict and reconstruct when the user calls `subset` or
+            `squeeze` rather than defining a complicated logic to update it.
+        """
+        unique = super()._ensure_no_new_duplicates(elems)
+
+        if self._index_groups:  # is pouplated
+            self._index_groups.clear()
+
+        return unique
+
     @override
     def _remove_elements(self, elems: list[ElemNDT]) -> None:
         """Remove elements from the IndexSet.
@@ -1421,6 +1570,59 @@ class IndexSetND(IndexSetBase[ElemNDT]):
     )
 
 
+def dim_index(
+    names: Sequence[str] | None, tuplelen: int | None, dim: int | str, names_of: str
+) -> int:
+    """Get the position index of a dimension of N-dim tuples.
+
+    Parameters
+    ----------
+    names : sequence of str or None
+        Names of the dimensions.
+    tuplelen : int or None
+        Length of the tuples (None if not known yet, in which case int `dim` is not validated).
+    dim : int or str
+        Dimension index (negative values count from the end) or name (one of `names`).
+    names_of : str
+        Description of `names` for the error message (e.g. ``'`names` of IndexSetND'``).
+
+    Returns
+    -------
+    int
+        Non-negative dimension index if `tuplelen` is known.
+
+    Raises
+    ------
+    TypeError
+        If `dim` is not an int or str.
+    ValueError
+        If the dimension is not found.
+    """
+    if isinstance(dim, str):
+        if names is None or dim not in names:
+            raise ValueError(f'{dim!r} not found in {names_of}')
+        return list(names).index(dim)
+    if isinstance(dim, int) and not isinstance(dim, bool):
+        if tuplelen is not None and not -tuplelen <= dim < tuplelen:
+            raise ValueError(f'`dim` {dim} is out of range for tuples of length {tuplelen}')
+        return dim if dim >= 0 or tuplelen is None else dim + tuplelen
+    raise TypeError('`dim` should be either int or str')
+
+
+def _unpickle_indexset1d(
+    cls: type[IndexSet1D[Any]], elems: list[Any], name: str | None
+) -> IndexSet1D[Any]:
+    # Reconstruct an unpickled IndexSet1D.
+    return cls._create(elems, name=name)
+
+
+def _unpickle_indexsetnd(
+    cls: type[IndexSetND[Any]], columns: list[Column], names: Sequence[str] | None, tuplelen: int
+) -> IndexSetND[Any]:
+    # Reconstruct an unpickled IndexSetND from columns of unique values and codes.
+    return cls._create(decode_tuples(columns), names=names, tuplelen=tuplelen)
+
+
 # Register as virtual subclass of collections.abc.MutableSequence
 MutableSequence.register(IndexSet1D)
 MutableSequence.register(IndexSetND)
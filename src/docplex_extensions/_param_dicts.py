@@ -6,13 +6,41 @@
 
 from __future__ import annotations
 
+import heapq
+import operator
 import statistics
 from collections import abc
-from collections.abc import Iterable, MutableMapping, Sequence
-from typing import Any, Literal, NoReturn, TypeVar, cast, overload
-
+from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from itertools import compress, repeat
+from typing import TYPE_CHECKING, Any, Literal, NoReturn, TypeVar, cast, overload
+
+from typing_extensions import Self, Unpack
+
+from ._arrays import (
+    NUMERIC_KINDS,
+    as_python_scalar,
+    as_python_values,
+    build_array,
+    build_exact_array,
+    calc_array_stat,
+    calc_group_stat,
+    check_array_value,
+    check_array_values,
+    check_dtype,
+    import_numpy,
+    int_abs_max,
+    int_arith_may_overflow,
+    int_sum_may_overflow,
+)
 from ._dict_mixins import DefaultT, Dict1DMixin, DictBaseMixin, DictNDMixin
+from ._frames import build_frame
 from ._index_sets import Elem1DT, ElemNDT, ElemT, IndexSet1D, IndexSetBase, IndexSetND
+from ._stat_cache import _MISSING, StatCache, StatCacheInfo
+from ._stats import FAST_STAT_FUNCS
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from pandas import DataFrame
 
 ParamT = TypeVar('ParamT', bound=int | float)
 
@@ -23,6 +51,44 @@ class _RAISE_KEYERROR:
 
 _raise_keyerror = _RAISE_KEYERROR()
 
+_ARRAY_STATS = ('sum', 'mean', 'median', 'median_high', 'median_low')
+"""Statistics that are vectorized for array-backed ParamDicts."""
+
+_ARITH_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    'add': operator.add,
+    'sub': operator.sub,
+    'mul': operator.mul,
+    'div': operator.truediv,
+}
+"""Arithmetic operations supported between ParamDicts."""
+
+_JOINS = ('inner', 'left', 'outer')
+"""Join types to align the keys of two ParamDicts."""
+
+JoinT = Literal['inner', 'left', 'outer']
+
+_AGG_FUNCS: dict[str, Callable[[list[Any]], Any]] = {
+    'sum': sum,
+    'mean': FAST_STAT_FUNCS['mean'],
+    'min': min,
+    'max': max,
+    'count': len,
+    'median': FAST_STAT_FUNCS['median'],
+}
+"""Aggregation functions supported for groups of parameter values."""
+
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    'lt': operator.lt,
+    'le': operator.le,
+    'gt': operator.gt,
+    'ge': operator.ge,
+    'eq': operator.eq,
+    'ne': operator.ne,
+}
+"""Comparison predicates supported to filter parameter values."""
+
+AggFuncT = Literal['sum', 'mean', 'min', 'max', 'count', 'median']
+
 
 class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
     """Base class for custom subclasses of `dict` to define parameters.
@@ -35,24 +101,83 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         Input data to be encapsulated in the ParamDict.
     indexset : IndexSetBase
         Keys of mapping encapsulated in an IndexSet.
+    dtype : str, optional
+        Data type of the array-backed storage of parameter values, if any.
     """
 
     # Private attributes
     # ------------------
     # _indexset : IndexSetBase
     #     Index-set of keys.
+    # _array : numpy.ndarray or None
+    #     Contiguous array of parameter values aligned with the positional order of the index-set,
+    #     only for array-backed ParamDicts. It may have extra capacity at the end to allow amortized
+    #     appends; only the first `len(self)` entries are valid.
+    # _positions : dict or None
+    #     Cache of position index of each key in `_array`, only for array-backed ParamDicts.
+    #     Constructed when first needed and reset when keys are removed.
+    # _stat_cache : StatCache or None
+    #     Cache of statistics calculated with parameter values, only if enabled.
+
+    __slots__ = ('_indexset', '_array', '_positions', '_stat_cache')
 
-    __slots__ = ('_indexset',)
+    _value_name: str | None
 
     def __init__(
-        self, mapping: MutableMapping[ElemT, ParamT], /, *, indexset: IndexSetBase[ElemT]
+        self,
+        mapping: MutableMapping[ElemT, ParamT],
+        /,
+        *,
+        indexset: IndexSetBase[ElemT],
+        dtype: str | None = None,
     ) -> None:
         if any(not self._is_valid_value_type(x) for x in mapping.values()):
-            raise TypeError("input mapping's values should be either int or float")
+            values = as_python_values(list(mapping.values()))
+            if values is None:
+                raise TypeError("input mapping's values should be either int or float")
+            mapping = dict(zip(mapping, values, strict=True))
+
+        array = None
+        if dtype is not None:
+            check_dtype(dtype)
+            check_array_values(list(mapping.values()), dtype, "input mapping's values")
+            array = build_array(mapping.values(), dtype, len(mapping))
+
+        self._setup(mapping, indexset=indexset, array=array)
+
+    def _setup(
+        self,
+        mapping: MutableMapping[ElemT, ParamT],
+        /,
+        *,
+        indexset: IndexSetBase[ElemT],
+        array: NDArray[Any] | None,
+    ) -> None:
+        """Set up the storage of the ParamDict, without any validation checks.
 
+        Parameters
+        ----------
+        mapping : dict or dict-like mapping
+            Input data to be encapsulated in the ParamDict.
+        indexset : IndexSetBase
+            Keys of mapping encapsulated in an IndexSet.
+        array : numpy.ndarray or None
+            Array of mapping's values, aligned with the positional order of the index-set, for
+            array-backed storage.
+        """
         self._indexset = indexset
         """Index-set of keys."""
 
+        self._array: NDArray[Any] | None = array
+        """Contiguous array of parameter values aligned with the positional order of the index-set,
+        only for array-backed ParamDicts."""
+
+        self._positions: dict[ElemT, int] | None = None
+        """Cache of position index of each key in the array, only for array-backed ParamDicts."""
+
+        self._stat_cache: StatCache | None = None
+        """Cache of statistics calculated with parameter values, only if enabled."""
+
         super().__init__(mapping)
 
     @staticmethod
@@ -69,22 +194,137 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         """
         return isinstance(value, int | float)
 
+    def _coerce_value(self, value: Any, arg_name: str) -> int | float:
+        """Coerce a value to int or float, accepting NumPy numeric scalars as well.
+
+        Parameters
+        ----------
+        value : Any
+        arg_name : str
+            Name of the argument to refer to in the error message.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        TypeError
+            If `value` is not int or float, or a NumPy numeric scalar.
+        """
+        if not self._is_valid_value_type(value):
+            value = as_python_scalar(value)
+            if not self._is_valid_value_type(value):
+                raise TypeError(f'`{arg_name}` should be either int or float')
+        return cast('int | float', value)
+
+    def _check_array_value(self, value: ParamT, arg_name: str) -> None:
+        """Check if a value is valid for the dtype of the array-backed storage, if any.
+
+        Parameters
+        ----------
+        value : int or float
+        arg_name : str
+            Name of the argument to refer to in the error message.
+
+        Raises
+        ------
+        TypeError
+            If a float is given for an integer dtype.
+        OverflowError
+            If the value is out of the range of the dtype.
+        """
+        if self._array is not None:
+            check_array_value(value, self._array.dtype.name, f'`{arg_name}`')
+
+    def _position(self, key: ElemT) -> int:
+        """Get the position index of a key in the array-backed storage.
+
+        Parameters
+        ----------
+        key : key
+
+        Returns
+        -------
+        int
+        """
+        if self._positions is None:
+            self._positions = {k: i for i, k in enumerate(self)}
+        return self._positions[key]
+
+    def _array_append(self, key: ElemT, value: ParamT) -> None:
+        """Append a value at the end of the array-backed storage, after the key is inserted.
+
+        The array grows geometrically, so that repeated appends take amortized constant time.
+
+        Parameters
+        ----------
+        key : key
+        value : int or float
+        """
+        arr = cast('NDArray[Any]', self._array)
+        pos = len(self) - 1
+        if pos >= arr.shape[0]:
+            np = import_numpy()
+            grown = np.empty(max(2 * arr.shape[0], 8), dtype=arr.dtype)
+            grown[:pos] = arr[:pos]
+            self._array = arr = grown
+        arr[pos] = value
+        if self._positions is not None:
+            self._positions[key] = pos
+
+    def _array_remove(self, key: ElemT) -> None:
+        """Remove the value of a key from the array-backed storage, before the key is removed.
+
+        Parameters
+        ----------
+        key : key
+        """
+        arr = cast('NDArray[Any]', self._array)
+        pos = self._position(key)
+        last = len(self) - 1
+        if pos == last:
+            del cast('dict[ElemT, int]', self._positions)[key]
+        else:
+            arr[pos:last] = arr[pos + 1 : last + 1]
+            self._positions = None  # positions of subsequent keys are shifted
+
+    def _invalidate_stats(self, key: ElemT) -> None:
+        """Invalidate cached statistics affected by a change to the parameter value of a key.
+
+        Parameters
+        ----------
+        key : key
+        """
+        if self._stat_cache is not None:
+            self._stat_cache.invalidate(key)
+
     def __setitem__(self, key: ElemT, value: ParamT, /) -> None:
         # Set `self[key]` to `value`.
-        if self._is_valid_value_type(value):
-            if key in self._indexset:
-                super().__setitem__(key, value)
-            else:
-                try:
-                    self._indexset.append(key)
-                    super().__setitem__(key, value)
-                except Exception as exc:
-                    self._reraise_exc_from_indexset(exc)
+        value = cast('ParamT', self._coerce_value(value, 'value'))
+        self._check_array_value(value, 'value')
+        if key in self._indexset:
+            self._invalidate_stats(key)
+            super().__setitem__(key, value)
+            if self._array is not None:
+                self._array[self._position(key)] = value
         else:
-            raise TypeError('`value` should be either int or float')
+            try:
+                self._indexset.append(key)
+                super().__setitem__(key, value)
+            except Exception as exc:
+                self._reraise_exc_from_indexset(exc)
+            # Only once the key is validated by the index-set (the cache expects valid keys)
+            self._invalidate_stats(key)
+            if self._array is not None:
+                self._array_append(key, value)
 
     def __delitem__(self, key: ElemT, /) -> None:
         # Remove `self[key]`.
+        if key in self:
+            self._invalidate_stats(key)
+            if self._array is not None:
+                self._array_remove(key)
         super().__delitem__(key)
         self._indexset.remove(key)
 
@@ -92,11 +332,32 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         """Remove all items from the ParamDict."""
         super().clear()
         self._indexset.clear()
+        if self._stat_cache is not None:
+            self._stat_cache.clear()
+        if self._array is not None:
+            self._array = self._array[:0].copy()
+            self._positions = None
 
     def copy(self) -> NoReturn:
         """Not supported by ParamDict."""
         self._raise_not_supported_err('copy')
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle the keys only once, with the compact pickling of the index-set, and the values as a
+        # list (the array of array-backed ParamDicts is rebuilt from them). Unpickle without any
+        # validation checks. The cache of statistics is not pickled, only whether it is enabled.
+        return (
+            _unpickle_paramdict,
+            (
+                type(self),
+                self._indexset,
+                list(self.values()),
+                self._get_names(),
+                self.dtype,
+                self._stat_cache is not None,
+            ),
+        )
+
     @overload
     def get(self, key: ElemT, /) -> ParamT | None: ...  # numpydoc ignore=GL08
 
@@ -147,6 +408,9 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
             If key not found in the ParamDict.
         """
         if key in self:
+            self._invalidate_stats(key)
+            if self._array is not None:
+                self._array_remove(key)
             self._indexset.remove(key)
         if isinstance(default, _RAISE_KEYERROR):
             return super().pop(key)
@@ -161,8 +425,11 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         (key, int or float)
             Tuple of key, parameter value.
         """
+        if self._array is not None and self:
+            self._array_remove(next(reversed(self)))
         item = super().popitem()
         self._indexset.remove(item[0])
+        self._invalidate_stats(item[0])
         return item
 
     def setdefault(self, key: ElemT, default: ParamT, /) -> ParamT:
@@ -179,23 +446,1158 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         -------
         int or float
         """
-        if self._is_valid_value_type(default):
-            if key not in self._indexset:
-                try:
-                    self._indexset.append(key)
-                except Exception as exc:
-                    self._reraise_exc_from_indexset(exc)
-            return super().setdefault(key, default)
-        raise TypeError('`default` should be either int or float')
+        default = cast('ParamT', self._coerce_value(default, 'default'))
+        if key not in self._indexset:
+            self._check_array_value(default, 'default')
+            try:
+                self._indexset.append(key)
+            except Exception as exc:
+                self._reraise_exc_from_indexset(exc)
+            self._invalidate_stats(key)
+            value = super().setdefault(key, default)
+            if self._array is not None:
+                self._array_append(key, value)
+            return value
+        return super().setdefault(key, default)
 
     def update(self, *args: Any, **kwargs: Any) -> NoReturn:
         """Not supported by ParamDict."""
         self._raise_not_supported_err('update')
 
-    @classmethod
-    def fromkeys(cls, keys: Any, value: Any = None, /) -> NoReturn:
-        """Not supported by ParamDict."""
-        raise AttributeError(f'`fromkeys` is not supported by {cls.__name__}')
+    @classmethod
+    def fromkeys(cls, keys: Any, value: Any = None, /) -> NoReturn:
+        """Not supported by ParamDict."""
+        raise AttributeError(f'`fromkeys` is not supported by {cls.__name__}')
+
+    @staticmethod
+    def _as_list(obj: Iterable[Any], arg_name: str) -> list[Any]:
+        """Coerce an iterable (including a NumPy array) to a list of Python objects.
+
+        Parameters
+        ----------
+        obj : iterable
+            A 2-dim NumPy array is coerced to a list of tuples (one for each row).
+        arg_name : str
+
+        Returns
+        -------
+        list
+
+        Raises
+        ------
+        TypeError
+            If `obj` is not an iterable.
+        """
+        if hasattr(obj, 'tolist') and hasattr(obj, 'ndim'):  # NumPy array or pandas Series/Index
+            lst: list[Any] = obj.tolist()
+            return list(map(tuple, lst)) if obj.ndim == 2 else lst
+        try:
+            return list(obj)
+        except TypeError:
+            raise TypeError(f'`{arg_name}` should be an iterable') from None
+
+    def _prepare_many(
+        self, keys: Iterable[Any], values: Iterable[Any]
+    ) -> tuple[list[ElemT], list[int | float]]:
+        """Validate keys and values to set many items at once, in a single pass.
+
+        Parameters
+        ----------
+        keys : iterable
+        values : iterable[int or float]
+
+        Returns
+        -------
+        tuple[list, list[int or float]]
+
+        Raises
+        ------
+        TypeError
+            If any value is not int or float.
+        TypeError
+            If any value is float for an array-backed ParamDict with an int data type.
+        OverflowError
+            If any value is out of the range of the data type of an array-backed ParamDict.
+        ValueError
+            If `keys` and `values` are not of the same length.
+        ValueError
+            If `keys` has duplicates.
+        """
+        lst_keys = self._as_list(keys, 'keys')
+        dtype = getattr(values, 'dtype', None)
+        lst_values = self._as_list(values, 'values')
+
+        if len(lst_keys) != len(lst_values):
+            raise ValueError('`keys` and `values` should be of the same length')
+
+        if dtype is not None and getattr(dtype, 'kind', None) in NUMERIC_KINDS:
+            pass  # vectorized check; elements are coerced to int or float
+        elif not all(isinstance(v, int | float) for v in lst_values):
+            coerced = as_python_values(lst_values)
+            if coerced is None:
+                raise TypeError('`values` should be either int or float')
+            lst_values = coerced
+        if self._array is not None:
+            check_array_values(lst_values, self._array.dtype.name, '`values`')
+
+        if len(set(lst_keys)) != len(lst_keys):
+            raise ValueError('`keys` should not have duplicates')
+
+        return lst_keys, lst_values
+
+    def _set_many(
+        self, keys: list[ElemT], values: list[int | float], new_keys: list[ElemT]
+    ) -> None:
+        """Set parameter values for many keys at once, after validation of values.
+
+        Parameters
+        ----------
+        keys : list
+        values : list[int or float]
+        new_keys : list
+            Keys that are not present in the ParamDict, in the same order as in `keys`.
+        """
+        if new_keys:
+            try:
+                self._indexset.extend(new_keys)
+            except Exception as exc:
+                self._reraise_exc_from_indexset(exc)
+
+        if self._stat_cache is not None:
+            self._stat_cache.invalidate_many(keys)
+
+        nexisting = len(self)
+        super().update(zip(keys, cast('list[ParamT]', values), strict=True))
+
+        if self._array is not None:
+            arr = self._array
+            if len(self) > arr.shape[0]:
+                np = import_numpy()
+                grown = np.empty(max(2 * arr.shape[0], len(self), 8), dtype=arr.dtype)
+                grown[:nexisting] = arr[:nexisting]
+                self._array = arr = grown
+            if self._positions is not None:
+                self._positions.update(zip(new_keys, range(nexisting, len(self)), strict=True))
+            if len(new_keys) == len(keys):  # all keys are appended at the end
+                arr[nexisting : len(self)] = values
+            else:
+                arr[list(map(self._position, keys))] = values
+
+    def set_many(self, keys: Iterable[ElemT], values: Iterable[int | float], /) -> None:
+        """Set parameter values for many keys at once, in-place.
+
+        Values of existing keys are updated and new keys are added (in the given order). All checks
+        are done upfront in a single pass - either all or none of the items are set.
+
+        Parameters
+        ----------
+        keys : iterable
+            1-dim scalar keys for ParamDict1D or N-dim tuple keys for ParamDictND. A NumPy array is
+            also accepted (2-dim, with one row for each key, for N-dim tuple keys).
+        values : iterable[int or float]
+            Parameter values aligned with `keys`. A NumPy array of ints or floats is also accepted.
+
+        Raises
+        ------
+        TypeError
+            If any value is not int or float.
+        TypeError
+            If any value is float for an array-backed ParamDict with an int data type.
+        OverflowError
+            If any value is out of the range of the data type of an array-backed ParamDict.
+        ValueError
+            If `keys` and `values` are not of the same length.
+        ValueError
+            If `keys` has duplicates.
+        TypeError
+            If any new key is not a 1-dim scalar for ParamDict1D (or not a tuple for ParamDictND).
+        ValueError
+            If any new key is a tuple of different length than the other keys of ParamDictND.
+
+        Examples
+        --------
+        >>> forecast = ParamDict1D({'JAN': 100, 'FEB': 120})
+        >>> forecast.set_many(['FEB', 'MAR', 'APR'], [125, 130, 90])
+        >>> forecast
+        ParamDict1D:
+        {'JAN': 100, 'FEB': 125, 'MAR': 130, 'APR': 90}
+        """
+        lst_keys, lst_values = self._prepare_many(keys, values)
+        new_keys = [k for k in lst_keys if k not in self]
+        self._set_many(lst_keys, lst_values, new_keys)
+
+    def extend_from(
+        self,
+        other: abc.Mapping[ElemT, int | float] | tuple[Iterable[ElemT], Iterable[int | float]],
+        /,
+    ) -> None:
+        """Extend the ParamDict with new items from a mapping or a pair of keys and values.
+
+        All checks are done upfront in a single pass - either all or none of the items are added.
+
+        Parameters
+        ----------
+        other : mapping or tuple[iterable, iterable[int or float]]
+            New items as a mapping (such as a dict or a ParamDict), or a pair of aligned keys and
+            parameter values (such as NumPy arrays; see `set_many` for details).
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a mapping or a pair of keys and values.
+        ValueError
+            If any key is already present in the ParamDict.
+        TypeError
+            If any value is not int or float.
+        TypeError
+            If any value is float for an array-backed ParamDict with an int data type.
+        OverflowError
+            If any value is out of the range of the data type of an array-backed ParamDict.
+        ValueError
+            If the keys and values are not of the same length.
+        ValueError
+            If the keys have duplicates.
+        TypeError
+            If any key is not a 1-dim scalar for ParamDict1D (or not a tuple for ParamDictND).
+        ValueError
+            If any key is a tuple of different length than the other keys of ParamDictND.
+
+        Examples
+        --------
+        >>> forecast = ParamDictND({('S1', 'JAN'): 100})
+        >>> forecast.extend_from({('S1', 'FEB'): 120, ('S2', 'JAN'): 80})
+        >>> forecast
+        ParamDictND:
+        {('S1', 'JAN'): 100, ('S1', 'FEB'): 120, ('S2', 'JAN'): 80}
+        """
+        if isinstance(other, abc.Mapping):
+            keys: Iterable[Any] = list(other)
+            values: Iterable[Any] = list(other.values())
+        elif isinstance(other, tuple) and len(other) == 2:
+            keys, values = other
+        else:
+            raise TypeError('`other` should be a mapping or a pair of keys and values')
+
+        lst_keys, lst_values = self._prepare_many(keys, values)
+        if any(k in self for k in lst_keys):
+            raise ValueError(f'input introduced keys already present in {self.__class__.__name__}')
+        self._set_many(lst_keys, lst_values, lst_keys)
+
+    @property
+    def dtype(self) -> str | None:
+        """Data type of the array-backed storage of parameter values.
+
+        ``None`` if the ParamDict is not array-backed.
+
+        Returns
+        -------
+        str
+        """
+        return None if self._array is None else self._array.dtype.name
+
+    def values_array(self) -> NDArray[Any]:
+        """Get the parameter values as a NumPy array, aligned with the positional order of keys.
+
+        For an array-backed ParamDict, this is a read-only view of the underlying array without any
+        copy. It reflects any later update to the values of existing keys, but not the insertion or
+        removal of keys. Otherwise, a new array is created from the parameter values.
+
+        Requires NumPy, which is an optional dependency.
+
+        Returns
+        -------
+        numpy.ndarray
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        """
+        if self._array is not None:
+            view = self._array[: len(self)]
+            view.flags.writeable = False
+            return view
+        np = import_numpy()
+        return cast('NDArray[Any]', np.array(list(self.values())))
+
+    def to_frame(self, *, categorical: bool = True) -> DataFrame:
+        """Get the keys and parameter values as a pandas DataFrame, with a column for each.
+
+        Key columns are built from the unique values of each dimension of keys and an array of
+        codes, without any intermediate list of rows. Requires pandas, which is an optional
+        dependency.
+
+        Parameters
+        ----------
+        categorical : bool, default ``True``
+            Whether key columns are categorical (with categories in the order of first occurrence)
+            - only for dimensions whose values are all `str` or all `int`; other dimensions are kept
+            as plain values.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Columns are named after `key_name` or `key_names` (by default ``'key'``, or ``'key_0'``,
+            ``'key_1'``, and so on), followed by `value_name` (by default ``'value'``).
+
+        Raises
+        ------
+        ImportError
+            If pandas is not installed.
+        ValueError
+            If column names are not unique.
+
+        Examples
+        --------
+        >>> demand = ParamDictND(
+        ...     {('P1', 'JAN'): 10, ('P1', 'FEB'): 30, ('P2', 'JAN'): 20},
+        ...     key_names=['PRODUCT', 'PERIOD'],
+        ...     value_name='DEMAND',
+        ... )
+        >>> df = demand.to_frame()
+        >>> df
+          PRODUCT PERIOD  DEMAND
+        0      P1    JAN      10
+        1      P1    FEB      30
+        2      P2    JAN      20
+
+        >>> df['PERIOD'].cat.categories.tolist()
+        ['JAN', 'FEB']
+        """
+        names = self._get_names()
+        tuple_keys = isinstance(self._indexset, IndexSetND)
+        if tuple_keys:
+            key_names = names['key_names']
+            if key_names is None:
+                tuplelen = cast('IndexSetND[Any]', self._indexset)._tuplelen if self else 0
+                key_names = [f'key_{dim}' for dim in range(tuplelen)]
+        else:
+            key_names = ['key' if names['key_name'] is None else names['key_name']]
+        value_name = 'value' if names['value_name'] is None else names['value_name']
+        values = list(self.values()) if self._array is None else self.values_array()
+        return build_frame(
+            self._indexset._list,
+            values,
+            key_columns=key_names,
+            value_column=value_name,
+            tuple_keys=tuple_keys,
+            categorical=categorical,
+        )
+
+    def _derive(
+        self,
+        mapping: dict[ElemT, Any],
+        /,
+        *,
+        array: NDArray[Any] | None = None,
+        keyset: set[ElemT] | None = None,
+    ) -> Self:
+        """Construct a new ParamDict of the same type and key name(s), without validation checks.
+
+        Parameters
+        ----------
+        mapping : dict
+            Keys and values that are known to be valid.
+        array : numpy.ndarray, optional
+            Array of mapping's values for array-backed storage.
+        keyset : set, optional
+            Set of mapping's keys, if already known - a copy of the set of another IndexSet avoids
+            hashing the keys again.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+        """
+        # Implement in subclasses by overloading this method
+        raise NotImplementedError  # pragma: no cover
+
+    def _derive_keys(self, positions: Iterable[int], /) -> IndexSetBase[ElemT]:
+        """Construct a new IndexSet with the keys at given positions, without validation checks.
+
+        Parameters
+        ----------
+        positions : iterable[int]
+            Positions of keys in ascending order.
+
+        Returns
+        -------
+        IndexSet1D or IndexSetND
+        """
+        # Implement in subclasses by overloading this method
+        raise NotImplementedError  # pragma: no cover
+
+    def _get_names(self) -> dict[str, Any]:
+        """Get the key name(s) and value name, as keyword arguments of `_create`.
+
+        Returns
+        -------
+        dict
+        """
+        # Implement in subclasses by overloading this method
+        raise NotImplementedError  # pragma: no cover
+
+    def _select_items(self, positions: list[int] | NDArray[Any], /) -> Self:
+        """Construct a new ParamDict with the items at given positions, without validation checks.
+
+        Parameters
+        ----------
+        positions : list[int] or numpy.ndarray
+            Positions of keys in ascending order.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            Names of keys and values are carried over, and array-backed if the ParamDict is.
+        """
+        keys = self._indexset._list
+        values = list(self.values())
+        mapping = {keys[pos]: values[pos] for pos in positions}
+        array = None if self._array is None else self._array[positions]
+        res = self._derive(mapping, array=array)
+        res._value_name = self._value_name
+        return res
+
+    def _filter_positions(self, mask: Any, comparisons: dict[str, Any]) -> list[int]:
+        """Get the positions of keys whose parameter values satisfy a mask and comparisons.
+
+        Comparisons are vectorized with the array of an array-backed ParamDict, and done in a single
+        pass over the parameter values otherwise.
+
+        Parameters
+        ----------
+        mask : callable or array-like or None
+        comparisons : dict[str, Any]
+            Values to compare with by comparison name (from `_COMPARISONS`); None if not given.
+
+        Returns
+        -------
+        list[int]
+            Positions of keys in ascending order.
+
+        Raises
+        ------
+        ValueError
+            If neither a mask nor a comparison is given.
+        TypeError
+            If any value to compare with is not int or float.
+        ValueError
+            If the mask does not have one bool for each key.
+        """
+        preds = []
+        for name, other in comparisons.items():
+            if other is not None:
+                preds.append((_COMPARISONS[name], self._coerce_value(other, name)))
+        if mask is None and not preds:
+            raise ValueError('either `mask` or a comparison is required')
+
+        if mask is None and self._array is None:
+            if len(preds) == 1:
+                op, other = preds[0]
+                return [pos for pos, value in enumerate(self.values()) if op(value, other)]
+            return [
+                pos
+                for pos, value in enumerate(self.values())
+                if all(op(value, other) for op, other in preds)
+            ]
+
+        np = import_numpy()
+        arr = self.values_array()
+        if mask is None:
+            selected = np.ones(len(self), dtype=bool)
+        else:
+            selected = np.asarray(mask(arr) if callable(mask) else mask)
+            if selected.dtype != np.bool_ or selected.shape != (len(self),):
+                raise ValueError('`mask` should be a bool array with one value for each key')
+        for op, other in preds:
+            selected = selected & op(arr, other)
+        return cast('list[int]', np.flatnonzero(selected).tolist())
+
+    def filter(
+        self,
+        mask: Callable[[NDArray[Any]], Any] | Iterable[bool] | None = None,
+        /,
+        *,
+        lt: int | float | None = None,
+        le: int | float | None = None,
+        gt: int | float | None = None,
+        ge: int | float | None = None,
+        eq: int | float | None = None,
+        ne: int | float | None = None,
+    ) -> Self:
+        """Get the items whose parameter values satisfy a mask and/or comparisons as a ParamDict.
+
+        The new ParamDict reuses the keys of the ParamDict without any validation checks, since they
+        are known to be valid and unique.
+
+        Parameters
+        ----------
+        mask : callable or array-like of bool, optional
+            Vectorized function that takes the array of parameter values (see `values_array`) and
+            returns a bool array, or such a bool array directly - with one value for each key, in
+            the positional order of keys. Requires NumPy, which is an optional dependency.
+        lt, le, gt, ge, eq, ne : int or float, optional
+            Keep the items whose parameter value is less than, less than or equal to, greater than,
+            greater than or equal to, equal to, or not equal to the given value. Vectorized for an
+            array-backed ParamDict, and a single pass over the parameter values otherwise.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            Items that satisfy the mask and all comparisons, in the same order as in the ParamDict.
+            Names of keys and values are carried over, and array-backed if the ParamDict is.
+
+        Raises
+        ------
+        ValueError
+            If neither a mask nor a comparison is given.
+        TypeError
+            If any value to compare with is not int or float.
+        ValueError
+            If the mask does not have one bool for each key.
+        ImportError
+            If `mask` is given and NumPy is not installed.
+
+        See Also
+        --------
+        filter_keys : For the keys as an IndexSet.
+
+        Examples
+        --------
+        >>> capacity = ParamDict1D(
+        ...     {'P1': 100, 'P2': 0, 'P3': 50}, key_name='PLANT', value_name='CAPACITY'
+        ... )
+        >>> capacity.filter(gt=0)
+        ParamDict1D: PLANT -> CAPACITY
+        {'P1': 100, 'P3': 50}
+
+        With a vectorized mask:
+
+        >>> import numpy as np
+        >>> cost = ParamDictND({('A', 1): 2.5, ('A', 2): float('inf'), ('B', 1): 4.0})
+        >>> cost.filter(np.isfinite, lt=3)
+        ParamDictND:
+        {('A', 1): 2.5}
+        """
+        comparisons = {'lt': lt, 'le': le, 'gt': gt, 'ge': ge, 'eq': eq, 'ne': ne}
+        return self._select_items(self._filter_positions(mask, comparisons))
+
+    def filter_keys(
+        self,
+        mask: Callable[[NDArray[Any]], Any] | Iterable[bool] | None = None,
+        /,
+        *,
+        lt: int | float | None = None,
+        le: int | float | None = None,
+        gt: int | float | None = None,
+        ge: int | float | None = None,
+        eq: int | float | None = None,
+        ne: int | float | None = None,
+    ) -> IndexSetBase[ElemT]:
+        """Get the keys whose parameter values satisfy a mask and/or comparisons, as an IndexSet.
+
+        The IndexSet reuses the keys of the ParamDict without any validation checks, since they are
+        known to be valid and unique. It can be used directly to add variables (or constraints) only
+        for the selected keys.
+
+        Parameters
+        ----------
+        mask : callable or array-like of bool, optional
+            Vectorized function that takes the array of parameter values (see `values_array`) and
+            returns a bool array, or such a bool array directly - with one value for each key, in
+            the positional order of keys. Requires NumPy, which is an optional dependency.
+        lt, le, gt, ge, eq, ne : int or float, optional
+            Keep the keys whose parameter value is less than, less than or equal to, greater than,
+            greater than or equal to, equal to, or not equal to the given value. Vectorized for an
+            array-backed ParamDict, and a single pass over the parameter values otherwise.
+
+        Returns
+        -------
+        IndexSet1D or IndexSetND
+            IndexSet1D for ParamDict1D (with `key_name` as name) and IndexSetND for ParamDictND
+            (with `key_names` as names), in the same order as in the ParamDict.
+
+        Raises
+        ------
+        ValueError
+            If neither a mask nor a comparison is given.
+        TypeError
+            If any value to compare with is not int or float.
+        ValueError
+            If the mask does not have one bool for each key.
+        ImportError
+            If `mask` is given and NumPy is not installed.
+
+        See Also
+        --------
+        filter : For the items as a ParamDict.
+
+        Examples
+        --------
+        >>> capacity = ParamDictND(
+        ...     {('P1', 'JAN'): 100, ('P1', 'FEB'): 0, ('P2', 'JAN'): 50},
+        ...     key_names=['PLANT', 'PERIOD'],
+        ... )
+        >>> capacity.filter_keys(gt=0)
+        IndexSetND: (PLANT, PERIOD)
+        [('P1', 'JAN'), ('P2', 'JAN')]
+        """
+        comparisons = {'lt': lt, 'le': le, 'gt': gt, 'ge': ge, 'eq': eq, 'ne': ne}
+        return self._derive_keys(self._filter_positions(mask, comparisons))
+
+    @staticmethod
+    def _get_all(
+        mapping: ParamDictBase[Any, Any], keys: list[Any], fill_value: int | float | None
+    ) -> list[int | float]:
+        """Get the parameter values of a ParamDict for a list of keys, with a fill value if missing.
+
+        Parameters
+        ----------
+        mapping : ParamDict1D or ParamDictND
+        keys : list
+        fill_value : int or float or None
+
+        Returns
+        -------
+        list[int or float]
+
+        Raises
+        ------
+        ValueError
+            If any key is missing and no fill value is given.
+        """
+        if fill_value is None:
+            try:
+                return list(map(mapping.__getitem__, keys))
+            except KeyError:
+                raise ValueError('`fill_value` is required since keys are not aligned') from None
+        n = len(keys)
+        return list(map(dict.get, repeat(mapping, n), keys, repeat(fill_value, n)))
+
+    def _align(
+        self, other: ParamDictBase[Any, Any], join: JoinT, fill_value: int | float | None
+    ) -> tuple[list[Any], list[Any], list[int | float]]:
+        """Align the keys of two ParamDicts of the same type and get their parameter values.
+
+        Parameters
+        ----------
+        other : ParamDict1D or ParamDictND
+        join : {'inner', 'left', 'outer'}
+        fill_value : int or float or None
+
+        Returns
+        -------
+        tuple[list, list[int or float], list[int or float]]
+            Aligned keys, values of `self`, and values of `other`.
+        """
+        if self._indexset._list == other._indexset._list:  # same keys in the same order
+            return self._indexset._list, list(self.values()), list(other.values())
+
+        match join:
+            case 'inner':
+                keys = [k for k in self if k in other]
+                return keys, self._get_all(self, keys, None), self._get_all(other, keys, None)
+            case 'left':
+                keys = list(self)
+                return keys, list(self.values()), self._get_all(other, keys, fill_value)
+            case _:  # outer
+                keys = list(self)
+                keys.extend(k for k in other if k not in self)
+                return (
+                    keys,
+                    self._get_all(self, keys, fill_value),
+                    self._get_all(other, keys, fill_value),
+                )
+
+    def _arith(
+        self,
+        other: int | float | ParamDictBase[Any, Any],
+        op_name: str,
+        *,
+        join: JoinT,
+        fill_value: int | float | None,
+        dim: int | str | None,
+        reflected: bool = False,
+    ) -> Self:
+        """Perform an arithmetic operation with a number or another ParamDict aligned on keys.
+
+        Parameters
+        ----------
+        other : int or float or ParamDict1D or ParamDictND
+        op_name : str
+            One of `'add'`, `'sub'`, `'mul'`, or `'div'`.
+        join : {'inner', 'left', 'outer'}
+        fill_value : int or float or None
+        dim : int or str or None
+        reflected : bool, default ``False``
+            Whether `other` is the left operand.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+        """
+        if join not in _JOINS:
+            raise ValueError(f'`join` should be one of {", ".join(map(repr, _JOINS))}')
+        if fill_value is not None and not isinstance(fill_value, int | float):
+            raise TypeError('`fill_value` should be either int or float')
+
+        if isinstance(other, ParamDictBase):
+            if isinstance(self, ParamDict1D) and isinstance(other, ParamDictND):
+                # Broadcasting is done from the perspective of ParamDictND
+                return other._arith(  # type: ignore[return-value]
+                    self,
+                    op_name,
+                    join=join,
+                    fill_value=fill_value,
+                    dim=dim,
+                    reflected=not reflected,
+                )
+            if (
+                self._array is not None
+                and other._array is not None
+                and type(self) is type(other)
+                and self._indexset._list == other._indexset._list
+            ):
+                # Same keys in the same order: operate directly on the arrays
+                n = len(self)
+                return self._arith_arrays(
+                    self._array[:n], other._array[:n], op_name, reflected=reflected
+                )
+            if isinstance(self, ParamDictND) and isinstance(other, ParamDict1D):
+                return self._arith_broadcast(
+                    other, op_name, join=join, fill_value=fill_value, dim=dim, reflected=reflected
+                )
+            else:
+                if (
+                    isinstance(self, ParamDictND)
+                    and isinstance(other, ParamDictND)
+                    and self
+                    and other
+                    and self._indexset._tuplelen != other._indexset._tuplelen
+                ):
+                    raise ValueError('keys of both ParamDictND should be tuples of the same length')
+                keys, lvals, rvals = self._align(other, join, fill_value)
+            array_backed = self._array is not None or other._array is not None
+        elif isinstance(other, int | float):
+            if self._array is not None:
+                return self._arith_arrays(
+                    self._array[: len(self)], other, op_name, reflected=reflected
+                )
+            keys, lvals = self._indexset._list, list(self.values())
+            rvals = [other] * len(keys)
+            array_backed = False
+        else:
+            raise TypeError('`other` should be either int or float or ParamDict')
+
+        if array_backed:
+            np = import_numpy()
+            return self._arith_arrays(
+                np.array(lvals), np.array(rvals), op_name, reflected=reflected, keys=keys
+            )
+
+        if reflected:
+            lvals, rvals = rvals, lvals
+        values = list(map(_ARITH_OPS[op_name], lvals, rvals))
+        keyset = self._indexset._set.copy() if keys is self._indexset._list else None
+        return self._derive(dict(zip(keys, values, strict=True)), keyset=keyset)
+
+    def _arith_arrays(
+        self,
+        larr: NDArray[Any],
+        rarr: NDArray[Any] | int | float,
+        op_name: str,
+        *,
+        reflected: bool,
+        keys: list[Any] | None = None,
+        keyset: set[Any] | None = None,
+    ) -> Self:
+        """Perform a vectorized arithmetic operation with aligned arrays.
+
+        Parameters
+        ----------
+        larr : numpy.ndarray
+            Array of values of `self`.
+        rarr : numpy.ndarray or int or float
+            Array of values of the other operand, or a number.
+        op_name : str
+            One of `'add'`, `'sub'`, `'mul'`, or `'div'`.
+        reflected : bool
+            Whether the other operand is the left operand.
+        keys : list, optional
+            Keys aligned with the arrays; by default, the keys of `self`.
+        keyset : set, optional
+            Set of `keys`, if already known.
+
+        Integer values are calculated exactly if they could overflow in int64.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            Array-backed, unless any integer value is out of the int64 range.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any divisor is zero.
+        """
+        np = import_numpy()
+        if reflected:
+            larr, rarr = rarr, larr  # type: ignore[assignment]
+        if op_name == 'div' and np.any(np.equal(rarr, 0)):
+            raise ZeroDivisionError('division by zero')
+        if keys is None:
+            keys = self._indexset._list
+            keyset = self._indexset._set.copy()
+
+        if int_arith_may_overflow(larr, rarr, op_name):
+            # Calculate exactly with Python ints, as for ParamDicts that are not array-backed
+            n = len(keys)
+            lvals = repeat(larr, n) if isinstance(larr, int | float) else larr.tolist()
+            rvals = repeat(rarr, n) if isinstance(rarr, int | float) else rarr.tolist()
+            values = list(map(_ARITH_OPS[op_name], lvals, rvals))
+            return self._derive(
+                dict(zip(keys, values, strict=True)),
+                array=build_exact_array(values),
+                keyset=keyset,
+            )
+
+        array = np.asarray(_ARITH_OPS[op_name](larr, rarr))
+        array = array.astype('int64' if array.dtype.kind in 'iu' else 'float64', copy=False)
+        return self._derive(
+            dict(zip(keys, array.tolist(), strict=True)), array=array, keyset=keyset
+        )
+
+    def add(
+        self,
+        other: int | float | ParamDictBase[Any, Any],
+        /,
+        *,
+        join: JoinT = 'inner',
+        fill_value: int | float | None = None,
+        dim: int | str | None = None,
+    ) -> Self:
+        """Add a number or another ParamDict, aligned on keys, to get a new ParamDict.
+
+        Also available as the ``+`` operator, with the default arguments.
+
+        Parameters
+        ----------
+        other : int or float or ParamDict1D or ParamDictND
+            The other operand, in one of the following forms:
+
+            * A number - applied to all parameter values.
+            * A ParamDict of the same type - aligned on keys.
+            * A ParamDict1D with a ParamDictND (or vice versa) - the ParamDict1D is broadcast over
+              a dimension of the N-dim tuple keys of the ParamDictND.
+
+        join : {'inner', 'left', 'outer'}, default ``'inner'``
+            How to align the keys of two ParamDicts:
+
+            * ``'inner'``: Only the keys present in both.
+            * ``'left'``: All keys of the left operand.
+            * ``'outer'``: All keys present in either.
+
+            When broadcasting, ``'left'`` and ``'outer'`` keep all keys of the ParamDictND.
+        fill_value : int or float, optional
+            Parameter value to use for keys that are missing in one of the ParamDicts; required
+            with ``'left'`` or ``'outer'`` join when the keys are not aligned.
+        dim : int or str, optional
+            When broadcasting, the dimension index or name (one of `key_names`) of the ParamDictND
+            to match with the keys of the ParamDict1D. By default, the dimension having the same
+            name as the `key_name` of ParamDict1D.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            With the key name(s) of the left operand; the result of broadcasting is always a
+            ParamDictND. Array-backed if any of the operands is array-backed.
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a number or a ParamDict.
+        ValueError
+            If `join` is invalid.
+        ValueError
+            If the keys are not aligned and no `fill_value` is given with ``'left'`` or ``'outer'``
+            join.
+        ValueError
+            If the dimension to broadcast over is not found.
+
+        Examples
+        --------
+        >>> supply = ParamDict1D({'A': 10, 'B': 20, 'C': 5}, key_name='NODE')
+        >>> demand = ParamDict1D({'A': 4, 'C': 8, 'D': 3}, key_name='NODE')
+        >>> supply.add(demand)
+        ParamDict1D:
+        {'A': 14, 'C': 13}
+        >>> supply.add(demand, join='outer', fill_value=0)
+        ParamDict1D:
+        {'A': 14, 'B': 20, 'C': 13, 'D': 3}
+        >>> supply + 1
+        ParamDict1D:
+        {'A': 11, 'B': 21, 'C': 6}
+        """
+        return self._arith(other, 'add', join=join, fill_value=fill_value, dim=dim)
+
+    def sub(
+        self,
+        other: int | float | ParamDictBase[Any, Any],
+        /,
+        *,
+        join: JoinT = 'inner',
+        fill_value: int | float | None = None,
+        dim: int | str | None = None,
+    ) -> Self:
+        """Subtract a number or another ParamDict, aligned on keys, to get a new ParamDict.
+
+        Also available as the ``-`` operator, with the default arguments.
+
+        Parameters
+        ----------
+        other : int or float or ParamDict1D or ParamDictND
+            The other operand; see `add` for details.
+        join : {'inner', 'left', 'outer'}, default ``'inner'``
+            How to align the keys of two ParamDicts; see `add` for details.
+        fill_value : int or float, optional
+            Parameter value to use for keys that are missing in one of the ParamDicts; see `add`
+            for details.
+        dim : int or str, optional
+            When broadcasting, the dimension index or name of the ParamDictND; see `add` for
+            details.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a number or a ParamDict.
+        ValueError
+            If `join` is invalid.
+        ValueError
+            If the keys are not aligned and no `fill_value` is given with ``'left'`` or ``'outer'``
+            join.
+        ValueError
+            If the dimension to broadcast over is not found.
+
+        Examples
+        --------
+        >>> supply = ParamDict1D({'A': 10, 'B': 20, 'C': 5}, key_name='NODE')
+        >>> demand = ParamDict1D({'A': 4, 'C': 8, 'D': 3}, key_name='NODE')
+        >>> supply - demand
+        ParamDict1D:
+        {'A': 6, 'C': -3}
+        >>> supply.sub(demand, join='left', fill_value=0)
+        ParamDict1D:
+        {'A': 6, 'B': 20, 'C': -3}
+        """
+        return self._arith(other, 'sub', join=join, fill_value=fill_value, dim=dim)
+
+    def mul(
+        self,
+        other: int | float | ParamDictBase[Any, Any],
+        /,
+        *,
+        join: JoinT = 'inner',
+        fill_value: int | float | None = None,
+        dim: int | str | None = None,
+    ) -> Self:
+        """Multiply by a number or another ParamDict, aligned on keys, to get a new ParamDict.
+
+        Also available as the ``*`` operator, with the default arguments.
+
+        Parameters
+        ----------
+        other : int or float or ParamDict1D or ParamDictND
+            The other operand; see `add` for details.
+        join : {'inner', 'left', 'outer'}, default ``'inner'``
+            How to align the keys of two ParamDicts; see `add` for details.
+        fill_value : int or float, optional
+            Parameter value to use for keys that are missing in one of the ParamDicts; see `add`
+            for details.
+        dim : int or str, optional
+            When broadcasting, the dimension index or name of the ParamDictND; see `add` for
+            details.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a number or a ParamDict.
+        ValueError
+            If `join` is invalid.
+        ValueError
+            If the keys are not aligned and no `fill_value` is given with ``'left'`` or ``'outer'``
+            join.
+        ValueError
+            If the dimension to broadcast over is not found.
+
+        Examples
+        --------
+        >>> dist = ParamDictND(
+        ...     {('A', 'B', 'road'): 10, ('A', 'B', 'rail'): 12, ('B', 'C', 'road'): 5},
+        ...     key_names=['ORI', 'DES', 'MODE'],
+        ... )
+        >>> rate = ParamDict1D({'road': 2.0, 'rail': 1.5}, key_name='MODE')
+        >>> dist * rate
+        ParamDictND:
+        {('A', 'B', 'road'): 20.0, ('A', 'B', 'rail'): 18.0, ('B', 'C', 'road'): 10.0}
+        """
+        return self._arith(other, 'mul', join=join, fill_value=fill_value, dim=dim)
+
+    def div(
+        self,
+        other: int | float | ParamDictBase[Any, Any],
+        /,
+        *,
+        join: JoinT = 'inner',
+        fill_value: int | float | None = None,
+        dim: int | str | None = None,
+    ) -> Self:
+        """Divide by a number or another ParamDict, aligned on keys, to get a new ParamDict.
+
+        Also available as the ``/`` operator, with the default arguments.
+
+        Parameters
+        ----------
+        other : int or float or ParamDict1D or ParamDictND
+            The other operand; see `add` for details.
+        join : {'inner', 'left', 'outer'}, default ``'inner'``
+            How to align the keys of two ParamDicts; see `add` for details.
+        fill_value : int or float, optional
+            Parameter value to use for keys that are missing in one of the ParamDicts; see `add`
+            for details.
+        dim : int or str, optional
+            When broadcasting, the dimension index or name of the ParamDictND; see `add` for
+            details.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a number or a ParamDict.
+        ValueError
+            If `join` is invalid.
+        ValueError
+            If the keys are not aligned and no `fill_value` is given with ``'left'`` or ``'outer'``
+            join.
+        ValueError
+            If the dimension to broadcast over is not found.
+        ZeroDivisionError
+            If any divisor is zero.
+
+        Examples
+        --------
+        >>> cost = ParamDict1D({'A': 10, 'B': 30})
+        >>> units = ParamDict1D({'A': 4, 'B': 10})
+        >>> cost / units
+        ParamDict1D:
+        {'A': 2.5, 'B': 3.0}
+        """
+        return self._arith(other, 'div', join=join, fill_value=fill_value, dim=dim)
+
+    def dot(
+        self, other: ParamDictBase[Any, Any], /, *, dim: int | str | None = None
+    ) -> int | float:
+        """Calculate the sum of products of parameter values with another ParamDict.
+
+        Only the keys present in both ParamDicts contribute to the sum.
+
+        Parameters
+        ----------
+        other : ParamDict1D or ParamDictND
+            The other ParamDict; a ParamDict1D with a ParamDictND (or vice versa) is broadcast as
+            in `mul`.
+        dim : int or str, optional
+            When broadcasting, the dimension index or name of the ParamDictND; see `add` for
+            details.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a ParamDict.
+        ValueError
+            If the dimension to broadcast over is not found.
+
+        Examples
+        --------
+        >>> price = ParamDict1D({'chair': 20, 'table': 100, 'sofa': 300})
+        >>> units = ParamDict1D({'chair': 4, 'table': 1})
+        >>> price.dot(units)
+        180
+        """
+        if not isinstance(other, ParamDictBase):
+            raise TypeError('`other` should be a ParamDict')
+        if self._array is not None and other._array is not None:
+            if self._indexset._list == other._indexset._list:  # same keys in the same order
+                n = len(self)
+                larr, rarr = self._array[:n], other._array[:n]
+                is_int = larr.dtype.kind in 'iu' and rarr.dtype.kind in 'iu'
+                if is_int and n and int_sum_may_overflow(larr, int_abs_max(rarr)):
+                    # Python ints are exact, where int64 could overflow
+                    return cast('int', sum(map(operator.mul, larr.tolist(), rarr.tolist())))
+                return cast('int | float', larr.dot(rarr).item())
+        res = self._arith(other, 'mul', join='inner', fill_value=None, dim=dim)
+        return cast('int | float', sum(res.values()))
+
+    def __add__(self, other: int | float | ParamDictBase[Any, Any], /) -> Self:
+        # Add `other` to `self`.
+        if not isinstance(other, int | float | ParamDictBase):
+            return NotImplemented
+        return self.add(other)
+
+    def __radd__(self, other: int | float, /) -> Self:
+        # Add `self` to `other`.
+        if not isinstance(other, int | float):
+            return NotImplemented
+        return self.add(other)
+
+    def __sub__(self, other: int | float | ParamDictBase[Any, Any], /) -> Self:
+        # Subtract `other` from `self`.
+        if not isinstance(other, int | float | ParamDictBase):
+            return NotImplemented
+        return self.sub(other)
+
+    def __rsub__(self, other: int | float, /) -> Self:
+        # Subtract `self` from `other`.
+        if not isinstance(other, int | float):
+            return NotImplemented
+        return self._arith(other, 'sub', join='inner', fill_value=None, dim=None, reflected=True)
+
+    def __mul__(self, other: int | float | ParamDictBase[Any, Any], /) -> Self:
+        # Multiply `self` by `other`.
+        if not isinstance(other, int | float | ParamDictBase):
+            return NotImplemented
+        return self.mul(other)
+
+    def __rmul__(self, other: int | float, /) -> Self:
+        # Multiply `other` by `self`.
+        if not isinstance(other, int | float):
+            return NotImplemented
+        return self.mul(other)
+
+    def __truediv__(self, other: int | float | ParamDictBase[Any, Any], /) -> Self:
+        # Divide `self` by `other`.
+        if not isinstance(other, int | float | ParamDictBase):
+            return NotImplemented
+        return self.div(other)
+
+    def __rtruediv__(self, other: int | float, /) -> Self:
+        # Divide `other` by `self`.
+        if not isinstance(other, int | float):
+            return NotImplemented
+        return self._arith(other, 'div', join='inner', fill_value=None, dim=None, reflected=True)
 
     def _check_for_calc_stat(self, stat_func: str) -> None:
         """Perform validation checks before calculating a statistic with parameter values.
@@ -220,35 +1622,124 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
                 'Cannot calculate `%s` as the ParamDict is empty', stat_func
             )
 
-    def _calc_stat_all(self, stat_func: str) -> int | float:
+    def _calc_stat_all(self, stat_func: str, exact: bool = False) -> int | float:
         """Calculate a statistic with all parameter values.
 
         Supports `builtins.sum` and any statistical function provided in the `statistics` module of
-        the standard library.
+        the standard library. Unless `exact`, the sum, mean, and median variants are calculated with
+        fast reducers - vectorized over the underlying array for array-backed ParamDicts.
 
         Parameters
         ----------
         stat_func : str
             Either `'sum'` or the name of the statistical function from the `statistics` module of
             the standard library.
+        exact : bool, default ``False``
+            Whether to calculate with the `statistics` module of the standard library.
 
         Returns
         -------
         int or float
         """
         if stat_func == 'sum':
-            res: int | float = sum(self.values())
-        elif stat_func != 'sum':
+            if self._array is not None and not exact:
+                res: int | float = calc_array_stat(self._array[: len(self)], stat_func)
+            else:
+                res = sum(self.values())
+        elif exact or stat_func not in FAST_STAT_FUNCS:
             res = getattr(statistics, stat_func)(self.values())
+        elif self._array is not None:
+            res = calc_array_stat(self._array[: len(self)], stat_func)
+        else:
+            res = FAST_STAT_FUNCS[stat_func](list(self.values()))
+
+        return res
 
+    def _calc_stat_cached(
+        self,
+        pattern: tuple[Any, ...],
+        stat_func: str,
+        exact: bool,
+        calc: Callable[[], int | float],
+    ) -> int | float:
+        """Get a statistic from the cache of statistics if enabled, or calculate it.
+
+        Parameters
+        ----------
+        pattern : tuple
+            Wildcard pattern; empty for a statistic with all parameter values.
+        stat_func : str
+        exact : bool
+        calc : callable
+            Function to calculate the statistic on a cache miss.
+
+        Returns
+        -------
+        int or float
+        """
+        cache = self._stat_cache
+        if cache is None:
+            return calc()
+
+        cache_key = (stat_func, exact, pattern)
+        try:
+            res = cache.lookup(cache_key)
+        except TypeError:  # unhashable pattern, which fails validation with `calc`
+            return calc()
+        if isinstance(res, _MISSING):
+            res = calc()
+            cache.store(cache_key, pattern, res)
         return res
 
+    def enable_stat_cache(self) -> None:
+        """Enable the cache of statistics calculated with parameter values.
+
+        Results of `sum`, `mean`, and the median variants (with the same wildcard pattern, if any)
+        are cached and reused on repeated calls. When keys are set or removed, only the results of
+        patterns that match the changed keys are invalidated. Enabling is a no-op if the cache is
+        already enabled.
+
+        Examples
+        --------
+        >>> demand = ParamDictND({('A', 1): 10, ('A', 2): 20, ('B', 1): 15})
+        >>> demand.enable_stat_cache()
+        >>> demand.sum('A', '*'), demand.sum('B', '*'), demand.sum('A', '*')
+        (30, 15, 30)
+        >>> demand.stat_cache_info()
+        StatCacheInfo(hits=1, misses=2, currsize=2)
+
+        Setting a key only invalidates results of patterns that match it:
+
+        >>> demand['B', 2] = 5
+        >>> demand.stat_cache_info()
+        StatCacheInfo(hits=1, misses=2, currsize=1)
+        """
+        if self._stat_cache is None:
+            self._stat_cache = StatCache()
+
+    def disable_stat_cache(self) -> None:
+        """Disable the cache of statistics, and discard all cached results and counters."""
+        self._stat_cache = None
+
+    def stat_cache_info(self) -> StatCacheInfo | None:
+        """Get the number of hits, misses, and cached results of the cache of statistics.
+
+        Returns
+        -------
+        StatCacheInfo or None
+            Named tuple of ``(hits, misses, currsize)``, or None if the cache is not enabled.
+        """
+        if self._stat_cache is None:
+            return None
+        return self._stat_cache.info()
+
 
 class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
     """Custom subclass of `dict` to define parameters with 1-dim scalar keys.
 
     Requires all keys to be unique scalars (such as `int`, `str`, `pd.Timestamp`, etc.) and all
-    values to be `int` or `float`.
+    values to be `int` or `float`. NumPy numeric scalars (such as `numpy.float32` or `numpy.int64`)
+    are also accepted, and stored as the equivalent Python `int` or `float`.
 
     Parameters
     ----------
@@ -258,6 +1749,11 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         Name to refer to 1-dim scalar keys - not used internally, and solely for user reference.
     value_name : str, optional
         Name to refer to parameter values - not used internally, and solely for user reference.
+    dtype : {'float64', 'int64'}, optional
+        Data type for array-backed storage. If specified, parameter values are also kept in a
+        contiguous NumPy array aligned with the positional order of keys - enables vectorized
+        numerical operations and zero-copy access with `values_array`. Requires NumPy, which is an
+        optional dependency. By default ``None`` (not array-backed).
 
     Raises
     ------
@@ -265,6 +1761,10 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         If input includes key(s) that are not scalar (any iterable except string).
     TypeError
         If input includes value(s) that are not int or float.
+    TypeError
+        If input includes float value(s) with ``dtype='int64'``.
+    OverflowError
+        If input includes int value(s) out of the range of ``dtype='int64'``.
 
     See Also
     --------
@@ -287,6 +1787,12 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
     ... )
     ParamDict1D: MONTH -> DAYS
     {'JAN': 31, 'FEB': 28, 'MAR': 31}
+
+    Constructing array-backed:
+
+    >>> days = ParamDict1D({'JAN': 31, 'FEB': 28, 'MAR': 31}, dtype='int64')
+    >>> days.values_array()
+    array([31, 28, 31])
     """
 
     # Private attributes
@@ -303,6 +1809,7 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         *,
         key_name: str | None = None,
         value_name: str | None = None,
+        dtype: str | None = None,
     ) -> None:
         self.key_name = key_name
         self.value_name = value_name
@@ -319,7 +1826,50 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
             except Exception as exc:
                 self._reraise_exc_from_indexset(exc, caller='IndexSet1D')
 
-        super().__init__(mapping, indexset=self._indexset)
+        super().__init__(mapping, indexset=self._indexset, dtype=dtype)
+
+    @classmethod
+    def _create(
+        cls,
+        mapping: dict[Elem1DT, ParamT],
+        /,
+        *,
+        key_name: str | None = None,
+        value_name: str | None = None,
+        array: NDArray[Any] | None = None,
+        keyset: set[Elem1DT] | None = None,
+    ) -> ParamDict1D[Elem1DT, ParamT]:
+        # Private method to construct ParamDict1D from keys and values that are known to be valid
+        # (e.g., derived from other ParamDicts), without any validation checks. A set of the keys
+        # can be given if already known.
+        instance = cls.__new__(cls)
+        instance.key_name = key_name
+        instance.value_name = value_name
+        indexset = IndexSet1D._create(list(mapping), name=key_name, elems_set=keyset)
+        instance._setup(mapping, indexset=indexset, array=array)
+        return instance
+
+    def _derive(
+        self,
+        mapping: dict[Elem1DT, Any],
+        /,
+        *,
+        array: NDArray[Any] | None = None,
+        keyset: set[Elem1DT] | None = None,
+    ) -> Self:
+        # Construct a new ParamDict1D with the same key name, without any validation checks.
+        return cast(
+            'Self', self._create(mapping, key_name=self.key_name, array=array, keyset=keyset)
+        )
+
+    def _get_names(self) -> dict[str, Any]:
+        # Key name and value name, as keyword arguments of `_create`.
+        return {'key_name': self.key_name, 'value_name': self.value_name}
+
+    def _derive_keys(self, positions: Iterable[int], /) -> IndexSet1D[Elem1DT]:
+        # Construct a new IndexSet1D with the keys at given positions, without validation checks.
+        keys = self._indexset._list
+        return IndexSet1D._create([keys[pos] for pos in positions], name=self.key_name)
 
     def __repr__(self) -> str:
         # Printable string representation.
@@ -354,7 +1904,7 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         """
         return super().get(key, 0)
 
-    def _calc_stat(self, stat_func: str) -> int | float:
+    def _calc_stat(self, stat_func: str, exact: bool = False) -> int | float:
         """Calculate a statistic with all parameter values.
 
         Supports `builtins.sum` and any statistical function provided in the `statistics` module of
@@ -365,6 +1915,8 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         stat_func : str
             Either `'sum'` or the name of the statistical function from the `statistics` module of
             the standard library.
+        exact : bool, default ``False``
+            Whether to calculate with the `statistics` module of the standard library.
 
         Returns
         -------
@@ -378,9 +1930,9 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
             If the ParamDict is empty.
         """
         self._check_for_calc_stat(stat_func)
-        res = self._calc_stat_all(stat_func)
-
-        return res
+        return self._calc_stat_cached(
+            (), stat_func, exact, lambda: self._calc_stat_all(stat_func, exact)
+        )
 
     def sum(self) -> int | float:
         """Calculate the sum of parameter values.
@@ -402,9 +1954,15 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         """
         return self._calc_stat('sum')
 
-    def mean(self) -> int | float:
+    def mean(self, *, exact: bool = False) -> int | float:
         """Calculate the mean of parameter values.
 
+        Parameters
+        ----------
+        exact : bool, default ``False``
+            Whether to calculate with `statistics.mean`, which is exact but slower. By default, a
+            fast single-pass reducer is used - the mean of floats may differ in the last digit.
+
         Returns
         -------
         int or float
@@ -420,11 +1978,17 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         >>> inventory.mean()
         29.5
         """
-        return self._calc_stat('mean')
+        return self._calc_stat('mean', exact)
 
-    def median(self) -> int | float:
+    def median(self, *, exact: bool = False) -> int | float:
         """Calculate the median of parameter values.
 
+        Parameters
+        ----------
+        exact : bool, default ``False``
+            Whether to calculate with `statistics.median`. The result is the same either
+            way, but by default, it is faster with linear-time selection instead of sorting.
+
         Returns
         -------
         int or float
@@ -440,11 +2004,17 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         >>> inventory.median()
         7.5
         """
-        return self._calc_stat('median')
+        return self._calc_stat('median', exact)
 
-    def median_high(self) -> int | float:
+    def median_high(self, *, exact: bool = False) -> int | float:
         """Calculate the high median of parameter values.
 
+        Parameters
+        ----------
+        exact : bool, default ``False``
+            Whether to calculate with `statistics.median_high`. The result is the same either
+            way, but by default, it is faster with linear-time selection instead of sorting.
+
         Returns
         -------
         int or float
@@ -460,11 +2030,17 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         >>> inventory.median_high()
         10
         """
-        return self._calc_stat('median_high')
+        return self._calc_stat('median_high', exact)
 
-    def median_low(self) -> int | float:
+    def median_low(self, *, exact: bool = False) -> int | float:
         """Calculate the low median of parameter values.
 
+        Parameters
+        ----------
+        exact : bool, default ``False``
+            Whether to calculate with `statistics.median_low`. The result is the same either
+            way, but by default, it is faster with linear-time selection instead of sorting.
+
         Returns
         -------
         int or float
@@ -480,14 +2056,16 @@ class ParamDict1D(ParamDictBase[Elem1DT, ParamT], Dict1DMixin[Elem1DT, ParamT]):
         >>> inventory.median_low()
         5
         """
-        return self._calc_stat('median_low')
+        return self._calc_stat('median_low', exact)
 
 
 class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
     """Custom subclass of `dict` to define parameters with N-dim tuple keys.
 
     Requires all keys to be unique tuples of the same length, each containing 'N' scalars (such as
-    `int`, `str`, `pd.Timestamp`, etc.) and all values to be `int` or `float`.
+    `int`, `str`, `pd.Timestamp`, etc.) and all values to be `int` or `float`. NumPy numeric scalars
+    (such as `numpy.float32` or `numpy.int64`) are also accepted, and stored as the equivalent
+    Python `int` or `float`.
 
     Parameters
     ----------
@@ -498,6 +2076,11 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         user reference.
     value_name : str, optional
         Name to refer to parameter values - not used internally, and solely for user reference.
+    dtype : {'float64', 'int64'}, optional
+        Data type for array-backed storage. If specified, parameter values are also kept in a
+        contiguous NumPy array aligned with the positional order of keys - enables vectorized
+        numerical operations and zero-copy access with `values_array`. Requires NumPy, which is an
+        optional dependency. By default ``None`` (not array-backed).
 
     Raises
     ------
@@ -507,6 +2090,10 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         If input includes tuple keys of different lengths.
     TypeError
         If input includes values that are not int or float.
+    TypeError
+        If input includes float value(s) with ``dtype='int64'``.
+    OverflowError
+        If input includes int value(s) out of the range of ``dtype='int64'``.
 
     See Also
     --------
@@ -529,6 +2116,12 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
     ... )
     ParamDictND: (ORI, DES) -> DEMAND
     {('A', 'B'): 10, ('B', 'C'): 20, ('A', 'C'): 15}
+
+    Constructing array-backed:
+
+    >>> demand = ParamDictND({('A', 'B'): 10, ('B', 'C'): 20, ('A', 'C'): 15}, dtype='float64')
+    >>> demand.values_array()
+    array([10., 20., 15.])
     """
 
     # Private attributes
@@ -545,6 +2138,7 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         *,
         key_names: Sequence[str] | None = None,
         value_name: str | None = None,
+        dtype: str | None = None,
     ) -> None:
         self.key_names = key_names
         self.value_name = value_name
@@ -561,7 +2155,168 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
             except Exception as exc:
                 self._reraise_exc_from_indexset(exc, caller='IndexSetND')
 
-        super().__init__(mapping, indexset=self._indexset)
+        super().__init__(mapping, indexset=self._indexset, dtype=dtype)
+
+    @classmethod
+    def _create(
+        cls,
+        mapping: dict[ElemNDT, ParamT],
+        /,
+        *,
+        key_names: Sequence[str] | None = None,
+        value_name: str | None = None,
+        array: NDArray[Any] | None = None,
+        keyset: set[ElemNDT] | None = None,
+    ) -> ParamDictND[ElemNDT, ParamT]:
+        # Private method to construct ParamDictND from keys and values that are known to be valid
+        # (e.g., derived from other ParamDicts), without any validation checks. A set of the keys
+        # can be given if already known.
+        instance = cls.__new__(cls)
+        instance.key_names = key_names
+        instance.value_name = value_name
+        keys = list(mapping)
+        tuplelen = len(keys[0]) if keys else 0
+        indexset = IndexSetND._create(keys, names=key_names, tuplelen=tuplelen, elems_set=keyset)
+        instance._setup(mapping, indexset=indexset, array=array)
+        return instance
+
+    def _derive(
+        self,
+        mapping: dict[ElemNDT, Any],
+        /,
+        *,
+        array: NDArray[Any] | None = None,
+        keyset: set[ElemNDT] | None = None,
+    ) -> Self:
+        # Construct a new ParamDictND with the same key names, without any validation checks.
+        return cast(
+            'Self', self._create(mapping, key_names=self.key_names, array=array, keyset=keyset)
+        )
+
+    def _get_names(self) -> dict[str, Any]:
+        # Key names and value name, as keyword arguments of `_create`.
+        return {'key_names': self.key_names, 'value_name': self.value_name}
+
+    def _derive_keys(self, positions: Iterable[int], /) -> IndexSetND[ElemNDT]:
+        # Construct a new IndexSetND with the keys at given positions, without validation checks.
+        keys = self._indexset._list
+        elems = [keys[pos] for pos in positions]
+        tuplelen = self._indexset._tuplelen if elems else 0
+        return IndexSetND._create(elems, names=self.key_names, tuplelen=tuplelen)
+
+    def _resolve_dim(self, other: ParamDict1D[Any, Any], dim: int | str | None) -> int:
+        """Resolve the dimension of N-dim tuple keys to broadcast a ParamDict1D over.
+
+        Parameters
+        ----------
+        other : ParamDict1D
+        dim : int or str or None
+            Dimension index or name; by default, the dimension named as the `key_name` of `other`.
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        TypeError
+            If `dim` is not an int or str.
+        ValueError
+            If the dimension is not found.
+        """
+        if dim is None:
+            if other.key_name is None or self.key_names is None:
+                raise ValueError(
+                    '`dim` is required since the dimension cannot be matched by `key_name` with '
+                    '`key_names`'
+                )
+            dim = other.key_name
+
+        return self._dim_index(dim)
+
+    def _arith_broadcast(
+        self,
+        other: ParamDict1D[Any, Any],
+        op_name: str,
+        *,
+        join: JoinT,
+        fill_value: int | float | None,
+        dim: int | str | None,
+        reflected: bool,
+    ) -> Self:
+        """Perform an arithmetic operation with a ParamDict1D broadcast over a dimension of keys.
+
+        The ParamDict1D serves as a lookup table for the values of the dimension, in a single pass
+        over the keys of the ParamDictND. If either ParamDict is array-backed, the lookup yields
+        position indices in the array of the ParamDict1D, and the operation is vectorized.
+
+        Parameters
+        ----------
+        other : ParamDict1D
+        op_name : str
+            One of `'add'`, `'sub'`, `'mul'`, or `'div'`.
+        join : {'inner', 'left', 'outer'}
+            With ``'left'`` or ``'outer'``, all keys of the ParamDictND are kept.
+        fill_value : int or float or None
+        dim : int or str or None
+        reflected : bool
+            Whether `other` is the left operand.
+
+        Returns
+        -------
+        ParamDictND
+
+        Raises
+        ------
+        ValueError
+            If any value of the dimension is missing in `other`, with ``'left'`` or ``'outer'`` join
+            and no `fill_value`.
+        """
+        idx = self._resolve_dim(other, dim)
+        keys = self._indexset._list
+        n = len(keys)
+        dimkeys = map(operator.itemgetter(idx), keys)
+
+        if self._array is None and other._array is None:
+            rvals: list[Any] = list(map(dict.get, repeat(other, n), dimkeys))
+            if None in rvals:  # some values of the dimension are missing in `other`
+                if join == 'inner':
+                    keep = [v is not None for v in rvals]
+                    keys = list(compress(keys, keep))
+                    rvals = list(compress(rvals, keep))
+                    lvals = list(map(self.__getitem__, keys))
+                elif fill_value is None:
+                    raise ValueError('`fill_value` is required since keys are not aligned')
+                else:
+                    rvals = [fill_value if v is None else v for v in rvals]
+                    lvals = list(self.values())
+            else:
+                lvals = list(self.values())
+            if reflected:
+                lvals, rvals = rvals, lvals
+            values = list(map(_ARITH_OPS[op_name], lvals, rvals))
+            keyset = self._indexset._set.copy() if keys is self._indexset._list else None
+            return self._derive(dict(zip(keys, values, strict=True)), keyset=keyset)
+
+        np = import_numpy()
+        table = {key: pos for pos, key in enumerate(other._indexset._list)}
+        missing = len(table)  # position index for values of the dimension missing in `other`
+        codes = np.fromiter(map(table.get, dimkeys, repeat(missing, n)), dtype=np.intp, count=n)
+        rarr = np.array(list(other.values())) if other._array is None else other._array[:missing]
+        larr = np.array(list(self.values())) if self._array is None else self._array[:n]
+
+        is_missing = codes == missing
+        if is_missing.any():
+            if join == 'inner':
+                kept = ~is_missing
+                keys = list(compress(keys, kept.tolist()))
+                return self._arith_arrays(
+                    larr[kept], rarr[codes[kept]], op_name, reflected=reflected, keys=keys
+                )
+            if fill_value is None:
+                raise ValueError('`fill_value` is required since keys are not aligned')
+            rarr = np.append(rarr, fill_value)
+        return self._arith_arrays(larr, rarr[codes], op_name, reflected=reflected)
 
     def __repr__(self) -> str:
         # Printable string representation.
@@ -600,7 +2355,7 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
             raise ValueError('lookup key length must be the same as that of N-dim tuple keys')
         return super().get(cast('ElemNDT', key), 0)
 
-    def _calc_stat(self, *pattern: Any, stat_func: str) -> int | float:
+    def _calc_stat(self, *pattern: Any, stat_func: str, exact: bool = False) -> int | float:
         """Calculate a statistic with all parameter values or a subset based on wildcard pattern.
 
         Supports `builtins.sum` and any statistical function provided in the `statistics` module of
@@ -615,6 +2370,8 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         stat_func : str
             Either `'sum'` or the name of the statistical function from the `statistics` module of
             the standard library.
+        exact : bool, default ``False``
+            Whether to calculate with the `statistics` module of the standard library.
 
         Returns
         -------
@@ -634,15 +2391,46 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
             If the pattern has no wildcard or all wildcards.
         """
         self._check_for_calc_stat(stat_func)
-        if stat_func == 'sum' and pattern:
-            res: int | float = sum(self.subset_values(*pattern))
-        elif stat_func != 'sum' and pattern:
-            try:
-                res = getattr(statistics, stat_func)(self.subset_values(*pattern))
-            except statistics.StatisticsError:
-                res = 0
+        return self._calc_stat_cached(
+            pattern,
+            stat_func,
+            exact,
+            lambda: self._calc_stat_subset(*pattern, stat_func=stat_func, exact=exact),
+        )
+
+    def _calc_stat_subset(self, *pattern: Any, stat_func: str, exact: bool) -> int | float:
+        """Calculate a statistic with all parameter values or a subset, without validation checks.
+
+        Parameters
+        ----------
+        *pattern : Any, optional
+        stat_func : str
+        exact : bool
+
+        Returns
+        -------
+        int or float
+        """
+        if not pattern:
+            return self._calc_stat_all(stat_func, exact)
+
+        if exact or stat_func not in FAST_STAT_FUNCS:
+            values: Sequence[Any] = self.subset_values(*pattern)
+            reducer = sum if stat_func == 'sum' else getattr(statistics, stat_func)
+        elif self._array is not None:
+            keys = self.subset_keys(*pattern)
+            if not keys:
+                return 0
+            arr = self._array[list(map(self._position, keys))]
+            return calc_array_stat(arr, stat_func)
         else:
-            res = self._calc_stat_all(stat_func)
+            values = self.subset_values(*pattern)
+            reducer = FAST_STAT_FUNCS[stat_func]
+
+        try:
+            res: int | float = reducer(values)
+        except statistics.StatisticsError:
+            res = 0
 
         return res
 
@@ -689,7 +2477,7 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         """
         return self._calc_stat(*pattern, stat_func='sum')
 
-    def mean(self, *pattern: Any) -> int | float:
+    def mean(self, *pattern: Any, exact: bool = False) -> int | float:
         """Calculate the mean of all parameter values or a subset based on wildcard pattern.
 
         Parameters
@@ -698,6 +2486,9 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
             For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
             The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
             all possible values for a dimension.
+        exact : bool, default ``False``
+            Whether to calculate with `statistics.mean`, which is exact but slower. By default, a
+            fast single-pass reducer is used - the mean of floats may differ in the last digit.
 
         Returns
         -------
@@ -730,9 +2521,9 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         >>> demand.mean('*', 'A')
         16
         """
-        return self._calc_stat(*pattern, stat_func='mean')
+        return self._calc_stat(*pattern, stat_func='mean', exact=exact)
 
-    def median(self, *pattern: Any) -> int | float:
+    def median(self, *pattern: Any, exact: bool = False) -> int | float:
         """Calculate the median of all parameter values or a subset based on wildcard pattern.
 
         Parameters
@@ -741,6 +2532,9 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
             For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
             The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
             all possible values for a dimension.
+        exact : bool, default ``False``
+            Whether to calculate with `statistics.median`. The result is the same either
+            way, but by default, it is faster with linear-time selection instead of sorting.
 
         Returns
         -------
@@ -773,9 +2567,9 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         >>> demand.median('*', 'A')
         16
         """
-        return self._calc_stat(*pattern, stat_func='median')
+        return self._calc_stat(*pattern, stat_func='median', exact=exact)
 
-    def median_high(self, *pattern: Any) -> int | float:
+    def median_high(self, *pattern: Any, exact: bool = False) -> int | float:
         """Calculate the high median of all parameter values or a subset based on wildcard pattern.
 
         Parameters
@@ -784,6 +2578,9 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
             For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
             The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
             all possible values for a dimension.
+        exact : bool, default ``False``
+            Whether to calculate with `statistics.median_high`. The result is the same either
+            way, but by default, it is faster with linear-time selection instead of sorting.
 
         Returns
         -------
@@ -816,9 +2613,9 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         >>> demand.median_high('*', 'A')
         16
         """
-        return self._calc_stat(*pattern, stat_func='median_high')
+        return self._calc_stat(*pattern, stat_func='median_high', exact=exact)
 
-    def median_low(self, *pattern: Any) -> int | float:
+    def median_low(self, *pattern: Any, exact: bool = False) -> int | float:
         """Calculate the low median of all parameter values or a subset based on wildcard pattern.
 
         Parameters
@@ -827,6 +2624,9 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
             For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
             The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
             all possible values for a dimension.
+        exact : bool, default ``False``
+            Whether to calculate with `statistics.median_low`. The result is the same either
+            way, but by default, it is faster with linear-time selection instead of sorting.
 
         Returns
         -------
@@ -859,4 +2659,464 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         >>> demand.median_low('*', 'A')
         16
         """
-        return self._calc_stat(*pattern, stat_func='median_low')
+        return self._calc_stat(*pattern, stat_func='median_low', exact=exact)
+
+    @overload
+    def aggregate(  # numpydoc ignore=GL08
+        self, *dims: Unpack[tuple[int | str]], func: AggFuncT = ..., exact: bool = ...
+    ) -> ParamDict1D[Any, Any]: ...
+
+    @overload
+    def aggregate(  # numpydoc ignore=GL08
+        self,
+        *dims: Unpack[tuple[int | str, int | str, Unpack[tuple[int | str, ...]]]],
+        func: AggFuncT = ...,
+        exact: bool = ...,
+    ) -> ParamDictND[tuple[Any, ...], Any]: ...
+
+    def aggregate(
+        self, *dims: int | str, func: AggFuncT = 'sum', exact: bool = False
+    ) -> ParamDict1D[Any, Any] | ParamDictND[tuple[Any, ...], Any]:
+        """Aggregate parameter values by groups of given dimensions to get a new ParamDict.
+
+        All groups are aggregated in a single pass over the ParamDict; this is much faster than
+        calculating a statistic with a wildcard pattern for each group.
+
+        Parameters
+        ----------
+        *dims : int or str
+            Dimensions of the N-dim tuple keys to keep, as position indices or names (from
+            `key_names`). All other dimensions are aggregated.
+        func : {'sum', 'mean', 'min', 'max', 'count', 'median'}, default ``'sum'``
+            Function to aggregate the parameter values of each group.
+        exact : bool, default ``False``
+            Whether to calculate the mean and median with the `statistics` module of the standard
+            library, which is exact but slower (and never array-backed). By default, fast
+            reducers are used - the mean of floats may differ in the last digit.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            ParamDict1D when keeping one dimension, ParamDictND otherwise; keys are ordered by their
+            first occurrence, and names of the kept dimensions and values are carried over.
+            Values are always floats for mean and median. Array-backed if the ParamDict is
+            array-backed (unless any sum of integers is out of the int64 range).
+
+        Raises
+        ------
+        LookupError
+            If the ParamDict is empty.
+        ValueError
+            If `func` is invalid.
+        ValueError
+            If no dimension is given, all dimensions are given, or any dimension is repeated.
+        ValueError
+            If any dimension is not found.
+        TypeError
+            If any dimension is not an int or str.
+
+        Examples
+        --------
+        >>> demand = ParamDictND(
+        ...     {
+        ...         ('S1', 'P1', 'A'): 10,
+        ...         ('S1', 'P1', 'B'): 20,
+        ...         ('S1', 'P2', 'A'): 15,
+        ...         ('S2', 'P1', 'B'): 5,
+        ...     },
+        ...     key_names=['SITE', 'PERIOD', 'PRODUCT'],
+        ...     value_name='DEMAND',
+        ... )
+
+        Total demand by site:
+
+        >>> demand.aggregate('SITE')
+        ParamDict1D: SITE -> DEMAND
+        {'S1': 45, 'S2': 5}
+
+        Maximum demand by site and period:
+
+        >>> demand.aggregate(0, 1, func='max')
+        ParamDictND: (SITE, PERIOD) -> DEMAND
+        {('S1', 'P1'): 20, ('S1', 'P2'): 15, ('S2', 'P1'): 5}
+        """
+        if not self:  # is empty
+            raise LookupError(f'{self.__class__.__name__} is empty')
+
+        if func not in _AGG_FUNCS:
+            raise ValueError(f'`func` should be one of {", ".join(map(repr, _AGG_FUNCS))}')
+
+        if len(dims) == 0:
+            raise ValueError('dimensions to keep are required')
+        indices = self._group_dim_indices(dims, 'aggregate')
+
+        names = None if self.key_names is None else [self.key_names[i] for i in indices]
+        keyfunc = operator.itemgetter(*indices)  # scalar when keeping one dimension
+
+        if self._array is not None and not (exact and func in ('mean', 'median')):
+            # Encode groups as integer codes for vectorized aggregation
+            np = import_numpy()
+            group_codes: dict[Any, int] = {}
+            codes = np.fromiter(
+                (
+                    group_codes.setdefault(group, len(group_codes))
+                    for group in map(keyfunc, self._indexset._list)
+                ),
+                dtype='int64',
+                count=len(self),
+            )
+            stats = calc_group_stat(self._array[: len(self)], codes, len(group_codes), func)
+            if stats.dtype.kind == 'O':
+                # Exact sums of integers are Python ints, which are stored in int64 only if they fit
+                values = stats.tolist()
+                array = build_exact_array(values)
+            else:
+                array = stats.astype('int64' if stats.dtype.kind in 'iu' else 'float64', copy=False)
+                values = array.tolist()
+            mapping = dict(zip(group_codes, values, strict=True))
+        else:
+            groups: dict[Any, list[Any]] = {}
+            for group, value in zip(map(keyfunc, self._indexset._list), self.values(), strict=True):
+                try:
+                    groups[group].append(value)
+                except KeyError:
+                    groups[group] = [value]
+            agg_func = (
+                getattr(statistics, func)
+                if exact and func in ('mean', 'median')
+                else _AGG_FUNCS[func]
+            )
+            if func in ('mean', 'median'):  # floats, same as with array-backed storage
+                mapping = {group: float(agg_func(values)) for group, values in groups.items()}
+            else:
+                mapping = {group: agg_func(values) for group, values in groups.items()}
+            array = None
+
+        if len(indices) == 1:
+            return ParamDict1D._create(
+                mapping,
+                key_name=None if names is None else names[0],
+                value_name=self.value_name,
+                array=array,
+            )
+        return ParamDictND._create(
+            mapping, key_names=names, value_name=self.value_name, array=array
+        )
+
+    def _select_by_group(
+        self, n: int, dims: tuple[int | str, ...], *, largest: bool, caller: str
+    ) -> list[int]:
+        """Select the positions of the keys with the n smallest or largest values of each group.
+
+        Groups are selected in a single pass over the ParamDict, keeping a heap of at most `n`
+        candidates for each group. Ties are resolved in favor of the keys that come first.
+
+        Parameters
+        ----------
+        n : int
+        dims : tuple[int or str, ...]
+            Dimensions to group keys by; all keys are in one group if empty.
+        largest : bool
+            Whether to select the largest values instead of the smallest.
+        caller : str
+            Name of the calling method to refer to in error messages.
+
+        Returns
+        -------
+        list[int]
+            Positions of the selected keys in ascending order.
+
+        Raises
+        ------
+        LookupError
+            If the ParamDict is empty.
+        TypeError
+            If `n` is not an int.
+        ValueError
+            If `n` is negative.
+        """
+        if not self:  # is empty
+            raise LookupError(f'{self.__class__.__name__} is empty')
+        if not isinstance(n, int) or isinstance(n, bool):
+            raise TypeError('`n` should be an int')
+        if n < 0:
+            raise ValueError('`n` should be non-negative')
+
+        indices = self._group_dim_indices(dims, caller)
+        if n == 0:
+            return []
+
+        groups: Iterable[Any] = (
+            map(operator.itemgetter(*indices), self._indexset._list) if indices else repeat(None)
+        )
+        sign = 1 if largest else -1
+        heaps: dict[Any, list[tuple[int | float, int]]] = {}
+        for pos, (group, value) in enumerate(zip(groups, self.values(), strict=False)):
+            # Heap of the worst candidate first: lower signed value, or same value and later key
+            entry = (sign * value, -pos)
+            heap = heaps.get(group)
+            if heap is None:
+                heaps[group] = [entry]
+            elif len(heap) < n:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        return sorted(-neg_pos for heap in heaps.values() for _, neg_pos in heap)
+
+    def nsmallest(self, n: int, /, *dims: int | str) -> Self:
+        """Get the items with the n smallest parameter values of each group, as a new ParamDictND.
+
+        Groups are selected in a single pass with a heap for each group; this is much faster than
+        sorting the values of each group selected with a wildcard pattern.
+
+        Parameters
+        ----------
+        n : int
+            Number of items to keep for each group (or fewer, if the group is smaller).
+        *dims : int or str
+            Dimensions of the N-dim tuple keys to group by, as position indices or names (from
+            `key_names`). If none are given, the n smallest values overall are kept.
+
+        Returns
+        -------
+        ParamDictND
+            Selected items in the same order as in the ParamDict, with the names of keys and values
+            carried over. Ties are resolved in favor of the keys that come first. Array-backed if
+            the ParamDict is array-backed.
+
+        Raises
+        ------
+        LookupError
+            If the ParamDict is empty.
+        TypeError
+            If `n` is not an int.
+        ValueError
+            If `n` is negative.
+        ValueError
+            If all dimensions are given, or any dimension is repeated.
+        ValueError
+            If any dimension is not found.
+        TypeError
+            If any dimension is not an int or str.
+
+        See Also
+        --------
+        nlargest : For the largest values.
+        argmin : For the keys with the smallest value of each group.
+
+        Examples
+        --------
+        >>> cost = ParamDictND(
+        ...     {
+        ...         ('C1', 'S1'): 4,
+        ...         ('C1', 'S2'): 2,
+        ...         ('C1', 'S3'): 3,
+        ...         ('C2', 'S1'): 1,
+        ...         ('C2', 'S2'): 5,
+        ...     },
+        ...     key_names=['CUSTOMER', 'SUPPLIER'],
+        ...     value_name='COST',
+        ... )
+
+        Two cheapest suppliers by customer:
+
+        >>> cost.nsmallest(2, 'CUSTOMER')
+        ParamDictND: (CUSTOMER, SUPPLIER) -> COST
+        {('C1', 'S2'): 2, ('C1', 'S3'): 3, ('C2', 'S1'): 1, ('C2', 'S2'): 5}
+        """
+        return self._select_items(self._select_by_group(n, dims, largest=False, caller='nsmallest'))
+
+    def nlargest(self, n: int, /, *dims: int | str) -> Self:
+        """Get the items with the n largest parameter values of each group, as a new ParamDictND.
+
+        Groups are selected in a single pass with a heap for each group; this is much faster than
+        sorting the values of each group selected with a wildcard pattern.
+
+        Parameters
+        ----------
+        n : int
+            Number of items to keep for each group (or fewer, if the group is smaller).
+        *dims : int or str
+            Dimensions of the N-dim tuple keys to group by, as position indices or names (from
+            `key_names`). If none are given, the n largest values overall are kept.
+
+        Returns
+        -------
+        ParamDictND
+            Selected items in the same order as in the ParamDict, with the names of keys and values
+            carried over. Ties are resolved in favor of the keys that come first. Array-backed if
+            the ParamDict is array-backed.
+
+        Raises
+        ------
+        LookupError
+            If the ParamDict is empty.
+        TypeError
+            If `n` is not an int.
+        ValueError
+            If `n` is negative.
+        ValueError
+            If all dimensions are given, or any dimension is repeated.
+        ValueError
+            If any dimension is not found.
+        TypeError
+            If any dimension is not an int or str.
+
+        See Also
+        --------
+        nsmallest : For the smallest values.
+        argmax : For the keys with the largest value of each group.
+
+        Examples
+        --------
+        >>> demand = ParamDictND(
+        ...     {('P1', 'JAN'): 10, ('P1', 'FEB'): 30, ('P2', 'JAN'): 20, ('P2', 'FEB'): 5}
+        ... )
+        >>> demand.nlargest(1, 0)
+        ParamDictND:
+        {('P1', 'FEB'): 30, ('P2', 'JAN'): 20}
+        >>> demand.nlargest(3)
+        ParamDictND:
+        {('P1', 'JAN'): 10, ('P1', 'FEB'): 30, ('P2', 'JAN'): 20}
+        """
+        return self._select_items(self._select_by_group(n, dims, largest=True, caller='nlargest'))
+
+    def argmin(self, *dims: int | str) -> IndexSetND[ElemNDT]:
+        """Get the keys with the smallest parameter value of each group, as an IndexSetND.
+
+        Groups are selected in a single pass over the ParamDict. The IndexSetND can be used directly
+        to add variables (or constraints) only for the selected keys.
+
+        Parameters
+        ----------
+        *dims : int or str
+            Dimensions of the N-dim tuple keys to group by, as position indices or names (from
+            `key_names`). If none are given, the key with the smallest value overall is selected.
+
+        Returns
+        -------
+        IndexSetND
+            One key for each group in the same order as in the ParamDict, with `key_names` as names.
+            Ties are resolved in favor of the key that comes first.
+
+        Raises
+        ------
+        LookupError
+            If the ParamDict is empty.
+        ValueError
+            If all dimensions are given, or any dimension is repeated.
+        ValueError
+            If any dimension is not found.
+        TypeError
+            If any dimension is not an int or str.
+
+        See Also
+        --------
+        argmax : For the largest value.
+        nsmallest : For the items with the n smallest values of each group.
+
+        Examples
+        --------
+        >>> cost = ParamDictND(
+        ...     {
+        ...         ('P1', 'JAN', 'F1'): 7,
+        ...         ('P1', 'JAN', 'F2'): 6,
+        ...         ('P1', 'FEB', 'F1'): 5,
+        ...         ('P1', 'FEB', 'F2'): 9,
+        ...     },
+        ...     key_names=['PRODUCT', 'PERIOD', 'FACTORY'],
+        ... )
+        >>> cost.argmin('PRODUCT', 'PERIOD')
+        IndexSetND: (PRODUCT, PERIOD, FACTORY)
+        [('P1', 'JAN', 'F2'), ('P1', 'FEB', 'F1')]
+        """
+        positions = self._select_by_group(1, dims, largest=False, caller='argmin')
+        return self._derive_keys(positions)
+
+    def argmax(self, *dims: int | str) -> IndexSetND[ElemNDT]:
+        """Get the keys with the largest parameter value of each group, as an IndexSetND.
+
+        Groups are selected in a single pass over the ParamDict. The IndexSetND can be used directly
+        to add variables (or constraints) only for the selected keys.
+
+        Parameters
+        ----------
+        *dims : int or str
+            Dimensions of the N-dim tuple keys to group by, as position indices or names (from
+            `key_names`). If none are given, the key with the largest value overall is selected.
+
+        Returns
+        -------
+        IndexSetND
+            One key for each group in the same order as in the ParamDict, with `key_names` as names.
+            Ties are resolved in favor of the key that comes first.
+
+        Raises
+        ------
+        LookupError
+            If the ParamDict is empty.
+        ValueError
+            If all dimensions are given, or any dimension is repeated.
+        ValueError
+            If any dimension is not found.
+        TypeError
+            If any dimension is not an int or str.
+
+        See Also
+        --------
+        argmin : For the smallest value.
+        nlargest : For the items with the n largest values of each group.
+
+        Examples
+        --------
+        >>> demand = ParamDictND(
+        ...     {('P1', 'JAN'): 10, ('P1', 'FEB'): 30, ('P2', 'JAN'): 20, ('P2', 'FEB'): 20}
+        ... )
+        >>> demand.argmax(0)
+        IndexSetND:
+        [('P1', 'FEB'), ('P2', 'JAN')]
+        """
+        positions = self._select_by_group(1, dims, largest=True, caller='argmax')
+        return self._derive_keys(positions)
+
+
+def _unpickle_paramdict(
+    cls: type[ParamDict1D[Any, Any]] | type[ParamDictND[Any, Any]],
+    indexset: IndexSetBase[Any],
+    values: list[int | float],
+    names: dict[str, Any],
+    dtype: str | None,
+    stat_cache: bool,
+) -> ParamDictBase[Any, Any]:
+    # Reconstruct an unpickled ParamDict, with a copy of the set of keys of the unpickled index-set
+    # (which reuses the hashes of the keys). The set is copied, not shared, since index-sets update
+    # their set in place when elements are added.
+    array = None if dtype is None else build_array(values, dtype, len(values))
+    mapping = dict(zip(indexset._list, values, strict=True))
+    instance = cls._create(mapping, array=array, keyset=set(indexset._set), **names)
+    if stat_cache:
+        instance.enable_stat_cache()
+    return instance
+
+
+def paramdict_bound_values(
+    indexset: IndexSet1D[Elem1DT] | IndexSetND[ElemNDT],
+    bound: ParamDict1D[Elem1DT, Any] | ParamDictND[ElemNDT, Any],
+) -> list[int | float | None]:
+    """Get the values of a ParamDict aligned with an index-set, at once.
+
+    Parameters
+    ----------
+    indexset : IndexSet1D or IndexSetND
+    bound : ParamDict1D or ParamDictND
+
+    Returns
+    -------
+    list[int or float or None]
+        Parameter values, or ``None`` for index-set elements that are not keys of `bound`.
+    """
+    keys: list[Any] = indexset._list
+    if bound._indexset._list == keys:  # same keys in the same order
+        return list(bound.values())
+    return list(map(dict.get, repeat(bound), keys))
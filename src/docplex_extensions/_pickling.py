@@ -0,0 +1,88 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Columnar encoding of N-dim tuple keys for compact pickling.
+
+Each dimension of the tuple keys is stored once as a column: a list of its unique values (the value
+dictionary, shared by all keys) and an array of codes with the position of each key's value in that
+list. Codes are stored with the standard library `array` module, in the smallest item size for the
+number of unique values, so NumPy is not required.
+
+Only columns of values of a single type among `str` and `int` are dictionary-encoded, since equal
+values of these types are interchangeable. Other columns (e.g., mixing `1`, `1.0`, and `True`, which
+are equal but not identical) are stored as plain lists of values.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import Any
+
+_ENCODED_TYPES = frozenset((str, int))
+
+_CODE_TYPECODES = tuple(
+    (2 ** (8 * array(typecode).itemsize), typecode) for typecode in ('B', 'H', 'I', 'Q')
+)
+
+Column = tuple[list[Any], 'array[int] | None']
+
+
+def encode_tuples(elems: Sequence[tuple[Any, ...]], tuplelen: int) -> list[Column]:
+    """Encode tuples of equal length into columns of unique values and codes.
+
+    Parameters
+    ----------
+    elems : sequence[tuple]
+    tuplelen : int
+        Length of each tuple.
+
+    Returns
+    -------
+    list[tuple[list, array.array or None]]
+        One ``(uniques, codes)`` pair for each dimension; ``codes`` is None if ``uniques`` is the
+        plain list of values of the dimension.
+    """
+    return [encode_column(list(map(itemgetter(dim), elems))) for dim in range(tuplelen)]
+
+
+def encode_column(col: list[Any]) -> Column:
+    """Encode a column of values into unique values and codes.
+
+    Parameters
+    ----------
+    col : list
+
+    Returns
+    -------
+    tuple[list, array.array or None]
+        ``(uniques, codes)`` pair; ``codes`` is None if ``uniques`` is the plain list of values.
+    """
+    types = set(map(type, col))
+    if len(types) != 1 or not types <= _ENCODED_TYPES:
+        return (col, None)
+    uniques = list(dict.fromkeys(col))
+    table = {value: code for code, value in enumerate(uniques)}
+    typecode = next(tc for limit, tc in _CODE_TYPECODES if len(uniques) <= limit)
+    return (uniques, array(typecode, map(table.__getitem__, col)))
+
+
+def decode_tuples(columns: list[Column]) -> list[tuple[Any, ...]]:
+    """Decode columns of unique values and codes back into tuples.
+
+    Parameters
+    ----------
+    columns : list[tuple[list, array.array or None]]
+        Output of `encode_tuples`.
+
+    Returns
+    -------
+    list[tuple]
+    """
+    values = [
+        uniques if codes is None else list(map(uniques.__getitem__, codes))
+        for uniques, codes in columns
+    ]
+    return list(zip(*values, strict=True))
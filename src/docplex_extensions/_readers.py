@@ -0,0 +1,582 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Chunked readers of tabular data into IndexSets and ParamDicts."""
+
+from __future__ import annotations
+
+import csv
+import importlib
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Literal
+
+from ._index_sets import IndexSet1D, IndexSetND
+from ._param_dicts import ParamDict1D, ParamDictND
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+DEFAULT_CHUNKSIZE = 100_000
+"""Default number of rows read at once."""
+
+EngineT = Literal['csv', 'pandas', 'parquet']
+
+_ENGINES = ('csv', 'pandas', 'parquet')
+"""Engines to read files in chunks."""
+
+_PARQUET_SUFFIXES = ('.parquet', '.pq')
+"""File name suffixes for which the Parquet engine is used by default."""
+
+SourceT = str | os.PathLike[str] | Iterable['DataFrame']
+
+
+def _import_pyarrow_parquet() -> ModuleType:
+    """Import the Parquet module of PyArrow, which is an optional dependency to read Parquet files.
+
+    Returns
+    -------
+    module
+
+    Raises
+    ------
+    ImportError
+        If PyArrow is not installed.
+    """
+    try:
+        parquet = importlib.import_module('pyarrow.parquet')
+    except ImportError:
+        raise ImportError(
+            'Unable to import optional dependency: pyarrow (required to read Parquet files)'
+        ) from None
+    return parquet
+
+
+def _parse_number(text: str) -> int | float:
+    """Parse a string as int if possible, or as float otherwise.
+
+    Parameters
+    ----------
+    text : str
+
+    Returns
+    -------
+    int or float
+
+    Raises
+    ------
+    ValueError
+        If the string is not a number.
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _check_columns(columns: str | Sequence[str], arg_name: str) -> list[str]:
+    """Check column names and get them as a list.
+
+    Parameters
+    ----------
+    columns : str or sequence[str]
+    arg_name : str
+
+    Returns
+    -------
+    list[str]
+
+    Raises
+    ------
+    TypeError
+        If `columns` is not a string or a sequence of strings.
+    ValueError
+        If `columns` is empty or has duplicates.
+    """
+    if isinstance(columns, str):
+        return [columns]
+    if not isinstance(columns, Sequence) or not all(isinstance(c, str) for c in columns):
+        raise TypeError(f'`{arg_name}` should be a string or a sequence of strings')
+    if len(columns) == 0:
+        raise ValueError(f'`{arg_name}` should not be empty')
+    if len(set(columns)) != len(columns):
+        raise ValueError(f'`{arg_name}` should not have duplicates')
+    return list(columns)
+
+
+def _resolve_engine(source: SourceT, engine: EngineT | None) -> EngineT | None:
+    """Resolve the engine to read a source, inferred from the file name suffix by default.
+
+    Parameters
+    ----------
+    source : str or path-like or iterable[DataFrame]
+    engine : {'csv', 'pandas', 'parquet'}, optional
+
+    Returns
+    -------
+    {'csv', 'pandas', 'parquet'} or None
+        None if the source is an iterable of DataFrame chunks.
+
+    Raises
+    ------
+    ValueError
+        If `engine` is invalid, or given for an iterable of DataFrame chunks.
+    """
+    if not isinstance(source, str | os.PathLike):
+        if engine is not None:
+            raise ValueError('`engine` is only applicable when reading from a file')
+        return None
+    if engine is None:
+        return 'parquet' if os.fspath(source).lower().endswith(_PARQUET_SUFFIXES) else 'csv'
+    if engine not in _ENGINES:
+        raise ValueError(f'`engine` should be one of {", ".join(map(repr, _ENGINES))}')
+    return engine
+
+
+def _frame_columns(df: DataFrame, columns: list[str]) -> list[list[Any]]:
+    """Get the values of columns (or index levels) of a DataFrame as lists of Python objects.
+
+    Parameters
+    ----------
+    df : DataFrame
+    columns : list[str]
+
+    Returns
+    -------
+    list[list]
+
+    Raises
+    ------
+    ValueError
+        If any column is not found in the columns or index levels of the DataFrame.
+    """
+    res = []
+    for col in columns:
+        if col in df.columns:
+            res.append(df[col].tolist())
+        elif col in df.index.names:
+            res.append(df.index.get_level_values(col).tolist())
+        else:
+            raise ValueError(f'column {col!r} not found in DataFrame chunk')
+    return res
+
+
+def _iter_csv_chunks(
+    path: str | os.PathLike[str],
+    columns: list[str],
+    *,
+    chunksize: int,
+    delimiter: str,
+    encoding: str,
+) -> Iterator[list[list[str]]]:
+    """Read columns of a CSV file in chunks of rows with the `csv` module of the standard library.
+
+    Parameters
+    ----------
+    path : str or path-like
+    columns : list[str]
+    chunksize : int
+    delimiter : str
+    encoding : str
+
+    Yields
+    ------
+    list[list[str]]
+        Values of each column in a chunk of rows.
+
+    Raises
+    ------
+    ValueError
+        If the CSV file has no header row, or any column is not found in the header row.
+    ValueError
+        If any row has fewer fields than the header row.
+    """
+    with open(path, newline='', encoding=encoding) as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError('CSV file has no header row')
+        missing = [col for col in columns if col not in header]
+        if missing:
+            raise ValueError(f'column(s) {missing} not found in the header row of CSV file')
+        positions = [header.index(col) for col in columns]
+
+        while rows := list(islice(reader, chunksize)):
+            try:
+                yield [[row[i] for row in rows] for i in positions]
+            except IndexError:
+                raise ValueError(
+                    f'CSV file has row(s) with fewer fields than the header row, before line '
+                    f'{reader.line_num + 1}'
+                ) from None
+
+
+def _iter_chunks(
+    source: SourceT,
+    columns: list[str],
+    *,
+    engine: EngineT | None,
+    chunksize: int,
+    delimiter: str,
+    encoding: str,
+    converters: dict[str, Callable[[Any], Any]],
+) -> Iterator[list[list[Any]]]:
+    """Read columns of a source in chunks of rows, with converters applied.
+
+    Parameters
+    ----------
+    source : str or path-like or iterable[DataFrame]
+    columns : list[str]
+    engine : {'csv', 'pandas', 'parquet'}, optional
+    chunksize : int
+    delimiter : str
+    encoding : str
+    converters : dict[str, callable]
+
+    Yields
+    ------
+    list[list]
+        Values of each column in a chunk of rows.
+    """
+    engine = _resolve_engine(source, engine)
+    chunks: Iterable[list[list[Any]]]
+    if not isinstance(source, str | os.PathLike):  # iterable of DataFrame chunks
+        try:
+            chunks = (_frame_columns(df, columns) for df in source)
+        except TypeError:
+            raise TypeError(
+                '`source` should be a file path or an iterable of DataFrame chunks'
+            ) from None
+    elif engine == 'csv':
+        chunks = _iter_csv_chunks(
+            source, columns, chunksize=chunksize, delimiter=delimiter, encoding=encoding
+        )
+    elif engine == 'pandas':
+        import pandas as pd
+
+        reader = pd.read_csv(
+            source,
+            usecols=columns,
+            chunksize=chunksize,
+            sep=delimiter,
+            encoding=encoding,
+            converters=converters,
+        )
+        converters = {}  # applied by pandas while parsing
+        chunks = (_frame_columns(df, columns) for df in reader)
+    else:  # 'parquet'
+        parquet = _import_pyarrow_parquet()
+        batches = parquet.ParquetFile(source).iter_batches(batch_size=chunksize, columns=columns)
+        chunks = ([batch.column(col).to_pylist() for col in columns] for batch in batches)
+
+    for chunk in chunks:
+        yield [
+            list(map(converters[col], values)) if col in converters else values
+            for col, values in zip(columns, chunk, strict=True)
+        ]
+
+
+def _chunk_keys(
+    key_chunks: list[list[Any]], memos: list[dict[Any, Any]], *, tuple_keys: bool
+) -> list[Any]:
+    """Get the keys of a chunk of rows, with equal key elements shared as one object.
+
+    Parameters
+    ----------
+    key_chunks : list[list]
+        Values of each key column in a chunk of rows.
+    memos : list[dict]
+        One dict for each key column that maps key elements to their first seen object.
+    tuple_keys : bool
+        Whether to get N-dim tuple keys instead of 1-dim scalar keys.
+
+    Returns
+    -------
+    list
+    """
+    shared = [
+        list(map(memo.setdefault, values, values))
+        for values, memo in zip(key_chunks, memos, strict=True)
+    ]
+    return list(zip(*shared, strict=True)) if tuple_keys else shared[0]
+
+
+def _check_new_keys(keys: list[Any], existing: set[Any], nrows: int) -> None:
+    """Check that the keys of a chunk of rows are neither repeated nor already read.
+
+    Parameters
+    ----------
+    keys : list
+    existing : set
+        Keys read from earlier chunks.
+    nrows : int
+        Number of rows read from earlier chunks.
+
+    Raises
+    ------
+    ValueError
+        If any key is duplicate.
+    """
+    if existing.isdisjoint(keys) and len(set(keys)) == len(keys):
+        return
+    seen = set(existing)
+    for i, key in enumerate(keys):
+        if key in seen:
+            raise ValueError(f'duplicate key {key!r} found at data row {nrows + i + 1}')
+        seen.add(key)
+
+
+def _check_read_args(
+    chunksize: int, converters: Mapping[str, Callable[[Any], Any]] | None
+) -> dict[str, Callable[[Any], Any]]:
+    """Check common arguments of the readers.
+
+    Parameters
+    ----------
+    chunksize : int
+    converters : mapping[str, callable], optional
+
+    Returns
+    -------
+    dict[str, callable]
+
+    Raises
+    ------
+    TypeError
+        If `chunksize` is not an int.
+    ValueError
+        If `chunksize` is not positive.
+    TypeError
+        If `converters` is not a mapping of column names to callables.
+    """
+    if not isinstance(chunksize, int) or isinstance(chunksize, bool):
+        raise TypeError('`chunksize` should be an integer')
+    if chunksize <= 0:
+        raise ValueError('`chunksize` should be positive')
+    if converters is None:
+        return {}
+    if not isinstance(converters, Mapping) or not all(callable(f) for f in converters.values()):
+        raise TypeError('`converters` should be a mapping of column names to callables')
+    return dict(converters)
+
+
+def read_indexset(
+    source: SourceT,
+    columns: str | Sequence[str],
+    /,
+    *,
+    engine: EngineT | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    delimiter: str = ',',
+    encoding: str = 'utf-8',
+    converters: Mapping[str, Callable[[Any], Any]] | None = None,
+) -> IndexSet1D[Any] | IndexSetND[tuple[Any, ...]]:
+    r"""Read an IndexSet1D/IndexSetND from a CSV or Parquet file in chunks of rows.
+
+    Rows are read and appended to the index-set one chunk at a time, so peak memory stays close to
+    the size of the index-set itself. Duplicate elements are detected across chunks. Equal values
+    of each column are shared as one object across elements.
+
+    Parameters
+    ----------
+    source : str or path-like or iterable[DataFrame]
+        Path of a CSV or Parquet file, or an iterable of pandas DataFrame chunks (such as from
+        ``pandas.read_csv(..., chunksize=...)``) having the columns or index levels to read.
+    columns : str or sequence[str]
+        Name of a column for an IndexSet1D, or names of multiple columns for an IndexSetND.
+    engine : {'csv', 'pandas', 'parquet'}, optional
+        Engine to read a file with - the `csv` module of the standard library, pandas, or PyArrow
+        for Parquet files. By default, ``'parquet'`` for files with ``.parquet`` or ``.pq``
+        suffix, and ``'csv'`` otherwise.
+    chunksize : int, default ``100000``
+        Number of rows to read at once (the number of rows per batch for Parquet files).
+    delimiter : str, default ``','``
+        Delimiter of CSV files.
+    encoding : str, default ``'utf-8'``
+        Encoding of CSV files.
+    converters : mapping[str, callable], optional
+        Functions to convert the values of columns, by column name. With the ``'csv'`` engine, all
+        values are read as strings unless converted.
+
+    Returns
+    -------
+    IndexSet1D or IndexSetND
+        Column names are set as the `name` or `names` attribute.
+
+    Raises
+    ------
+    TypeError
+        If `columns` is not a string or a sequence of strings.
+    ValueError
+        If `columns` is empty or has duplicates.
+    ValueError
+        If `engine` is invalid.
+    TypeError
+        If `chunksize` is not an int.
+    ValueError
+        If `chunksize` is not positive.
+    ValueError
+        If any column is not found.
+    ValueError
+        If any element is duplicate.
+    ImportError
+        If pandas is not installed for the ``'pandas'`` engine, or PyArrow for ``'parquet'``.
+
+    Examples
+    --------
+    >>> import tempfile, pathlib
+    >>> path = pathlib.Path(tempfile.mkdtemp()) / 'routes.csv'
+    >>> _ = path.write_text('ORI,DES,DIST\nDelhi,Tokyo,5836\nTokyo,Delhi,5830\n')
+
+    >>> read_indexset(path, ['ORI', 'DES'])
+    IndexSetND: (ORI, DES)
+    [('Delhi', 'Tokyo'), ('Tokyo', 'Delhi')]
+
+    >>> read_indexset(path, 'DIST', converters={'DIST': int})
+    IndexSet1D: (DIST)
+    [5836, 5830]
+    """
+    cols = _check_columns(columns, 'columns')
+    conv = _check_read_args(chunksize, converters)
+    chunks = _iter_chunks(
+        source,
+        cols,
+        engine=engine,
+        chunksize=chunksize,
+        delimiter=delimiter,
+        encoding=encoding,
+        converters=conv,
+    )
+
+    tuple_keys = isinstance(columns, Sequence) and not isinstance(columns, str)
+    indexset: IndexSet1D[Any] | IndexSetND[tuple[Any, ...]] = (
+        IndexSetND(names=cols) if tuple_keys else IndexSet1D(name=cols[0])
+    )
+    memos: list[dict[Any, Any]] = [{} for _ in cols]
+    for chunk in chunks:
+        keys = _chunk_keys(chunk, memos, tuple_keys=tuple_keys)
+        _check_new_keys(keys, indexset._set, len(indexset))
+        indexset.extend(keys)
+
+    return indexset
+
+
+def read_paramdict(
+    source: SourceT,
+    key_columns: str | Sequence[str],
+    value_column: str,
+    /,
+    *,
+    engine: EngineT | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    delimiter: str = ',',
+    encoding: str = 'utf-8',
+    converters: Mapping[str, Callable[[Any], Any]] | None = None,
+    dtype: str | None = None,
+) -> ParamDict1D[Any, int | float] | ParamDictND[tuple[Any, ...], int | float]:
+    r"""Read a ParamDict1D/ParamDictND from a CSV or Parquet file in chunks of rows.
+
+    Rows are read and appended to the ParamDict (and its index-set) one chunk at a time, so peak
+    memory stays close to the size of the ParamDict itself - unlike reading the whole file into a
+    DataFrame to cast it. Duplicate keys are detected across chunks. Equal values of each key
+    column are shared as one object across keys.
+
+    Parameters
+    ----------
+    source : str or path-like or iterable[DataFrame]
+        Path of a CSV or Parquet file, or an iterable of pandas DataFrame chunks (such as from
+        ``pandas.read_csv(..., chunksize=...)``) having the columns or index levels to read.
+    key_columns : str or sequence[str]
+        Name of a column for the keys of a ParamDict1D, or names of multiple columns for the keys
+        of a ParamDictND.
+    value_column : str
+        Name of the column for parameter values.
+    engine : {'csv', 'pandas', 'parquet'}, optional
+        Engine to read a file with - the `csv` module of the standard library, pandas, or PyArrow
+        for Parquet files. By default, ``'parquet'`` for files with ``.parquet`` or ``.pq``
+        suffix, and ``'csv'`` otherwise.
+    chunksize : int, default ``100000``
+        Number of rows to read at once (the number of rows per batch for Parquet files).
+    delimiter : str, default ``','``
+        Delimiter of CSV files.
+    encoding : str, default ``'utf-8'``
+        Encoding of CSV files.
+    converters : mapping[str, callable], optional
+        Functions to convert the values of columns, by column name. With the ``'csv'`` engine, key
+        columns are read as strings and the value column as int (if possible) or float, unless
+        converted.
+    dtype : {'float64', 'int64'}, optional
+        Data type for array-backed storage of the ParamDict.
+
+    Returns
+    -------
+    ParamDict1D or ParamDictND
+        Key column names are set as the `key_name` or `key_names` attribute, and the value column
+        name as the `value_name` attribute.
+
+    Raises
+    ------
+    TypeError
+        If `key_columns` is not a string or a sequence of strings, or `value_column` not a string.
+    ValueError
+        If `key_columns` is empty or has duplicates, or includes `value_column`.
+    ValueError
+        If `engine` is invalid.
+    TypeError
+        If `chunksize` is not an int.
+    ValueError
+        If `chunksize` is not positive.
+    ValueError
+        If any column is not found.
+    ValueError
+        If any key is duplicate.
+    TypeError
+        If any parameter value is not int or float.
+    ImportError
+        If pandas is not installed for the ``'pandas'`` engine, or PyArrow for ``'parquet'``.
+
+    Examples
+    --------
+    >>> import tempfile, pathlib
+    >>> path = pathlib.Path(tempfile.mkdtemp()) / 'routes.csv'
+    >>> _ = path.write_text('ORI,DES,DIST\nDelhi,Tokyo,5836\nTokyo,Delhi,5830\n')
+
+    >>> read_paramdict(path, ['ORI', 'DES'], 'DIST')
+    ParamDictND: (ORI, DES) -> DIST
+    {('Delhi', 'Tokyo'): 5836, ('Tokyo', 'Delhi'): 5830}
+    """
+    key_cols = _check_columns(key_columns, 'key_columns')
+    if not isinstance(value_column, str):
+        raise TypeError('`value_column` should be a string')
+    if value_column in key_cols:
+        raise ValueError('`key_columns` should not include `value_column`')
+    conv = _check_read_args(chunksize, converters)
+    if _resolve_engine(source, engine) == 'csv':
+        conv.setdefault(value_column, _parse_number)
+    chunks = _iter_chunks(
+        source,
+        [*key_cols, value_column],
+        engine=engine,
+        chunksize=chunksize,
+        delimiter=delimiter,
+        encoding=encoding,
+        converters=conv,
+    )
+
+    tuple_keys = isinstance(key_columns, Sequence) and not isinstance(key_columns, str)
+    paramdict: ParamDict1D[Any, int | float] | ParamDictND[tuple[Any, ...], int | float] = (
+        ParamDictND(key_names=key_cols, value_name=value_column, dtype=dtype)
+        if tuple_keys
+        else ParamDict1D(key_name=key_cols[0], value_name=value_column, dtype=dtype)
+    )
+    memos: list[dict[Any, Any]] = [{} for _ in key_cols]
+    for *key_chunks, values in chunks:
+        keys = _chunk_keys(key_chunks, memos, tuple_keys=tuple_keys)
+        _check_new_keys(keys, paramdict._indexset._set, len(paramdict))
+        lst_keys, lst_values = paramdict._prepare_many(keys, values)
+        paramdict._set_many(lst_keys, lst_values, lst_keys)
+
+    return paramdict
@@ -0,0 +1,958 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""SparseParamDict data structures."""
+
+from __future__ import annotations
+
+import math
+import operator
+import statistics
+from collections import Counter, abc
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import repeat
+from typing import Any, overload
+
+from typing_extensions import Unpack
+
+from ._arrays import as_python_scalar, as_python_values
+from ._dict_mixins import Dict1DMixin, DictBaseMixin, DictNDMixin
+from ._index_sets import Elem1DT, ElemNDT, ElemT, IndexSet1D, IndexSetBase, IndexSetND
+from ._param_dicts import _AGG_FUNCS, AggFuncT, ParamDict1D, ParamDictND
+
+
+def _sparse_stat(
+    stat_func: str, default: int | float, size: int, overrides: Sequence[int | float]
+) -> int | float:
+    """Calculate a statistic of values that are all equal to a default, except for the overrides.
+
+    Parameters
+    ----------
+    stat_func : str
+        One of ``'sum'``, ``'mean'``, ``'median'``, ``'median_high'``, ``'median_low'``,
+        ``'min'``, ``'max'``, ``'count'``.
+    default : int or float
+        Value for all but the overridden values.
+    size : int
+        Total number of values (positive), including the overridden ones.
+    overrides : sequence[int or float]
+        Overridden values.
+
+    Returns
+    -------
+    int or float
+    """
+    ndefault = size - len(overrides)
+    match stat_func:
+        case 'count':
+            return size
+        case 'sum':
+            return sum(overrides) + default * ndefault if ndefault else sum(overrides)
+        case 'mean':
+            total = sum(overrides) + default * ndefault if ndefault else sum(overrides)
+            if isinstance(total, int):  # all values are integers
+                return total // size if total % size == 0 else total / size
+            return (math.fsum(overrides) + default * ndefault) / size
+        case 'min':
+            return min([*overrides, default]) if ndefault else min(overrides)
+        case 'max':
+            return max([*overrides, default]) if ndefault else max(overrides)
+
+    # Medians: select by rank in the sorted order of values, i.e., the overridden values less than
+    # the default, followed by the default values, followed by the rest of the overridden values.
+    below = sorted(v for v in overrides if v < default)
+    above = sorted(v for v in overrides if not v < default)
+
+    def select(rank: int) -> int | float:
+        if rank < len(below):
+            return below[rank]
+        rank -= len(below)
+        return default if rank < ndefault else above[rank - ndefault]
+
+    match stat_func:
+        case 'median_high':
+            return select(size // 2)
+        case 'median_low':
+            return select((size - 1) // 2)
+        case _:  # 'median'
+            if size % 2:
+                return select(size // 2)
+            return (select(size // 2 - 1) + select(size // 2)) / 2
+
+
+class SparseParamDictBase(abc.Mapping[ElemT, int | float], DictBaseMixin[ElemT, int | float]):
+    """Base class for mappings of parameters with a default value and explicit overrides.
+
+    Provides:
+    1. Storage of the overridden parameter values only.
+    2. Runtime type checks to ensure parameter values are `int` or `float`.
+    3. Statistics calculated analytically from the default and overridden values.
+
+    Parameters
+    ----------
+    indexset : IndexSetBase
+        Index-set of keys for which the parameter is defined.
+    overrides : dict or dict-like mapping, optional
+        Parameter values different from the default.
+    default : int or float
+        Parameter value for all keys that are not overridden.
+    """
+
+    # Private attributes
+    # ------------------
+    # _overrides : dict
+    #     Parameter values different from the default, only for keys in the index-set (overrides
+    #     of keys removed from the index-set are discarded, as notified by the index-set).
+
+    __slots__ = ('_indexset', '_default', '_overrides')
+
+    def __init__(
+        self,
+        indexset: IndexSetBase[ElemT],
+        overrides: Mapping[ElemT, int | float] | None = None,
+        /,
+        *,
+        default: int | float = 0,
+    ) -> None:
+        default = as_python_scalar(default)
+        if not isinstance(default, int | float):
+            raise TypeError('`default` should be either int or float')
+        if overrides is None:
+            overrides = {}
+        elif not isinstance(overrides, Mapping):
+            raise TypeError('`overrides` should be a dict or dict-like mapping')
+        if any(not isinstance(x, int | float) for x in overrides.values()):
+            values = as_python_values(list(overrides.values()))
+            if values is None:
+                raise TypeError("`overrides` mapping's values should be either int or float")
+            overrides = dict(zip(overrides, values, strict=True))
+        if any(key not in indexset._set for key in overrides):
+            raise ValueError("`overrides` mapping's keys should be in the index-set")
+
+        self._indexset = indexset
+        self._default = default
+        self._overrides: dict[ElemT, int | float] = {
+            key: value for key, value in overrides.items() if not self._is_default(value)
+        }
+        indexset._add_dependent(self)
+
+    def _is_default(self, value: int | float) -> bool:
+        """Check if a value is the same as the default value, including its type.
+
+        Parameters
+        ----------
+        value : int or float
+
+        Returns
+        -------
+        bool
+        """
+        return value == self._default and type(value) is type(self._default)
+
+    def _discard_keys(self, keys: list[ElemT]) -> None:
+        """Discard the overrides of keys removed from the index-set.
+
+        Called by the index-set when elements are removed, so that keys added back to the index-set
+        get the default (instead of stale overrides).
+
+        Parameters
+        ----------
+        keys : list
+            Elements removed from (or replaced in) the index-set.
+        """
+        indexset_keys = self._indexset._set
+        overrides = self._overrides
+        for key in keys:
+            if key in overrides and key not in indexset_keys:
+                del overrides[key]
+
+    def __setstate__(self, state: tuple[dict[str, Any] | None, dict[str, Any]]) -> None:
+        # Restore attributes when unpickled (or copied), and register with the index-set again.
+        for attrs in state:
+            for name, value in (attrs or {}).items():
+                object.__setattr__(self, name, value)
+        self._indexset._add_dependent(self)
+
+    def __getitem__(self, key: ElemT, /) -> int | float:
+        # Get `self[key]`, the overridden value or the default.
+        if key not in self._indexset._set:
+            raise KeyError(key)
+        return self._overrides.get(key, self._default)
+
+    def __setitem__(self, key: ElemT, value: int | float, /) -> None:
+        # Set `self[key]` to `value`, only for keys in the index-set.
+        value = as_python_scalar(value)
+        if not isinstance(value, int | float):
+            raise TypeError('`value` should be either int or float')
+        if key not in self._indexset._set:
+            raise KeyError(key)
+        if self._is_default(value):
+            self._overrides.pop(key, None)
+        else:
+            self._overrides[key] = value
+
+    def __contains__(self, key: object, /) -> bool:
+        # Check if `key` is in the index-set.
+        return key in self._indexset._set
+
+    def __iter__(self) -> Iterator[ElemT]:
+        # Iterate over keys in the order of the index-set.
+        return iter(self._indexset._list)
+
+    def __len__(self) -> int:
+        # Number of keys in the index-set.
+        return len(self._indexset._list)
+
+    def _get_repr_body(self) -> str:
+        # Body for repr, summarizing the default and overrides instead of listing all items.
+        return f'<default {self._default!r} for {len(self)} keys; {len(self._overrides)} overrides>'
+
+    @property
+    def default(self) -> int | float:
+        """Parameter value for all keys that are not overridden.
+
+        Returns
+        -------
+        int or float
+        """
+        return self._default
+
+    @property
+    def overrides(self) -> dict[ElemT, int | float]:
+        """Copy of the parameter values that are different from the default.
+
+        Returns
+        -------
+        dict
+        """
+        return dict(self._overrides)
+
+    def _check_for_calc_stat(self, stat_func: str) -> None:
+        """Perform validation checks before calculating a statistic with parameter values.
+
+        Parameters
+        ----------
+        stat_func : str
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+        """
+        if not self:
+            raise statistics.StatisticsError(
+                f'Cannot calculate `{stat_func}` as the {self.__class__.__name__} is empty'
+            )
+
+    def _materialize_mapping(self) -> dict[ElemT, int | float]:
+        """Get a dict of all parameter values, in the order of the index-set.
+
+        Returns
+        -------
+        dict
+        """
+        mapping = dict.fromkeys(self._indexset._list, self._default)
+        mapping.update(self._overrides)
+        return mapping
+
+
+class SparseParamDict1D(SparseParamDictBase[Elem1DT], Dict1DMixin[Elem1DT, int | float]):
+    """Mapping of parameters with 1-dim scalar keys, storing only values different from a default.
+
+    Defined over a declared index-set, with the default as parameter value for all keys except
+    for the overridden ones - for parameters that are zero (or any constant) for most keys of a
+    large index-set. Statistics like `sum` and `mean` are calculated analytically from the default
+    and overridden values, without materializing all values. Can be used wherever a ParamDict1D is
+    used to read values, including as variable bounds with `add_variables`.
+
+    Parameters
+    ----------
+    indexset : IndexSet1D
+        Index-set of keys for which the parameter is defined. It is used by reference, so later
+        changes to the index-set are reflected.
+    overrides : dict or dict-like mapping, optional
+        Parameter values (int or float) that are different from the default; keys should be in
+        the index-set. Values same as the default are not stored.
+    default : int or float, default ``0``
+        Parameter value for all keys that are not overridden.
+    value_name : str, optional
+        Name to refer to parameter values - not used internally, and solely for user reference.
+
+    Raises
+    ------
+    TypeError
+        If `indexset` is not an IndexSet1D.
+    TypeError
+        If `default` or any value of `overrides` is not int or float.
+    TypeError
+        If `overrides` is not a mapping.
+    ValueError
+        If any key of `overrides` is not in the index-set.
+    TypeError
+        If `value_name` is not a string.
+
+    Examples
+    --------
+    >>> sites = IndexSet1D(range(1, 1_000_001), name='SITE')
+    >>> capacity = SparseParamDict1D(sites, {2: 500, 7: 300}, default=100, value_name='CAP')
+    >>> capacity
+    SparseParamDict1D: SITE -> CAP
+    <default 100 for 1000000 keys; 2 overrides>
+    >>> capacity[2], capacity[3]
+    (500, 100)
+    >>> capacity.sum()
+    100000600
+    """
+
+    __slots__ = ('_key_name', '_value_name')
+
+    def __init__(
+        self,
+        indexset: IndexSet1D[Elem1DT],
+        overrides: Mapping[Elem1DT, int | float] | None = None,
+        /,
+        *,
+        default: int | float = 0,
+        value_name: str | None = None,
+    ) -> None:
+        if not isinstance(indexset, IndexSet1D):
+            raise TypeError('`indexset` should be IndexSet1D')
+        self.key_name = indexset.name
+        self.value_name = value_name
+        super().__init__(indexset, overrides, default=default)
+
+    def __repr__(self) -> str:
+        # Printable string representation.
+        return f'{self._get_repr_header()}\n{self._get_repr_body()}'
+
+    def lookup(self, key: Elem1DT) -> int | float:
+        """Get the parameter value for the specified key, or zero if it is not found.
+
+        Parameters
+        ----------
+        key : key
+
+        Returns
+        -------
+        int or float
+
+        Examples
+        --------
+        >>> capacity = SparseParamDict1D(IndexSet1D([1, 2, 3]), {2: 500}, default=100)
+        >>> capacity.lookup(3)
+        100
+        >>> capacity.lookup(4)
+        0
+        """
+        if key in self._indexset._set:
+            return self[key]
+        return 0
+
+    def _calc_stat(self, stat_func: str) -> int | float:
+        """Calculate a statistic with all parameter values, analytically.
+
+        Parameters
+        ----------
+        stat_func : str
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+        """
+        self._check_for_calc_stat(stat_func)
+        overrides = list(self._overrides.values())
+        return _sparse_stat(stat_func, self._default, len(self), overrides)
+
+    def sum(self) -> int | float:
+        """Calculate the sum of all parameter values.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+
+        Examples
+        --------
+        >>> capacity = SparseParamDict1D(IndexSet1D(range(10)), {2: 500, 7: 300}, default=100)
+        >>> capacity.sum()
+        1600
+        """
+        return self._calc_stat('sum')
+
+    def mean(self) -> int | float:
+        """Calculate the mean of all parameter values.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+
+        Examples
+        --------
+        >>> capacity = SparseParamDict1D(IndexSet1D(range(10)), {2: 500, 7: 300}, default=100)
+        >>> capacity.mean()
+        160
+        """
+        return self._calc_stat('mean')
+
+    def median(self) -> int | float:
+        """Calculate the median of all parameter values.
+
+        Uses the mean of middle two for even number of values.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+
+        Examples
+        --------
+        >>> capacity = SparseParamDict1D(IndexSet1D(range(4)), {2: 500, 3: 300}, default=100)
+        >>> capacity.median()
+        200.0
+        """
+        return self._calc_stat('median')
+
+    def median_high(self) -> int | float:
+        """Calculate the high median of all parameter values.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+
+        Examples
+        --------
+        >>> capacity = SparseParamDict1D(IndexSet1D(range(4)), {2: 500, 3: 300}, default=100)
+        >>> capacity.median_high()
+        300
+        """
+        return self._calc_stat('median_high')
+
+    def median_low(self) -> int | float:
+        """Calculate the low median of all parameter values.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+
+        Examples
+        --------
+        >>> capacity = SparseParamDict1D(IndexSet1D(range(4)), {2: 500, 3: 300}, default=100)
+        >>> capacity.median_low()
+        100
+        """
+        return self._calc_stat('median_low')
+
+    def materialize(self, *, dtype: str | None = None) -> ParamDict1D[Elem1DT, int | float]:
+        """Get a ParamDict1D with explicit parameter values for all keys.
+
+        Parameters
+        ----------
+        dtype : {'float64', 'int64'}, optional
+            Data type for array-backed storage of the ParamDict1D.
+
+        Returns
+        -------
+        ParamDict1D
+
+        Examples
+        --------
+        >>> capacity = SparseParamDict1D(IndexSet1D([1, 2, 3]), {2: 500}, default=100)
+        >>> capacity.materialize()
+        ParamDict1D:
+        {1: 100, 2: 500, 3: 100}
+        """
+        mapping = self._materialize_mapping()
+        if dtype is not None:
+            return ParamDict1D(
+                mapping, key_name=self.key_name, value_name=self.value_name, dtype=dtype
+            )
+        return ParamDict1D._create(mapping, key_name=self.key_name, value_name=self.value_name)
+
+
+class SparseParamDictND(SparseParamDictBase[ElemNDT], DictNDMixin[ElemNDT, int | float]):
+    """Mapping of parameters with N-dim tuple keys, storing only values different from a default.
+
+    Defined over a declared index-set, with the default as parameter value for all keys except
+    for the overridden ones - for parameters that are zero (or any constant) for most keys of a
+    large index-set. Statistics like `sum` and `mean`, for all keys or a wildcard pattern, and
+    grouped aggregations are calculated analytically from the default and overridden values,
+    without materializing all values. Can be used wherever a ParamDictND is used to read values,
+    including as variable bounds with `add_variables`.
+
+    Parameters
+    ----------
+    indexset : IndexSetND
+        Index-set of keys for which the parameter is defined. It is used by reference, so later
+        changes to the index-set are reflected.
+    overrides : dict or dict-like mapping, optional
+        Parameter values (int or float) that are different from the default; keys should be in
+        the index-set. Values same as the default are not stored.
+    default : int or float, default ``0``
+        Parameter value for all keys that are not overridden.
+    value_name : str, optional
+        Name to refer to parameter values - not used internally, and solely for user reference.
+
+    Raises
+    ------
+    TypeError
+        If `indexset` is not an IndexSetND.
+    TypeError
+        If `default` or any value of `overrides` is not int or float.
+    TypeError
+        If `overrides` is not a mapping.
+    ValueError
+        If any key of `overrides` is not in the index-set.
+    TypeError
+        If `value_name` is not a string.
+
+    Examples
+    --------
+    >>> arcs = IndexSetND(['A', 'B', 'C'], range(1000), names=['ORI', 'DES'])
+    >>> capacity = SparseParamDictND(arcs, {('A', 5): 50, ('B', 5): 20}, value_name='CAP')
+    >>> capacity['A', 5], capacity['A', 6]
+    (50, 0)
+    >>> capacity.sum('*', 5)
+    70
+    """
+
+    __slots__ = ('_key_names', '_value_name')
+
+    def __init__(
+        self,
+        indexset: IndexSetND[ElemNDT],
+        overrides: Mapping[ElemNDT, int | float] | None = None,
+        /,
+        *,
+        default: int | float = 0,
+        value_name: str | None = None,
+    ) -> None:
+        if not isinstance(indexset, IndexSetND):
+            raise TypeError('`indexset` should be IndexSetND')
+        self.key_names = indexset.names
+        self.value_name = value_name
+        super().__init__(indexset, overrides, default=default)
+
+    def __repr__(self) -> str:
+        # Printable string representation.
+        return f'{self._get_repr_header()}\n{self._get_repr_body()}'
+
+    def lookup(self, *key: Any) -> int | float:
+        """Get the parameter value for the specified key, or zero if it is not found.
+
+        Parameters
+        ----------
+        *key : key
+
+        Returns
+        -------
+        int or float
+
+        Examples
+        --------
+        >>> arcs = IndexSetND([('A', 'B'), ('B', 'C')])
+        >>> capacity = SparseParamDictND(arcs, {('A', 'B'): 50}, default=10)
+        >>> capacity.lookup('B', 'C')
+        10
+        >>> capacity.lookup('B', 'A')
+        0
+        """
+        if any((isinstance(k, Iterable) and not isinstance(k, str)) for k in key):
+            raise TypeError('lookup key must be scalars (no iterables except string)')
+        if self and len(key) != self._indexset._tuplelen:
+            raise ValueError('lookup key length must be the same as that of N-dim tuple keys')
+        if key in self._indexset._set:
+            return self[key]
+        return 0
+
+    def _calc_stat(self, *pattern: Any, stat_func: str) -> int | float:
+        """Calculate a statistic with all parameter values or a subset, analytically.
+
+        Parameters
+        ----------
+        *pattern : Any, optional
+            For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
+            The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+        stat_func : str
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+        """
+        self._check_for_calc_stat(stat_func)
+        overrides = self._overrides
+        if not pattern:
+            return _sparse_stat(stat_func, self._default, len(self), list(overrides.values()))
+
+        size = len(self.subset_keys(*pattern))
+        if size == 0:
+            return 0
+        given = [(i, v) for i, v in enumerate(pattern) if v != '*']
+        values = [value for key, value in overrides.items() if all(key[i] == v for i, v in given)]
+        return _sparse_stat(stat_func, self._default, size, values)
+
+    def sum(self, *pattern: Any) -> int | float:
+        """Calculate the sum of all parameter values or a subset based on wildcard pattern.
+
+        Parameters
+        ----------
+        *pattern : Any, optional
+            For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
+            The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+
+        Examples
+        --------
+        >>> arcs = IndexSetND(['A', 'B'], ['X', 'Y', 'Z'])
+        >>> capacity = SparseParamDictND(arcs, {('A', 'X'): 50, ('B', 'X'): 20}, default=10)
+
+        Sum over all parameter values:
+
+        >>> capacity.sum()
+        110
+
+        Sum over a subset based on wildcard pattern:
+
+        >>> capacity.sum('A', '*')
+        70
+        """
+        return self._calc_stat(*pattern, stat_func='sum')
+
+    def mean(self, *pattern: Any) -> int | float:
+        """Calculate the mean of all parameter values or a subset based on wildcard pattern.
+
+        Parameters
+        ----------
+        *pattern : Any, optional
+            For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
+            The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+
+        Examples
+        --------
+        >>> arcs = IndexSetND(['A', 'B'], ['X', 'Y', 'Z'])
+        >>> capacity = SparseParamDictND(arcs, {('A', 'X'): 50, ('B', 'X'): 20}, default=10)
+        >>> capacity.mean('A', '*')
+        23.333333333333332
+        """
+        return self._calc_stat(*pattern, stat_func='mean')
+
+    def median(self, *pattern: Any) -> int | float:
+        """Calculate the median of all parameter values or a subset based on wildcard pattern.
+
+        Uses the mean of middle two for even number of values.
+
+        Parameters
+        ----------
+        *pattern : Any, optional
+            For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
+            The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+
+        Examples
+        --------
+        >>> arcs = IndexSetND(['A', 'B'], ['X', 'Y', 'Z'])
+        >>> capacity = SparseParamDictND(arcs, {('A', 'X'): 50, ('B', 'X'): 20}, default=10)
+        >>> capacity.median('*', 'X')
+        35.0
+        """
+        return self._calc_stat(*pattern, stat_func='median')
+
+    def median_high(self, *pattern: Any) -> int | float:
+        """Calculate the high median of all parameter values or a subset based on wildcard pattern.
+
+        Parameters
+        ----------
+        *pattern : Any, optional
+            For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
+            The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+
+        Examples
+        --------
+        >>> arcs = IndexSetND(['A', 'B'], ['X', 'Y', 'Z'])
+        >>> capacity = SparseParamDictND(arcs, {('A', 'X'): 50, ('B', 'X'): 20}, default=10)
+        >>> capacity.median_high('*', 'X')
+        50
+        """
+        return self._calc_stat(*pattern, stat_func='median_high')
+
+    def median_low(self, *pattern: Any) -> int | float:
+        """Calculate the low median of all parameter values or a subset based on wildcard pattern.
+
+        Parameters
+        ----------
+        *pattern : Any, optional
+            For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
+            The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+
+        Returns
+        -------
+        int or float
+
+        Raises
+        ------
+        StatisticsError
+            If the SparseParamDict is empty.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+
+        Examples
+        --------
+        >>> arcs = IndexSetND(['A', 'B'], ['X', 'Y', 'Z'])
+        >>> capacity = SparseParamDictND(arcs, {('A', 'X'): 50, ('B', 'X'): 20}, default=10)
+        >>> capacity.median_low('*', 'X')
+        20
+        """
+        return self._calc_stat(*pattern, stat_func='median_low')
+
+    @overload
+    def aggregate(  # numpydoc ignore=GL08
+        self, *dims: Unpack[tuple[int | str]], func: AggFuncT = ...
+    ) -> ParamDict1D[Any, Any]: ...
+
+    @overload
+    def aggregate(  # numpydoc ignore=GL08
+        self,
+        *dims: Unpack[tuple[int | str, int | str, Unpack[tuple[int | str, ...]]]],
+        func: AggFuncT = ...,
+    ) -> ParamDictND[tuple[Any, ...], Any]: ...
+
+    def aggregate(
+        self, *dims: int | str, func: AggFuncT = 'sum'
+    ) -> ParamDict1D[Any, Any] | ParamDictND[tuple[Any, ...], Any]:
+        """Aggregate parameter values by groups of given dimensions to get a new ParamDict.
+
+        Only the group sizes are counted over the index-set; each group is aggregated
+        analytically from the default and its overridden values.
+
+        Parameters
+        ----------
+        *dims : int or str
+            Dimensions of the N-dim tuple keys to keep, as position indices or names (from
+            `key_names`). All other dimensions are aggregated.
+        func : {'sum', 'mean', 'min', 'max', 'count', 'median'}, default ``'sum'``
+            Function to aggregate the parameter values of each group.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            ParamDict1D when keeping one dimension, ParamDictND otherwise; keys are ordered by their
+            first occurrence, and names of the kept dimensions and values are carried over.
+            Values are always floats for mean and median.
+
+        Raises
+        ------
+        LookupError
+            If the SparseParamDict is empty.
+        ValueError
+            If `func` is invalid.
+        ValueError
+            If no dimension is given, all dimensions are given, or any dimension is repeated.
+        ValueError
+            If any dimension is not found.
+        TypeError
+            If any dimension is not an int or str.
+
+        Examples
+        --------
+        >>> arcs = IndexSetND(['A', 'B'], ['X', 'Y', 'Z'], names=['ORI', 'DES'])
+        >>> capacity = SparseParamDictND(
+        ...     arcs, {('A', 'X'): 50, ('B', 'X'): 20}, default=10, value_name='CAP'
+        ... )
+        >>> capacity.aggregate('ORI')
+        ParamDict1D: ORI -> CAP
+        {'A': 70, 'B': 40}
+        >>> capacity.aggregate('DES', func='max')
+        ParamDict1D: DES -> CAP
+        {'X': 50, 'Y': 10, 'Z': 10}
+        """
+        if not self:  # is empty
+            raise LookupError(f'{self.__class__.__name__} is empty')
+
+        if func not in _AGG_FUNCS:
+            raise ValueError(f'`func` should be one of {", ".join(map(repr, _AGG_FUNCS))}')
+
+        if len(dims) == 0:
+            raise ValueError('dimensions to keep are required')
+        indices = self._group_dim_indices(dims, 'aggregate')
+
+        names = None if self.key_names is None else [self.key_names[i] for i in indices]
+        keyfunc = operator.itemgetter(*indices)  # scalar when keeping one dimension
+
+        sizes = Counter(map(keyfunc, self._indexset._list))
+        groups: dict[Any, list[int | float]] = {}
+        for key, value in self._overrides.items():
+            try:
+                groups[keyfunc(key)].append(value)
+            except KeyError:
+                groups[keyfunc(key)] = [value]
+        mapping = {
+            group: _sparse_stat(func, self._default, size, groups.get(group, []))
+            for group, size in sizes.items()
+        }
+        if func in ('mean', 'median'):  # floats, same as for ParamDictND
+            mapping = {group: float(value) for group, value in mapping.items()}
+
+        if len(indices) == 1:
+            return ParamDict1D._create(
+                mapping, key_name=None if names is None else names[0], value_name=self.value_name
+            )
+        return ParamDictND._create(mapping, key_names=names, value_name=self.value_name)
+
+    def materialize(self, *, dtype: str | None = None) -> ParamDictND[ElemNDT, int | float]:
+        """Get a ParamDictND with explicit parameter values for all keys.
+
+        Parameters
+        ----------
+        dtype : {'float64', 'int64'}, optional
+            Data type for array-backed storage of the ParamDictND.
+
+        Returns
+        -------
+        ParamDictND
+
+        Examples
+        --------
+        >>> arcs = IndexSetND([('A', 'B'), ('B', 'C')])
+        >>> capacity = SparseParamDictND(arcs, {('A', 'B'): 50}, default=10)
+        >>> capacity.materialize()
+        ParamDictND:
+        {('A', 'B'): 50, ('B', 'C'): 10}
+        """
+        mapping = self._materialize_mapping()
+        if dtype is not None:
+            return ParamDictND(
+                mapping, key_names=self.key_names, value_name=self.value_name, dtype=dtype
+            )
+        return ParamDictND._create(mapping, key_names=self.key_names, value_name=self.value_name)
+
+
+def sparse_bound_values(
+    indexset: IndexSet1D[Elem1DT] | IndexSetND[ElemNDT],
+    bound: SparseParamDict1D[Elem1DT] | SparseParamDictND[ElemNDT],
+) -> list[int | float | None]:
+    """Get the values of a SparseParamDict aligned with an index-set.
+
+    Parameters
+    ----------
+    indexset : IndexSet1D or IndexSetND
+    bound : SparseParamDict1D or SparseParamDictND
+
+    Returns
+    -------
+    list[int or float or None]
+        Parameter values, or ``None`` for index-set elements that are not keys of `bound`.
+    """
+    keys: list[Any] = indexset._list
+    overrides: dict[Any, int | float] = bound._overrides
+    default = bound._default
+    if bound._indexset is indexset:
+        return list(map(overrides.get, keys, repeat(default)))
+    bound_keys = bound._indexset._set
+    return [overrides.get(k, default) if k in bound_keys else None for k in keys]
@@ -0,0 +1,134 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Cache of statistics calculated with parameter values, invalidated by key coordinates.
+
+Each cached result is registered under the non-wildcard dimensions of its wildcard pattern and the
+given values for them (no dimensions for results with all parameter values). When the parameter
+value of a key is changed, only the results registered under the key's own values for those
+dimensions are invalidated - that is, the results of patterns that match the key.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from typing import Any, NamedTuple
+
+
+class StatCacheInfo(NamedTuple):
+    """Statistics of a cache of ParamDict statistics."""
+
+    hits: int
+    """Number of statistics served from the cache."""
+    misses: int
+    """Number of statistics calculated and stored in the cache."""
+    currsize: int
+    """Number of statistics currently in the cache."""
+
+
+class _MISSING:
+    __slots__ = ()
+
+
+MISSING = _MISSING()
+
+
+class StatCache:
+    """Cache of statistics by (statistic, exact, wildcard pattern), with hit/miss counters.
+
+    Invalidation is by the coordinates of changed keys, see the module docstring.
+    """
+
+    # Attributes
+    # ----------
+    # results : dict
+    #     Cached results by (statistic, exact, pattern).
+    # registry : dict[tuple[int, ...], dict[tuple, list]]
+    #     Cache keys of results by non-wildcard dimensions and the given values for them.
+    # hits, misses : int
+    #     Number of lookups that were served from the cache, or not.
+
+    __slots__ = ('results', 'registry', 'hits', 'misses')
+
+    def __init__(self) -> None:
+        self.results: dict[Hashable, int | float] = {}
+        self.registry: dict[tuple[int, ...], dict[tuple[Any, ...], list[Hashable]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, cache_key: Hashable) -> int | float | _MISSING:
+        """Get a cached result, counting the lookup as a hit or a miss.
+
+        Parameters
+        ----------
+        cache_key : hashable
+
+        Returns
+        -------
+        int or float or MISSING
+        """
+        res = self.results.get(cache_key, MISSING)
+        if res is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return res
+
+    def store(self, cache_key: Hashable, pattern: tuple[Any, ...], res: int | float) -> None:
+        """Store a result, registered by the non-wildcard coordinates of its pattern.
+
+        Parameters
+        ----------
+        cache_key : hashable
+        pattern : tuple
+            Wildcard pattern; empty for a result with all parameter values.
+        res : int or float
+        """
+        dims = tuple(i for i, v in enumerate(pattern) if v != '*')
+        given = tuple(pattern[i] for i in dims)
+        self.results[cache_key] = res
+        self.registry.setdefault(dims, {}).setdefault(given, []).append(cache_key)
+
+    def invalidate(self, key: Any) -> None:
+        """Invalidate the results of all patterns that match a key.
+
+        Parameters
+        ----------
+        key : key
+            1-dim scalar key or N-dim tuple key.
+        """
+        results = self.results
+        for dims, by_given in self.registry.items():
+            for cache_key in by_given.pop(tuple(key[i] for i in dims), ()):
+                results.pop(cache_key, None)
+
+    def invalidate_many(self, keys: Iterable[Any]) -> None:
+        """Invalidate the results of all patterns that match any of many keys.
+
+        Parameters
+        ----------
+        keys : iterable
+        """
+        if not self.results:
+            return
+        for key in keys:
+            self.invalidate(key)
+            if not self.results:
+                break
+        if not self.results:
+            self.registry.clear()
+
+    def clear(self) -> None:
+        """Remove all results."""
+        self.results.clear()
+        self.registry.clear()
+
+    def info(self) -> StatCacheInfo:
+        """Get statistics of the cache.
+
+        Returns
+        -------
+        StatCacheInfo
+        """
+        return StatCacheInfo(self.hits, self.misses, len(self.results))
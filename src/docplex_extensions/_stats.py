@@ -0,0 +1,161 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Fast single-pass reducers for parameter values.
+
+The `statistics` module of the standard library is exact but slow: it converts values to fractions
+to calculate the mean and fully sorts the values to find the median. The reducers here calculate
+the same statistics faster:
+
+* Mean of integers is exact (with integer result when possible), same as `statistics.mean`.
+* Mean of floats is calculated with `math.fsum` (exactly rounded sum) followed by one division, so
+  it can differ from `statistics.mean` in the last digit only.
+* Medians use linear-time selection with NumPy for large data, if it is installed, and sorting
+  otherwise. The results are the same as `statistics.median`, `median_high`, and `median_low`.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from statistics import StatisticsError
+from typing import Any
+
+_SELECT_MIN_SIZE = 1024
+"""Minimum number of values to use NumPy for selection, below which sorting is faster."""
+
+
+def _select(data: Sequence[int | float], ranks: tuple[int, ...]) -> list[int | float]:
+    """Select values with given ranks (position indices in sorted order).
+
+    Parameters
+    ----------
+    data : sequence[int or float]
+        Populated sequence of values.
+    ranks : tuple[int, ...]
+        Ranks of values to select.
+
+    Returns
+    -------
+    list[int or float]
+        Original values (keeping their types) with the given ranks.
+    """
+    if len(data) >= _SELECT_MIN_SIZE:
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            pass
+        else:
+            arr = np.array(data)
+            if arr.dtype.kind in 'if':  # not an object array of very large integers
+                idx = np.argpartition(arr, ranks)
+                return [data[idx[r]] for r in ranks]
+
+    ordered = sorted(data)
+    return [ordered[r] for r in ranks]
+
+
+def fast_mean(data: Sequence[int | float]) -> int | float:
+    """Calculate the mean of values.
+
+    Parameters
+    ----------
+    data : sequence[int or float]
+
+    Returns
+    -------
+    int or float
+
+    Raises
+    ------
+    StatisticsError
+        If `data` is empty.
+    """
+    n = len(data)
+    if n == 0:
+        raise StatisticsError('mean requires at least one data point')
+
+    total = sum(data)
+    if isinstance(total, int):  # all values are integers
+        return total // n if total % n == 0 else total / n
+    return math.fsum(data) / n
+
+
+def fast_median(data: Sequence[int | float]) -> int | float:
+    """Calculate the median of values, using the mean of middle two for even number of values.
+
+    Parameters
+    ----------
+    data : sequence[int or float]
+
+    Returns
+    -------
+    int or float
+
+    Raises
+    ------
+    StatisticsError
+        If `data` is empty.
+    """
+    n = len(data)
+    if n == 0:
+        raise StatisticsError('no median for empty data')
+    if n % 2:
+        return _select(data, (n // 2,))[0]
+    lo, hi = _select(data, (n // 2 - 1, n // 2))
+    return (lo + hi) / 2
+
+
+def fast_median_high(data: Sequence[int | float]) -> int | float:
+    """Calculate the high median of values.
+
+    Parameters
+    ----------
+    data : sequence[int or float]
+
+    Returns
+    -------
+    int or float
+
+    Raises
+    ------
+    StatisticsError
+        If `data` is empty.
+    """
+    n = len(data)
+    if n == 0:
+        raise StatisticsError('no median for empty data')
+    return _select(data, (n // 2,))[0]
+
+
+def fast_median_low(data: Sequence[int | float]) -> int | float:
+    """Calculate the low median of values.
+
+    Parameters
+    ----------
+    data : sequence[int or float]
+
+    Returns
+    -------
+    int or float
+
+    Raises
+    ------
+    StatisticsError
+        If `data` is empty.
+    """
+    n = len(data)
+    if n == 0:
+        raise StatisticsError('no median for empty data')
+    return _select(data, ((n - 1) // 2,))[0]
+
+
+FAST_STAT_FUNCS: dict[str, Callable[[Sequence[Any]], int | float]] = {
+    'sum': sum,
+    'mean': fast_mean,
+    'median': fast_median,
+    'median_high': fast_median_high,
+    'median_low': fast_median_low,
+}
+"""Fast reducers by name of the statistic."""
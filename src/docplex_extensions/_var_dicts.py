@@ -6,16 +6,29 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import Any, Literal, NoReturn, TypeVar, cast, overload
+from collections.abc import Callable, Iterable, Sequence
+from itertools import compress, repeat
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Any, Literal, NoReturn, TypeVar, cast, overload
 
+from docplex.mp.constants import EffortLevel, WriteLevel
 from docplex.mp.dvar import Var
 from docplex.mp.linear import LinearExpr, ZeroExpr
 from docplex.mp.model import Model
+from docplex.mp.solution import SolveSolution
 from docplex.mp.vartype import VarType
 
+from ._arrays import build_array, check_array_values, check_dtype
+from ._bounds import preprocess_bound
+from ._computed_params import ComputedParamDict1D, ComputedParamDictND
 from ._dict_mixins import DefaultT, Dict1DMixin, DictBaseMixin, DictNDMixin
 from ._index_sets import Elem1DT, ElemNDT, ElemT, IndexSet1D, IndexSetBase, IndexSetND
+from ._param_dicts import ParamDict1D, ParamDictBase, ParamDictND
+from ._sparse_params import SparseParamDict1D, SparseParamDictND
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from pandas import DataFrame
 
 VarT = TypeVar('VarT', bound=Var)
 
@@ -43,8 +56,11 @@ class VarDictBase(dict[ElemT, VarT], DictBaseMixin[ElemT, VarT]):
     # ------------------
     # _indexset : IndexSetBase
     #     Index-set of keys.
+    # _naming : function or None
+    #     Function to derive the name of each variable from its key, only for variables created with
+    #     lazy naming whose names are not assigned yet.
 
-    __slots__ = ('_indexset', '_model', '_vartype')
+    __slots__ = ('_indexset', '_model', '_vartype', '_naming')
 
     def __init__(
         self,
@@ -68,6 +84,7 @@ class VarDictBase(dict[ElemT, VarT], DictBaseMixin[ElemT, VarT]):
 
         self._model = model
         self._vartype = vartype
+        self._naming: Callable[[ElemT], str] | None = None
 
         super().__init__(docpx_var_dict)
 
@@ -91,6 +108,586 @@ class VarDictBase(dict[ElemT, VarT], DictBaseMixin[ElemT, VarT]):
         """
         return self._vartype
 
+    def assign_names(self) -> None:
+        """Assign names to the variables, if created with lazy naming.
+
+        Names are derived from the keys, and are identical to those assigned at creation without
+        lazy naming (including lookups by name with the `get_var_by_name` method of the model). This
+        is a no-op if names were assigned at creation or have been assigned
+        already.
+
+        See Also
+        --------
+        add_variables : With `lazy_names` to create variables with lazy naming.
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-set:
+
+        >>> nodes = IndexSet1D(['A', 'B'], name='node')
+
+        Add variables with lazy naming:
+
+        >>> from docplex_extensions import add_variables
+        >>> node_select = add_variables(mdl, nodes, 'B', name='select', lazy_names=True)
+        >>> node_select['A']
+        docplex.mp.Var(type=B)
+
+        Assign names before exporting the model:
+
+        >>> node_select.assign_names()
+        >>> node_select['A']
+        docplex.mp.Var(type=B,name='select_A')
+        >>> mdl.get_var_by_name('select_B') is node_select['B']
+        True
+        """
+        if self._naming is None:
+            return
+        # Keys of the VarDict itself, since the index-set it was created with can be modified later
+        names = list(map(self._naming, self.keys()))
+        variables = list(self.values())
+        # Rename all columns in one call, since CPLEX takes time linear in the number of columns for
+        # each call (as when setting the `name` of each variable one at a time)
+        self.model.get_cplex().variables.set_names(
+            list(zip((var.index for var in variables), names, strict=True))
+        )
+        # Register the names in the name index of the model as well, as for names assigned at
+        # creation (for lookups with `get_var_by_name`)
+        vars_by_name = self.model._vars_by_name
+        for var, name in zip(variables, names, strict=True):
+            var._set_name(name)
+            if name:
+                vars_by_name[name] = var
+        self._naming = None
+
+    def solution_values(
+        self, *, dtype: str | None = None, drop_zeros: bool = False
+    ) -> ParamDict1D[Any, float] | ParamDictND[Any, float]:
+        """Get the values of all variables in the incumbent solution of the model at once.
+
+        Values are read in one bulk call from the solution, rather than through the
+        `solution_value` of each variable.
+
+        Parameters
+        ----------
+        dtype : str, optional
+            Data type for array-backed storage of the values (e.g., ``'float64'``), whose
+            `values_array` is then a view of the values without any copy. Requires NumPy.
+        drop_zeros : bool, default ``False``
+            Whether to leave out keys of variables with a value of zero (e.g., for sparse
+            solutions).
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            Solution values (as floats) with the same keys (and value name) as the variables.
+
+        Raises
+        ------
+        ValueError
+            If the model has no solution.
+
+        See Also
+        --------
+        reduced_costs : For the reduced costs of all variables.
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-set:
+
+        >>> items = IndexSet1D(['A', 'B', 'C'], name='item')
+
+        Add variables, and solve:
+
+        >>> from docplex_extensions import add_variables
+        >>> pick = add_variables(mdl, items, 'B', name='pick')
+        >>> _ = mdl.add_constraint(pick.sum() <= 2)
+        >>> mdl.maximize(pick['A'] + 2 * pick['B'] + 3 * pick['C'])
+        >>> _ = mdl.solve()
+
+        >>> pick.solution_values()
+        ParamDict1D: item -> pick
+        {'A': 0.0, 'B': 1.0, 'C': 1.0}
+
+        >>> pick.solution_values(drop_zeros=True)
+        ParamDict1D: item -> pick
+        {'B': 1.0, 'C': 1.0}
+        """
+        solution = self.model.solution
+        if solution is None:
+            raise ValueError(f'Model `{self.model.name}` has no solution')
+        return self._to_paramdict(solution.get_values(list(self.values())), dtype, drop_zeros)
+
+    def reduced_costs(
+        self, *, dtype: str | None = None, drop_zeros: bool = False
+    ) -> ParamDict1D[Any, float] | ParamDictND[Any, float]:
+        """Get the reduced costs of all variables at once.
+
+        The model should be a pure LP (with no integer or binary variables), solved successfully.
+        Reduced costs are read in one bulk call, rather than through the `reduced_cost` of each
+        variable.
+
+        Parameters
+        ----------
+        dtype : str, optional
+            Data type for array-backed storage of the reduced costs (e.g., ``'float64'``), whose
+            `values_array` is then a view of the reduced costs without any copy. Requires NumPy.
+        drop_zeros : bool, default ``False``
+            Whether to leave out keys of variables with a reduced cost of zero (e.g., basic
+            variables).
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+            Reduced costs (as floats) with the same keys (and value name) as the variables.
+
+        See Also
+        --------
+        solution_values : For the solution values of all variables.
+        """
+        return self._to_paramdict(self.model.reduced_costs(list(self.values())), dtype, drop_zeros)
+
+    def to_frame(self, *, categorical: bool = True, drop_zeros: bool = False) -> DataFrame:
+        """Get the keys and solution values of all variables as a pandas DataFrame.
+
+        Solution values are read in one bulk call, as with `solution_values`, and key columns are
+        built from the unique values of each dimension of keys and an array of codes, without any
+        intermediate list of rows. Requires pandas, which is an optional dependency.
+
+        Parameters
+        ----------
+        categorical : bool, default ``True``
+            Whether key columns are categorical (with categories in the order of first occurrence)
+            - only for dimensions whose values are all `str` or all `int`; other dimensions are kept
+            as plain values.
+        drop_zeros : bool, default ``False``
+            Whether to leave out rows of variables with a value of zero (e.g., for sparse
+            solutions).
+
+        Returns
+        -------
+        pandas.DataFrame
+            Columns are named after `key_name` or `key_names` (by default ``'key'``, or ``'key_0'``,
+            ``'key_1'``, and so on), followed by `value_name` (by default ``'value'``).
+
+        Raises
+        ------
+        ValueError
+            If the model has no solution.
+        ImportError
+            If pandas is not installed.
+        ValueError
+            If column names are not unique.
+
+        See Also
+        --------
+        solution_values : For the solution values as a ParamDict.
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-set:
+
+        >>> routes = IndexSetND(
+        ...     [('Delhi', 'Tokyo'), ('Delhi', 'Paris'), ('Tokyo', 'Paris')], names=['ORI', 'DES']
+        ... )
+
+        Add variables, and solve:
+
+        >>> from docplex_extensions import add_variables
+        >>> ship = add_variables(mdl, routes, 'C', ub=10, name='SHIP')
+        >>> mdl.maximize(ship.sum('Delhi', '*') - ship.sum('Tokyo', '*'))
+        >>> _ = mdl.solve()
+
+        >>> ship.to_frame()
+             ORI    DES  SHIP
+        0  Delhi  Tokyo  10.0
+        1  Delhi  Paris  10.0
+        2  Tokyo  Paris   0.0
+
+        >>> ship.to_frame(drop_zeros=True)
+             ORI    DES  SHIP
+        0  Delhi  Tokyo  10.0
+        1  Delhi  Paris  10.0
+        """
+        return self.solution_values(drop_zeros=drop_zeros).to_frame(categorical=categorical)
+
+    def set_start(
+        self,
+        values: ParamDictBase[ElemT, Any] | Sequence[int | float] | NDArray[Any],
+        /,
+        *,
+        effort: EffortLevel | int | str | None = None,
+        start: SolveSolution | None = None,
+    ) -> SolveSolution:
+        """Add a MIP start to the model with values of the variables, at once.
+
+        All values are mapped to the variables in one pass, and registered as a single MIP start
+        with the `add_mip_start` method of the model (for all variables, including continuous
+        ones). Values for several VarDicts can be combined into one MIP start, by passing the MIP
+        start returned for one VarDict as `start` for the next.
+
+        Parameters
+        ----------
+        values : ParamDict or sequence or numpy.ndarray
+            Start values, in one of the following forms:
+
+            * A ParamDict - with keys following the same structure as the VarDict keys; may be
+              partial, as keys not found in the VarDict are skipped (and variables of keys not
+              found in the ParamDict are left out of the MIP start).
+            * A sequence of numbers (or a NumPy array) - one for each variable, in the order of
+              the VarDict.
+
+        effort : docplex.mp.constants.EffortLevel or int or str, optional
+            Effort level for CPLEX to process the MIP start, by default ``EffortLevel.Auto``. Only
+            for a new MIP start.
+        start : docplex.mp.solution.SolveSolution, optional
+            A MIP start of the model (as returned by this method) to add the values to, instead of
+            adding a new MIP start.
+
+        Returns
+        -------
+        docplex.mp.solution.SolveSolution
+            MIP start of the model.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not in any of the accepted forms.
+        ValueError
+            If a sequence does not have one value for each variable.
+        ValueError
+            If `values` has no value for any variable.
+        ValueError
+            If `start` is not a MIP start of the model, or if `effort` is given with `start`.
+        ValueError
+            If the model is not a MIP.
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-sets:
+
+        >>> sites = IndexSet1D(['S1', 'S2', 'S3'], name='site')
+        >>> links = IndexSetND([('S1', 'S2'), ('S2', 'S3')], names=['ori', 'des'])
+
+        Add variables:
+
+        >>> from docplex_extensions import add_variables
+        >>> open_site = add_variables(mdl, sites, 'B', name='open')
+        >>> use_link = add_variables(mdl, links, 'B', name='use')
+
+        Add a MIP start from the previous solution of both VarDicts:
+
+        >>> start = open_site.set_start(ParamDict1D({'S1': 1, 'S2': 1, 'S3': 0}))
+        >>> start = use_link.set_start([1, 0], start=start)
+        >>> start.number_of_var_values
+        5
+        >>> mdl.number_of_mip_starts
+        1
+        """
+        var_values = self._start_var_values(values)
+        if not var_values:
+            raise ValueError('`values` should have a value for at least one variable')
+
+        if start is not None:
+            if effort is not None:
+                raise ValueError('`effort` cannot be given with an existing `start`')
+            if not any(start is mip_start for mip_start, _ in self.model.iter_mip_starts()):
+                raise ValueError('`start` should be a MIP start of the model')
+            start.update(var_values)
+            return start
+
+        solution = SolveSolution(self.model, keep_zeros=True)
+        solution.update(var_values)
+        mip_start = self.model.add_mip_start(
+            solution, effort_level=effort, write_level=WriteLevel.AllVars
+        )
+        if mip_start is None:
+            raise ValueError('MIP starts are only available for models with discrete variables')
+        return cast('SolveSolution', mip_start)
+
+    def _start_var_values(
+        self, values: ParamDictBase[ElemT, Any] | Sequence[int | float] | NDArray[Any]
+    ) -> dict[VarT, Any]:
+        """Map start values to the variables.
+
+        Parameters
+        ----------
+        values : ParamDict or sequence or numpy.ndarray
+
+        Returns
+        -------
+        dict
+            Start value of each variable.
+        """
+        if isinstance(values, ParamDictBase):
+            if isinstance(self, VarDictND):
+                self._validate_coef_paramdict(values, 'values')
+            elif not isinstance(values, ParamDict1D):
+                raise TypeError('`values` should be a ParamDict1D')
+            # Keys of the VarDict itself, since the index-set it was created with can be modified
+            if values._indexset._list == list(self.keys()):  # same keys in the same order
+                return dict(zip(self.values(), values.values(), strict=True))
+            # Skip keys not found in the VarDict
+            return {self[key]: value for key, value in values.items() if key in self}
+
+        if hasattr(values, 'tolist') and hasattr(values, 'ndim'):  # NumPy array
+            values = values.tolist()
+        if not isinstance(values, Sequence) or isinstance(values, str):
+            raise TypeError('`values` should be either a ParamDict, sequence, or NumPy array')
+        if len(values) != len(self):
+            raise ValueError('`values` should have one value for each variable')
+        return dict(zip(self.values(), values, strict=True))
+
+    def update_bounds(
+        self,
+        *,
+        lb: int
+        | float
+        | Sequence[int | float | None]
+        | Callable[..., int | float | None]
+        | ParamDictBase[ElemT, Any]
+        | ComputedParamDict1D[Any]
+        | ComputedParamDictND[Any]
+        | SparseParamDict1D[Any]
+        | SparseParamDictND[Any]
+        | NDArray[Any]
+        | None = None,
+        ub: int
+        | float
+        | Sequence[int | float | None]
+        | Callable[..., int | float | None]
+        | ParamDictBase[ElemT, Any]
+        | ComputedParamDict1D[Any]
+        | ComputedParamDictND[Any]
+        | SparseParamDict1D[Any]
+        | SparseParamDictND[Any]
+        | NDArray[Any]
+        | None = None,
+    ) -> int:
+        """Change the lower and/or upper bounds of the variables in place, at once.
+
+        New bounds are compared with the current ones, and only the bounds that actually change are
+        passed to the model - in a single call of its `change_var_lower_bounds` (and
+        `change_var_upper_bounds`) method. This is meant for re-solving the model with new data,
+        without rebuilding it.
+
+        Parameters
+        ----------
+        lb, ub : int or float or sequence or function or ParamDict, optional
+            New lower/upper bounds, in any of the forms accepted by `add_variables`. A ParamDict may
+            be partial - keys not found in the VarDict are skipped, and the bounds of variables of
+            keys not found in the ParamDict are left unchanged (as for ``None`` values).
+
+        Returns
+        -------
+        int
+            Number of bounds that changed.
+
+        Raises
+        ------
+        TypeError
+            If a bound is not in any of the accepted forms.
+        ValueError
+            If a sequence does not have one value for each variable.
+
+        Examples
+        --------
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+        >>> plants = IndexSet1D(['Delhi', 'Tokyo', 'Paris'], name='plant')
+
+        >>> from docplex_extensions import add_variables
+        >>> output = add_variables(mdl, plants, 'C', ub=100, name='output')
+
+        >>> capacity = ParamDict1D({'Delhi': 100, 'Tokyo': 80, 'Berlin': 60})
+        >>> output.update_bounds(ub=capacity)
+        1
+        >>> output.update_bounds(lb=[10, 0, 10], ub=capacity)
+        2
+        >>> [var.ub for var in output.values()]
+        [100.0, 80.0, 100.0]
+        >>> output['Paris'].lb
+        10.0
+        """
+        changed = 0
+        if lb is not None:
+            changed += self._update_bound(lb, 'lb')
+        if ub is not None:
+            changed += self._update_bound(ub, 'ub')
+        return changed
+
+    def _update_bound(self, bound: Any, bound_type: Literal['lb', 'ub']) -> int:
+        """Change the lower or upper bounds of the variables that differ from the new bounds.
+
+        Parameters
+        ----------
+        bound : int or float or sequence or function or ParamDict
+        bound_type : {'lb', 'ub'}
+
+        Returns
+        -------
+        int
+            Number of bounds that changed.
+        """
+        indexset = cast('IndexSet1D[Any] | IndexSetND[Any]', self._indexset)
+        keys = list(self.keys())
+        if indexset._list != keys:
+            # The index-set the VarDict was created with has been modified, so align the bounds
+            # with an index-set of the keys of the VarDict itself
+            if isinstance(indexset, IndexSetND):
+                indexset = IndexSetND._create(
+                    keys, names=indexset.names, tuplelen=indexset._tuplelen
+                )
+            else:
+                indexset = IndexSet1D._create(keys, name=indexset.name)
+        values: Any = preprocess_bound(indexset, bound, bound_type)
+        if isinstance(values, int | float):
+            values = list(repeat(values, len(self)))
+        elif callable(values):
+            values = list(map(values, keys))
+        if not isinstance(values, Sequence) or isinstance(values, str):
+            raise TypeError(
+                f'`{bound_type}` should be either a number, sequence, function, or ParamDict'
+            )
+        if len(values) != len(self):
+            raise ValueError(f'`{bound_type}` should have one value for each variable')
+
+        # Bounds that differ from the current ones are resolved as DOcplex does (e.g., infinity),
+        # and compared again
+        model = self.model
+        resolve = 'resolve_lb' if bound_type == 'lb' else 'resolve_ub'
+        get_current = attrgetter('_lb' if bound_type == 'lb' else '_ub')
+        changed_vars = []
+        new_bounds = []
+        for var, value in zip(self.values(), values, strict=True):
+            if value is None or value == get_current(var):
+                continue
+            value = getattr(var.vartype, resolve)(value, model)
+            if value != get_current(var):
+                changed_vars.append(var)
+                new_bounds.append(value)
+
+        if changed_vars:
+            if bound_type == 'lb':
+                model.change_var_lower_bounds(changed_vars, new_bounds, check_bounds=False)
+            else:
+                model.change_var_upper_bounds(changed_vars, new_bounds, check_bounds=False)
+        return len(changed_vars)
+
+    def _to_paramdict(
+        self, values: list[float], dtype: str | None, drop_zeros: bool
+    ) -> ParamDict1D[Any, float] | ParamDictND[Any, float]:
+        """Build a ParamDict of values aligned with the keys of the variables.
+
+        Parameters
+        ----------
+        values : list[float]
+        dtype : str or None
+            Data type for array-backed storage.
+        drop_zeros : bool
+            Whether to leave out keys with a value of zero.
+
+        Returns
+        -------
+        ParamDict1D or ParamDictND
+        """
+        # Keys of the VarDict itself, since the index-set it was created with can be modified later
+        keys = list(self.keys())
+        values = list(map(float, values))  # DOcplex defaults to int 0 for variables not found
+        if drop_zeros:
+            keys = list(compress(keys, values))
+            values = list(compress(values, values))
+        keyset = set(keys)
+
+        array = None
+        if dtype is not None:
+            check_dtype(dtype)
+            check_array_values(cast('list[int | float]', values), dtype, 'values')
+            array = build_array(values, dtype, len(values))
+
+        mapping = dict(zip(keys, values, strict=True))
+        if isinstance(self, VarDict1D):
+            return ParamDict1D._create(
+                mapping,
+                key_name=self.key_name,
+                value_name=self.value_name,
+                array=array,
+                keyset=keyset,
+            )
+        vardict_nd = cast('VarDictND[Any, Any]', self)
+        return ParamDictND._create(
+            mapping,
+            key_names=vardict_nd.key_names,
+            value_name=vardict_nd.value_name,
+            array=array,
+            keyset=keyset,
+        )
+
+    def _scal_prod(
+        self, paramdict: ParamDictBase[Any, Any], keys: list[ElemT] | None = None
+    ) -> LinearExpr | ZeroExpr:
+        """Build the scalar product of the variables with parameter values aligned by key.
+
+        Parameters
+        ----------
+        paramdict : ParamDictBase
+            Coefficients by key; keys not found have a coefficient of zero.
+        keys : list, optional
+            Keys of the variables, if only a subset of the variables is required.
+
+        Returns
+        -------
+        docplex.mp.linear.LinearExpr or docplex.mp.linear.ZeroExpr
+        """
+        if keys is None:
+            # Keys of the VarDict itself, since the index-set it was created with can be modified
+            keys = list(self.keys())
+            variables = list(self.values())
+        else:
+            variables = [self[key] for key in keys]
+        coefs = self._aligned_coefs(paramdict, keys)
+        # Drop zero coefficients upfront, and build the expression in a single pass over the terms
+        return self.model.scal_prod_vars_all_different(
+            list(compress(variables, coefs)), list(compress(coefs, coefs))
+        )
+
+    @staticmethod
+    def _aligned_coefs(paramdict: ParamDictBase[Any, Any], keys: list[ElemT]) -> list[Any]:
+        """Get the parameter values for the keys, with zero for keys not found.
+
+        Parameters
+        ----------
+        paramdict : ParamDictBase
+        keys : list
+
+        Returns
+        -------
+        list
+        """
+        if paramdict._indexset._list == keys:  # same keys in the same order
+            return list(paramdict.values())
+        return list(map(dict.get, repeat(paramdict), keys, repeat(0)))
+
     @staticmethod
     def _validate_docpx_var_dict(docpx_var_dict: dict[ElemT, VarT]) -> None:
         """Validate that the input is a populated dict of DOcplex variables.
@@ -229,12 +826,15 @@ class VarDict1D(VarDictBase[Elem1DT, VarT], Dict1DMixin[Elem1DT, VarT]):
         model: Model,
         vartype: VarType,
         value_name: str | None = None,
+        naming: Callable[[Elem1DT], str] | None = None,
     ) -> VarDict1D[Elem1DT, VarT]:
-        # Private method to construt VarDict1D
+        # Private method to construt VarDict1D, with the function to derive variable names from keys
+        # for lazy naming
         instance = super().__new__(cls)
         cls.__init__(
             instance, docpx_var_dict, indexset, model=model, vartype=vartype, value_name=value_name
         )
+        instance._naming = naming
         return instance
 
     def __repr__(self) -> str:
@@ -316,6 +916,52 @@ class VarDict1D(VarDictBase[Elem1DT, VarT], Dict1DMixin[Elem1DT, VarT]):
         """
         return self.model.sum_vars_all_different(self.values())
 
+    def dot(self, paramdict: ParamDict1D[Elem1DT, Any], /) -> LinearExpr | ZeroExpr:
+        """Build the scalar product of the variables with the parameter values of a ParamDict1D.
+
+        Keys are aligned with the variables; the variables for keys not found in the ParamDict1D,
+        and those with a coefficient of zero, are left out of the linear expression.
+
+        Parameters
+        ----------
+        paramdict : ParamDict1D
+            Coefficients of the variables.
+
+        Returns
+        -------
+        docplex.mp.linear.LinearExpr or docplex.mp.linear.ZeroExpr
+
+        Raises
+        ------
+        TypeError
+            If `paramdict` is not a ParamDict1D.
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-set:
+
+        >>> nodes = IndexSet1D(['A', 'B', 'C'], name='node')
+
+        Add variables:
+
+        >>> from docplex_extensions import add_variables
+        >>> node_select = add_variables(mdl, nodes, 'B', name='node-select')
+
+        Scalar product with costs:
+
+        >>> cost = ParamDict1D({'A': 5, 'B': 0, 'C': 2.5})
+        >>> node_select.dot(cost)
+        docplex.mp.LinearExpr(5node-select_A+2.500node-select_C)
+        """
+        if not isinstance(paramdict, ParamDict1D):
+            raise TypeError('`paramdict` should be a ParamDict1D')
+        return self._scal_prod(paramdict)
+
 
 class VarDictND(VarDictBase[ElemNDT, VarT], DictNDMixin[ElemNDT, VarT]):
     """Custom subclasses of `dict` to define DOcplex model variables with N-dim tuple keys.
@@ -381,12 +1027,15 @@ class VarDictND(VarDictBase[ElemNDT, VarT], DictNDMixin[ElemNDT, VarT]):
         model: Model,
         vartype: VarType,
         value_name: str | None = None,
+        naming: Callable[[ElemNDT], str] | None = None,
     ) -> VarDictND[ElemNDT, VarT]:
-        # Private method to construt VarDictND
+        # Private method to construt VarDictND, with the function to derive variable names from keys
+        # for lazy naming
         instance = super().__new__(cls)
         cls.__init__(
             instance, docpx_var_dict, indexset, model=model, vartype=vartype, value_name=value_name
         )
+        instance._naming = naming
         return instance
 
     def __repr__(self) -> str:
@@ -401,6 +1050,22 @@ class VarDictND(VarDictBase[ElemNDT, VarT], DictNDMixin[ElemNDT, VarT]):
         p.text(f'{self._get_repr_header()}\n')
         p.pretty(dict(self))
 
+    def _validate_coef_paramdict(self, paramdict: Any, argname: str) -> None:
+        """Validate that the input is a ParamDictND with keys of the same length as the VarDictND.
+
+        Parameters
+        ----------
+        paramdict : Any
+        argname : str
+            Name of the argument to refer to in error messages.
+        """
+        if not isinstance(paramdict, ParamDictND):
+            raise TypeError(f'`{argname}` should be a ParamDictND')
+        if paramdict and paramdict._indexset._tuplelen != self._indexset._tuplelen:
+            raise ValueError(
+                f'keys of `{argname}` and VarDictND should be tuples of the same length'
+            )
+
     def lookup(self, *key: Any) -> VarT | Literal[0]:
         """Get the variable for the specified key, or zero if it is not found.
 
@@ -499,3 +1164,171 @@ class VarDictND(VarDictBase[ElemNDT, VarT], DictNDMixin[ElemNDT, VarT]):
         if pattern:
             return self.model.sum_vars_all_different(self.subset_values(*pattern))
         return self.model.sum_vars_all_different(self.values())
+
+    def dot(self, paramdict: ParamDictND[ElemNDT, Any], /, *pattern: Any) -> LinearExpr | ZeroExpr:
+        """Build the scalar product of the variables with the parameter values of a ParamDictND.
+
+        All variables, or a subset based on wildcard pattern, are included. Keys are aligned with
+        the variables; the variables for keys not found in the ParamDictND, and those with a
+        coefficient of zero, are left out of the linear expression.
+
+        Parameters
+        ----------
+        paramdict : ParamDictND
+            Coefficients of the variables.
+        *pattern : Any, optional
+            For subsets, the pattern requires one value for each dimension of the N-dim tuple key.
+            The single-character string ``'*'`` (asterisk) can be used as a wildcard to represent
+            all possible values for a dimension.
+
+        Returns
+        -------
+        docplex.mp.linear.LinearExpr or docplex.mp.linear.ZeroExpr
+
+        Raises
+        ------
+        TypeError
+            If `paramdict` is not a ParamDictND.
+        ValueError
+            If the N-dim tuple keys of `paramdict` and the variables are of different lengths.
+        TypeError
+            If the pattern includes non-scalar(s).
+        ValueError
+            If the pattern is not the same as the length of N-dim tuple keys.
+        ValueError
+            If the pattern has no wildcard or all wildcards.
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-set:
+
+        >>> arcs = IndexSetND([('A', 'B'), ('B', 'C'), ('C', 'B')], names=['ori', 'des'])
+
+        Add variables:
+
+        >>> from docplex_extensions import add_variables
+        >>> arc_flow = add_variables(mdl, arcs, 'C', ub=10, name='arc-flow')
+
+        Scalar product with costs:
+
+        >>> cost = ParamDictND({('A', 'B'): 2, ('B', 'C'): 3, ('C', 'B'): 4})
+        >>> arc_flow.dot(cost)
+        docplex.mp.LinearExpr(2arc-flow_A_B+3arc-flow_B_C+4arc-flow_C_B)
+
+        Scalar product for the subset of variables having ``'B'`` at the second dimension index:
+
+        >>> arc_flow.dot(cost, '*', 'B')
+        docplex.mp.LinearExpr(2arc-flow_A_B+4arc-flow_C_B)
+        """
+        self._validate_coef_paramdict(paramdict, 'paramdict')
+        if pattern:
+            return self._scal_prod(paramdict, self.subset_keys(*pattern))
+        return self._scal_prod(paramdict)
+
+    def sum_by(
+        self, *dims: int | str, coef: ParamDictND[ElemNDT, Any] | None = None
+    ) -> dict[Any, LinearExpr | ZeroExpr]:
+        """Sum the variables by groups of given dimensions, in a linear expression for each group.
+
+        All groups are summed in a single pass over the variables; this is much faster than calling
+        `sum` with a wildcard pattern for each group.
+
+        Parameters
+        ----------
+        *dims : int or str
+            Dimensions of the N-dim tuple keys to group by, as position indices or names (from
+            `key_names`). All other dimensions are summed.
+        coef : ParamDictND, optional
+            Coefficients of the variables; the variables for keys not found, and those with a
+            coefficient of zero, are left out of the linear expressions.
+
+        Returns
+        -------
+        dict
+            Linear expression for each group, ordered by first occurrence; groups are scalars when
+            grouping by one dimension, and tuples otherwise. Groups with no terms (only zero
+            coefficients) have a ``docplex.mp.linear.ZeroExpr``.
+
+        Raises
+        ------
+        ValueError
+            If no dimension is given, all dimensions are given, or any dimension is repeated.
+        ValueError
+            If any dimension is not found.
+        TypeError
+            If any dimension is not an int or str.
+        TypeError
+            If `coef` is not a ParamDictND.
+        ValueError
+            If the N-dim tuple keys of `coef` and the variables are of different lengths.
+
+        Examples
+        --------
+        Create DOcplex model:
+
+        >>> from docplex.mp.model import Model
+        >>> mdl = Model()
+
+        Create index-set:
+
+        >>> arcs = IndexSetND([('A', 'B'), ('B', 'C'), ('C', 'B')], names=['ori', 'des'])
+
+        Add variables:
+
+        >>> from docplex_extensions import add_variables
+        >>> arc_flow = add_variables(mdl, arcs, 'C', ub=10, name='arc-flow')
+
+        Sum of inflows for each node:
+
+        >>> arc_flow.sum_by('des')
+        {'B': docplex.mp.LinearExpr(arc-flow_A_B+arc-flow_C_B),
+         'C': docplex.mp.LinearExpr(arc-flow_B_C)}
+
+        Sum of costs of outflows for each node:
+
+        >>> cost = ParamDictND({('A', 'B'): 2, ('B', 'C'): 3, ('C', 'B'): 4})
+        >>> arc_flow.sum_by(0, coef=cost)
+        {'A': docplex.mp.LinearExpr(2arc-flow_A_B),
+         'B': docplex.mp.LinearExpr(3arc-flow_B_C),
+         'C': docplex.mp.LinearExpr(4arc-flow_C_B)}
+        """
+        if len(dims) == 0:
+            raise ValueError('dimensions to group by are required')
+        indices = tuple(self._dim_index(dim) for dim in dims)
+        if len(set(indices)) != len(indices):
+            raise ValueError('dimensions to group by should not be repeated')
+        if len(indices) == self._indexset._tuplelen:
+            raise ValueError(
+                '`sum_by` does not work with all dimensions; use the VarDictND directly'
+            )
+        if coef is not None:
+            self._validate_coef_paramdict(coef, 'coef')
+
+        # Keys of the VarDict itself, since the index-set it was created with can be modified later
+        keys = list(self.keys())
+        keyfunc = itemgetter(*indices)  # scalar when grouping by one dimension
+        groups: dict[Any, list[Any]] = {}
+        for group, var in zip(map(keyfunc, keys), self.values(), strict=True):
+            try:
+                groups[group].append(var)
+            except KeyError:
+                groups[group] = [var]
+        if coef is None:
+            return {
+                group: self.model.sum_vars_all_different(variables)
+                for group, variables in groups.items()
+            }
+
+        # Group the coefficients in the same order as the variables
+        group_coefs: dict[Any, list[Any]] = {group: [] for group in groups}
+        for group, value in zip(map(keyfunc, keys), self._aligned_coefs(coef, keys), strict=True):
+            group_coefs[group].append(value)
+        return {
+            group: self.model.scal_prod_vars_all_different(variables, group_coefs[group])
+            for group, variables in groups.items()
+        }
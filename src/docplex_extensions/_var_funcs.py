@@ -10,6 +10,7 @@ from collections.abc import Callable, Sequence
 from typing import Literal, overload
 
 from docplex.mp.dvar import Var
+from docplex.mp.mfactory import compile_naming_function, str_flatten_tuple
 from docplex.mp.model import Model
 from docplex.mp.vartype import (
     BinaryVarType,
@@ -19,8 +20,11 @@ from docplex.mp.vartype import (
     SemiIntegerVarType,
 )
 
+from ._bounds import preprocess_bound
+from ._computed_params import ComputedParamDict1D, ComputedParamDictND
 from ._index_sets import Elem1DT, ElemNDT, IndexSet1D, IndexSetND
 from ._param_dicts import ParamDict1D, ParamDictND, ParamT
+from ._sparse_params import SparseParamDict1D, SparseParamDictND
 from ._var_dicts import VarDict1D, VarDictND
 
 
@@ -65,89 +69,6 @@ def _get_docpx_vartype(
             raise ValueError('`vartype` is invalid')
 
 
-def _paramdictNd_as_bound(
-    indexset: IndexSetND[ElemNDT],
-    bound: ParamDictND[ElemNDT, ParamT],
-    bound_type: Literal['lb', 'ub'],
-) -> Callable[..., int | float | None]:
-    """Use ParamDictND as DOcplex varaible bound.
-
-    Parameters
-    ----------
-    indexset : IndexSetND
-        Index-set for defining the variables.
-    bound : ParamDictND
-        ParamDict to be used as variable bound.
-    bound_type : str
-        Bound type, either ``'lb'`` or ``'ub'``.
-
-    Returns
-    -------
-    function
-        ParamDictND.get method that can be used for variable bound DOcplex variable bound for
-        the `Model.xyz_var_dict` method.
-
-    Raises
-    ------
-    ValueError
-        ParamDict keys and indexset have tuple elements of different lengths.
-    """
-    if (not bound) or (bound and bound._indexset._tuplelen == indexset._tuplelen):
-        return bound.get
-    else:
-        raise ValueError(f'{bound_type} keys and indexset have tuple elements of different lengths')
-
-
-def _preprocess_bound(
-    indexset: IndexSet1D[Elem1DT] | IndexSetND[ElemNDT],
-    bound: int
-    | float
-    | Sequence[int | float | None]
-    | Callable[..., int | float | None]
-    | ParamDict1D[Elem1DT, ParamT]
-    | ParamDictND[ElemNDT, ParamT]
-    | None,
-    bound_type: Literal['lb', 'ub'],
-) -> int | float | Sequence[int | float | None] | Callable[..., int | float | None] | None:
-    """Preprocess DOcplex variable bound.
-
-    Parameters
-    ----------
-    indexset : IndexSet1D or IndexSetND
-        Index-set for defining the variables.
-    bound : ParamDict1D or ParamDictND
-        ParamDict to be used as variable bound.
-    bound_type : str
-        Bound type, either ``'lb'`` or ``'ub'``.
-
-    Returns
-    -------
-    int or float or Sequence or function or None
-        DOcplex variable bound for the `Model.xyz_var_dict` method.
-
-    Raises
-    ------
-    ValueError
-        ParamDict keys and indexset have tuple elements of different lengths.
-    TypeError
-        If paramdict is ParamDictND and indexset is IndexSet1D, or vice versa.
-    """
-    # Validate if ParamDict is used as variable bound
-    if isinstance(bound, ParamDict1D):
-        if isinstance(indexset, IndexSet1D):
-            return bound.get
-        else:
-            raise TypeError(f'`{bound_type}` should be ParamDictND when indexset is IndexSetND')
-    elif isinstance(bound, ParamDictND):
-        if isinstance(indexset, IndexSetND):
-            return _paramdictNd_as_bound(indexset, bound, bound_type)
-        else:
-            raise TypeError(f'`{bound_type}` should be ParamDict1D when indexset is IndexSet1D')
-    # Let DOcplex handle everything else, so return as is
-    else:
-        return bound
-
-
 @overload
 def add_variable(  # numpydoc ignore=GL08
     model: Model,
@@ -304,15 +225,20 @@ def add_variables(  # numpydoc ignore=GL08
     | float
     | Sequence[int | float]
     | Callable[..., int | float]
-    | ParamDict1D[Elem1DT, ParamT],
+    | ParamDict1D[Elem1DT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT],
     ub: int
     | float
     | Sequence[int | float | None]
     | Callable[..., int | float | None]
     | ParamDict1D[Elem1DT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT]
     | None = ...,
     name: str | Callable[..., str] | None = ...,
     key_format: str | None = ...,
+    lazy_names: bool = ...,
 ) -> VarDict1D[Elem1DT, Var]: ...
 
 
@@ -327,15 +253,20 @@ def add_variables(  # numpydoc ignore=GL08
     | Sequence[int | float | None]
     | Callable[..., int | float | None]
     | ParamDict1D[Elem1DT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT]
     | None = ...,
     ub: int
     | float
     | Sequence[int | float | None]
     | Callable[..., int | float | None]
     | ParamDict1D[Elem1DT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT]
     | None = ...,
     name: str | Callable[..., str] | None = ...,
     key_format: str | None = ...,
+    lazy_names: bool = ...,
 ) -> VarDict1D[Elem1DT, Var]: ...
 
 
@@ -360,15 +291,20 @@ def add_variables(  # numpydoc ignore=GL08
     | float
     | Sequence[int | float]
     | Callable[..., int | float]
-    | ParamDictND[ElemNDT, ParamT],
+    | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT],
     ub: int
     | float
     | Sequence[int | float | None]
     | Callable[..., int | float | None]
     | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT]
     | None = ...,
     name: str | Callable[..., str] | None = ...,
     key_format: str | None = ...,
+    lazy_names: bool = ...,
 ) -> VarDictND[ElemNDT, Var]: ...
 
 
@@ -383,15 +319,20 @@ def add_variables(  # numpydoc ignore=GL08
     | Sequence[int | float | None]
     | Callable[..., int | float | None]
     | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT]
     | None = ...,
     ub: int
     | float
     | Sequence[int | float | None]
     | Callable[..., int | float | None]
     | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT]
     | None = ...,
     name: str | Callable[..., str] | None = ...,
     key_format: str | None = ...,
+    lazy_names: bool = ...,
 ) -> VarDictND[ElemNDT, Var]: ...
 
 
@@ -417,6 +358,10 @@ def add_variables(
     | Callable[..., int | float | None]
     | ParamDict1D[Elem1DT, ParamT]
     | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT]
     | None = None,
     ub: int
     | float
@@ -424,9 +369,14 @@ def add_variables(
     | Callable[..., int | float | None]
     | ParamDict1D[Elem1DT, ParamT]
     | ParamDictND[ElemNDT, ParamT]
+    | ComputedParamDict1D[Elem1DT]
+    | SparseParamDict1D[Elem1DT]
+    | ComputedParamDictND[ElemNDT]
+    | SparseParamDictND[ElemNDT]
     | None = None,
     name: str | Callable[..., str] | None = None,
     key_format: str | None = None,
+    lazy_names: bool = False,
 ) -> VarDict1D[Elem1DT, Var] | VarDictND[ElemNDT, Var]:
     """Create and add multiple variables (corresponding to an index-set) to the DOcplex model.
 
@@ -453,11 +403,13 @@ def add_variables(
         Lower bound, in one of the following forms:
 
         * A number - if all variables share the same lower bound.
-        * A sequence of numbers - one for each variable.
+        * A sequence of numbers (or a NumPy array) - one for each variable.
         * A function - that returns a number when called on each element of index-set.
         * A ParamDict - with keys following the same structute as the index-set elements and values
           representing the lower bound; will fallback to ``None`` for index-set elements not found
           in ParamDict keys.
+        * A ComputedParamDict - same as a ParamDict, with all values computed at once.
+        * A SparseParamDict - same as a ParamDict, with the default for keys not overridden.
 
         Default ``None`` corresponds to:
 
@@ -471,11 +423,13 @@ def add_variables(
         Upper bound, in one of the following forms:
 
         * A number - if all variables share the same lower bound.
-        * A sequence of numbers - one for each variable.
+        * A sequence of numbers (or a NumPy array) - one for each variable.
         * A function - that returns a number when called on each element of the index-set.
         * A ParamDict - with keys following the same structute as the index-set elements and values
           representing the upper bound; will fallback to ``None`` for index-set elements not found
           in ParamDict keys.
+        * A ComputedParamDict - same as a ParamDict, with all values computed at once.
+        * A SparseParamDict - same as a ParamDict, with the default for keys not overridden.
 
         Default ``None`` corresponds to:
 
@@ -497,6 +451,12 @@ def add_variables(
 
     key_format : format str (should include '%s'), optional
         Defines how index-set elements are incorporated into variable names, by default ``'_%s'``.
+    lazy_names : bool, optional
+        If ``True``, variables are created without names, and the names given by `name` and
+        `key_format` are assigned only when needed with the `assign_names` method of the VarDict
+        (e.g., before exporting the model as an LP file) - this saves the time and memory to format
+        and store a name for each variable. Names are identical to those assigned at creation
+        otherwise. By default ``False``.
 
     Returns
     -------
@@ -550,28 +510,39 @@ def add_variables(
     if not indexset:
         raise ValueError(f'{indexset.__class__.__name__} is empty')
 
-    lb = _preprocess_bound(indexset, lb, 'lb')
-    ub = _preprocess_bound(indexset, ub, 'ub')
+    lb = preprocess_bound(indexset, lb, 'lb')
+    ub = preprocess_bound(indexset, ub, 'ub')
 
     vt = _get_docpx_vartype(var_type, model)
     if vt.is_semi_type():
         # Provide informative error messages since those from DOcplex are not easy to understand
         if lb is None:
             raise ValueError(f'Need to set a lower bound for {vt.short_name} variable type')
-        if (isinstance(lb, Sequence) and None in lb) or (
-            callable(lb) and any(lb(elem) is None for elem in indexset)
-        ):
+        if callable(lb):  # call once for each element, and reuse the values for DOcplex
+            lb = list(map(lb, indexset._list))
+        if isinstance(lb, Sequence) and None in lb:
             raise ValueError(
                 f'Found None with given `lb`; not allowed for {vt.short_name} variable type'
             )
 
-    docpx_var_dict = model.var_dict(indexset, vt, lb, ub, name, key_format)
+    if not isinstance(lazy_names, bool):
+        raise TypeError('`lazy_names` should be a bool')
+    naming = None
+    if lazy_names:
+        # Compile the naming function (same as DOcplex) now, so invalid names fail early
+        if name is not None and not model.ignore_names:
+            naming = compile_naming_function(
+                indexset._list, name, key_format=key_format, stringifier=str_flatten_tuple
+            )
+        docpx_var_dict = model.var_dict(indexset, vt, lb, ub, None)
+    else:
+        docpx_var_dict = model.var_dict(indexset, vt, lb, ub, name, key_format)
     value_name = name if isinstance(name, str) else None
 
     if isinstance(indexset, IndexSet1D):
         return VarDict1D._create(
-            docpx_var_dict, indexset, model=model, vartype=vt, value_name=value_name
+            docpx_var_dict, indexset, model=model, vartype=vt, value_name=value_name, naming=naming
         )
     return VarDictND._create(
-        docpx_var_dict, indexset, model=model, vartype=vt, value_name=value_name
+        docpx_var_dict, indexset, model=model, vartype=vt, value_name=value_name, naming=naming
     )
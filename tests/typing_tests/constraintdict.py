@@ -0,0 +1,32 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+from docplex.mp.constr import LinearConstraint
+from docplex.mp.model import Model
+from typing_extensions import assert_type
+
+from docplex_extensions import (
+    ConstraintDict1D,
+    ConstraintDictND,
+    IndexSet1D,
+    IndexSetND,
+    add_constraints,
+    add_variables,
+)
+
+mdl = Model()
+
+nodes = IndexSet1D(['A', 'B', 'C'])
+arcs = IndexSetND([('A', 'B'), ('B', 'C')])
+select = add_variables(mdl, nodes, 'B')
+flow = add_variables(mdl, arcs, 'C')
+
+assert_type(add_constraints(mdl, nodes, select, '<=', 1), ConstraintDict1D[str, LinearConstraint])
+assert_type(
+    add_constraints(mdl, nodes, lambda node: flow.sum(node, '*'), '==', [1, 2, 3]),
+    ConstraintDict1D[str, LinearConstraint],
+)
+assert_type(
+    add_constraints(mdl, arcs, flow, '>=', 0), ConstraintDictND[tuple[str, str], LinearConstraint]
+)
@@ -0,0 +1,15 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Common fixtures for testing constraint functionality."""
+
+import pytest
+from docplex.mp.model import Model
+
+
+@pytest.fixture
+def mdl():
+    mdl = Model()
+    yield mdl
+    mdl.end()
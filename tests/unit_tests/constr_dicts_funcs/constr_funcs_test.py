@@ -0,0 +1,162 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Add constraints functionality."""
+
+import numpy as np
+import pytest
+from docplex.mp.model import Model
+
+from docplex_extensions import (
+    ComputedParamDict1D,
+    ConstraintDict1D,
+    ConstraintDictND,
+    IndexSet1D,
+    IndexSetND,
+    ParamDict1D,
+    ParamDictND,
+    SparseParamDictND,
+    add_constraints,
+    add_variables,
+)
+
+NODES = IndexSet1D(['A', 'B', 'C'], name='node')
+ARCS = IndexSetND([('A', 'B'), ('B', 'C'), ('C', 'B')], names=['ori', 'des'])
+
+
+def zero(key):
+    return 0
+
+
+def ct_tuple(ct):
+    return (
+        {var.index: coef for var, coef in ct.iter_net_linear_coefs()},
+        ct.sense.value,
+        ct.cplex_num_rhs(),
+        ct.name,
+    )
+
+
+@pytest.mark.parametrize(
+    'sense, docpx_method',
+    [
+        ('<=', 'le_constraint'),
+        ('le', 'le_constraint'),
+        ('>=', 'ge_constraint'),
+        ('GE', 'ge_constraint'),
+        ('==', 'eq_constraint'),
+        ('eq', 'eq_constraint'),
+    ],
+)
+def test_add_constraints_1d_pass(mdl, sense, docpx_method):
+    x = add_variables(mdl, NODES, 'C', name='x')
+    cts = add_constraints(mdl, NODES, lambda key: 2 * x[key] + 1, sense, 5, name='ct')
+    assert type(cts) is ConstraintDict1D
+    assert list(cts) == list(NODES)
+    assert cts.key_name == 'node'
+    assert cts.value_name == 'ct'
+    assert cts.model is mdl
+    for key, ct in cts.items():
+        expected = getattr(mdl, docpx_method)(2 * x[key] + 1, 5, f'ct_{key}')
+        assert ct_tuple(ct) == ct_tuple(expected)
+        assert ct.is_added()
+    assert mdl.number_of_linear_constraints == 3
+
+
+def test_add_constraints_nd_pass(mdl):
+    x = add_variables(mdl, ARCS, 'C', name='x')
+    cts = add_constraints(mdl, ARCS, x, '<=', ParamDictND({('A', 'B'): 4, ('C', 'B'): 6}))
+    assert type(cts) is ConstraintDictND
+    assert list(cts) == list(ARCS)
+    assert cts.key_names == ['ori', 'des']
+    assert cts.value_name is None
+    assert [ct.cplex_num_rhs() for ct in cts.values()] == [4, 0, 6]  # 0 for keys not found
+    assert all(ct.name is None for ct in cts.values())
+    assert mdl.number_of_linear_constraints == 3
+
+
+def test_add_constraints_lhs_mapping(mdl):
+    x = add_variables(mdl, ARCS, 'C', name='x')
+    inflow = x.sum_by('des')  # no arcs into 'A'
+    with pytest.raises(ValueError, match="should have a value for each element.*missing 1: 'A'"):
+        add_constraints(mdl, NODES, inflow, '>=', 1)
+    assert mdl.number_of_constraints == 0
+    cts = add_constraints(mdl, IndexSet1D(['B', 'C']), inflow, '>=', 1)
+    assert ct_tuple(cts['B'])[0] == {x[('A', 'B')].index: 1, x[('C', 'B')].index: 1}
+    cts = add_constraints(mdl, NODES, lambda node: inflow.get(node, 0), '>=', 0)
+    assert [ct.lhs.is_zero() for ct in cts.values()] == [True, False, False]
+
+
+def test_add_constraints_lhs_mapping_missing_many(mdl):
+    nodes = IndexSet1D(range(8))
+    with pytest.raises(ValueError, match=r'missing 7: 1, 2, 3, 4, 5, \.\.\.$'):
+        add_constraints(mdl, nodes, {0: mdl.continuous_var()}, '<=', 1)
+
+
+@pytest.mark.parametrize(
+    'rhs',
+    [
+        [1, 2, 3],
+        (1, 2, 3),
+        np.array([1, 2, 3]),
+        {'A': 1, 'B': 2, 'C': 3}.get,
+        ParamDict1D({'C': 3, 'B': 2, 'A': 1}),
+        ParamDict1D({'A': 1, 'B': 2, 'C': 3}, dtype='int64'),
+        ComputedParamDict1D(lambda key: ord(key) - 64, NODES),
+    ],
+)
+def test_add_constraints_rhs_pass(mdl, rhs):
+    x = add_variables(mdl, NODES, 'C')
+    cts = add_constraints(mdl, NODES, x, '<=', rhs)
+    assert [ct.cplex_num_rhs() for ct in cts.values()] == [1, 2, 3]
+
+
+def test_add_constraints_rhs_scalar(mdl):
+    x = add_variables(mdl, ARCS, 'C')
+    cts = add_constraints(mdl, ARCS, x, '<=', np.float32(2.5))
+    assert [ct.cplex_num_rhs() for ct in cts.values()] == [2.5] * 3
+    sparse = SparseParamDictND(ARCS, {('B', 'C'): 1}, default=5)
+    cts = add_constraints(mdl, ARCS, x, '>=', sparse)
+    assert [ct.cplex_num_rhs() for ct in cts.values()] == [5, 1, 5]
+
+
+def test_add_constraints_names(mdl):
+    x = add_variables(mdl, ARCS, 'C')
+    cts = add_constraints(mdl, ARCS, x, '<=', 1, name='cap', key_format='[%s]')
+    assert [ct.name for ct in cts.values()] == ['cap[A_B]', 'cap[B_C]', 'cap[C_B]']
+    cts = add_constraints(mdl, ARCS, x, '<=', 1, name=lambda key: '-'.join(key))
+    assert [ct.name for ct in cts.values()] == ['A-B', 'B-C', 'C-B']
+    assert cts.value_name is None
+    mdl_no_names = Model(ignore_names=True)
+    y = add_variables(mdl_no_names, ARCS, 'C')
+    cts = add_constraints(mdl_no_names, ARCS, y, '<=', 1, name='cap')
+    assert all(ct.name is None for ct in cts.values())
+    mdl_no_names.end()
+
+
+@pytest.mark.parametrize(
+    'args, exc, match',
+    [
+        (('abc', NODES, zero, '<=', 0), TypeError, '`model` should be'),
+        ((None, ['A'], zero, '<=', 0), TypeError, '`indexset` should be'),
+        ((None, IndexSet1D(), zero, '<=', 0), ValueError, 'IndexSet1D is empty'),
+        ((None, NODES, 1, '<=', 0), TypeError, '`lhs` should be either a function or a mapping'),
+        ((None, NODES, {'A': 0}, '<=', 0), ValueError, "missing 2: 'B', 'C'"),
+        ((None, NODES, zero, '<', 0), ValueError, '`sense` should be one of'),
+        ((None, NODES, zero, 1, 0), ValueError, '`sense` should be one of'),
+        ((None, NODES, zero, '<=', None), TypeError, '`rhs` should be either a number'),
+        ((None, NODES, zero, '<=', 'abc'), TypeError, '`rhs` should be either a number'),
+        ((None, NODES, zero, '<=', [1, 2]), ValueError, '`rhs` should have one value'),
+        ((None, NODES, zero, '<=', [1, None, 3]), ValueError, '`rhs` should not have None values'),
+        ((None, NODES, zero, '<=', {'A': 1}.get), ValueError, '`rhs` should not have None values'),
+        ((None, NODES, zero, '<=', ParamDictND()), TypeError, '`rhs` should be ParamDict1D'),
+        ((None, ARCS, zero, '<=', ParamDictND({(1, 2, 3): 1})), ValueError, 'rhs keys'),
+    ],
+)
+def test_add_constraints_err(mdl, args, exc, match):
+    if args[0] is None:
+        args = (mdl, *args[1:])
+    with pytest.raises(exc, match=match):
+        add_constraints(*args)
+    assert mdl.number_of_constraints == 0
@@ -0,0 +1,121 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""ConstraintDict1D & ConstraintDictND constructor, methods, and bulk accessors."""
+
+import pytest
+
+from docplex_extensions import (
+    ConstraintDict1D,
+    ConstraintDictND,
+    IndexSet1D,
+    IndexSetND,
+    ParamDict1D,
+    ParamDictND,
+    add_constraints,
+    add_variables,
+)
+
+NODES = IndexSet1D(['A', 'B', 'C'], name='node')
+ARCS = IndexSetND([('A', 'B'), ('B', 'C'), ('C', 'B')], names=['ori', 'des'])
+
+
+@pytest.mark.parametrize('cls, indexset', [[ConstraintDict1D, NODES], [ConstraintDictND, ARCS]])
+def test_constraintdict_init_typerr(mdl, cls, indexset):
+    with pytest.raises(TypeError, match='not meant to be instantiated'):
+        cls({}, indexset, model=mdl)
+    with pytest.raises(TypeError, match='input should be a dict'):
+        cls._create([1], indexset, model=mdl)
+    with pytest.raises(ValueError, match='dict should be populated'):
+        cls._create({}, indexset, model=mdl)
+    x = add_variables(mdl, indexset, 'C')
+    with pytest.raises(TypeError, match='dict values should be'):
+        cls._create(dict(x), indexset, model=mdl)
+    cts = add_constraints(mdl, indexset, x, '<=', 1)
+    with pytest.raises(ValueError, match='keys are not the same'):
+        cls._create({indexset[0]: cts[indexset[0]]}, indexset, model=mdl)
+
+
+@pytest.mark.parametrize(
+    'method', ['clear', 'copy', 'pop', 'popitem', 'setdefault', 'update', 'fromkeys']
+)
+@pytest.mark.parametrize('indexset', [NODES, ARCS])
+def test_constraintdict_attrerr(mdl, indexset, method):
+    cts = add_constraints(mdl, indexset, add_variables(mdl, indexset, 'C'), '<=', 1)
+    with pytest.raises(AttributeError, match=f'`{method}` is not supported'):
+        getattr(cts, method)()
+
+
+@pytest.mark.parametrize('indexset', [NODES, ARCS])
+def test_constraintdict_item_attrerr(mdl, indexset):
+    cts = add_constraints(mdl, indexset, add_variables(mdl, indexset, 'C'), '<=', 1)
+    with pytest.raises(AttributeError, match='`__setitem__` is not supported'):
+        cts[indexset[0]] = cts[indexset[1]]
+    with pytest.raises(AttributeError, match='`__delitem__` is not supported'):
+        del cts[indexset[0]]
+
+
+def test_constraintdict_repr(mdl):
+    cts = add_constraints(mdl, NODES, add_variables(mdl, NODES, 'C', name='x'), '<=', 1, name='c')
+    assert repr(cts).startswith('ConstraintDict1D: node -> c\n{')
+    cts = add_constraints(mdl, ARCS, add_variables(mdl, ARCS, 'C'), '<=', 1, name='c')
+    assert repr(cts).startswith('ConstraintDictND: (ori, des) -> c\n{')
+    cts = add_constraints(mdl, IndexSetND([(1, 2)]), lambda key: 0, '<=', 1)
+    assert repr(cts).startswith('ConstraintDictND:\n{')
+
+
+def test_constraintdict_lookup(mdl):
+    cts = add_constraints(mdl, NODES, add_variables(mdl, NODES, 'C'), '<=', 1)
+    assert cts.lookup('A') is cts['A']
+    assert cts.lookup('Z') is None
+    cts = add_constraints(mdl, ARCS, add_variables(mdl, ARCS, 'C'), '<=', 1)
+    assert cts.lookup('A', 'B') is cts[('A', 'B')]
+    assert cts.lookup('A', 'C') is None
+    with pytest.raises(TypeError, match='lookup key must be scalars'):
+        cts.lookup(('A', 'B'))
+    with pytest.raises(ValueError, match='lookup key length must be the same'):
+        cts.lookup('A')
+
+
+def test_constraintdictNd_subset(mdl):
+    cts = add_constraints(mdl, ARCS, add_variables(mdl, ARCS, 'C'), '<=', 1)
+    assert cts.subset_keys('*', 'B') == [('A', 'B'), ('C', 'B')]
+    assert cts.subset_values('*', 'B') == [cts[('A', 'B')], cts[('C', 'B')]]
+    assert cts.subset_values('Z', '*') == []
+
+
+def test_constraintdict_bulk_accessors(mdl):
+    # Ship 10 units from A to C, through B at a lower cost up to the capacity of 6
+    arcs = IndexSetND([('A', 'B'), ('B', 'C'), ('A', 'C')], names=['ori', 'des'])
+    flow = add_variables(mdl, arcs, 'C', name='flow')
+    cost = ParamDictND({('A', 'B'): 1, ('B', 'C'): 1, ('A', 'C'): 5})
+    mdl.minimize(flow.dot(cost))
+    supply = ParamDict1D({'A': 10, 'C': -10})
+    balance = add_constraints(
+        mdl, NODES, lambda n: flow.sum(n, '*') - flow.sum('*', n), '==', supply, name='bal'
+    )
+    cap = add_constraints(mdl, arcs, lambda arc: flow[arc] + 1, '<=', 7, name='cap')
+    assert mdl.solve()
+
+    rhs = cap.rhs()
+    assert type(rhs) is ParamDictND
+    assert rhs == {arc: 6 for arc in arcs}
+    assert rhs.key_names == ['ori', 'des']
+    slacks = cap.slacks()
+    assert type(slacks) is ParamDictND
+    assert slacks == pytest.approx({('A', 'B'): 0, ('B', 'C'): 0, ('A', 'C'): 2})
+    duals = cap.duals()
+    assert duals == dict(zip(arcs, mdl.dual_values(list(cap.values())), strict=True))
+
+    rhs = balance.rhs()
+    assert type(rhs) is ParamDict1D
+    assert rhs == {'A': 10, 'B': 0, 'C': -10}
+    assert rhs.key_name == 'node'
+    assert balance.slacks() == pytest.approx({'A': 0, 'B': 0, 'C': 0})
+    duals = balance.duals()
+    assert type(duals) is ParamDict1D
+    assert duals == dict(zip(NODES, mdl.dual_values(list(balance.values())), strict=True))
+
+    rhs['Z'] = 1  # independent of the ConstraintDict keys
+    assert list(balance) == ['A', 'B', 'C']
@@ -0,0 +1,134 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Network view over an IndexSetND of arcs."""
+
+import pytest
+from docplex.mp.model import Model
+
+from docplex_extensions import IndexSet1D, IndexSetND, Network, add_variables
+
+ARCS = [('A', 'B'), ('A', 'C'), ('B', 'C'), ('C', 'A'), ('C', 'B')]
+ARCS_K = [
+    ('A', 'B', 1),
+    ('A', 'C', 2),
+    ('B', 'C', 1),
+    ('C', 'A', 1),
+    ('B', 'C', 2),
+]
+
+
+@pytest.fixture
+def mdl():
+    mdl = Model()
+    yield mdl
+    mdl.end()
+
+
+def expr_coefs(expr):
+    return {var.name: coef for var, coef in expr.iter_terms()}
+
+
+def test_network_adjacency():
+    network = Network(IndexSetND(ARCS, names=['ori', 'des']), node_name='node')
+    assert type(network.nodes) is IndexSet1D
+    assert list(network.nodes) == ['A', 'B', 'C']
+    assert network.nodes.name == 'node'
+    for node in network.nodes:
+        assert network.out_arcs(node) == [arc for arc in ARCS if arc[0] == node]
+        assert network.in_arcs(node) == [arc for arc in ARCS if arc[1] == node]
+    assert network.out_arcs('Z') == []
+    assert network.in_arcs('Z') == []
+    assert repr(network) == 'Network: 3 nodes, 5 arcs'
+
+
+@pytest.mark.parametrize(('tail', 'head'), [(1, 0), ('des', 'ori'), (-1, -2)])
+def test_network_reversed_dims(tail, head):
+    network = Network(IndexSetND(ARCS, names=['ori', 'des']), tail, head)
+    assert list(network.nodes) == ['B', 'A', 'C']
+    assert network.nodes.name is None
+    assert network.out_arcs('A') == [('C', 'A')]
+    assert network.in_arcs('A') == [('A', 'B'), ('A', 'C')]
+
+
+def test_network_other_dims():
+    arcs = IndexSetND(ARCS_K, names=['ori', 'des', 'com'])
+    network = Network(arcs, 'ori', 'des', node_name='node')
+    assert type(network.nodes) is IndexSetND
+    assert list(network.nodes) == [('A', 1), ('B', 1), ('A', 2), ('C', 2), ('C', 1), ('B', 2)]
+    assert network.nodes.names == ['node', 'com']
+    assert network.nodes.subset('*', 2) == [('A', 2), ('C', 2), ('B', 2)]
+    assert network.out_arcs(('B', 1)) == [('B', 'C', 1)]
+    assert network.in_arcs(('C', 2)) == [('A', 'C', 2), ('B', 'C', 2)]
+    assert network.out_arcs(('B', 2)) == [('B', 'C', 2)]
+    assert Network(arcs).nodes.names is None
+
+
+def test_network_other_dims_middle():
+    arcs = IndexSetND([(1, 'A', 'B'), (2, 'B', 'A')])
+    network = Network(arcs, 1, 2)
+    assert list(network.nodes) == [('A', 1), ('B', 1), ('B', 2), ('A', 2)]
+    assert network.out_arcs(('B', 2)) == [(2, 'B', 'A')]
+
+
+def test_network_snapshot():
+    arcs = IndexSetND(ARCS)
+    network = Network(arcs)
+    arcs.append(('B', 'A'))
+    assert network.out_arcs('B') == [('B', 'C')]
+    assert len(network.nodes) == 3
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_network_flow_balance(mdl, ordered):
+    arcs = IndexSetND(ARCS_K)
+    flow_keys = arcs if ordered else IndexSetND(reversed(ARCS_K))
+    flow = add_variables(mdl, flow_keys, 'C', name='flow')
+    network = Network(arcs)
+    res = network.flow_balance(flow)
+    assert list(res) == list(network.nodes)
+    for node, expr in res.items():
+        expected = {}
+        for arc in network.out_arcs(node):
+            expected[flow[arc].name] = 1
+        for arc in network.in_arcs(node):
+            expected[flow[arc].name] = -1
+        assert expr_coefs(expr) == expected
+        assert expr_coefs(expr) == expr_coefs(
+            flow.sum(node[0], '*', node[1]) - flow.sum('*', *node)
+        )
+
+
+def test_network_flow_balance_loops(mdl):
+    arcs = IndexSetND([('A', 'A'), ('A', 'B'), ('B', 'A')])
+    flow = add_variables(mdl, arcs, 'C', name='flow')
+    res = Network(arcs).flow_balance(flow)
+    assert expr_coefs(res['A']) == {'flow_A_B': 1, 'flow_B_A': -1}
+    assert expr_coefs(res['B']) == {'flow_B_A': 1, 'flow_A_B': -1}
+    loop = IndexSetND([('A', 'A')])
+    assert Network(loop).flow_balance(add_variables(mdl, loop, 'C'))['A'].is_zero()
+
+
+def test_network_errors(mdl):
+    with pytest.raises(TypeError, match='`arcs` should be an IndexSetND'):
+        Network(ARCS)
+    with pytest.raises(ValueError, match='IndexSetND is empty'):
+        Network(IndexSetND())
+    arcs = IndexSetND(ARCS, names=['ori', 'des'])
+    with pytest.raises(ValueError, match='`tail` and `head` should be different dimensions'):
+        Network(arcs, 0, -2)
+    with pytest.raises(ValueError, match="'com' not found in `names` of IndexSetND"):
+        Network(arcs, 'com')
+    with pytest.raises(ValueError, match="'ori' not found in `names` of IndexSetND"):
+        Network(IndexSetND(ARCS), 'ori')
+    with pytest.raises(ValueError, match='`dim` 2 is out of range for tuples of length 2'):
+        Network(arcs, 0, 2)
+    with pytest.raises(TypeError, match='`dim` should be either int or str'):
+        Network(arcs, True)
+    network = Network(arcs)
+    with pytest.raises(TypeError, match='`flow` should be a VarDictND'):
+        network.flow_balance({arc: 1 for arc in ARCS})
+    flow = add_variables(mdl, IndexSetND(ARCS[:-1]), 'C')
+    with pytest.raises(ValueError, match='`flow` should have a variable for each arc'):
+        network.flow_balance(flow)
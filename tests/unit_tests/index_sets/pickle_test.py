@@ -0,0 +1,97 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Pickling of IndexSet1D & IndexSetND."""
+
+import copy
+import pickle
+from datetime import date
+
+import pytest
+
+from docplex_extensions import IndexSet1D, IndexSetND
+from docplex_extensions._pickling import decode_tuples, encode_tuples
+
+from ..helper_indexset import assert_sets_same
+
+
+def roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+@pytest.mark.parametrize('_input', ['set1d_emp', 'set1d_012', 'setNd_emp', 'setNd_012'])
+def test_indexset_pickle_pass(request, _input):
+    _input = request.getfixturevalue(_input)
+    res = roundtrip(_input)
+    assert type(res) is type(_input)
+    assert_sets_same(res, _input)
+
+
+def test_indexset1d_pickle_name():
+    res = roundtrip(IndexSet1D(['A', 'B'], name='X'))
+    assert res.name == 'X'
+    res.append('C')
+    assert list(res) == ['A', 'B', 'C']
+
+
+def test_indexsetNd_pickle_names_and_subset():
+    idx = IndexSetND(['A', 'B'], [1, 2, 3], names=['X', 'Y'])
+    idx.subset('A', '*')  # populate the cache of index groups
+    res = roundtrip(idx)
+    assert res.names == ['X', 'Y']
+    assert res._index_groups == {}
+    assert res.subset('*', 2) == [('A', 2), ('B', 2)]
+    res.append(('C', 1))
+    assert res.subset('C', '*') == [('C', 1)]
+    with pytest.raises(ValueError):
+        res.append(('C', 1, 1))
+
+
+def test_indexsetNd_pickle_empty_then_append():
+    res = roundtrip(IndexSetND(names=['X', 'Y']))
+    assert res.names == ['X', 'Y']
+    res.append(('A', 1))
+    assert list(res) == [('A', 1)]
+
+
+def test_indexset_deepcopy():
+    idx = IndexSetND(['A', 'B'], [1, 2], names=['X', 'Y'])
+    res = copy.deepcopy(idx)
+    assert_sets_same(res, idx)
+    res.append(('C', 1))
+    assert len(idx) == 4
+
+
+@pytest.mark.parametrize(
+    'elems',
+    [
+        [],
+        [('A', 1), ('A', 2), ('B', 1)],
+        [(i, f'x{i % 300}') for i in range(70_000)],  # more codes than 1- and 2-byte items
+        [(1, 'A'), (True, 'B'), (1.0, 'C')],  # equal but not identical
+        [(0.0, 'A'), (-0.0, 'B')],
+        [(date(2024, 1, 1), 'A', None), (date(2024, 1, 2), 'A', None)],
+    ],
+)
+def test_encode_decode_tuples(elems):
+    tuplelen = len(elems[0]) if elems else 2
+    columns = encode_tuples(elems, tuplelen)
+    assert len(columns) == tuplelen
+    res = decode_tuples(columns)
+    assert res == elems
+    assert [tuple(map(type, elem)) for elem in res] == [tuple(map(type, e)) for e in elems]
+    assert [repr(elem) for elem in res] == [repr(elem) for elem in elems]
+
+
+def test_encode_tuples_shared_values():
+    elems = [('A', 1), ('A', 2), ('B', 1), ('B', 2)]
+    columns = encode_tuples(elems, 2)
+    assert columns[0][0] == ['A', 'B'] and list(columns[0][1]) == [0, 0, 1, 1]
+    assert columns[1][0] == [1, 2] and list(columns[1][1]) == [0, 1, 0, 1]
+    assert columns[0][1].itemsize == 1
+
+
+def test_indexsetNd_pickle_smaller_than_list():
+    elems = [(f'S{i % 10}', f'P{i // 10}') for i in range(1000)]  # distinct str objects
+    assert len(pickle.dumps(IndexSetND(elems))) < len(pickle.dumps(elems)) / 4
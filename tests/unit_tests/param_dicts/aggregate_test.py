@@ -0,0 +1,134 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Grouped aggregation of ParamDictND."""
+
+import statistics
+
+import pytest
+
+from docplex_extensions import ParamDict1D, ParamDictND
+
+VALUES = {
+    ('S1', 'P1', 'A'): 10,
+    ('S1', 'P1', 'B'): 20,
+    ('S2', 'P1', 'A'): 5,
+    ('S1', 'P2', 'A'): 15,
+    ('S1', 'P1', 'C'): 3,
+    ('S2', 'P2', 'B'): 7,
+    ('S2', 'P1', 'B'): 8,
+}
+FUNCS = {
+    'sum': sum,
+    'mean': lambda vals: float(statistics.mean(vals)),
+    'min': min,
+    'max': max,
+    'count': len,
+    'median': lambda vals: float(statistics.median(vals)),
+}
+
+
+def expected_groups(values, indices, func):
+    groups = {}
+    for key, value in values.items():
+        group = key[indices[0]] if len(indices) == 1 else tuple(key[i] for i in indices)
+        groups.setdefault(group, []).append(value)
+    return {group: FUNCS[func](vals) for group, vals in groups.items()}
+
+
+@pytest.mark.parametrize('func', list(FUNCS))
+@pytest.mark.parametrize(
+    'dims, indices',
+    [
+        (('SITE',), (0,)),
+        ((2,), (2,)),
+        ((-1,), (2,)),
+        (('SITE', 'PERIOD'), (0, 1)),
+        ((2, 0), (2, 0)),
+        (('PRODUCT', 1), (2, 1)),
+    ],
+)
+@pytest.mark.parametrize('values', [VALUES, {k: v + 0.5 for k, v in VALUES.items()}])
+def test_paramdictNd_aggregate_pass(values, dims, indices, func):
+    prm = ParamDictND(values, key_names=['SITE', 'PERIOD', 'PRODUCT'], value_name='DEMAND')
+    res = prm.aggregate(*dims, func=func)
+    expected = expected_groups(values, indices, func)
+    assert list(res.items()) == list(expected.items())
+    assert all(type(v) is type(expected[k]) for k, v in res.items())
+    assert res.value_name == 'DEMAND'
+    assert res.dtype is None
+    if len(indices) == 1:
+        assert type(res) is ParamDict1D
+        assert res.key_name == ['SITE', 'PERIOD', 'PRODUCT'][indices[0]]
+        assert list(res._indexset) == list(expected)
+    else:
+        assert type(res) is ParamDictND
+        assert res.key_names == [['SITE', 'PERIOD', 'PRODUCT'][i] for i in indices]
+        assert res._indexset._tuplelen == len(indices)
+
+
+@pytest.mark.parametrize('func', list(FUNCS))
+@pytest.mark.parametrize('dims', [(0,), (2,), (0, 1), (1, 2)])
+@pytest.mark.parametrize('dtype', ['int64', 'float64'])
+def test_paramdictNd_aggregate_array_backed(dtype, dims, func):
+    prm = ParamDictND(VALUES, dtype=dtype)
+    res = prm.aggregate(*dims, func=func)
+    expected = expected_groups(VALUES, dims, func)
+    assert list(res) == list(expected)
+    assert list(res.values()) == pytest.approx(list(expected.values()))
+    if func == 'count':
+        exp_dtype = 'int64'
+    elif func in ('mean', 'median'):
+        exp_dtype = 'float64'
+    else:
+        exp_dtype = dtype
+    assert res.dtype == exp_dtype
+    assert res.values_array().tolist() == list(res.values())
+    assert res.key_name is None if len(dims) == 1 else res.key_names is None
+
+
+@pytest.mark.parametrize('func', ['mean', 'median'])
+@pytest.mark.parametrize('exact', [False, True])
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdictNd_aggregate_float_for_int_values(dtype, exact, func):
+    # Same result type, with or without array-backed storage
+    prm = ParamDictND({('x', 1): 2, ('x', 2): 4, ('x', 3): 3, ('y', 1): 1}, dtype=dtype)
+    res = prm.aggregate(0, func=func, exact=exact)
+    assert list(res.items()) == [('x', 3.0), ('y', 1.0)]
+    assert all(type(v) is float for v in res.values())
+
+
+def test_paramdictNd_aggregate_result_mutable():
+    prm = ParamDictND(VALUES, key_names=['SITE', 'PERIOD', 'PRODUCT'])
+    res = prm.aggregate('SITE', 'PERIOD')
+    res['S3', 'P1'] = 1
+    assert res.sum('S3', '*') == 1
+    with pytest.raises(ValueError):
+        res['S3', 'P1', 'A'] = 1
+
+
+def test_paramdictNd_aggregate_lookuperr():
+    with pytest.raises(LookupError):
+        ParamDictND().aggregate(0)
+
+
+@pytest.mark.parametrize(
+    'dims, func, error',
+    [
+        ((), 'sum', ValueError),
+        ((0, 1, 2), 'sum', ValueError),
+        ((0, 0), 'sum', ValueError),
+        ((0, -3), 'sum', ValueError),
+        ((3,), 'sum', ValueError),
+        (('X',), 'sum', ValueError),
+        ((0,), 'std', ValueError),
+        ((0,), None, ValueError),
+        ((0.0,), 'sum', TypeError),
+        ((['SITE'],), 'sum', TypeError),
+    ],
+)
+def test_paramdictNd_aggregate_err(dims, func, error):
+    prm = ParamDictND(VALUES, key_names=['SITE', 'PERIOD', 'PRODUCT'])
+    with pytest.raises(error):
+        prm.aggregate(*dims, func=func)
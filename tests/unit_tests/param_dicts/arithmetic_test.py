@@ -0,0 +1,344 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Arithmetic operations of ParamDict1D & ParamDictND."""
+
+import pytest
+
+from docplex_extensions import ParamDict1D, ParamDictND
+
+
+def assert_result(res, expected, cls, dtype=None):
+    assert type(res) is cls
+    assert list(res.items()) == list(expected.items())
+    assert list(res._indexset) == list(expected)
+    assert res.dtype == dtype
+    if dtype is not None:
+        assert res.values_array().tolist() == list(res.values())
+
+
+@pytest.mark.parametrize(
+    'op_name, other, expected',
+    [
+        ('add', 2, {'A': 3, 'B': 4}),
+        ('sub', 2, {'A': -1, 'B': 0}),
+        ('mul', 2.5, {'A': 2.5, 'B': 5.0}),
+        ('div', 2, {'A': 0.5, 'B': 1.0}),
+    ],
+)
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdict1d_arith_scalar(op_name, other, expected, dtype):
+    prm = ParamDict1D({'A': 1, 'B': 2}, key_name='K', dtype=dtype)
+    res = getattr(prm, op_name)(other)
+    exp_dtype = None if dtype is None else type(list(expected.values())[0]).__name__ + '64'
+    assert_result(res, expected, ParamDict1D, exp_dtype)
+    assert res.key_name == 'K'
+    assert res.value_name is None
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdict_arith_operators(dtype):
+    prm = ParamDict1D({'A': 2.0, 'B': 4.0}, dtype=dtype)
+    assert prm + 1 == {'A': 3.0, 'B': 5.0}
+    assert 1 + prm == {'A': 3.0, 'B': 5.0}
+    assert prm - 1 == {'A': 1.0, 'B': 3.0}
+    assert 1 - prm == {'A': -1.0, 'B': -3.0}
+    assert prm * 2 == {'A': 4.0, 'B': 8.0}
+    assert 2 * prm == {'A': 4.0, 'B': 8.0}
+    assert prm / 2 == {'A': 1.0, 'B': 2.0}
+    assert 8 / prm == {'A': 4.0, 'B': 2.0}
+    assert prm - prm == {'A': 0.0, 'B': 0.0}
+
+
+@pytest.mark.parametrize(
+    'join, fill_value, expected',
+    [
+        ('inner', None, {'B': 22, 'C': 33}),
+        ('inner', 0, {'B': 22, 'C': 33}),
+        ('left', 0, {'A': 1, 'B': 22, 'C': 33}),
+        ('outer', 0, {'A': 1, 'B': 22, 'C': 33, 'D': 40}),
+    ],
+)
+@pytest.mark.parametrize('dtypes', [(None, None), ('int64', None), (None, 'int64')])
+def test_paramdict1d_arith_join(join, fill_value, expected, dtypes):
+    prm1 = ParamDict1D({'A': 1, 'B': 2, 'C': 3}, dtype=dtypes[0])
+    prm2 = ParamDict1D({'C': 30, 'B': 20, 'D': 40}, dtype=dtypes[1])
+    res = prm1.add(prm2, join=join, fill_value=fill_value)
+    exp_dtype = None if dtypes == (None, None) else 'int64'
+    assert_result(res, expected, ParamDict1D, exp_dtype)
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdictNd_arith_join(dtype):
+    prm1 = ParamDictND({('A', 1): 1.0, ('B', 2): 2.0}, key_names=['X', 'Y'], dtype=dtype)
+    prm2 = ParamDictND({('B', 2): 4.0, ('C', 3): 8.0}, key_names=['P', 'Q'], dtype=dtype)
+    res = prm1.div(prm2, join='outer', fill_value=1)
+    assert_result(
+        res, {('A', 1): 1.0, ('B', 2): 0.5, ('C', 3): 0.125}, ParamDictND, dtype and 'float64'
+    )
+    assert res.key_names == ['X', 'Y']
+
+
+@pytest.mark.parametrize('join', ['left', 'outer'])
+def test_paramdict_arith_join_fill_valerr(join):
+    prm1 = ParamDict1D({'A': 1, 'B': 2})
+    prm2 = ParamDict1D({'B': 3})
+    with pytest.raises(ValueError):
+        prm1.sub(prm2, join=join)
+    if join == 'outer':
+        with pytest.raises(ValueError):
+            prm2.sub(prm1, join=join)
+    else:
+        assert prm2.sub(prm1, join=join) == {'B': 1}
+
+
+@pytest.mark.parametrize(
+    'kwargs, error',
+    [
+        ({'join': 'right'}, ValueError),
+        ({'join': None}, ValueError),
+        ({'fill_value': '0'}, TypeError),
+    ],
+)
+def test_paramdict_arith_args_err(kwargs, error):
+    prm = ParamDict1D({'A': 1})
+    with pytest.raises(error):
+        prm.add(prm, **kwargs)
+
+
+@pytest.mark.parametrize('other', ['1', [1], {'A': 1}, None])
+def test_paramdict_arith_other_typerr(other):
+    prm = ParamDict1D({'A': 1})
+    with pytest.raises(TypeError):
+        prm.mul(other)
+    for op in (
+        lambda x, y: x + y,
+        lambda x, y: x - y,
+        lambda x, y: x * y,
+        lambda x, y: x / y,
+    ):
+        with pytest.raises(TypeError):
+            op(prm, other)
+        with pytest.raises(TypeError):
+            op(other, prm)
+
+
+def test_paramdictNd_arith_tuplelen_valerr():
+    prm1 = ParamDictND({('A', 1): 1})
+    prm2 = ParamDictND({('A', 1, 'X'): 1})
+    with pytest.raises(ValueError):
+        prm1 + prm2
+    assert prm1 + ParamDictND() == {}
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdict_div_zero(dtype):
+    prm = ParamDict1D({'A': 1, 'B': 0}, dtype=dtype)
+    with pytest.raises(ZeroDivisionError):
+        prm / 0
+    with pytest.raises(ZeroDivisionError):
+        1 / prm
+    with pytest.raises(ZeroDivisionError):
+        prm / prm
+
+
+@pytest.mark.parametrize(
+    'func, exp_dtype',
+    [
+        (lambda prm: prm + prm, None),
+        (lambda prm: prm - prm * -1, None),
+        (lambda prm: prm * 4, None),
+        (lambda prm: prm * 2**70, None),
+        (lambda prm: 2**70 - prm, None),
+        (lambda prm: prm * prm, None),
+        (lambda prm: prm / 2**70, 'float64'),
+        (lambda prm: prm - prm, 'int64'),
+        (lambda prm: prm + 1, 'int64'),
+        (lambda prm: prm + ParamDict1D({'A': 2**70, 'B': 1}), None),
+        (lambda prm: prm + ParamDict1D({'A': -(2**62), 'B': 1}), 'int64'),
+        (lambda prm: prm + ParamDict1D({'A': 2**70, 'B': 0.5}), None),
+    ],
+)
+def test_paramdict_arith_int_overflow(func, exp_dtype):
+    # Integers are exact, as without array-backed storage, even beyond the range of int64
+    values = {'A': 2**62, 'B': 2**62 - 1}
+    expected = func(ParamDict1D(values))
+    assert expected.dtype is None
+    res = func(ParamDict1D(values, dtype='int64'))
+    assert_result(res, expected, ParamDict1D, exp_dtype)
+    assert list(map(type, res.values())) == list(map(type, expected.values()))
+
+
+def test_paramdict_arith_broadcast_int_overflow():
+    nd = ParamDictND({('A', 1): 2**62, ('B', 1): 1, ('C', 1): 2}, dtype='int64')
+    oned = ParamDict1D({'A': 4, 'B': 2**62}, dtype='int64')
+    expected = {('A', 1): 2**64, ('B', 1): 2**62, ('C', 1): 2}
+    assert_result(nd.mul(oned, join='left', fill_value=1, dim=0), expected, ParamDictND)
+    expected = {('A', 1): 2**62 + 4, ('B', 1): 2**62 + 1}
+    assert_result(nd.add(oned, dim=0), expected, ParamDictND, 'int64')
+
+
+@pytest.fixture
+def dist():
+    return ParamDictND(
+        {('A', 'B', 'road'): 10, ('A', 'B', 'rail'): 12, ('B', 'C', 'air'): 5},
+        key_names=['ORI', 'DES', 'MODE'],
+    )
+
+
+@pytest.mark.parametrize('dtypes', [(None, None), ('int64', None), (None, 'float64')])
+@pytest.mark.parametrize(
+    'dim',
+    [None, 'MODE', 2, -1],
+)
+def test_paramdict_arith_broadcast(dist, dim, dtypes):
+    nd = ParamDictND(dist, key_names=dist.key_names, dtype=dtypes[0])
+    rate = ParamDict1D({'rail': 1.5, 'road': 2.0}, key_name='MODE', dtype=dtypes[1])
+    exp_dtype = None if dtypes == (None, None) else 'float64'
+    expected = {('A', 'B', 'road'): 20.0, ('A', 'B', 'rail'): 18.0}
+
+    res = nd.mul(rate, dim=dim)
+    assert_result(res, expected, ParamDictND, exp_dtype)
+    assert res.key_names == ['ORI', 'DES', 'MODE']
+    res = rate.mul(nd, dim=dim)
+    assert_result(res, expected, ParamDictND, exp_dtype)
+
+    res = nd.sub(rate, join='left', fill_value=0, dim=dim)
+    expected = {('A', 'B', 'road'): 8.0, ('A', 'B', 'rail'): 10.5, ('B', 'C', 'air'): 5}
+    assert_result(res, expected, ParamDictND, exp_dtype)
+    res = rate.sub(nd, join='outer', fill_value=0, dim=dim)
+    expected = {('A', 'B', 'road'): -8.0, ('A', 'B', 'rail'): -10.5, ('B', 'C', 'air'): -5}
+    assert_result(res, expected, ParamDictND, exp_dtype)
+
+
+def test_paramdict_arith_broadcast_no_join_loss(dist):
+    rate = ParamDict1D({'A': 2, 'B': 3})
+    assert dist.mul(rate, dim='ORI') == {
+        ('A', 'B', 'road'): 20,
+        ('A', 'B', 'rail'): 24,
+        ('B', 'C', 'air'): 15,
+    }
+    assert dist * ParamDict1D({'road': 1}, key_name='MODE') == {('A', 'B', 'road'): 10}
+
+
+@pytest.mark.parametrize(
+    'nd, oned, dim, error',
+    [
+        ('dist', ParamDict1D({'road': 1}), None, ValueError),
+        ('dist', ParamDict1D({'road': 1}, key_name='X'), None, ValueError),
+        ('dist', ParamDict1D({'road': 1}), 'X', ValueError),
+        ('dist', ParamDict1D({'road': 1}), 3, ValueError),
+        ('dist', ParamDict1D({'road': 1}), -4, ValueError),
+        ('dist', ParamDict1D({'road': 1}), 1.0, TypeError),
+        ('dist', ParamDict1D({'road': 1}), True, TypeError),
+        (ParamDictND({('A', 'B'): 1}), ParamDict1D({'A': 1}, key_name='X'), None, ValueError),
+        (ParamDictND({('A', 'B'): 1}), ParamDict1D({'A': 1}), 'X', ValueError),
+    ],
+)
+def test_paramdict_arith_broadcast_dim_err(request, nd, oned, dim, error):
+    if nd == 'dist':
+        nd = request.getfixturevalue('dist')
+    with pytest.raises(error):
+        nd.mul(oned, dim=dim)
+    with pytest.raises(error):
+        oned.mul(nd, dim=dim)
+
+
+def test_paramdict_arith_broadcast_empty():
+    res = ParamDictND(key_names=['X', 'Y']).add(ParamDict1D({'A': 1}), dim=5)
+    assert res == {}
+
+
+@pytest.mark.parametrize('dtypes', [(None, None), ('float64', None), ('int64', 'float64')])
+def test_paramdict_arith_broadcast_empty_array_backed(dtypes):
+    nd = ParamDictND(key_names=['X', 'Y'], dtype=dtypes[0])
+    res = nd.mul(ParamDict1D({'A': 1}, dtype=dtypes[1]), dim='Y')
+    assert res == {}
+    assert res.key_names == ['X', 'Y']
+
+
+@pytest.mark.parametrize('dtypes', [(None, None), ('int64', None), (None, 'int64')])
+@pytest.mark.parametrize('join', ['left', 'outer'])
+def test_paramdict_arith_broadcast_fill_valerr(dist, join, dtypes):
+    nd = ParamDictND(dist, key_names=dist.key_names, dtype=dtypes[0])
+    rate = ParamDict1D({'rail': 1, 'road': 2}, key_name='MODE', dtype=dtypes[1])
+    with pytest.raises(ValueError, match='`fill_value` is required since keys are not aligned'):
+        nd.mul(rate, join=join)
+    with pytest.raises(ValueError, match='`fill_value` is required since keys are not aligned'):
+        rate.mul(nd, join=join)
+
+
+@pytest.mark.parametrize('dtypes', [('int64', None), (None, 'int64'), ('float64', 'int64')])
+def test_paramdict_arith_broadcast_mixed_dtypes(dtypes):
+    nd = ParamDictND({('A', 1): 30_000, ('A', 2): 2, ('B', 1): 4}, dtype=dtypes[0])
+    prm = ParamDict1D({1: 30_000, 2: 3}, dtype=dtypes[1])
+    exp_dtype = 'float64' if 'float64' in dtypes else 'int64'
+    res = nd.mul(prm, dim=1)
+    assert_result(
+        res, {('A', 1): 900_000_000, ('A', 2): 6, ('B', 1): 120_000}, ParamDictND, exp_dtype
+    )
+    res = prm.sub(nd, dim=1)
+    assert_result(res, {('A', 1): 0, ('A', 2): 1, ('B', 1): 29_996}, ParamDictND, exp_dtype)
+
+
+@pytest.mark.parametrize('dtypes', [(None, None), ('float64', None), (None, 'float64')])
+def test_paramdict_arith_broadcast_result_independent(dist, dtypes):
+    nd = ParamDictND(dist, key_names=dist.key_names, dtype=dtypes[0])
+    rate = ParamDict1D({'A': 2, 'B': 3}, dtype=dtypes[1])
+    res = nd.mul(rate, dim='ORI')
+    assert res._indexset._set is not nd._indexset._set
+    res[('C', 'D', 'road')] = 1
+    assert list(nd) == list(dist)
+    assert ('C', 'D', 'road') not in nd
+    assert list(res) == [*dist, ('C', 'D', 'road')]
+
+
+@pytest.mark.parametrize('dtypes', [(None, None), ('int64', None), (None, 'float64')])
+@pytest.mark.parametrize('op_name', ['add', 'sub', 'mul', 'div'])
+def test_paramdict_arith_broadcast_many_keys(op_name, dtypes):
+    nd = ParamDictND(
+        {(i, j): i * 10 + j + 1 for i in range(20) for j in range(15)}, dtype=dtypes[0]
+    )
+    oned = ParamDict1D({j: j - 7.5 for j in range(0, 15, 2)}, dtype=dtypes[1])
+    func = {
+        'add': lambda x, y: x + y,
+        'sub': lambda x, y: x - y,
+        'mul': lambda x, y: x * y,
+        'div': lambda x, y: x / y,
+    }[op_name]
+    expected = {key: func(value, oned[key[1]]) for key, value in nd.items() if key[1] in oned}
+    assert getattr(nd, op_name)(oned, dim=1) == expected
+    expected = {key: func(oned.get(key[1], 1), value) for key, value in nd.items()}
+    assert getattr(oned, op_name)(nd, join='outer', fill_value=1, dim=1) == expected
+
+
+@pytest.mark.parametrize(
+    'prm1, prm2, dim, expected',
+    [
+        (ParamDict1D({'A': 2, 'B': 3}), ParamDict1D({'B': 4, 'C': 5}), None, 12),
+        (
+            ParamDict1D({'A': 2.0, 'B': 3.0}, dtype='float64'),
+            ParamDict1D({'A': 1.0, 'B': 4.0}, dtype='float64'),
+            None,
+            14.0,
+        ),
+        (
+            ParamDict1D({'A': 2, 'B': 3}, dtype='int64'),
+            ParamDict1D({'B': 4, 'A': 1}, dtype='int64'),
+            None,
+            14,
+        ),
+        (ParamDictND({('A', 1): 2, ('B', 2): 3}), ParamDict1D({1: 10}), 1, 20),
+        (ParamDict1D({1: 10}), ParamDictND({('A', 1): 2, ('B', 2): 3}), 1, 20),
+    ],
+)
+def test_paramdict_dot_pass(prm1, prm2, dim, expected):
+    res = prm1.dot(prm2, dim=dim)
+    assert res == expected
+    assert type(res) is type(expected)
+
+
+def test_paramdict_dot_typerr():
+    with pytest.raises(TypeError):
+        ParamDict1D({'A': 1}).dot({'A': 1})
@@ -0,0 +1,189 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Array-backed storage of ParamDict1D & ParamDictND."""
+
+import pickle
+import statistics
+
+import numpy as np
+import pytest
+
+from docplex_extensions import ParamDict1D, ParamDictND
+
+
+def assert_aligned(prm):
+    assert prm.values_array().tolist() == list(prm.values())
+
+
+@pytest.mark.parametrize(
+    'input, dtype, expected',
+    [
+        (ParamDict1D({'A': 1, 'B': 2}), None, None),
+        (ParamDict1D({'A': 1, 'B': 2}, dtype='int64'), 'int64', 'int64'),
+        (ParamDict1D({'A': 1, 'B': 2.5}, dtype='float64'), 'float64', 'float64'),
+        (ParamDictND({('A', 'B'): 1}, dtype='int64'), 'int64', 'int64'),
+        (ParamDictND(dtype='float64'), 'float64', 'float64'),
+    ],
+)
+def test_paramdict_dtype_pass(input, dtype, expected):
+    assert input.dtype == expected
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'int16', 'float16', 'uint8', 'str', 'object'])
+def test_paramdict_dtype_valerr(dtype):
+    with pytest.raises(ValueError):
+        ParamDict1D({'A': 1}, dtype=dtype)
+
+
+@pytest.mark.parametrize('dtype', [1, float, np.float64])
+def test_paramdict_dtype_typerr(dtype):
+    with pytest.raises(TypeError):
+        ParamDictND({('A', 'B'): 1}, dtype=dtype)
+
+
+def test_paramdict_int_dtype_float_value_typerr():
+    with pytest.raises(TypeError):
+        ParamDict1D({'A': 1, 'B': 2.5}, dtype='int64')
+    prm = ParamDict1D({'A': 1}, dtype='int64')
+    with pytest.raises(TypeError):
+        prm['B'] = 2.5
+    with pytest.raises(TypeError):
+        prm.setdefault('B', 2.5)
+    assert prm == ParamDict1D({'A': 1})
+    assert_aligned(prm)
+
+
+@pytest.mark.parametrize('value', [2**63, -(2**63) - 1])
+def test_paramdict_int64_value_overflow(value):
+    with pytest.raises(OverflowError, match="input mapping's values .* dtype int64"):
+        ParamDict1D({'A': 1, 'B': value}, dtype='int64')
+    prm = ParamDict1D({'A': 1}, dtype='int64')
+    with pytest.raises(OverflowError, match='`value` .* dtype int64'):
+        prm['A'] = value
+    with pytest.raises(OverflowError, match='`value` .* dtype int64'):
+        prm['B'] = value
+    with pytest.raises(OverflowError, match='`default` .* dtype int64'):
+        prm.setdefault('B', value)
+    with pytest.raises(OverflowError, match='`values` .* dtype int64'):
+        prm.set_many(['B', 'C'], [1, value])
+    assert prm == {'A': 1}
+    assert_aligned(prm)
+
+
+def test_paramdict_int64_bounds_pass():
+    prm = ParamDict1D({'A': 2**63 - 1, 'B': -(2**63)}, dtype='int64')
+    assert prm.values_array().tolist() == [2**63 - 1, -(2**63)]
+
+
+def test_paramdict_values_array_view():
+    prm = ParamDictND({('A', 'B'): 1.0, ('C', 'D'): 2.0}, dtype='float64')
+    arr = prm.values_array()
+    assert arr.dtype == np.float64
+    assert not arr.flags.writeable
+    assert arr.base is not None  # no copy
+    prm['A', 'B'] = 5.0
+    assert arr.tolist() == [5.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    'input, expected',
+    [
+        (ParamDict1D({'A': 1, 'B': 2}), [1, 2]),
+        (ParamDict1D({'A': 1, 'B': 2.5}), [1.0, 2.5]),
+        (ParamDictND({('A', 'B'): 1, ('C', 'D'): 2}), [1, 2]),
+    ],
+)
+def test_paramdict_values_array_not_backed(input, expected):
+    arr = input.values_array()
+    assert arr.tolist() == expected
+    assert arr.flags.writeable
+
+
+def test_paramdict_array_backed_mutations():
+    prm = ParamDict1D({'A': 0, 'B': 1, 'C': 2}, dtype='int64')
+    for i in range(20):  # beyond the initial capacity
+        prm[i] = i
+    assert_aligned(prm)
+    prm['B'] = 100
+    assert_aligned(prm)
+    del prm['A']
+    assert_aligned(prm)
+    del prm[19]
+    assert_aligned(prm)
+    assert prm.pop('C') == 2
+    assert prm.pop('Z', -1) == -1
+    assert_aligned(prm)
+    assert prm.popitem() == (18, 18)
+    assert_aligned(prm)
+    assert prm.setdefault('D', 7) == 7
+    assert prm.setdefault('D', 9) == 7
+    assert_aligned(prm)
+    prm[0] = -5
+    assert_aligned(prm)
+    prm.clear()
+    assert prm.values_array().tolist() == []
+    prm['E'] = 3
+    assert_aligned(prm)
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        [1, 2],
+        [1, 3],
+        [1, 2, 7],
+        [8, 1, 7, 2],
+        [5, 3, 3, 9, 1],
+        [1.5, 2.5],
+        [0.1, 0.7, 0.3],
+        [2.0, 8.0, 4.0, 6.0],
+    ],
+)
+@pytest.mark.parametrize('stat_func', ['sum', 'mean', 'median', 'median_high', 'median_low'])
+def test_paramdict_array_backed_stat_pass(values, stat_func):
+    dtype = 'int64' if all(isinstance(x, int) for x in values) else 'float64'
+    prm1d = ParamDict1D(dict(enumerate(values)), dtype=dtype)
+    prmNd = ParamDictND({(i, i): v for i, v in enumerate(values)}, dtype=dtype)
+    expected = sum(values) if stat_func == 'sum' else getattr(statistics, stat_func)(values)
+    for prm in (prm1d, prmNd):
+        res = getattr(prm, stat_func)()
+        assert res == pytest.approx(expected)
+        assert type(res) is type(expected)
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        [2**62, 2**62],
+        [2**62, 2**62, 2**62, -(2**62)],
+        [-(2**63), -1],
+        [2**63 - 1, 1, 3],
+    ],
+)
+def test_paramdict_array_backed_int_overflow(values):
+    # Sums of integers are exact, even beyond the range of int64
+    prm1d = ParamDict1D(dict(enumerate(values)), dtype='int64')
+    prmNd = ParamDictND({(i % 2, i): v for i, v in enumerate(values)}, dtype='int64')
+    for prm in (prm1d, prmNd):
+        assert prm.sum() == sum(values)
+        assert prm.mean() == statistics.mean(values)
+        assert prm.median() == statistics.median(values)
+        assert prm.dot(prm) == sum(v * v for v in values)
+    assert prmNd.sum(0, '*') == sum(values[::2])
+    groups = {g: values[g::2] for g in range(2)}
+    res = prmNd.aggregate(0)
+    assert res == {g: sum(vals) for g, vals in groups.items()}
+    # Stored in int64 only if all sums fit, so that later stats are exact too
+    fits = all(-(2**63) <= sum(vals) < 2**63 for vals in groups.values())
+    assert res.dtype == ('int64' if fits else None)
+    assert res.sum() == sum(values)
+    assert pickle.loads(pickle.dumps(res)).dtype == res.dtype
+    assert prmNd.aggregate(0, func='mean').dtype == 'float64'
+    assert prmNd.aggregate(0, func='mean') == {
+        g: sum(vals) / len(vals) for g, vals in groups.items()
+    }
+    assert prmNd.aggregate(0, func='median') == {
+        g: statistics.median(vals) for g, vals in groups.items()
+    }
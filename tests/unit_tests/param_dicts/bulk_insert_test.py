@@ -0,0 +1,148 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Bulk insertion of items in ParamDict1D & ParamDictND."""
+
+import numpy as np
+import pytest
+
+from docplex_extensions import ParamDict1D, ParamDictND
+
+
+def assert_consistent(prm):
+    assert list(prm._indexset) == list(prm)
+    assert prm._indexset._set == set(prm)
+    if prm.dtype is not None:
+        assert prm.values_array().tolist() == list(prm.values())
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64', 'float64'])
+def test_paramdict1d_set_many_pass(dtype):
+    prm = ParamDict1D({'A': 1, 'B': 2}, key_name='K', dtype=dtype)
+    prm['A']  # build positions cache for array-backed
+    prm.set_many(['B', 'C', 'D'], [20, 3, 4])
+    assert list(prm.items()) == [('A', 1), ('B', 20), ('C', 3), ('D', 4)]
+    assert_consistent(prm)
+    for i in range(3):  # beyond the array capacity
+        prm.set_many(range(i * 10, i * 10 + 10), range(10))
+    assert len(prm) == 34
+    assert_consistent(prm)
+    prm.set_many([], [])
+    assert len(prm) == 34
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdictNd_set_many_pass(dtype):
+    prm = ParamDictND({('A', 1): 1.0}, dtype=dtype)
+    assert prm.subset_keys('A', '*') == [('A', 1)]  # cache index groups
+    prm.set_many([('A', 2), ('A', 1), ('B', 1)], [2.0, 1.5, 3.0])
+    assert list(prm.items()) == [(('A', 1), 1.5), (('A', 2), 2.0), (('B', 1), 3.0)]
+    assert prm.subset_keys('A', '*') == [('A', 1), ('A', 2)]
+    assert_consistent(prm)
+
+
+def test_paramdictNd_set_many_empty():
+    prm = ParamDictND()
+    prm.set_many([('A', 1), ('B', 2)], [1, 2])
+    assert prm == {('A', 1): 1, ('B', 2): 2}
+    assert prm._indexset._tuplelen == 2
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdict_set_many_numpy(dtype):
+    prm1d = ParamDict1D({0: 1}, dtype=dtype)
+    prm1d.set_many(np.arange(5), np.arange(5) * 2)
+    assert list(prm1d.items()) == [(0, 0), (1, 2), (2, 4), (3, 6), (4, 8)]
+    assert all(type(k) is int and type(v) is int for k, v in prm1d.items())
+    assert_consistent(prm1d)
+
+    prmNd = ParamDictND({(0, 1): 1}, dtype=dtype)
+    prmNd.set_many(np.array([[0, 1], [1, 2]]), np.array([5, 6]))
+    assert list(prmNd.items()) == [((0, 1), 5), ((1, 2), 6)]
+    assert_consistent(prmNd)
+
+
+@pytest.mark.parametrize(
+    'keys, values, error',
+    [
+        (['C', 'D'], [1, '2'], TypeError),
+        (['C', 'D'], [1, None], TypeError),
+        (['C', 'D'], np.array(['1', '2']), TypeError),
+        (['C', 'D'], [1], ValueError),
+        (['C', 'C'], [1, 2], ValueError),
+        (['A', 'A'], [1, 2], ValueError),
+        (['C', ('D', 1)], [1, 2], TypeError),
+        (['C', ['D']], [1, 2], TypeError),
+        (1, [1], TypeError),
+        (['C'], 1, TypeError),
+    ],
+)
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdict1d_set_many_err(keys, values, error, dtype):
+    prm = ParamDict1D({'A': 1, 'B': 2}, dtype=dtype)
+    with pytest.raises(error):
+        prm.set_many(keys, values)
+    assert list(prm.items()) == [('A', 1), ('B', 2)]  # all-or-nothing
+    assert_consistent(prm)
+
+
+def test_paramdict_set_many_int_dtype_typerr():
+    prm = ParamDict1D({'A': 1}, dtype='int64')
+    with pytest.raises(TypeError):
+        prm.set_many(['A', 'B'], [2, 2.5])
+    with pytest.raises(TypeError):
+        prm.set_many(['B'], np.array([2.0]))
+    assert list(prm.items()) == [('A', 1)]
+
+
+@pytest.mark.parametrize(
+    'keys, error',
+    [
+        ([('A', 2), 'B'], TypeError),
+        ([('A', 2), ('B', 2, 3)], ValueError),
+    ],
+)
+def test_paramdictNd_set_many_err(keys, error):
+    prm = ParamDictND({('A', 1): 1})
+    with pytest.raises(error):
+        prm.set_many(keys, [1, 2])
+    assert list(prm.items()) == [(('A', 1), 1)]
+    assert_consistent(prm)
+
+
+@pytest.mark.parametrize(
+    'other',
+    [
+        {'C': 3, 'D': 4},
+        ParamDict1D({'C': 3, 'D': 4}),
+        (['C', 'D'], [3, 4]),
+        (np.array(['C', 'D']), np.array([3, 4])),
+    ],
+)
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdict_extend_from_pass(other, dtype):
+    prm = ParamDict1D({'A': 1, 'B': 2}, dtype=dtype)
+    prm.extend_from(other)
+    assert list(prm.items()) == [('A', 1), ('B', 2), ('C', 3), ('D', 4)]
+    assert_consistent(prm)
+
+
+@pytest.mark.parametrize(
+    'other, error',
+    [
+        ({'B': 3, 'C': 4}, ValueError),
+        ((['C', 'C'], [3, 4]), ValueError),
+        ((['C', 'D'], [3]), ValueError),
+        ({'C': '3'}, TypeError),
+        ((['C'], [3], [4]), TypeError),
+        (['C', 3], TypeError),
+        ('C', TypeError),
+    ],
+)
+def test_paramdict_extend_from_err(other, error):
+    prm = ParamDict1D({'A': 1, 'B': 2})
+    with pytest.raises(error):
+        prm.extend_from(other)
+    assert list(prm.items()) == [('A', 1), ('B', 2)]
+    assert_consistent(prm)
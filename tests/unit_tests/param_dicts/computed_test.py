@@ -0,0 +1,287 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""ComputedParamDict1D & ComputedParamDictND."""
+
+from collections import OrderedDict
+from statistics import StatisticsError
+
+import numpy as np
+import pytest
+
+from docplex_extensions import (
+    ComputedParamDict1D,
+    ComputedParamDictND,
+    IndexSet1D,
+    IndexSetND,
+    ParamDict1D,
+    ParamDictND,
+)
+
+
+class CountingFunc:
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.func(*args)
+
+
+@pytest.fixture
+def computed1d():
+    return ComputedParamDict1D(
+        CountingFunc(lambda k: 10 * k), IndexSet1D([1, 2, 3], name='K'), value_name='V'
+    )
+
+
+@pytest.fixture
+def computedNd():
+    return ComputedParamDictND(
+        CountingFunc(lambda i, j: i * j), IndexSetND(range(1, 3), range(1, 4), names=['I', 'J'])
+    )
+
+
+def test_computed1d_mapping(computed1d):
+    assert computed1d.key_name == 'K'
+    assert computed1d.value_name == 'V'
+    assert len(computed1d) == 3
+    assert list(computed1d) == [1, 2, 3]
+    assert 2 in computed1d
+    assert 4 not in computed1d
+    assert computed1d[2] == 20
+    assert computed1d.get(4) is None
+    assert computed1d.get(4, -1) == -1
+    assert dict(computed1d) == {1: 10, 2: 20, 3: 30}
+    assert computed1d == {1: 10, 2: 20, 3: 30}
+    with pytest.raises(KeyError):
+        computed1d[4]
+    with pytest.raises(TypeError):
+        computed1d[1] = 1
+
+
+def test_computedNd_mapping(computedNd):
+    assert computedNd.key_names == ['I', 'J']
+    assert computedNd.value_name is None
+    assert len(computedNd) == 6
+    assert computedNd[2, 3] == 6
+    assert list(computedNd.items())[:2] == [((1, 1), 1), ((1, 2), 2)]
+    with pytest.raises(KeyError):
+        computedNd[3, 3]
+
+
+def test_computed_memoized(computed1d):
+    func = computed1d._func
+    assert computed1d[1] == 10
+    assert computed1d[1] == 10
+    assert func.calls == 1
+    assert computed1d.sum() == 60
+    assert func.calls == 3
+    computed1d.cache_clear()
+    assert computed1d.lookup(1) == 10
+    assert func.calls == 4
+
+
+def test_computed_lru_eviction():
+    func = CountingFunc(lambda k: k)
+    computed = ComputedParamDict1D(func, IndexSet1D(range(10)), maxsize=2)
+    assert computed.maxsize == 2
+    computed[0], computed[1]
+    computed[0]  # 0 is now most recent
+    computed[2]  # evicts 1
+    assert list(computed._cache) == [0, 2]
+    computed[0]
+    assert func.calls == 3
+    computed[1]
+    assert func.calls == 4
+    assert computed.sum() == 45
+    assert len(computed._cache) == 2
+
+
+def test_computed_lru_batch_bounded():
+    class TrackedCache(OrderedDict):
+        peak = 0
+
+        def __setitem__(self, key, value):
+            super().__setitem__(key, value)
+            TrackedCache.peak = max(TrackedCache.peak, len(self))
+
+    computed = ComputedParamDict1D(lambda k: k, IndexSet1D(range(10)), maxsize=3)
+    computed._cache = TrackedCache()
+    computed[0]
+    # Only the last `maxsize` values of a batch are cached
+    assert computed.sum() == 45
+    assert list(computed._cache) == [7, 8, 9]
+    assert computed.materialize() == {k: k for k in range(10)}
+    assert TrackedCache.peak == 3
+
+
+def test_computed_lru_bulk_hits():
+    computed = ComputedParamDict1D(lambda k: k, IndexSet1D(range(5)), maxsize=3)
+    computed[0], computed[1]
+    assert computed._get_many([0, 2]) == [0, 2]
+    assert list(computed._cache) == [1, 0, 2]
+
+
+@pytest.mark.parametrize('maxsize', [0, None])
+def test_computed_maxsize(maxsize):
+    func = CountingFunc(lambda k: k)
+    computed = ComputedParamDict1D(func, IndexSet1D(range(100)), maxsize=maxsize)
+    assert computed.sum() == 4950
+    assert computed[5] == 5
+    assert len(computed._cache) == (0 if maxsize == 0 else 100)
+    assert func.calls == (101 if maxsize == 0 else 100)
+
+
+@pytest.mark.parametrize('as_array', [False, True])
+def test_computed_batch_func(as_array):
+    batches = []
+
+    def batch(keys):
+        batches.append(list(keys))
+        values = [i + j for i, j in keys]
+        return np.array(values) if as_array else values
+
+    func = CountingFunc(lambda i, j: i + j)
+    computed = ComputedParamDictND(func, IndexSetND(range(2), range(3)), batch_func=batch)
+    assert computed[0, 1] == 1
+    assert func.calls == 1  # single key access uses `func`
+    assert computed.sum(0, '*') == 3
+    assert batches == [[(0, 0), (0, 2)]]  # only keys not in the cache
+    assert computed.subset_values('*', 2) == [2, 3]
+    assert batches[-1] == [(1, 2)]
+    assert computed.sum() == 9
+    assert type(computed[1, 1]) is int
+
+
+def test_computed_batch_func_valerr():
+    computed = ComputedParamDict1D(lambda k: k, IndexSet1D(range(3)), batch_func=lambda ks: [1])
+    with pytest.raises(ValueError):
+        computed.sum()
+    assert len(computed._cache) == 0
+
+
+@pytest.mark.parametrize(
+    'func, batch_func',
+    [
+        (lambda k: 'A', None),
+        (lambda k: None, None),
+        (lambda k: 1, lambda ks: ['A'] * len(ks)),
+    ],
+)
+def test_computed_value_typerr(func, batch_func):
+    computed = ComputedParamDict1D(func, IndexSet1D(range(3)), batch_func=batch_func)
+    with pytest.raises(TypeError):
+        computed.sum()
+    if batch_func is None:
+        with pytest.raises(TypeError):
+            computed[0]
+    assert len(computed._cache) == 0
+
+
+def test_computedNd_value_typerr():
+    computed = ComputedParamDictND(lambda i, j: 'A', IndexSetND([(0, 0)]))
+    with pytest.raises(TypeError):
+        computed.sum()
+
+
+def test_computed1d_lookup(computed1d):
+    assert computed1d.lookup(3) == 30
+    assert computed1d.lookup(4) == 0
+    assert computed1d._func.calls == 1
+
+
+def test_computedNd_lookup(computedNd):
+    assert computedNd.lookup(2, 2) == 4
+    assert computedNd.lookup(3, 3) == 0
+    with pytest.raises(TypeError):
+        computedNd.lookup((2, 2))
+    with pytest.raises(ValueError):
+        computedNd.lookup(2, 2, 2)
+    assert ComputedParamDictND(lambda i, j: 1, IndexSetND()).lookup(1, 1) == 0
+
+
+def test_computedNd_sum_pattern(computedNd):
+    assert computedNd.sum() == 18
+    assert computedNd.sum(2, '*') == 12
+    assert computedNd.sum('*', 4) == 0
+    with pytest.raises(ValueError):
+        computedNd.sum(1, 2, 3)
+    with pytest.raises(ValueError):
+        computedNd.sum('*', '*')
+
+
+@pytest.mark.parametrize(
+    'computed',
+    [
+        ComputedParamDict1D(lambda k: k, IndexSet1D()),
+        ComputedParamDictND(lambda i, j: 1, IndexSetND()),
+    ],
+)
+def test_computed_sum_empty(computed):
+    with pytest.raises(StatisticsError):
+        computed.sum()
+
+
+def test_computed_indexset_by_reference():
+    indexset = IndexSet1D([1, 2])
+    computed = ComputedParamDict1D(lambda k: k, indexset)
+    indexset.append(3)
+    assert computed[3] == 3
+    assert computed.sum() == 6
+    # Cached values of keys removed from the index-set are not served
+    indexset.remove(2)
+    assert 2 not in computed
+    with pytest.raises(KeyError):
+        computed[2]
+    assert computed.get(2) is None
+    assert computed.sum() == 4
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_computed_materialize(computed1d, computedNd, dtype):
+    prm1d = computed1d.materialize(dtype=dtype)
+    assert type(prm1d) is ParamDict1D
+    assert prm1d == {1: 10, 2: 20, 3: 30}
+    assert (prm1d.key_name, prm1d.value_name, prm1d.dtype) == ('K', 'V', dtype)
+    prm1d[4] = 40  # independent of the computed one
+    assert 4 not in computed1d
+
+    prmNd = computedNd.materialize(dtype=dtype)
+    assert type(prmNd) is ParamDictND
+    assert prmNd.sum(2, '*') == 12
+    assert (prmNd.key_names, prmNd.dtype) == (['I', 'J'], dtype)
+
+
+def test_computed_repr(computed1d):
+    computed1d[1]
+    assert repr(computed1d) == (
+        "ComputedParamDict1D: K -> V\n<computed with 'CountingFunc' for 3 keys; 1 cached>"
+    )
+    computed = ComputedParamDictND(max, IndexSetND([(1, 2)]))
+    assert repr(computed) == "ComputedParamDictND:\n<computed with 'max' for 1 keys; 0 cached>"
+
+
+@pytest.mark.parametrize(
+    'args, kwargs, error',
+    [
+        ((1, IndexSet1D([1])), {}, TypeError),
+        ((abs, IndexSet1D([1])), {'batch_func': 1}, TypeError),
+        ((abs, [1]), {}, TypeError),
+        ((abs, IndexSetND([(1, 1)])), {}, TypeError),
+        ((abs, IndexSet1D([1])), {'maxsize': 1.0}, TypeError),
+        ((abs, IndexSet1D([1])), {'maxsize': True}, TypeError),
+        ((abs, IndexSet1D([1])), {'maxsize': -1}, ValueError),
+        ((abs, IndexSet1D([1])), {'value_name': 1}, TypeError),
+    ],
+)
+def test_computed1d_constructor_err(args, kwargs, error):
+    with pytest.raises(error):
+        ComputedParamDict1D(*args, **kwargs)
+
+
+def test_computedNd_constructor_typerr():
+    with pytest.raises(TypeError):
+        ComputedParamDictND(max, IndexSet1D([1]))
@@ -0,0 +1,111 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Fast reducers & exact mode for statistics of ParamDict1D & ParamDictND."""
+
+import random
+import statistics
+from statistics import StatisticsError
+
+import pytest
+
+from docplex_extensions import ParamDict1D, ParamDictND
+from docplex_extensions._stats import FAST_STAT_FUNCS
+
+STAT_FUNCS = ['mean', 'median', 'median_high', 'median_low']
+
+rng = random.Random(42)
+DATASETS = [
+    [7],
+    [1, 2],
+    [3, 1, 2],
+    [4, 4, 1, 9],
+    [1, 2.5, 3],
+    [0.1, 0.2, 0.3, 0.4],
+    [2**70, 1, 3],  # beyond int64
+    [rng.randint(-1000, 1000) for _ in range(2001)],  # selection with NumPy
+    [rng.random() for _ in range(2000)],  # selection with NumPy
+    [rng.randint(0, 10) for _ in range(1500)] + [2**70],  # fallback to sorting
+]
+
+
+@pytest.mark.parametrize('stat_func', STAT_FUNCS)
+@pytest.mark.parametrize('data', DATASETS)
+def test_fast_stat_funcs(data, stat_func):
+    res = FAST_STAT_FUNCS[stat_func](data)
+    expected = getattr(statistics, stat_func)(data)
+    assert res == pytest.approx(expected, rel=1e-15)
+    assert type(res) is type(expected)
+    if stat_func != 'mean':
+        assert res == expected
+
+
+@pytest.mark.parametrize('stat_func', STAT_FUNCS)
+def test_fast_stat_funcs_empty(stat_func):
+    with pytest.raises(StatisticsError):
+        FAST_STAT_FUNCS[stat_func]([])
+
+
+def test_fast_mean_int_exact():
+    assert FAST_STAT_FUNCS['mean']([2**70, 2**70 + 2]) == 2**70 + 1
+    assert FAST_STAT_FUNCS['mean']([1, 2]) == 1.5
+
+
+def test_fast_mean_float_compensated():
+    data = [1e16, 1.0, -1e16, 1.0]
+    assert FAST_STAT_FUNCS['mean'](data) == statistics.mean(data) == 0.5
+
+
+@pytest.mark.parametrize('stat_func', STAT_FUNCS)
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+@pytest.mark.parametrize('exact', [False, True])
+def test_paramdict_stat_exact(exact, dtype, stat_func):
+    values = [0.1, 0.7, 0.3, 0.2, 0.9, 0.4]
+    prm1d = ParamDict1D(dict(enumerate(values)), dtype=dtype)
+    prmNd = ParamDictND({(i % 2, i): v for i, v in enumerate(values)}, dtype=dtype)
+    expected = getattr(statistics, stat_func)(values)
+    expected_sub = getattr(statistics, stat_func)(values[::2])
+    for res in (
+        getattr(prm1d, stat_func)(exact=exact),
+        getattr(prmNd, stat_func)(exact=exact),
+    ):
+        assert res == pytest.approx(expected)
+        if exact:
+            assert res == expected
+    res = getattr(prmNd, stat_func)(0, '*', exact=exact)
+    assert res == pytest.approx(expected_sub)
+    if exact:
+        assert res == expected_sub
+
+
+@pytest.mark.parametrize('stat_func', ['sum'] + STAT_FUNCS)
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdictNd_stat_subset_pass(dtype, stat_func):
+    prm = ParamDictND({('A', 1): 4, ('B', 1): 2, ('A', 2): 7, ('A', 3): 1}, dtype=dtype)
+    expected = (sum if stat_func == 'sum' else getattr(statistics, stat_func))([4, 7, 1])
+    res = prm._calc_stat('A', '*', stat_func=stat_func)
+    assert res == expected
+    assert type(res) is type(expected)
+    assert prm._calc_stat('C', '*', stat_func=stat_func) == 0
+    assert prm._calc_stat('C', '*', stat_func=stat_func, exact=True) == 0
+
+
+def test_paramdictNd_stat_subset_not_fast():
+    prm = ParamDictND({('A', 1): 4, ('B', 1): 2, ('A', 2): 7}, dtype='int64')
+    assert prm._calc_stat('A', '*', stat_func='stdev') == statistics.stdev([4, 7])
+    assert prm._calc_stat('C', '*', stat_func='stdev') == 0
+    assert prm._calc_stat(stat_func='stdev') == statistics.stdev([4, 2, 7])
+
+
+@pytest.mark.parametrize('func', ['mean', 'median'])
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdictNd_aggregate_exact(dtype, func):
+    values = {(0, 0): 0.1, (0, 1): 0.7, (1, 0): 0.3, (1, 1): 0.2, (1, 2): 0.9}
+    prm = ParamDictND(values, dtype=dtype)
+    res = prm.aggregate(0, func=func, exact=True)
+    assert res == {
+        0: getattr(statistics, func)([0.1, 0.7]),
+        1: getattr(statistics, func)([0.3, 0.2, 0.9]),
+    }
+    assert res.dtype is None
@@ -0,0 +1,109 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Filtering of ParamDict1D & ParamDictND by parameter values."""
+
+import math
+import operator
+
+import numpy as np
+import pytest
+
+from docplex_extensions import IndexSet1D, IndexSetND, ParamDict1D, ParamDictND
+
+VALUES_1D = {'A': 3, 'B': 0, 'C': -2, 'D': 7, 'E': 0}
+VALUES_ND = {('A', 1): 2.5, ('A', 2): math.inf, ('B', 1): 0.0, ('B', 2): -1.5, ('C', 1): 4.0}
+OPS = {
+    'lt': operator.lt,
+    'le': operator.le,
+    'gt': operator.gt,
+    'ge': operator.ge,
+    'eq': operator.eq,
+    'ne': operator.ne,
+}
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+@pytest.mark.parametrize('name', list(OPS))
+def test_paramdict1d_filter_comparison(name, dtype):
+    prm = ParamDict1D(VALUES_1D, key_name='K', value_name='V', dtype=dtype)
+    expected = {k: v for k, v in VALUES_1D.items() if OPS[name](v, 0)}
+    res = prm.filter(**{name: 0})
+    assert type(res) is ParamDict1D
+    assert list(res.items()) == list(expected.items())
+    assert (res.key_name, res.value_name, res.dtype) == ('K', 'V', dtype)
+    if dtype is not None:
+        assert res.values_array().tolist() == list(res.values())
+    keys = prm.filter_keys(**{name: 0})
+    assert type(keys) is IndexSet1D
+    assert list(keys) == list(expected)
+    assert keys.name == 'K'
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdictNd_filter_many_comparisons(dtype):
+    prm = ParamDictND(VALUES_ND, key_names=['X', 'Y'], dtype=dtype)
+    res = prm.filter(ge=0, lt=math.inf, ne=4)
+    assert type(res) is ParamDictND
+    assert res == {('A', 1): 2.5, ('B', 1): 0.0}
+    assert res.key_names == ['X', 'Y']
+    keys = prm.filter_keys(ge=0, lt=math.inf, ne=4)
+    assert type(keys) is IndexSetND
+    assert list(keys) == [('A', 1), ('B', 1)]
+    assert keys.names == ['X', 'Y']
+    assert keys.subset('A', '*') == [('A', 1)]
+    assert prm.filter(gt=math.inf) == {}
+    assert list(prm.filter_keys(gt=math.inf)) == []
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdictNd_filter_mask(dtype):
+    prm = ParamDictND(VALUES_ND, dtype=dtype)
+    assert list(prm.filter(np.isfinite)) == [('A', 1), ('B', 1), ('B', 2), ('C', 1)]
+    assert list(prm.filter(lambda arr: arr > 0, lt=4)) == [('A', 1)]
+    assert list(prm.filter_keys([True, False, False, False, True])) == [('A', 1), ('C', 1)]
+    assert list(prm.filter_keys(np.array([False] * 5))) == []
+
+
+def test_paramdict_filter_reuses_keys():
+    key = ('A', 1)
+    prm = ParamDictND({key: 1, ('B', 2): 2})
+    assert next(iter(prm.filter(lt=2))) is key
+    assert prm.filter_keys(lt=2)[0] is key
+
+
+def test_paramdict_filter_result_independent():
+    prm = ParamDict1D(VALUES_1D, dtype='int64')
+    res = prm.filter(gt=0)
+    res['Z'] = 10
+    res['A'] = 30
+    assert prm == VALUES_1D
+    assert prm.values_array().tolist() == list(VALUES_1D.values())
+    keys = prm.filter_keys(gt=0)
+    keys.append('Y')
+    assert list(prm) == list(VALUES_1D)
+
+
+def test_paramdict_filter_numpy_scalar_comparison():
+    prm = ParamDict1D(VALUES_1D)
+    assert list(prm.filter(gt=np.int64(2))) == ['A', 'D']
+
+
+def test_paramdict_filter_empty():
+    assert ParamDict1D().filter(gt=0) == {}
+    assert list(ParamDictND().filter_keys(np.isfinite)) == []
+
+
+def test_paramdict_filter_errors():
+    prm = ParamDictND(VALUES_ND)
+    with pytest.raises(ValueError, match='either `mask` or a comparison is required'):
+        prm.filter()
+    with pytest.raises(TypeError, match='`gt` should be either int or float'):
+        prm.filter(gt='0')
+    with pytest.raises(ValueError, match='`mask` should be a bool array with one value'):
+        prm.filter(lambda arr: arr)
+    with pytest.raises(ValueError, match='`mask` should be a bool array with one value'):
+        prm.filter_keys([True, False])
+    with pytest.raises(TypeError):
+        prm.filter(1, 2)
@@ -0,0 +1,131 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Per-group top-k, argmin, and argmax selection of ParamDictND."""
+
+import random
+
+import pytest
+
+from docplex_extensions import IndexSetND, ParamDictND
+
+VALUES = {
+    ('S1', 'P1', 'A'): 10,
+    ('S1', 'P1', 'B'): 20,
+    ('S2', 'P1', 'A'): 5,
+    ('S1', 'P2', 'A'): 15,
+    ('S1', 'P1', 'C'): 3,
+    ('S2', 'P2', 'B'): 7,
+    ('S2', 'P1', 'B'): 8,
+    ('S1', 'P1', 'D'): 10,
+}
+
+
+def expected_keys(values, indices, n, largest):
+    # Reference: sort each group (stable for ties), keep n, and restore the original order
+    groups = {}
+    for pos, (key, value) in enumerate(values.items()):
+        group = tuple(key[i] for i in indices)
+        groups.setdefault(group, []).append((value, pos, key))
+    selected = []
+    for items in groups.values():
+        items.sort(key=lambda item: (-item[0] if largest else item[0], item[1]))
+        selected.extend(items[:n])
+    return [key for _, _, key in sorted(selected, key=lambda item: item[1])]
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+@pytest.mark.parametrize('largest', [False, True])
+@pytest.mark.parametrize('n', [0, 1, 2, 3, 10])
+@pytest.mark.parametrize('dims', [(), (0,), ('PERIOD',), (0, 1), (-1,), ('SITE', 'PRODUCT')])
+def test_paramdictNd_nsmallest_nlargest(dims, n, largest, dtype):
+    prm = ParamDictND(
+        VALUES, key_names=['SITE', 'PERIOD', 'PRODUCT'], value_name='COST', dtype=dtype
+    )
+    res = prm.nlargest(n, *dims) if largest else prm.nsmallest(n, *dims)
+    indices = [prm._dim_index(dim) for dim in dims]
+    keys = expected_keys(VALUES, indices, n, largest)
+    assert type(res) is ParamDictND
+    assert list(res.items()) == [(key, VALUES[key]) for key in keys]
+    assert res.key_names == ['SITE', 'PERIOD', 'PRODUCT']
+    assert res.value_name == 'COST'
+    assert res.dtype == dtype
+    if dtype is not None:
+        assert res.values_array().tolist() == list(res.values())
+    assert prm == VALUES  # unchanged
+
+
+@pytest.mark.parametrize('largest', [False, True])
+@pytest.mark.parametrize('dims', [(), (1,), (0, 2)])
+def test_paramdictNd_argmin_argmax(dims, largest):
+    prm = ParamDictND(VALUES, key_names=['SITE', 'PERIOD', 'PRODUCT'])
+    res = prm.argmax(*dims) if largest else prm.argmin(*dims)
+    assert type(res) is IndexSetND
+    assert list(res) == expected_keys(VALUES, dims, 1, largest)
+    assert res.names == ['SITE', 'PERIOD', 'PRODUCT']
+
+
+def test_paramdictNd_group_selection_ties():
+    prm = ParamDictND({('A', 1): 2, ('A', 2): 1, ('A', 3): 1, ('A', 4): 2})
+    assert list(prm.argmin(0)) == [('A', 2)]
+    assert list(prm.argmax(0)) == [('A', 1)]
+    assert list(prm.nsmallest(3, 0)) == [('A', 1), ('A', 2), ('A', 3)]
+    assert list(prm.nlargest(3, 0)) == [('A', 1), ('A', 2), ('A', 4)]
+
+
+def test_paramdictNd_group_selection_random():
+    rng = random.Random(0)
+    values = {
+        (i, j, k): rng.choice([1, 2.5, 3, 4.0])
+        for i in range(5)
+        for j in range(4)
+        for k in range(6)
+    }
+    prm = ParamDictND(values)
+    for n in (1, 2, 5):
+        for dims in ((0,), (1,), (0, 1), (2,)):
+            assert list(prm.nsmallest(n, *dims)) == expected_keys(values, dims, n, False)
+            assert list(prm.nlargest(n, *dims)) == expected_keys(values, dims, n, True)
+
+
+def test_paramdictNd_group_selection_result_independent():
+    prm = ParamDictND({('A', 1): 2, ('A', 2): 1})
+    res = prm.nsmallest(1, 0)
+    res[('B', 1)] = 5
+    assert list(prm) == [('A', 1), ('A', 2)]
+    idx = prm.argmin(0)
+    idx.append(('C', 1))
+    assert list(prm) == [('A', 1), ('A', 2)]
+
+
+@pytest.mark.parametrize('method', ['nsmallest', 'nlargest'])
+def test_paramdictNd_nsmallest_nlargest_errors(method):
+    prm = ParamDictND(VALUES, key_names=['SITE', 'PERIOD', 'PRODUCT'])
+    with pytest.raises(LookupError, match='ParamDictND is empty'):
+        getattr(ParamDictND(), method)(1)
+    with pytest.raises(TypeError, match='`n` should be an int'):
+        getattr(prm, method)(1.0, 0)
+    with pytest.raises(TypeError, match='`n` should be an int'):
+        getattr(prm, method)(True, 0)
+    with pytest.raises(ValueError, match='`n` should be non-negative'):
+        getattr(prm, method)(-1, 0)
+    with pytest.raises(ValueError, match=f'`{method}` does not work with all dimensions'):
+        getattr(prm, method)(1, 0, 1, 2)
+    with pytest.raises(ValueError, match='should not be repeated'):
+        getattr(prm, method)(1, 0, 'SITE')
+    with pytest.raises(ValueError, match="'X' not found in `key_names` of ParamDictND"):
+        getattr(prm, method)(1, 'X')
+    with pytest.raises(TypeError, match='`dim` should be either int or str'):
+        getattr(prm, method)(1, 1.0)
+
+
+@pytest.mark.parametrize('method', ['argmin', 'argmax'])
+def test_paramdictNd_argmin_argmax_errors(method):
+    prm = ParamDictND(VALUES)
+    with pytest.raises(LookupError, match='ParamDictND is empty'):
+        getattr(ParamDictND(), method)()
+    with pytest.raises(ValueError, match=f'`{method}` does not work with all dimensions'):
+        getattr(prm, method)(0, 1, 2)
+    with pytest.raises(ValueError, match='`dim` 3 is out of range'):
+        getattr(prm, method)(3)
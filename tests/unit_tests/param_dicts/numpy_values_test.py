@@ -0,0 +1,141 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""NumPy numeric scalars and arrays as parameter values of ParamDicts."""
+
+import numpy as np
+import pytest
+
+from docplex_extensions import (
+    ComputedParamDict1D,
+    IndexSet1D,
+    ParamDict1D,
+    ParamDictND,
+    SparseParamDict1D,
+)
+
+
+def value_types(prm):
+    return [type(v) for v in prm.values()]
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdict1d_constructor_numpy_scalars_pass(dtype):
+    prm = ParamDict1D({'A': np.float32(1.5), 'B': np.int64(2), 'C': 3, 'D': 4.0}, dtype=dtype)
+    assert prm == {'A': 1.5, 'B': 2, 'C': 3, 'D': 4.0}
+    assert value_types(prm) == [float, int, int, float]
+    if dtype is not None:
+        assert prm.values_array().tolist() == [1.5, 2.0, 3.0, 4.0]
+
+
+def test_paramdictNd_constructor_numpy_scalars_pass():
+    prm = ParamDictND({('A', 1): np.uint8(1), ('A', 2): np.float16(0.5)}, dtype='float64')
+    assert prm == {('A', 1): 1, ('A', 2): 0.5}
+    assert value_types(prm) == [int, float]
+    assert prm.sum('A', '*') == 1.5
+
+
+def test_paramdict1d_constructor_numpy_scalars_large_int_pass():
+    prm = ParamDict1D({'A': 2**70, 'B': np.int64(2)})  # inconclusive object data type
+    assert prm == {'A': 2**70, 'B': 2}
+    assert value_types(prm) == [int, int]
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        [np.int64(1), 'X'],
+        [np.int64(1), None],
+        [np.int64(1), [1, 2]],
+        [np.int64(1), np.complex128(1)],
+        [np.int64(1), np.datetime64('2024-01-01')],
+        [np.array([1, 2]), np.array([3, 4])],
+    ],
+)
+def test_paramdict1d_constructor_numpy_scalars_fail(values):
+    with pytest.raises(TypeError, match="input mapping's values should be either int or float"):
+        ParamDict1D(dict(zip('AB', values, strict=True)))
+
+
+def test_paramdict1d_constructor_numpy_float_int_dtype_fail():
+    with pytest.raises(TypeError, match="input mapping's values should be int for dtype int64"):
+        ParamDict1D({'A': np.int64(1), 'B': np.float32(2)}, dtype='int64')
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdict1d_setitem_setdefault_numpy_scalars_pass(dtype):
+    prm = ParamDict1D({'A': 1}, dtype=dtype)
+    prm['A'] = np.int32(10)
+    prm['B'] = np.array(20)  # 0-dim array
+    assert prm.setdefault('C', np.int64(30)) == 30
+    assert prm.setdefault('C', np.int64(40)) == 30
+    assert prm == {'A': 10, 'B': 20, 'C': 30}
+    assert value_types(prm) == [int, int, int]
+
+
+def test_paramdict1d_setitem_setdefault_numpy_scalars_fail():
+    prm = ParamDict1D({'A': 1}, dtype='int64')
+    with pytest.raises(TypeError, match='`value` should be int for dtype int64'):
+        prm['A'] = np.float64(1.5)
+    with pytest.raises(TypeError, match='`value` should be either int or float'):
+        prm['A'] = np.str_('X')
+    with pytest.raises(TypeError, match='`value` should be either int or float'):
+        prm['A'] = np.array([1])
+    with pytest.raises(TypeError, match='`default` should be either int or float'):
+        prm.setdefault('B', np.complex64(1))
+    assert prm == {'A': 1}
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdict1d_set_many_numpy_pass(dtype):
+    prm = ParamDict1D({'A': 1.0}, dtype=dtype)
+    prm.set_many(['A', 'B'], [np.float32(0.5), np.int64(2)])
+    prm.set_many(np.array(['C', 'D']), np.array([3.0, 4.0], dtype='float32'))
+    prm.set_many(['E'], np.array([True]))
+    assert prm == {'A': 0.5, 'B': 2, 'C': 3.0, 'D': 4.0, 'E': True}
+    assert value_types(prm) == [float, int, float, float, bool]
+
+
+def test_paramdict1d_set_many_numpy_fail():
+    prm = ParamDict1D({'A': 1.0})
+    with pytest.raises(TypeError, match='`values` should be either int or float'):
+        prm.set_many(['B', 'C'], [np.float32(0.5), 'X'])
+    with pytest.raises(TypeError, match='`values` should be either int or float'):
+        prm.set_many(['B', 'C'], np.array(['X', 'Y']))
+    assert prm == {'A': 1.0}
+
+
+def test_sparse_paramdict1d_numpy_scalars():
+    prm = SparseParamDict1D(
+        IndexSet1D(['A', 'B', 'C']), {'A': np.float32(1.5), 'B': np.int64(0)}, default=np.int64(0)
+    )
+    assert prm.default == 0 and type(prm.default) is int
+    assert prm.overrides == {'A': 1.5}
+    prm['C'] = np.int16(3)
+    assert prm.overrides == {'A': 1.5, 'C': 3}
+    assert [type(v) for v in prm.overrides.values()] == [float, int]
+    with pytest.raises(TypeError, match="`overrides` mapping's values should be either int"):
+        SparseParamDict1D(IndexSet1D(['A']), {'A': np.str_('X')})
+
+
+def test_computed_paramdict1d_numpy_scalars():
+    prm = ComputedParamDict1D(lambda key: np.float32(key) / 2, IndexSet1D([1, 2, 3]))
+    assert prm[1] == 0.5 and type(prm[1]) is float
+    assert prm.materialize() == {1: 0.5, 2: 1.0, 3: 1.5}
+    assert [type(v) for v in prm.materialize().values()] == [float, float, float]
+
+
+def test_computed_paramdict1d_batch_numpy_scalars():
+    prm = ComputedParamDict1D(
+        lambda key: key * 2,
+        IndexSet1D([1, 2, 3]),
+        batch_func=lambda keys: [np.int32(key * 2) for key in keys],
+    )
+    assert prm.materialize() == {1: 2, 2: 4, 3: 6}
+    assert [type(v) for v in prm.materialize().values()] == [int, int, int]
+    prm = ComputedParamDict1D(
+        lambda key: key, IndexSet1D([1, 2]), batch_func=lambda keys: [np.str_('X')] * len(keys)
+    )
+    with pytest.raises(TypeError, match='computed parameter values should be either int or float'):
+        prm.materialize()
@@ -0,0 +1,110 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Pickling of ParamDict1D & ParamDictND."""
+
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from docplex_extensions import IndexSet1D, ParamDict1D, ParamDictND, SparseParamDict1D
+
+
+def roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64', 'int64'])
+@pytest.mark.parametrize(
+    'cls, mapping, names',
+    [
+        (ParamDict1D, {}, {'key_name': 'K'}),
+        (ParamDict1D, {'A': 1, 'B': 2, 'C': 3}, {'key_name': 'K', 'value_name': 'V'}),
+        (ParamDictND, {}, {'key_names': ['X', 'Y']}),
+        (ParamDictND, {('A', 1): 1, ('A', 2): 2, ('B', 1): 3}, {'key_names': ['X', 'Y']}),
+    ],
+)
+def test_paramdict_pickle_pass(cls, mapping, names, dtype):
+    prm = cls(mapping, dtype=dtype, **names)
+    res = roundtrip(prm)
+    assert type(res) is cls
+    assert list(res.items()) == list(prm.items())
+    assert list(res._indexset) == list(prm)
+    assert res._indexset._set == prm._indexset._set
+    assert res.value_name == prm.value_name
+    assert res.dtype == dtype
+    if dtype is not None:
+        assert res.values_array().tolist() == prm.values_array().tolist()
+    for attr, value in names.items():
+        assert getattr(res, attr) == value
+
+
+def test_paramdict_pickle_keyset_not_shared():
+    # The unpickled index-set (pickled once, along with the ParamDict) is independent of it
+    prm = ParamDict1D({'A': 1, 'B': 2})
+    res, indexset = roundtrip((prm, prm._indexset))
+    indexset.append('C')
+    assert 'C' not in res
+    assert res._indexset._set == {'A', 'B'}
+    res['D'] = 4
+    assert 'D' not in indexset
+
+
+def test_paramdict_pickle_value_types():
+    prm = ParamDict1D({'A': 1, 'B': 2.5, 'C': float('inf')}, dtype='float64')
+    res = roundtrip(prm)
+    assert [type(v) for v in res.values()] == [int, float, float]
+    assert res.values_array().dtype == np.float64
+
+
+def test_paramdict_pickle_key_names_differ_from_indexset():
+    prm = ParamDictND({('A', 1): 1}, key_names=['X', 'Y'])
+    prm.key_names = ['P', 'Q']
+    assert roundtrip(prm).key_names == ['P', 'Q']
+
+
+def test_paramdict_pickle_result_usable():
+    prm = ParamDictND({('A', 1): 1, ('B', 2): 2}, dtype='int64')
+    res = roundtrip(prm)
+    res[('C', 3)] = 3
+    del res[('A', 1)]
+    assert res == {('B', 2): 2, ('C', 3): 3}
+    assert res.values_array().tolist() == [2, 3]
+    assert res.sum('*', 2) == 2
+    assert prm == {('A', 1): 1, ('B', 2): 2}
+
+
+def test_paramdict_pickle_stat_cache():
+    prm = ParamDictND({('A', 1): 1, ('B', 2): 2})
+    assert roundtrip(prm).stat_cache_info() is None
+    prm.enable_stat_cache()
+    prm.sum('A', '*')
+    res = roundtrip(prm)
+    assert res.stat_cache_info() == (0, 0, 0)
+    assert res.sum('A', '*') == 1
+
+
+def test_paramdict_deepcopy():
+    prm = ParamDict1D({'A': 1.5}, key_name='K', dtype='float64')
+    res = copy.deepcopy(prm)
+    res['B'] = 2
+    assert prm == {'A': 1.5}
+    assert res.key_name == 'K'
+
+
+def test_sparse_paramdict_pickle():
+    prm = SparseParamDict1D(IndexSet1D(['A', 'B']), {'B': 5}, default=1)
+    res = roundtrip(prm)
+    assert dict(res) == {'A': 1, 'B': 5}
+    # Overrides of keys removed from the unpickled index-set are discarded
+    res._indexset.remove('B')
+    res._indexset.append('B')
+    assert dict(res) == {'A': 1, 'B': 1}
+    assert dict(prm) == {'A': 1, 'B': 5}
+    res = copy.copy(prm)
+    prm._indexset.remove('B')
+    prm._indexset.append('B')
+    assert res.overrides == {}
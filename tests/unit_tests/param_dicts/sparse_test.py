@@ -0,0 +1,304 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""SparseParamDict1D & SparseParamDictND."""
+
+import random
+import statistics
+from statistics import StatisticsError
+
+import pytest
+
+from docplex_extensions import (
+    IndexSet1D,
+    IndexSetND,
+    ParamDict1D,
+    ParamDictND,
+    SparseParamDict1D,
+    SparseParamDictND,
+)
+
+
+@pytest.fixture
+def sparse1d():
+    return SparseParamDict1D(
+        IndexSet1D(range(10), name='K'), {2: 500, 7: 300}, default=100, value_name='V'
+    )
+
+
+@pytest.fixture
+def sparseNd():
+    indexset = IndexSetND(['A', 'B', 'C'], range(4), names=['I', 'J'])
+    return SparseParamDictND(indexset, {('A', 0): 5, ('A', 3): -2, ('B', 0): 7.5})
+
+
+def test_sparse1d_mapping(sparse1d):
+    assert sparse1d.key_name == 'K'
+    assert sparse1d.value_name == 'V'
+    assert sparse1d.default == 100
+    assert sparse1d.overrides == {2: 500, 7: 300}
+    assert len(sparse1d) == 10
+    assert list(sparse1d) == list(range(10))
+    assert 9 in sparse1d
+    assert 10 not in sparse1d
+    assert sparse1d[2] == 500
+    assert sparse1d[3] == 100
+    assert sparse1d.get(10) is None
+    with pytest.raises(KeyError):
+        sparse1d[10]
+    assert dict(sparse1d) == {**dict.fromkeys(range(10), 100), 2: 500, 7: 300}
+
+
+def test_sparseNd_mapping(sparseNd):
+    assert sparseNd.key_names == ['I', 'J']
+    assert sparseNd.value_name is None
+    assert sparseNd.default == 0
+    assert len(sparseNd) == 12
+    assert sparseNd['A', 3] == -2
+    assert sparseNd['C', 3] == 0
+    assert list(sparseNd.items())[:2] == [(('A', 0), 5), (('A', 1), 0)]
+    assert sparseNd.subset_values('*', 0) == [5, 7.5, 0]
+    with pytest.raises(KeyError):
+        sparseNd['D', 0]
+
+
+def test_sparse_setitem(sparse1d):
+    sparse1d[3] = 1
+    sparse1d[2] = 100  # back to default
+    sparse1d[7] = 100.0  # same value as default but different type
+    assert sparse1d.overrides == {3: 1, 7: 100.0}
+    assert type(sparse1d[7]) is float
+    with pytest.raises(KeyError):
+        sparse1d[10] = 1
+    with pytest.raises(TypeError):
+        sparse1d[1] = '1'
+
+
+def test_sparse_overrides_same_as_default():
+    sparse = SparseParamDict1D(IndexSet1D(range(3)), {0: 0, 1: 0.0, 2: 1})
+    assert sparse.overrides == {1: 0.0, 2: 1}
+
+
+def test_sparse_indexset_by_reference():
+    indexset = IndexSet1D([1, 2])
+    sparse = SparseParamDict1D(indexset, {1: 5}, default=1)
+    indexset.append(3)
+    assert sparse[3] == 1
+    assert sparse.sum() == 7
+    indexset.remove(1)
+    assert 1 not in sparse
+    assert sparse.overrides == {}
+    assert sparse.sum() == 2
+    assert repr(sparse) == 'SparseParamDict1D:\n<default 1 for 2 keys; 0 overrides>'
+
+
+@pytest.mark.parametrize(
+    'remove',
+    [
+        lambda indexset: indexset.remove(2),
+        lambda indexset: indexset.pop(1),
+        lambda indexset: indexset.__delitem__(slice(1, 2)),
+        lambda indexset: indexset.__setitem__(1, 9),
+        lambda indexset: indexset.__setitem__(slice(0, 2), [1, 9]),
+        lambda indexset: indexset.clear(),
+    ],
+)
+def test_sparse_indexset_keys_removed(remove):
+    # Overrides of removed keys are stale; keys added back get the default
+    indexset = IndexSet1D([1, 2, 3])
+    sparse = SparseParamDict1D(indexset, {2: 500}, default=1)
+    remove(indexset)
+    assert 2 not in sparse
+    with pytest.raises(KeyError):
+        sparse[2]
+    assert sparse.get(2) is None
+    with pytest.raises(KeyError):
+        sparse[2] = 5
+    indexset.append(2)
+    assert sparse[2] == 1
+    assert sparse.overrides == {}
+
+
+def test_sparse_indexset_key_readded():
+    # Removing and adding back a key, without accessing the SparseParamDict in between
+    indexset = IndexSet1D([1, 2, 3])
+    sparse = SparseParamDict1D(indexset, {2: 500, 3: 300}, default=1)
+    indexset.remove(2)
+    indexset.append(2)
+    assert sparse[2] == 1
+    assert sparse.get(2) == 1
+    assert sparse.overrides == {3: 300}
+    assert dict(sparse) == {1: 1, 3: 300, 2: 1}
+    assert sparse.sum() == 302
+    sparse[2] = 7
+    assert sparse.overrides == {3: 300, 2: 7}
+    indexset.remove(3)
+    indexset.append(3)
+    assert sparse.materialize() == {1: 1, 2: 7, 3: 1}
+
+
+def test_sparse1d_stats(sparse1d):
+    assert sparse1d.sum() == 1600
+    assert sparse1d.mean() == 160
+    assert sparse1d.median() == 100
+    assert sparse1d.median_high() == 100
+    assert sparse1d.median_low() == 100
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('stat_func', ['sum', 'mean', 'median', 'median_high', 'median_low'])
+def test_sparse_stats_same_as_paramdict(seed, stat_func):
+    rng = random.Random(seed)
+    size = rng.randint(1, 30)
+    default = rng.choice([0, 3, -2.5])
+    keys = rng.sample(range(size), rng.randint(0, size))
+    overrides = {k: rng.choice([rng.randint(-10, 10), rng.uniform(-10, 10)]) for k in keys}
+
+    sparse = SparseParamDict1D(IndexSet1D(range(size)), overrides, default=default)
+    paramdict = ParamDict1D(dict(sparse))
+    expected = (
+        getattr(paramdict, stat_func)(exact=True) if stat_func != 'sum' else sum(paramdict.values())
+    )
+    assert getattr(sparse, stat_func)() == pytest.approx(expected)
+
+
+def test_sparse_stats_all_overridden():
+    sparse = SparseParamDict1D(IndexSet1D(range(4)), {0: 1, 1: 2, 2: 3, 3: 5}, default=0.0)
+    assert sparse.sum() == 11
+    assert type(sparse.sum()) is int
+    assert sparse.mean() == 2.75
+    assert sparse.median() == 2.5
+    assert sparse.median_high() == 3
+    assert sparse.median_low() == 2
+
+
+def test_sparseNd_stats(sparseNd):
+    assert sparseNd.sum() == 10.5
+    assert sparseNd.sum('A', '*') == 3
+    assert sparseNd.sum('*', 0) == 12.5
+    assert sparseNd.sum('D', '*') == 0
+    assert sparseNd.mean('A', '*') == 0.75
+    assert sparseNd.mean('*', 0) == statistics.mean([5, 7.5, 0])
+    assert sparseNd.median('*', 0) == 5
+    assert sparseNd.median_high('A', '*') == 0
+    assert sparseNd.median_low('A', '*') == 0
+    assert sparseNd.median('C', '*') == 0
+    with pytest.raises(ValueError):
+        sparseNd.sum('A', 0, 1)
+    with pytest.raises(ValueError):
+        sparseNd.sum('*', '*')
+    with pytest.raises(TypeError):
+        sparseNd.sum(['A'], '*')
+
+
+@pytest.mark.parametrize(
+    'sparse',
+    [SparseParamDict1D(IndexSet1D()), SparseParamDictND(IndexSetND())],
+)
+@pytest.mark.parametrize('stat_func', ['sum', 'mean', 'median', 'median_high', 'median_low'])
+def test_sparse_stats_empty(sparse, stat_func):
+    with pytest.raises(StatisticsError):
+        getattr(sparse, stat_func)()
+
+
+@pytest.mark.parametrize('func', ['sum', 'mean', 'min', 'max', 'count', 'median'])
+@pytest.mark.parametrize('dims', [('I',), (1,), (-1,)])
+def test_sparseNd_aggregate_same_as_paramdict(sparseNd, func, dims):
+    res = sparseNd.aggregate(*dims, func=func)
+    expected = ParamDictND(dict(sparseNd), key_names=['I', 'J']).aggregate(*dims, func=func)
+    assert type(res) is type(expected)
+    assert res == pytest.approx(expected)
+    assert list(res) == list(expected)
+    assert all(type(v) is type(expected[k]) for k, v in res.items())
+    assert (res.key_name if len(dims) == 1 else res.key_names) == (
+        expected.key_name if len(dims) == 1 else expected.key_names
+    )
+
+
+def test_sparseNd_aggregate_names():
+    indexset = IndexSetND(range(2), range(2), range(2))
+    sparse = SparseParamDictND(indexset, {(0, 0, 1): 4}, default=1, value_name='V')
+    res = sparse.aggregate(0, 2)
+    assert type(res) is ParamDictND
+    assert res == {(0, 0): 2, (0, 1): 5, (1, 0): 2, (1, 1): 2}
+    assert res.key_names is None
+    assert res.value_name == 'V'
+
+
+@pytest.mark.parametrize(
+    'dims, func, error',
+    [
+        ((0,), 'prod', ValueError),
+        ((), 'sum', ValueError),
+        ((0, 0), 'sum', ValueError),
+        ((0, 1), 'sum', ValueError),
+        (('K',), 'sum', ValueError),
+        ((2,), 'sum', ValueError),
+        ((0.0,), 'sum', TypeError),
+    ],
+)
+def test_sparseNd_aggregate_err(sparseNd, dims, func, error):
+    with pytest.raises(error):
+        sparseNd.aggregate(*dims, func=func)
+
+
+def test_sparseNd_aggregate_empty():
+    with pytest.raises(LookupError):
+        SparseParamDictND(IndexSetND()).aggregate(0)
+
+
+def test_sparse_lookup(sparse1d, sparseNd):
+    assert sparse1d.lookup(2) == 500
+    assert sparse1d.lookup(3) == 100
+    assert sparse1d.lookup(10) == 0
+    assert sparseNd.lookup('B', 0) == 7.5
+    assert sparseNd.lookup('D', 0) == 0
+    with pytest.raises(TypeError):
+        sparseNd.lookup(('B', 0))
+    with pytest.raises(ValueError):
+        sparseNd.lookup('B', 0, 0)
+    assert SparseParamDictND(IndexSetND()).lookup(1, 1) == 0
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_sparse_materialize(sparse1d, sparseNd, dtype):
+    prm1d = sparse1d.materialize(dtype=dtype)
+    assert type(prm1d) is ParamDict1D
+    assert prm1d == dict(sparse1d)
+    assert (prm1d.key_name, prm1d.value_name, prm1d.dtype) == ('K', 'V', dtype)
+    prm1d[10] = 1  # independent of the sparse one
+    assert 10 not in sparse1d
+
+    prmNd = sparseNd.materialize(dtype=dtype)
+    assert type(prmNd) is ParamDictND
+    assert prmNd == dict(sparseNd)
+    assert list(prmNd) == list(sparseNd)
+    assert (prmNd.key_names, prmNd.dtype) == (['I', 'J'], dtype)
+
+
+def test_sparse_repr(sparse1d, sparseNd):
+    assert repr(sparse1d) == 'SparseParamDict1D: K -> V\n<default 100 for 10 keys; 2 overrides>'
+    assert repr(sparseNd) == 'SparseParamDictND:\n<default 0 for 12 keys; 3 overrides>'
+
+
+@pytest.mark.parametrize(
+    'args, kwargs, error',
+    [
+        (([1],), {}, TypeError),
+        ((IndexSetND([(1, 1)]),), {}, TypeError),
+        ((IndexSet1D([1]), [(1, 2)]), {}, TypeError),
+        ((IndexSet1D([1]), {1: '2'}), {}, TypeError),
+        ((IndexSet1D([1]), {2: 2}), {}, ValueError),
+        ((IndexSet1D([1]),), {'default': None}, TypeError),
+        ((IndexSet1D([1]),), {'value_name': 1}, TypeError),
+    ],
+)
+def test_sparse1d_constructor_err(args, kwargs, error):
+    with pytest.raises(error):
+        SparseParamDict1D(*args, **kwargs)
+
+
+def test_sparseNd_constructor_typerr():
+    with pytest.raises(TypeError):
+        SparseParamDictND(IndexSet1D([1]))
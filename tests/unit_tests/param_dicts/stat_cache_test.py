@@ -0,0 +1,170 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Cache of statistics of ParamDict1D & ParamDictND."""
+
+import statistics
+
+import pytest
+
+from docplex_extensions import ParamDict1D, ParamDictND
+
+
+@pytest.fixture(params=[None, 'float64'])
+def paramdictNd(request):
+    paramdict = ParamDictND(
+        {
+            (i, j, t): float(i + 10 * j + 100 * t)
+            for i in range(3)
+            for j in range(2)
+            for t in range(2)
+        },
+        dtype=request.param,
+    )
+    paramdict.enable_stat_cache()
+    return paramdict
+
+
+def check_same_as_uncached(paramdict, calls):
+    uncached = ParamDictND(dict(paramdict))
+    for method, pattern, kwargs in calls:
+        assert getattr(paramdict, method)(*pattern, **kwargs) == getattr(uncached, method)(
+            *pattern, **kwargs
+        )
+
+
+CALLS = [
+    ('sum', (), {}),
+    ('sum', ('*', 1, 0), {}),
+    ('sum', (2, '*', '*'), {}),
+    ('sum', ('*', '*', 1), {}),
+    ('mean', ('*', 1, 0), {}),
+    ('mean', ('*', 1, 0), {'exact': True}),
+    ('median', (), {}),
+    ('median_low', (0, 0, '*'), {}),
+    ('median_high', ('*', 0, '*'), {}),
+]
+
+
+def test_stat_cache_disabled_by_default():
+    paramdict = ParamDictND({(0, 0): 1})
+    assert paramdict.stat_cache_info() is None
+    assert paramdict.sum() == 1
+    assert paramdict.stat_cache_info() is None
+
+
+def test_stat_cache_hits_misses(paramdictNd):
+    assert paramdictNd.stat_cache_info() == (0, 0, 0)
+    check_same_as_uncached(paramdictNd, CALLS)
+    assert paramdictNd.stat_cache_info() == (0, len(CALLS), len(CALLS))
+    check_same_as_uncached(paramdictNd, CALLS)
+    assert paramdictNd.stat_cache_info() == (len(CALLS), len(CALLS), len(CALLS))
+    info = paramdictNd.stat_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (len(CALLS), len(CALLS), len(CALLS))
+
+
+def test_stat_cache_exact_and_stat_are_separate(paramdictNd):
+    paramdictNd.mean('*', 1, 0)
+    paramdictNd.mean('*', 1, 0, exact=True)
+    paramdictNd.median('*', 1, 0)
+    paramdictNd.sum('*', 1, 0)
+    assert paramdictNd.stat_cache_info() == (0, 4, 4)
+
+
+@pytest.mark.parametrize(
+    'mutate, remaining',
+    [
+        # Cached patterns that match (0, 1, 0): (), ('*', 1, 0) - 5 results in total
+        (lambda p: p.__setitem__((0, 1, 0), 7.0), 4),
+        (lambda p: p.__delitem__((2, 0, 1)), 4),
+        (lambda p: p.pop((2, 0, 1)), 4),
+        (lambda p: p.pop((5, 5, 5), None), 9),
+        (lambda p: p.setdefault((5, 1, 0), 1.0), 4),
+        (lambda p: p.setdefault((0, 1, 0), 1.0), 9),  # no change
+        (lambda p: p.popitem(), 5),  # (2, 1, 1)
+        (lambda p: p.set_many([(1, 1, 1), (0, 0, 0)], [1.0, 2.0]), 4),
+        (lambda p: p.extend_from({(5, 1, 0): 1.0}), 4),
+        (lambda p: p.clear(), 0),
+    ],
+)
+def test_stat_cache_invalidation(paramdictNd, mutate, remaining):
+    check_same_as_uncached(paramdictNd, CALLS)
+    mutate(paramdictNd)
+    assert paramdictNd.stat_cache_info().currsize == remaining
+    if paramdictNd:
+        check_same_as_uncached(paramdictNd, CALLS)
+
+
+def test_stat_cache_empty_pattern_invalidated_by_new_key(paramdictNd):
+    assert paramdictNd.sum(9, '*', '*') == 0
+    paramdictNd[9, 0, 0] = 5.0
+    assert paramdictNd.sum(9, '*', '*') == 5
+    assert paramdictNd.stat_cache_info() == (0, 2, 1)
+
+
+@pytest.mark.parametrize(
+    'key, error, match',
+    [
+        (5, TypeError, 'non-tuple key'),
+        (('A',), ValueError, 'different length'),
+        (('A', 0, 0, 0), ValueError, 'different length'),
+    ],
+)
+@pytest.mark.parametrize('method', ['__setitem__', 'setdefault'])
+def test_stat_cache_invalid_key_same_error(paramdictNd, method, key, error, match):
+    # Same error as without the cache, which is left intact
+    paramdictNd.sum(0, '*', '*')
+    for paramdict in (paramdictNd, ParamDictND(dict(paramdictNd))):
+        with pytest.raises(error, match=match):
+            getattr(paramdict, method)(key, 3.0)
+    assert paramdictNd.stat_cache_info().currsize == 1
+    check_same_as_uncached(paramdictNd, CALLS)
+
+
+def test_stat_cache_errors_not_cached(paramdictNd):
+    with pytest.raises(TypeError):
+        paramdictNd.sum(['A'], '*', '*')
+    with pytest.raises(ValueError):
+        paramdictNd.sum(0, '*')
+    with pytest.raises(statistics.StatisticsError):
+        ParamDictND()._calc_stat(stat_func='sum')
+    assert paramdictNd.stat_cache_info().currsize == 0
+
+
+def test_stat_cache_enable_disable(paramdictNd):
+    paramdictNd.sum()
+    paramdictNd.enable_stat_cache()  # no-op
+    assert paramdictNd.stat_cache_info() == (0, 1, 1)
+    paramdictNd.disable_stat_cache()
+    assert paramdictNd.stat_cache_info() is None
+    paramdictNd[0, 0, 0] = 1.0  # no cache to invalidate
+    paramdictNd.enable_stat_cache()
+    assert paramdictNd.stat_cache_info() == (0, 0, 0)
+
+
+def test_stat_cache_not_carried_over(paramdictNd):
+    paramdictNd.sum()
+    assert paramdictNd.add(1).stat_cache_info() is None
+    assert paramdictNd.aggregate(0).stat_cache_info() is None
+
+
+def test_stat_cache_paramdict1d():
+    paramdict = ParamDict1D({'A': 1, 'B': 2, 'C': 4})
+    paramdict.enable_stat_cache()
+    assert paramdict.sum() == 7
+    assert paramdict.mean() == paramdict.mean()
+    assert paramdict.stat_cache_info() == (1, 2, 2)
+    paramdict['D'] = 1
+    assert paramdict.stat_cache_info().currsize == 0
+    assert paramdict.sum() == 8
+    assert paramdict.median() == 1.5
+
+
+def test_stat_cache_invalidate_many_all(paramdictNd):
+    paramdictNd.set_many([(0, 0, 0)], [1.0])  # nothing cached yet
+    paramdictNd.sum()
+    paramdictNd.set_many([(0, 0, 0), (1, 0, 0), (2, 0, 0)], [1.0, 2.0, 3.0])
+    assert paramdictNd.stat_cache_info().currsize == 0
+    assert paramdictNd._stat_cache.registry == {}
+    assert paramdictNd.sum() == sum(paramdictNd.values())
@@ -0,0 +1,75 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Casting of ParamDict1D & ParamDictND to pandas DataFrame."""
+
+import pandas as pd
+import pytest
+
+from docplex_extensions import ParamDict1D, ParamDictND
+
+VALUES_1D = {'A': 3, 'B': 0, 'C': -2}
+VALUES_ND = {('A', 1, 'x'): 2.5, ('A', 2, 'y'): 1.0, ('B', 1, 'x'): 0.0, ('C', 2, 'x'): -1.5}
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_paramdict1d_to_frame(dtype):
+    prm = ParamDict1D(VALUES_1D, key_name='K', value_name='V', dtype=dtype)
+    df = prm.to_frame()
+    assert list(df.columns) == ['K', 'V']
+    assert isinstance(df['K'].dtype, pd.CategoricalDtype)
+    assert df['K'].tolist() == list(VALUES_1D)
+    assert df['V'].tolist() == list(VALUES_1D.values())
+    assert df['V'].dtype == 'int64'
+    df = prm.to_frame(categorical=False)
+    assert df['K'].dtype == object
+    assert df['K'].tolist() == list(VALUES_1D)
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_paramdictNd_to_frame(dtype):
+    prm = ParamDictND(VALUES_ND, key_names=['X', 'Y', 'Z'], dtype=dtype)
+    df = prm.to_frame()
+    assert list(df.columns) == ['X', 'Y', 'Z', 'value']
+    for col in ['X', 'Y', 'Z']:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    assert df['X'].cat.categories.tolist() == ['A', 'B', 'C']
+    assert df['Y'].cat.categories.tolist() == [1, 2]
+    assert df['Z'].cat.categories.tolist() == ['x', 'y']
+    assert list(df.itertuples(index=False)) == [(*k, v) for k, v in VALUES_ND.items()]
+    assert df['value'].dtype == (dtype or 'float64')
+    df = prm.to_frame(categorical=False)
+    assert df['Y'].dtype == 'int64'
+    assert list(df.itertuples(index=False)) == [(*k, v) for k, v in VALUES_ND.items()]
+
+
+def test_paramdict_to_frame_default_names():
+    assert list(ParamDict1D(VALUES_1D).to_frame().columns) == ['key', 'value']
+    assert list(ParamDictND(VALUES_ND).to_frame().columns) == ['key_0', 'key_1', 'key_2', 'value']
+
+
+def test_paramdict_to_frame_mixed_types():
+    # Dimensions with values of mixed types are kept as plain values
+    prm = ParamDictND({('A', 1): 1, ('B', 1.5): 2, ('C', True): 3})
+    df = prm.to_frame()
+    assert isinstance(df['key_0'].dtype, pd.CategoricalDtype)
+    assert df['key_1'].dtype == object
+    assert df['key_1'].tolist() == [1, 1.5, True]
+
+
+@pytest.mark.parametrize('categorical', [True, False])
+def test_paramdict_to_frame_empty(categorical):
+    df = ParamDict1D(key_name='K').to_frame(categorical=categorical)
+    assert list(df.columns) == ['K', 'value']
+    assert df.empty
+    df = ParamDictND(key_names=['X', 'Y']).to_frame(categorical=categorical)
+    assert list(df.columns) == ['X', 'Y', 'value']
+    assert df.empty
+    assert list(ParamDictND().to_frame(categorical=categorical).columns) == ['value']
+
+
+def test_paramdict_to_frame_err():
+    prm = ParamDictND(VALUES_ND, key_names=['X', 'Y', 'Z'], value_name='X')
+    with pytest.raises(ValueError, match='column names should be unique'):
+        prm.to_frame()
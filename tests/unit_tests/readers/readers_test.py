@@ -0,0 +1,236 @@
+# Copyright 2024 Samarth Mistry
+# This file is part of the `docplex-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Chunked readers of CSV/Parquet files into IndexSet and ParamDict."""
+
+from importlib.util import find_spec
+
+import pandas as pd
+import pytest
+
+import docplex_extensions as dex
+
+CSV = """ORI,DES,DIST,COST
+Delhi,Tokyo,5836,1.5
+Delhi,Seattle,11303,2
+Tokyo,Delhi,5830,1.25
+Seattle,Tokyo,7695,3
+Tokyo,Seattle,7700,0.5
+"""
+
+EXPECTED_DIST = {
+    ('Delhi', 'Tokyo'): 5836,
+    ('Delhi', 'Seattle'): 11303,
+    ('Tokyo', 'Delhi'): 5830,
+    ('Seattle', 'Tokyo'): 7695,
+    ('Tokyo', 'Seattle'): 7700,
+}
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'routes.csv'
+    path.write_text(CSV)
+    return path
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 5, 100])
+@pytest.mark.parametrize('engine', ['csv', 'pandas'])
+def test_read_paramdictNd(csv_path, chunksize, engine):
+    res = dex.read_paramdict(csv_path, ['ORI', 'DES'], 'DIST', chunksize=chunksize, engine=engine)
+    assert type(res) is dex.ParamDictND
+    assert res == EXPECTED_DIST
+    assert list(res) == list(EXPECTED_DIST)
+    assert list(res._indexset) == list(EXPECTED_DIST)
+    assert res.key_names == ['ORI', 'DES']
+    assert res.value_name == 'DIST'
+    assert res.dtype is None
+
+
+@pytest.mark.parametrize('engine', ['csv', 'pandas'])
+def test_read_paramdict1d(csv_path, engine):
+    res = dex.read_paramdict(
+        str(csv_path), 'DIST', 'COST', chunksize=2, engine=engine, converters={'DIST': int}
+    )
+    assert type(res) is dex.ParamDict1D
+    assert res == {5836: 1.5, 11303: 2, 5830: 1.25, 7695: 3, 7700: 0.5}
+    assert (res.key_name, res.value_name) == ('DIST', 'COST')
+
+
+def test_read_paramdict_parse_values(csv_path):
+    res = dex.read_paramdict(csv_path, ['ORI', 'DES'], 'COST')
+    assert [type(v) for v in res.values()] == [float, int, float, int, float]
+    res = dex.read_paramdict(csv_path, ['ORI', 'DES'], 'COST', converters={'COST': float})
+    assert all(type(v) is float for v in res.values())
+
+
+def test_read_paramdict_dtype(csv_path):
+    res = dex.read_paramdict(csv_path, ['ORI', 'DES'], 'DIST', chunksize=2, dtype='int64')
+    assert res.dtype == 'int64'
+    assert res.values_array().tolist() == list(EXPECTED_DIST.values())
+    with pytest.raises(TypeError):
+        dex.read_paramdict(csv_path, ['ORI', 'DES'], 'COST', dtype='int64')
+
+
+def test_read_paramdict_shared_key_elements(csv_path):
+    res = dex.read_paramdict(csv_path, ['ORI', 'DES'], 'DIST', chunksize=1)
+    keys = list(res)
+    assert keys[0][0] is keys[1][0]  # 'Delhi'
+    assert keys[0][1] is keys[3][1]  # 'Tokyo', across chunks
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 100])
+@pytest.mark.parametrize('engine', ['csv', 'pandas'])
+def test_read_paramdict_duplicate_valerr(tmp_path, chunksize, engine):
+    path = tmp_path / 'dup.csv'
+    path.write_text('K1,K2,V\nA,X,1\nB,X,2\nA,Y,3\nB,X,4\n')
+    with pytest.raises(ValueError, match=r"duplicate key \('B', 'X'\) found at data row 4"):
+        dex.read_paramdict(path, ['K1', 'K2'], 'V', chunksize=chunksize, engine=engine)
+    with pytest.raises(ValueError, match="duplicate key 'X' found at data row 2"):
+        dex.read_paramdict(path, 'K2', 'V', chunksize=chunksize, engine=engine)
+    with pytest.raises(ValueError, match="duplicate key 'A' found at data row 3"):
+        dex.read_paramdict(path, 'K1', 'V', chunksize=chunksize, engine=engine)
+
+
+def test_read_paramdict_header_only(tmp_path):
+    path = tmp_path / 'empty.csv'
+    path.write_text('K1,K2,V\n')
+    res = dex.read_paramdict(path, ['K1', 'K2'], 'V')
+    assert res == {}
+    assert res.key_names == ['K1', 'K2']
+
+
+@pytest.mark.parametrize(
+    'text, error',
+    [
+        ('', ValueError),  # no header
+        ('K1,V\nA,1\n', ValueError),  # missing column
+        ('K1,K2,V\nA,X,1\nB,Y\n', ValueError),  # missing field
+        ('K1,K2,V\nA,X,one\n', ValueError),  # not a number
+    ],
+)
+def test_read_paramdict_csv_valerr(tmp_path, text, error):
+    path = tmp_path / 'bad.csv'
+    path.write_text(text)
+    with pytest.raises(error):
+        dex.read_paramdict(path, ['K1', 'K2'], 'V')
+
+
+def test_read_paramdict_value_typerr(tmp_path):
+    path = tmp_path / 'bad.csv'
+    path.write_text('K,V\nA,1\n')
+    with pytest.raises(TypeError):
+        dex.read_paramdict(path, 'K', 'V', converters={'V': str})
+
+
+def test_read_paramdict_delimiter_encoding(tmp_path):
+    path = tmp_path / 'semicolon.csv'
+    path.write_bytes('K;V\nCafé;1\n'.encode('latin-1'))
+    res = dex.read_paramdict(path, 'K', 'V', delimiter=';', encoding='latin-1')
+    assert res == {'Café': 1}
+
+
+@pytest.mark.parametrize('chunksize', [1, 3])
+def test_read_paramdict_dataframe_chunks(csv_path, chunksize):
+    chunks = pd.read_csv(csv_path, chunksize=chunksize, index_col='ORI')
+    res = dex.read_paramdict(chunks, ['ORI', 'DES'], 'DIST')
+    assert res == EXPECTED_DIST
+    assert all(type(v) is int for v in res.values())
+
+    chunks = [pd.DataFrame({'K': ['A', 'B'], 'V': [1, 2]})]
+    res = dex.read_paramdict(chunks, 'K', 'V', converters={'V': float})
+    assert res == {'A': 1.0, 'B': 2.0}
+    assert all(type(v) is float for v in res.values())
+
+
+def test_read_paramdict_dataframe_chunks_err():
+    with pytest.raises(ValueError):
+        dex.read_paramdict([pd.DataFrame({'K': ['A'], 'W': [1]})], 'K', 'V')
+    with pytest.raises(ValueError):
+        dex.read_paramdict([pd.DataFrame({'K': ['A'], 'V': [1]})], 'K', 'V', engine='csv')
+    with pytest.raises(TypeError):
+        dex.read_paramdict(1, 'K', 'V')
+
+
+@pytest.mark.parametrize(
+    'key_columns, value_column, kwargs, error',
+    [
+        (1, 'V', {}, TypeError),
+        (['K', 1], 'V', {}, TypeError),
+        ([], 'V', {}, ValueError),
+        (['K', 'K'], 'V', {}, ValueError),
+        ('K', 1, {}, TypeError),
+        (['K', 'V'], 'V', {}, ValueError),
+        ('K', 'V', {'chunksize': 0}, ValueError),
+        ('K', 'V', {'chunksize': 1.0}, TypeError),
+        ('K', 'V', {'chunksize': True}, TypeError),
+        ('K', 'V', {'converters': [int]}, TypeError),
+        ('K', 'V', {'converters': {'K': 1}}, TypeError),
+        ('K', 'V', {'engine': 'excel'}, ValueError),
+    ],
+)
+def test_read_paramdict_arg_err(csv_path, key_columns, value_column, kwargs, error):
+    with pytest.raises(error):
+        dex.read_paramdict(csv_path, key_columns, value_column, **kwargs)
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 100])
+@pytest.mark.parametrize('engine', ['csv', 'pandas'])
+def test_read_indexset(csv_path, chunksize, engine):
+    res = dex.read_indexset(csv_path, ['ORI', 'DES'], chunksize=chunksize, engine=engine)
+    assert type(res) is dex.IndexSetND
+    assert list(res) == list(EXPECTED_DIST)
+    assert res.names == ['ORI', 'DES']
+
+    res = dex.read_indexset(csv_path, ['DIST'], chunksize=chunksize, engine=engine)
+    assert type(res) is dex.IndexSetND
+    assert len(res) == 5
+
+    res = dex.read_indexset(
+        csv_path, 'DIST', chunksize=chunksize, engine=engine, converters={'DIST': int}
+    )
+    assert type(res) is dex.IndexSet1D
+    assert list(res) == [5836, 11303, 5830, 7695, 7700]
+    assert res.name == 'DIST'
+
+
+@pytest.mark.parametrize('chunksize', [1, 100])
+def test_read_indexset_duplicate_valerr(csv_path, chunksize):
+    with pytest.raises(ValueError, match="duplicate key 'Delhi' found at data row 2"):
+        dex.read_indexset(csv_path, 'ORI', chunksize=chunksize)
+
+
+def test_read_indexset_arg_err(csv_path):
+    with pytest.raises(TypeError):
+        dex.read_indexset(csv_path, None)
+    with pytest.raises(ValueError):
+        dex.read_indexset(csv_path, ['ORI', 'XYZ'])
+
+
+@pytest.mark.skipif(find_spec('pyarrow') is not None, reason='pyarrow is installed')
+@pytest.mark.parametrize(
+    'name, engine', [('data.parquet', None), ('data.PQ', None), ('x', 'parquet')]
+)
+def test_read_parquet_importerr(tmp_path, name, engine):
+    with pytest.raises(ImportError, match='pyarrow'):
+        dex.read_paramdict(tmp_path / name, 'K', 'V', engine=engine)
+    with pytest.raises(ImportError, match='pyarrow'):
+        dex.read_indexset(tmp_path / name, 'K', engine=engine)
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 100])
+def test_read_parquet(tmp_path, csv_path, chunksize):
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'routes.parquet'
+    pd.read_csv(csv_path).to_parquet(path, row_group_size=2)
+
+    res = dex.read_paramdict(path, ['ORI', 'DES'], 'DIST', chunksize=chunksize)
+    assert res == EXPECTED_DIST
+    assert res.key_names == ['ORI', 'DES']
+
+    res = dex.read_indexset(path, 'DIST', chunksize=chunksize)
+    assert list(res) == [5836, 11303, 5830, 7695, 7700]
+
+    with pytest.raises(ValueError, match="duplicate key 'Tokyo'"):
+        dex.read_paramdict(path, 'ORI', 'DIST', chunksize=chunksize)
@@ -4,9 +4,21 @@
 
 """Custom methods of VarDict1D & VarDictND."""
 
+import numpy as np
 import pytest
+from docplex.mp.constants import EffortLevel
+from docplex.mp.linear import LinearExpr, ZeroExpr
+from docplex.mp.model import Model
 
-from docplex_extensions import IndexSet1D, IndexSetND, add_variables
+from docplex_extensions import (
+    ComputedParamDictND,
+    IndexSet1D,
+    IndexSetND,
+    ParamDict1D,
+    ParamDictND,
+    SparseParamDictND,
+    add_variables,
+)
 
 
 @pytest.mark.parametrize(
@@ -104,3 +116,415 @@ def test_vardictNd_sum_partial_valerr(mdl_1, indexset, pattern):
     v = add_variables(mdl_1, indexset, 'C', name='VAL')
     with pytest.raises(ValueError):
         v.sum(*pattern)
+
+
+def expr_coefs(expr):
+    return {var.index: coef for var, coef in expr.iter_terms()}
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_vardict1d_dot_pass(mdl_1, dtype):
+    v = add_variables(mdl_1, IndexSet1D(['A', 'B', 'C', 'D']), 'C', name='VAL')
+    prm = ParamDict1D({'D': 4, 'B': 0, 'A': 1.5, 'Z': 9}, dtype=dtype)
+    expr = v.dot(prm)
+    assert isinstance(expr, LinearExpr)
+    assert expr_coefs(expr) == {v['A'].index: 1.5, v['D'].index: 4}
+    assert [var for var, _ in expr.iter_terms()] == [v['A'], v['D']]  # order of VarDict keys
+
+
+def test_vardict_dot_indexset_modified(mdl_1):
+    # Coefficients aligned with the keys of the VarDict, even if the index-set is modified
+    indexset = IndexSet1D(['A', 'B'])
+    v = add_variables(mdl_1, indexset, 'C', name='VAL')
+    indexset.remove('A')
+    indexset.extend(['A', 'C'])
+    expr = v.dot(ParamDict1D({'A': 1, 'B': 2, 'C': 3}))
+    assert expr_coefs(expr) == {v['A'].index: 1, v['B'].index: 2}
+
+
+@pytest.mark.parametrize('dtype', [None, 'int64'])
+def test_vardictNd_dot_pass(mdl_1, setNd_cmb3, dtype):
+    v = add_variables(mdl_1, setNd_cmb3, 'C', name='VAL')
+    values = {key: sum(key) for key in setNd_cmb3}
+    prm = ParamDictND(values, dtype=dtype)
+    expected = mdl_1.sum(values[key] * v[key] for key in setNd_cmb3)
+    assert expr_coefs(v.dot(prm)) == expr_coefs(expected)
+    prm = ParamDictND({key: values[key] for key in reversed(setNd_cmb3)}, dtype=dtype)
+    assert expr_coefs(v.dot(prm)) == expr_coefs(expected)
+
+
+@pytest.mark.parametrize('pattern', [(0, '*', '*'), ('*', 1, 0), (5, '*', '*')])
+def test_vardictNd_dot_partial_pass(mdl_1, setNd_cmb3, pattern):
+    v = add_variables(mdl_1, setNd_cmb3, 'C', name='VAL')
+    prm = ParamDictND({key: key[0] + 2 * key[2] + 1 for key in setNd_cmb3})
+    keys = setNd_cmb3.subset(*pattern)
+    expected = mdl_1.sum(prm[key] * v[key] for key in keys)
+    assert expr_coefs(v.dot(prm, *pattern)) == expr_coefs(expected)
+
+
+def test_vardict_dot_zero(mdl_1, setNd_cmb2):
+    v = add_variables(mdl_1, IndexSet1D(['A', 'B']), 'C', name='VAL')
+    assert isinstance(v.dot(ParamDict1D({'A': 0, 'Z': 1})), ZeroExpr)
+    assert isinstance(v.dot(ParamDict1D()), ZeroExpr)
+    v = add_variables(mdl_1, setNd_cmb2, 'C', name='VAL')
+    assert isinstance(v.dot(ParamDictND()), ZeroExpr)
+
+
+def test_vardict_dot_err(mdl_1, setNd_cmb2):
+    v = add_variables(mdl_1, IndexSet1D(['A', 'B']), 'C', name='VAL')
+    with pytest.raises(TypeError, match='`paramdict` should be a ParamDict1D'):
+        v.dot({'A': 1})
+    with pytest.raises(TypeError, match='`paramdict` should be a ParamDict1D'):
+        v.dot(ParamDictND({('A', 1): 1}))
+    v = add_variables(mdl_1, setNd_cmb2, 'C', name='VAL')
+    with pytest.raises(TypeError, match='`paramdict` should be a ParamDictND'):
+        v.dot(ParamDict1D({0: 1}))
+    with pytest.raises(ValueError, match='should be tuples of the same length'):
+        v.dot(ParamDictND({(0, 0, 0): 1}))
+    with pytest.raises(ValueError):
+        v.dot(ParamDictND({(0, 0): 1}), '*', '*')
+
+
+@pytest.mark.parametrize('dims', [(0,), ('J',), (-1,), (0, 2), ('K', 'I')])
+def test_vardictNd_sum_by_pass(mdl_1, dims):
+    indexset = IndexSetND([(i, j, k) for i in 'AB' for j in range(3) for k in 'XY'])
+    indexset.names = ['I', 'J', 'K']
+    v = add_variables(mdl_1, indexset, 'C', name='VAL')
+    indices = [v._dim_index(dim) for dim in dims]
+    res = v.sum_by(*dims)
+    expected = {}
+    for key in indexset:
+        group = key[indices[0]] if len(indices) == 1 else tuple(key[i] for i in indices)
+        expected.setdefault(group, []).append(key)
+    assert list(res) == list(expected)
+    for group, keys in expected.items():
+        pattern = ['*'] * 3
+        for i in indices:
+            pattern[i] = keys[0][i]
+        assert expr_coefs(res[group]) == expr_coefs(v.sum(*pattern))
+
+
+@pytest.mark.parametrize('dtype', [None, 'float64'])
+def test_vardictNd_sum_by_coef_pass(mdl_1, setNd_cmb3, dtype):
+    v = add_variables(mdl_1, setNd_cmb3, 'C', name='VAL')
+    coef = ParamDictND({key: key[0] + key[2] for key in reversed(setNd_cmb3)}, dtype=dtype)
+    res = v.sum_by(1, coef=coef)
+    assert list(res) == [0, 1]
+    for group, expr in res.items():
+        assert expr_coefs(expr) == expr_coefs(v.dot(coef, '*', group, '*'))
+    res = v.sum_by(0, 2, coef=ParamDictND({(0, 0, 0): 5, (1, 1, 1): 0}))
+    assert list(res) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert expr_coefs(res[(0, 0)]) == {v[(0, 0, 0)].index: 5}
+    assert all(isinstance(res[group], ZeroExpr) for group in [(0, 1), (1, 0), (1, 1)])
+
+
+def test_vardictNd_sum_by_indexset_modified(mdl_1, setNd_cmb2):
+    # Groups of the keys of the VarDict, even if the index-set is modified
+    v = add_variables(mdl_1, setNd_cmb2, 'C', name='VAL')
+    setNd_cmb2.insert(0, (2, 0))
+    res = v.sum_by(0)
+    assert list(res) == [0, 1]
+    assert expr_coefs(res[1]) == {v[(1, 0)].index: 1, v[(1, 1)].index: 1}
+    res = v.sum_by(0, coef=ParamDictND({(1, 1): 3, (2, 0): 1}))
+    assert expr_coefs(res[1]) == {v[(1, 1)].index: 3}
+
+
+@pytest.mark.parametrize(
+    'dims, coef, exc, match',
+    [
+        ((), None, ValueError, 'dimensions to group by are required'),
+        ((0, 0), None, ValueError, 'should not be repeated'),
+        ((0, 1, 2), None, ValueError, '`sum_by` does not work with all dimensions'),
+        ((3,), None, ValueError, '`dim` 3 is out of range'),
+        (('X',), None, ValueError, "'X' not found in `key_names`"),
+        ((1.0,), None, TypeError, '`dim` should be either int or str'),
+        ((0,), {(0, 0, 0): 1}, TypeError, '`coef` should be a ParamDictND'),
+        ((0,), ParamDictND({(0, 0): 1}), ValueError, 'keys of `coef` and VarDictND'),
+    ],
+)
+def test_vardictNd_sum_by_err(mdl_1, setNd_cmb3, dims, coef, exc, match):
+    v = add_variables(mdl_1, setNd_cmb3, 'C', name='VAL')
+    with pytest.raises(exc, match=match):
+        v.sum_by(*dims, coef=coef)
+
+
+@pytest.fixture
+def solved_lp():
+    # Ship 10 units from A to C, through B at a lower cost up to the capacity of 6
+    mdl = Model()
+    arcs = IndexSetND([('A', 'B'), ('B', 'C'), ('A', 'C'), ('C', 'A')], names=['ori', 'des'])
+    flow = add_variables(mdl, arcs, 'C', ub=6, name='flow')
+    nodes = IndexSet1D(['A', 'B', 'C'], name='node')
+    slack = add_variables(mdl, nodes, 'C', name='slack')
+    cost = ParamDictND({('A', 'B'): 1, ('B', 'C'): 1, ('A', 'C'): 5, ('C', 'A'): 1})
+    mdl.minimize(flow.dot(cost) + 100 * slack.sum())
+    for node, supply in [('A', 10), ('B', 0), ('C', -10)]:
+        mdl.add_constraint(flow.sum(node, '*') - flow.sum('*', node) + slack[node] >= supply)
+    assert mdl.solve()
+    yield flow, slack
+    mdl.end()
+
+
+def test_vardict_solution_values(solved_lp):
+    flow, slack = solved_lp
+    res = flow.solution_values()
+    assert type(res) is ParamDictND
+    assert res == {('A', 'B'): 6, ('B', 'C'): 6, ('A', 'C'): 4, ('C', 'A'): 0}
+    assert all(type(value) is float for value in res.values())
+    assert (res.key_names, res.value_name, res.dtype) == (['ori', 'des'], 'flow', None)
+    res = slack.solution_values()
+    assert type(res) is ParamDict1D
+    assert res == {'A': 0, 'B': 0, 'C': 0}
+    assert (res.key_name, res.value_name) == ('node', 'slack')
+
+    res = flow.solution_values(drop_zeros=True)
+    assert list(res) == [('A', 'B'), ('B', 'C'), ('A', 'C')]
+    assert res.subset_keys('*', 'C') == [('B', 'C'), ('A', 'C')]
+    assert slack.solution_values(drop_zeros=True) == {}
+
+    res['Z', 'Z'] = 1  # independent of the VarDict keys
+    assert list(flow) == [('A', 'B'), ('B', 'C'), ('A', 'C'), ('C', 'A')]
+
+
+def test_vardict_solution_values_indexset_modified(solved_lp):
+    # Keys of the VarDict, even if the index-set it was created with is modified later
+    flow, slack = solved_lp
+    flow._indexset.append(('D', 'A'))
+    slack._indexset.insert(0, 'D')
+    assert flow.solution_values() == {('A', 'B'): 6, ('B', 'C'): 6, ('A', 'C'): 4, ('C', 'A'): 0}
+    assert list(slack.solution_values()) == ['A', 'B', 'C']
+    assert list(slack.reduced_costs()) == ['A', 'B', 'C']
+    assert flow.to_frame()['flow'].tolist() == [6.0, 6.0, 4.0, 0.0]
+    assert slack.to_frame()['node'].tolist() == ['A', 'B', 'C']
+
+
+def test_vardict_solution_values_array(solved_lp):
+    flow, _ = solved_lp
+    res = flow.solution_values(dtype='float64', drop_zeros=True)
+    assert res.dtype == 'float64'
+    arr = res.values_array()
+    assert arr.dtype == 'float64'
+    assert arr.tolist() == [6, 6, 4]
+    assert arr.base is res._array
+
+
+def test_vardict_reduced_costs(solved_lp):
+    flow, slack = solved_lp
+    res = flow.reduced_costs()
+    assert type(res) is ParamDictND
+    assert res == dict(zip(flow, flow.model.reduced_costs(list(flow.values())), strict=True))
+    assert res[('C', 'A')] > 0
+    assert list(flow.reduced_costs(drop_zeros=True)) == [
+        key for key, value in res.items() if value != 0
+    ]
+    res = slack.reduced_costs(dtype='float64')
+    assert type(res) is ParamDict1D
+    assert res.values_array().tolist() == list(res.values())
+
+
+def test_vardict_solution_values_err(mdl_1):
+    v = add_variables(mdl_1, IndexSet1D(['A', 'B']), 'C')
+    with pytest.raises(ValueError, match='has no solution'):
+        v.solution_values()
+
+
+def test_vardict_to_frame(solved_lp):
+    flow, slack = solved_lp
+    df = flow.to_frame()
+    assert list(df.columns) == ['ori', 'des', 'flow']
+    assert df['ori'].dtype == 'category'
+    assert list(df.itertuples(index=False)) == [
+        ('A', 'B', 6.0),
+        ('B', 'C', 6.0),
+        ('A', 'C', 4.0),
+        ('C', 'A', 0.0),
+    ]
+    df = flow.to_frame(drop_zeros=True, categorical=False)
+    assert df['ori'].dtype == object
+    assert df['flow'].tolist() == [6.0, 6.0, 4.0]
+    df = slack.to_frame()
+    assert list(df.columns) == ['node', 'slack']
+    assert df['node'].cat.categories.tolist() == ['A', 'B', 'C']
+    assert slack.to_frame(drop_zeros=True).empty
+
+
+@pytest.fixture
+def mip():
+    mdl = Model()
+    sites = IndexSet1D(['S1', 'S2', 'S3'], name='site')
+    links = IndexSetND([('S1', 'S2'), ('S2', 'S3'), ('S1', 'S3')], names=['ori', 'des'])
+    open_site = add_variables(mdl, sites, 'B', name='open')
+    use_link = add_variables(mdl, links, 'I', ub=5, name='use')
+    yield mdl, open_site, use_link
+    mdl.end()
+
+
+def start_values(start):
+    return {var.name: value for var, value in start.iter_var_values()}
+
+
+def test_vardict_set_start_paramdict(mip):
+    mdl, open_site, use_link = mip
+    # Keys not found in the VarDict are skipped, and variables of missing keys are left out
+    start = open_site.set_start(ParamDict1D({'S3': 0, 'S9': 1, 'S1': 1}), effort=EffortLevel.Repair)
+    assert start_values(start) == {'open_S3': 0, 'open_S1': 1}
+    assert [(mip_start, effort) for mip_start, effort in mdl.iter_mip_starts()] == [
+        (start, EffortLevel.Repair)
+    ]
+    start = use_link.set_start(
+        ParamDictND({('S1', 'S2'): 2, ('S2', 'S3'): 3, ('S1', 'S3'): 0}), effort=2
+    )
+    assert start_values(start) == {'use_S1_S2': 2, 'use_S2_S3': 3, 'use_S1_S3': 0}
+    assert mdl.number_of_mip_starts == 2
+
+
+def test_vardict_set_start_indexset_modified(mip):
+    # Start values for the keys of the VarDict, even if the index-set is modified
+    _, open_site, _ = mip
+    open_site._indexset.append('S4')
+    start = open_site.set_start(ParamDict1D({'S1': 1, 'S4': 1}))
+    assert start_values(start) == {'open_S1': 1}
+    start = open_site.set_start(ParamDict1D({'S1': 1, 'S2': 0, 'S3': 1, 'S4': 1}))
+    assert start_values(start) == {'open_S1': 1, 'open_S2': 0, 'open_S3': 1}
+
+
+@pytest.mark.parametrize('values', [[1, 0, 1], (1.0, 0.0, 1.0), np.array([1, 0, 1])])
+def test_vardict_set_start_sequence(mip, values):
+    mdl, open_site, _ = mip
+    start = open_site.set_start(values)
+    assert start_values(start) == {'open_S1': 1, 'open_S2': 0, 'open_S3': 1}
+    assert all(type(value) in (int, float) for value in start_values(start).values())
+
+
+def test_vardict_set_start_combined(mip):
+    mdl, open_site, use_link = mip
+    start = open_site.set_start([1, 1, 0])
+    res = use_link.set_start(ParamDictND({('S1', 'S2'): 4}), start=start)
+    assert res is start
+    assert start_values(start) == {'open_S1': 1, 'open_S2': 1, 'open_S3': 0, 'use_S1_S2': 4}
+    assert mdl.number_of_mip_starts == 1
+
+    # Solve with the MIP start
+    mdl.maximize(use_link.sum() - open_site.sum())
+    _ = mdl.add_constraints(use_link[ori, des] <= 5 * open_site[des] for ori, des in use_link)
+    assert mdl.solve()
+    assert mdl.solve_details.status_code in (101, 102)
+
+
+@pytest.mark.parametrize(
+    'which, values, kwargs, exc, match',
+    [
+        ('site', ParamDictND({('S1', 'S2'): 1}), {}, TypeError, '`values` should be a ParamDict1D'),
+        ('link', ParamDict1D({'S1': 1}), {}, TypeError, '`values` should be a ParamDictND'),
+        ('link', ParamDictND({('S1', 'S2', 0): 1}), {}, ValueError, 'tuples of the same length'),
+        ('site', '101', {}, TypeError, 'should be either a ParamDict, sequence, or NumPy array'),
+        ('site', {'S1': 1}, {}, TypeError, 'should be either a ParamDict, sequence, or NumPy'),
+        ('site', [1, 0], {}, ValueError, 'should have one value for each variable'),
+        ('site', ParamDict1D({'S9': 1}), {}, ValueError, 'at least one variable'),
+        ('site', [1, 0, 1], {'start': 'start', 'effort': 2}, ValueError, '`effort` cannot be'),
+        ('site', [1, 0, 1], {'start': 'other'}, ValueError, 'should be a MIP start of the model'),
+    ],
+)
+def test_vardict_set_start_err(mip, which, values, kwargs, exc, match):
+    mdl, open_site, use_link = mip
+    starts = {'start': open_site.set_start([0, 0, 0])}
+    with Model() as other:
+        other_vars = add_variables(other, IndexSet1D(['A']), 'B')
+        starts['other'] = other_vars.set_start([1])
+        if 'start' in kwargs:
+            kwargs['start'] = starts[kwargs['start']]
+        vardict = open_site if which == 'site' else use_link
+        with pytest.raises(exc, match=match):
+            vardict.set_start(values, **kwargs)
+
+
+def test_vardict_set_start_lp_err():
+    with Model() as mdl:
+        v = add_variables(mdl, IndexSet1D(['A', 'B']), 'C')
+        with pytest.raises(ValueError, match='only available for models with discrete variables'):
+            v.set_start([1, 2])
+
+
+def bounds(vardict):
+    return [(var.lb, var.ub) for var in vardict.values()]
+
+
+def test_vardict_update_bounds_resolve(solved_lp):
+    flow, slack = solved_lp
+    mdl = flow.model
+    assert mdl.objective_value == 6 * 2 + 4 * 5
+    # Raise the capacity of the cheaper path, and re-solve without rebuilding the model
+    assert flow.update_bounds(ub=ParamDictND({('A', 'B'): 10, ('B', 'C'): 10, ('Z', 'Z'): 1})) == 2
+    assert flow.update_bounds(ub=ParamDictND({('A', 'B'): 10, ('A', 'C'): 6})) == 0
+    assert mdl.solve()
+    assert mdl.objective_value == 10 * 2
+    assert dict(flow.solution_values()) == {
+        ('A', 'B'): 10.0,
+        ('B', 'C'): 10.0,
+        ('A', 'C'): 0.0,
+        ('C', 'A'): 0.0,
+    }
+    # Force flow through the expensive arc
+    assert flow.update_bounds(lb=[0, 0, 3, 0]) == 1
+    assert mdl.solve()
+    assert mdl.objective_value == 7 * 2 + 3 * 5
+
+
+@pytest.mark.parametrize(
+    'lb, ub, expected, changed',
+    [
+        (None, None, [(0, 10), (0, 10), (0, 10)], 0),
+        (0, 10, [(0, 10), (0, 10), (0, 10)], 0),
+        (2, 10, [(2, 10), (2, 10), (2, 10)], 3),
+        (ParamDict1D({'B': 1, 'C': 0, 'D': 5}), None, [(0, 10), (1, 10), (0, 10)], 1),
+        (None, [10, None, 20], [(0, 10), (0, 10), (0, 20)], 1),
+        (np.array([1, 0, 1]), np.array([5.0, 10.0, 10.0]), [(1, 5), (0, 10), (1, 10)], 3),
+        (lambda key: 1 if key == 'A' else 0, float('inf'), [(1, 1e20), (0, 1e20), (0, 1e20)], 4),
+    ],
+)
+def test_vardict_update_bounds(mdl_1, lb, ub, expected, changed):
+    v = add_variables(mdl_1, IndexSet1D(['A', 'B', 'C']), 'I', ub=10)
+    assert v.update_bounds(lb=lb, ub=ub) == changed
+    assert bounds(v) == expected
+    assert all(type(value) is float for bound in bounds(v) for value in bound if value)
+
+
+def test_vardictNd_update_bounds(mdl_1):
+    keys = IndexSetND([('A', 1), ('B', 2)])
+    v = add_variables(mdl_1, keys, 'C')
+    assert v.update_bounds(lb=SparseParamDictND(keys, {('B', 2): 0}, default=1)) == 1
+    assert v.update_bounds(ub=ComputedParamDictND(lambda a, b: b, IndexSetND([('B', 2)]))) == 1
+    assert bounds(v) == [(1, 1e20), (0, 2)]
+    assert v.update_bounds(lb=ParamDictND(), ub=ParamDictND({('C', 3): 1})) == 0
+
+
+def test_vardict_update_bounds_indexset_modified(mdl_1, setNd_cmb2):
+    # Bounds aligned with the keys of the VarDict, even if the index-set is modified
+    indexset = IndexSet1D(['A', 'B', 'C'])
+    v = add_variables(mdl_1, indexset, 'C', ub=10)
+    indexset.remove('A')
+    indexset.append('D')
+    assert v.update_bounds(lb=ParamDict1D({'A': 1, 'D': 2}), ub=lambda key: ord(key)) == 4
+    assert bounds(v) == [(1, 65), (0, 66), (0, 67)]
+    v = add_variables(mdl_1, setNd_cmb2, 'C')
+    setNd_cmb2.insert(0, (2, 2))
+    assert v.update_bounds(ub=ParamDictND({(0, 1): 5, (2, 2): 1})) == 1
+    assert bounds(v) == [(0, 1e20), (0, 5), (0, 1e20), (0, 1e20)]
+
+
+@pytest.mark.parametrize(
+    'which, kwargs, exc, match',
+    [
+        ('1d', {'lb': ParamDictND({('A', 1): 1})}, TypeError, '`lb` should be ParamDict1D'),
+        ('nd', {'ub': ParamDict1D({'A': 1})}, TypeError, '`ub` should be ParamDictND'),
+        ('nd', {'ub': ParamDictND({('A', 1, 0): 1})}, ValueError, 'different lengths'),
+        ('1d', {'lb': '101'}, TypeError, '`lb` should be either a number, sequence, function'),
+        ('1d', {'ub': {'A': 1}}, TypeError, '`ub` should be either a number, sequence, function'),
+        ('1d', {'ub': [1, 2]}, ValueError, '`ub` should have one value for each variable'),
+    ],
+)
+def test_vardict_update_bounds_err(mdl_1, which, kwargs, exc, match):
+    v1 = add_variables(mdl_1, IndexSet1D(['A', 'B', 'C']), 'C')
+    vn = add_variables(mdl_1, IndexSetND([('A', 1), ('B', 2)]), 'C')
+    with pytest.raises(exc, match=match):
+        (v1 if which == '1d' else vn).update_bounds(**kwargs)
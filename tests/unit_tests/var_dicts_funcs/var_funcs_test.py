@@ -4,13 +4,19 @@
 
 """Add variable functionality."""
 
+import numpy as np
 import pytest
+from docplex.mp.model import Model
 
 from docplex_extensions import (
+    ComputedParamDict1D,
+    ComputedParamDictND,
     IndexSet1D,
     IndexSetND,
     ParamDict1D,
     ParamDictND,
+    SparseParamDict1D,
+    SparseParamDictND,
     add_variable,
     add_variables,
 )
@@ -238,6 +244,55 @@ def test_add_variables_paramdict_bound(mdl_1, indexset, paramdict, bound_type):
     assert repr(dict(one)) == repr(two)
 
 
+@pytest.mark.parametrize('dtype', [None, 'float64', 'int64'])
+@pytest.mark.parametrize(
+    'indexset, mapping, expected',
+    [
+        (IndexSet1D(['A', 'B', 'C']), {'C': 3, 'A': 1, 'B': 2}, [1, 2, 3]),
+        (IndexSet1D(['A', 'B', 'C']), {'B': 2, 'X': 9}, [None, 2, None]),
+        (IndexSetND(range(2), range(2)), {(1, 1): 4, (0, 0): 1}, [1, None, None, 4]),
+        (IndexSetND(range(2), range(2)), {}, [None, None, None, None]),
+    ],
+)
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_paramdict_bound_aligned(
+    mdl_1, indexset, mapping, expected, bound_type, dtype
+):
+    cls = ParamDict1D if isinstance(indexset, IndexSet1D) else ParamDictND
+    paramdict = cls(mapping, dtype=dtype)
+    one = add_variables(mdl_1, indexset, 'C', **{bound_type: paramdict})
+    two = mdl_1.continuous_var_dict(indexset, **{bound_type: expected})
+    assert repr(dict(one)) == repr(two)
+
+
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_numpy_bound(mdl_1, bound_type):
+    indexset = IndexSet1D(['A', 'B', 'C'])
+    one = add_variables(mdl_1, indexset, 'I', **{bound_type: np.array([1, 2, 3], dtype='int32')})
+    two = mdl_1.integer_var_dict(indexset, **{bound_type: [1, 2, 3]})
+    assert repr(dict(one)) == repr(two)
+    one = add_variables(mdl_1, indexset, 'C', **{bound_type: np.array([0.5, 2.0, 1.5])})
+    assert [getattr(var, bound_type) for var in one.values()] == [0.5, 2.0, 1.5]
+
+
+def test_add_variables_semi_bound_numpy_and_callable(mdl_1):
+    indexset = IndexSet1D(['A', 'B', 'C'])
+    one = add_variables(mdl_1, indexset, 'SC', lb=np.array([1.0, 2.0, 3.0]), ub=10)
+    assert [var.lb for var in one.values()] == [1.0, 2.0, 3.0]
+
+    calls = []
+
+    def lb(key):
+        calls.append(key)
+        return {'A': 1, 'B': 2, 'C': 3}[key]
+
+    one = add_variables(mdl_1, indexset, 'SI', lb=lb, ub=10)
+    assert [var.lb for var in one.values()] == [1, 2, 3]
+    assert calls == ['A', 'B', 'C']  # called once for each element
+    with pytest.raises(ValueError, match='Found None with given `lb`'):
+        add_variables(mdl_1, indexset, 'SC', lb=np.array([1.0, None, 3.0], dtype=object))
+
+
 @pytest.mark.parametrize(
     'indexset, paramdict',
     [
@@ -264,3 +319,188 @@ def test_add_variables_paramdict_difflen_valerr(mdl_1, indexset, paramdict, boun
     with pytest.raises(ValueError):
         bound_kwargs_1 = {bound_type: paramdict}
         add_variables(mdl_1, indexset, 'C', **bound_kwargs_1)
+
+
+@pytest.mark.parametrize(
+    'indexset, computed, expected',
+    [
+        (
+            IndexSet1D(['A', 'B', 'C']),
+            ComputedParamDict1D(lambda k: ord(k) - 60, IndexSet1D(['A', 'C', 'D'])),
+            [5, None, 7],
+        ),
+        (
+            IndexSetND(range(2), range(2)),
+            ComputedParamDictND(lambda i, j: i + j + 1, IndexSetND(range(2), range(2))),
+            [1, 2, 2, 3],
+        ),
+        (
+            IndexSetND(range(2), range(2)),
+            ComputedParamDictND(
+                lambda i, j: 0,
+                IndexSetND([(0, 1), (1, 1)]),
+                batch_func=lambda keys: [k[0] + 5 for k in keys],
+            ),
+            [None, 5, None, 6],
+        ),
+    ],
+)
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_computed_bound(mdl_1, indexset, computed, expected, bound_type):
+    bound_kwargs_1 = {bound_type: computed}
+    one = add_variables(mdl_1, indexset, 'C', **bound_kwargs_1)
+
+    bound_kwargs_2 = {bound_type: expected}
+    two = mdl_1.continuous_var_dict(indexset, **bound_kwargs_2)
+
+    assert repr(dict(one)) == repr(two)
+
+
+def test_add_variables_computed_bound_semi_valerr(mdl_1):
+    computed = ComputedParamDict1D(lambda k: 1, IndexSet1D(['A']))
+    with pytest.raises(ValueError):
+        add_variables(mdl_1, IndexSet1D(['A', 'B']), 'SC', lb=computed)
+
+
+@pytest.mark.parametrize(
+    'indexset, computed',
+    [
+        (IndexSet1D(['A', 'B']), ComputedParamDictND(lambda i, j: 1, IndexSetND([('A', 0)]))),
+        (IndexSetND(range(2), range(2)), ComputedParamDict1D(lambda k: 1, IndexSet1D([0, 1]))),
+    ],
+)
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_computed_typerr(mdl_1, indexset, computed, bound_type):
+    with pytest.raises(TypeError):
+        add_variables(mdl_1, indexset, 'C', **{bound_type: computed})
+
+
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_computed_difflen_valerr(mdl_1, bound_type):
+    computed = ComputedParamDictND(lambda *k: 1, IndexSetND([(0, 0, 0)]))
+    with pytest.raises(ValueError):
+        add_variables(mdl_1, IndexSetND(range(2), range(2)), 'C', **{bound_type: computed})
+
+
+@pytest.mark.parametrize('same_indexset', [True, False])
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_sparse_bound_1d(mdl_1, same_indexset, bound_type):
+    indexset = IndexSet1D(['A', 'B', 'C'])
+    if same_indexset:
+        sparse = SparseParamDict1D(indexset, {'B': 7}, default=2)
+        expected = [2, 7, 2]
+    else:
+        sparse = SparseParamDict1D(IndexSet1D(['B', 'C', 'D']), {'B': 7}, default=2)
+        expected = [None, 7, 2]
+
+    one = add_variables(mdl_1, indexset, 'C', **{bound_type: sparse})
+    two = mdl_1.continuous_var_dict(indexset, **{bound_type: expected})
+    assert repr(dict(one)) == repr(two)
+
+
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_sparse_bound_nd(mdl_1, bound_type):
+    indexset = IndexSetND(range(2), range(2))
+    sparse = SparseParamDictND(IndexSetND([(0, 1), (1, 1)]), {(1, 1): 4}, default=1.5)
+
+    one = add_variables(mdl_1, indexset, 'C', **{bound_type: sparse})
+    two = mdl_1.continuous_var_dict(indexset, **{bound_type: [None, 1.5, None, 4]})
+    assert repr(dict(one)) == repr(two)
+
+
+def test_add_variables_sparse_bound_keys_removed(mdl_1):
+    # Overrides of keys removed from the index-set of the SparseParamDict are not used
+    indexset = IndexSet1D(['A', 'B', 'C'])
+    sparse_keys = IndexSet1D(['A', 'B'])
+    sparse = SparseParamDict1D(sparse_keys, {'B': 7}, default=2)
+    sparse_keys.remove('B')
+    one = add_variables(mdl_1, indexset, 'C', ub=sparse)
+    sparse_keys.append('B')
+    two = add_variables(mdl_1, indexset, 'C', ub=sparse)
+    assert [var.ub for var in one.values()] == [2, 1e20, 1e20]
+    assert [var.ub for var in two.values()] == [2, 2, 1e20]
+
+
+@pytest.mark.parametrize(
+    'indexset, sparse',
+    [
+        (IndexSet1D(['A', 'B']), SparseParamDictND(IndexSetND([('A', 0)]))),
+        (IndexSetND(range(2), range(2)), SparseParamDict1D(IndexSet1D([0, 1]))),
+    ],
+)
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_sparse_typerr(mdl_1, indexset, sparse, bound_type):
+    with pytest.raises(TypeError):
+        add_variables(mdl_1, indexset, 'C', **{bound_type: sparse})
+
+
+@pytest.mark.parametrize('bound_type', ['lb', 'ub'])
+def test_add_variables_sparse_difflen_valerr(mdl_1, bound_type):
+    sparse = SparseParamDictND(IndexSetND([(0, 0, 0)]))
+    with pytest.raises(ValueError):
+        add_variables(mdl_1, IndexSetND(range(2), range(2)), 'C', **{bound_type: sparse})
+
+
+@pytest.mark.parametrize(
+    'indexset, name, key_format',
+    [
+        (IndexSet1D(['A', 'B', 'C']), 'x', None),
+        (IndexSet1D([1, 2, 3]), 'x', '[%s]'),
+        (IndexSetND(['A', 'B'], [1, 2]), 'flow', None),
+        (IndexSetND(['A', 'B'], [1, 2], [('P', 'Q')]), 'flow', '_{%s}'),
+        (IndexSetND(['A', 'B'], [1, 2]), lambda key: f'f{key[0]}{key[1]}', None),
+    ],
+)
+def test_add_variables_lazy_names(indexset, name, key_format):
+    mdl_eager, mdl_lazy = Model('lazy_names'), Model('lazy_names')
+    eager = add_variables(mdl_eager, indexset, 'C', name=name, key_format=key_format)
+    lazy = add_variables(mdl_lazy, indexset, 'C', name=name, key_format=key_format, lazy_names=True)
+    assert all(var.name is None for var in lazy.values())
+    assert lazy.value_name == eager.value_name
+
+    assert mdl_lazy.get_var_by_name(eager[eager._indexset[0]].name) is None
+
+    lazy.assign_names()
+    assert [var.name for var in lazy.values()] == [var.name for var in eager.values()]
+    assert repr(lazy) == repr(eager)
+    for key, var in eager.items():
+        assert mdl_lazy.get_var_by_name(var.name) is lazy[key]
+    assert mdl_lazy.export_as_lp_string() == mdl_eager.export_as_lp_string()
+    lazy.assign_names()  # no-op once assigned
+    assert [var.name for var in lazy.values()] == [var.name for var in eager.values()]
+    mdl_eager.end()
+    mdl_lazy.end()
+
+
+def test_add_variables_lazy_names_without_name():
+    mdl = Model()
+    one = add_variables(mdl, IndexSet1D(['A', 'B']), 'B', lazy_names=True)
+    one.assign_names()
+    assert [var.name for var in one.values()] == [None, None]
+    assert mdl.get_var_by_name(None) is None
+    two = add_variables(mdl, IndexSet1D(['A', 'B']), 'B', name='x')
+    two.assign_names()  # no-op with eager names
+    assert [var.name for var in two.values()] == ['x_A', 'x_B']
+    mdl.end()
+
+
+def test_add_variables_lazy_names_indexset_modified():
+    # Names of the keys of the VarDict, even if the index-set is modified before assigning them
+    mdl = Model()
+    indexset = IndexSet1D(['A', 'B'])
+    v = add_variables(mdl, indexset, 'B', name='x', lazy_names=True)
+    indexset.insert(0, 'C')
+    v.assign_names()
+    assert [var.name for var in v.values()] == ['x_A', 'x_B']
+    mdl.end()
+
+
+def test_add_variables_lazy_names_ignore_names(mdl_1):
+    one = add_variables(mdl_1, IndexSet1D(['A', 'B']), 'B', name='x', lazy_names=True)
+    one.assign_names()
+    assert [var.name for var in one.values()] == [None, None]
+
+
+def test_add_variables_lazy_names_typerr(mdl_1):
+    with pytest.raises(TypeError, match='`lazy_names` should be a bool'):
+        add_variables(mdl_1, IndexSet1D(['A', 'B']), 'B', name='x', lazy_names=1)